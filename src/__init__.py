@@ -10,17 +10,25 @@ __author__ = "Fisherk2"
 
 # ⋮⋮⋮⋮⋮⋮⋮⋮ Importar clases desde submódulos ⋮⋮⋮⋮⋮⋮⋮⋮
 from src.validators.csv_validator import CSVValidator
+from src.validators.async_orchestrator import AsyncAuditOrchestrator
 from src.readers.csv_reader import CSVReader
+from src.readers.jsonl_reader import JSONLinesReader
+from src.readers.sqlite_source import SQLiteSource
+from src.readers.columnar_snapshot import ColumnarSnapshot
 from src.validators.type_validator import TypeValidator
 from src.validators.schema_validator import SchemaValidator
 from src.utils.csv_error_reporter import CSVErrorReporter
+from src.utils.error_record import ErrorRecord
 
 from src.quality_auditor.main_auditor import QualityAuditor
 from src.quality_auditor.null_analyzer import NullAnalyzer
 from src.quality_auditor.uniqueness_analyzer import UniquenessAnalyzer
 from src.quality_auditor.statistical_analyzer import StatisticalAnalyzer
 from src.quality_auditor.date_analyzer import DateAnalyzer
-from src.readers.quality_rules_reader import QualityRulesReader
+from src.quality_auditor.temporal_profile import TemporalProfile
+from src.readers.quality_rules_reader import QualityRulesReader, RulesSnapshot
+from src.readers.rules_watcher import RulesWatcher
+from src.readers.typed_rules import DataTypeRules, NullRules, BooleanRules, NumericRules, TextRules, DateRules, Thresholds
 from src.utils.quality_report import QualityReport
 from src.utils.data_parser import DataParser
 from src.utils.date_helper import DateHelper
@@ -28,17 +36,32 @@ from src.utils.date_helper import DateHelper
 # ⋮⋮⋮⋮⋮⋮⋮⋮ Declaración de módulos disponibles para importación ⋮⋮⋮⋮⋮⋮⋮⋮
 __all__ = [
     'CSVValidator',
+    'AsyncAuditOrchestrator',
     'CSVReader',
+    'JSONLinesReader',
+    'SQLiteSource',
+    'ColumnarSnapshot',
     'TypeValidator',
     'SchemaValidator',
     'CSVErrorReporter',
+    'ErrorRecord',
 
     'QualityAuditor',
     'NullAnalyzer',
     'UniquenessAnalyzer',
     'StatisticalAnalyzer',
     'DateAnalyzer',
+    'TemporalProfile',
     'QualityRulesReader',
+    'RulesSnapshot',
+    'RulesWatcher',
+    'DataTypeRules',
+    'NullRules',
+    'BooleanRules',
+    'NumericRules',
+    'TextRules',
+    'DateRules',
+    'Thresholds',
     'QualityReport',
     'DataParser',
     'DateHelper'
@@ -9,8 +9,12 @@ DESCRIPCIÓN: Proporciona funciones para verificar coherencia de fechas (ej: fec
 
 from typing import Any, Optional
 from datetime import datetime
-from utils.date_helper import DateHelper
+from utils.date_helper import DateHelper, DateFormatResolver
+from utils.error_record import ErrorRecord
+from utils.error_sink import ErrorSummarySink
+from quality_auditor.temporal_profile import TemporalProfile
 from readers.quality_rules_reader import QualityRulesReader
+from readers.typed_rules import DateRules
 
 # ⋮⋮⋮⋮⋮⋮⋮⋮ ALIAS de estructura datos ⋮⋮⋮⋮⋮⋮⋮⋮
 RowDataType = list[dict[str, Any]]
@@ -21,135 +25,223 @@ class DateAnalyzer:
     Clase para análisis de coherencia y validación de fechas en datos estructurados
     """
 
+    _INVALID_COLUMN_ERROR = "Error en encabezado: Nombre de columna de fecha inválido o vacío"
+
     @staticmethod
     def check_date_coherence(
             datos: RowDataType,
             birth_column_name: str,
-            path_quality_rules: Optional[str] = None
+            path_quality_rules: Optional[str] = None,
+            structured: bool = False
     ) -> dict[str, Any]:
         """
         Verifica la coherencia de fechas usando configuración
         Detecta fechas de nacimiento futuras o fechas imposibles según reglas configuradas
+        El formato de la columna se infiere sobre una muestra y se registra cuántas veces se observó cada uno
         :param datos: Lista de diccionarios representando filas de datos
         :param birth_column_name: Nombre de la columna que contiene fechas de nacimiento
         :param path_quality_rules: Ruta opcional al archivo YAML de configuración
-        :return: Diccionario con errores y reglas aplicadas
+        :param structured: Devolver los errores de fila como ErrorRecord en lugar de mensajes
+        :return: Diccionario con errores, reglas aplicadas y formatos observados
         """
         if datos is None or not datos:
             return {"errors": [], "rules_applied": {}}
 
-        errors = list()
-        rules_applied = dict()
-
         if birth_column_name is None or not birth_column_name.strip():
-            errors.append("Error en encabezado: Nombre de columna de fecha inválido o vacío")
-            return {"errors": errors, "rules_applied": rules_applied}
+            return {"errors": [DateAnalyzer._INVALID_COLUMN_ERROR], "rules_applied": {}}
 
-        # ■■■■■■■■■■■■ Cargar configuración de fechas ■■■■■■■■■■■■■
-        date_rules = DateAnalyzer._get_date_rules(path_quality_rules)
-        supported_formats = date_rules.get('supported_formats', ["%Y-%m-%d"])
-        allow_future = date_rules.get('allow_future_dates', False)
-        min_date_str = date_rules.get('min_date')
-        max_date_str = date_rules.get('max_date')
-
-        # ■■■■■■■■■■■■ Guardar reglas aplicadas ■■■■■■■■■■■■■
-        rules_applied["supported_formats"] = supported_formats
-        rules_applied["allow_future_dates"] = allow_future
-        rules_applied["min_date"] = min_date_str
-        rules_applied["max_date"] = max_date_str
-
-        # ■■■■■■■■■■■■ Parsear fechas de rango si existen ■■■■■■■■■■■■■
-        min_date = None
-        max_date = None
-
-        if min_date_str:
-            try:
-                min_date = datetime.strptime(min_date_str, '%Y-%m-%d')
-            except ValueError:
-                errors.append(f"Advertencia: Fecha mínima inválida en configuración: {min_date_str}")
+        # ■■■■■■■■■■■■ Caso particular del análisis por lotes con una sola columna ■■■■■■■■■■■■■
+        batch_result = DateAnalyzer.check_dates_batch(
+            datos, [birth_column_name], path_quality_rules, structured=structured
+        )
+        column_result = batch_result["columns"][birth_column_name]
 
-        if max_date_str:
-            try:
-                max_date = datetime.strptime(max_date_str, '%Y-%m-%d')
-            except ValueError:
-                errors.append(f"Advertencia: Fecha máxima inválida en configuración: {max_date_str}")
+        return {
+            "errors": batch_result["config_errors"] + column_result["errors"],
+            "rules_applied": batch_result["rules_applied"],
+            "formats_observed": column_result["formats_observed"]
+        }
 
-        for i in range(len(datos)):
-            row = datos[i]
+    @staticmethod
+    def check_dates_batch(
+            datos: RowDataType,
+            date_columns: list[str],
+            path_quality_rules: Optional[str] = None,
+            reference_time: Optional[datetime] = None,
+            structured: bool = False,
+            profiles: Optional[dict[str, TemporalProfile]] = None,
+            profile_granularity: str = "day",
+            sink: Optional[Any] = None,
+            summary_sample_size: Optional[int] = None
+    ) -> dict[str, Any]:
+        """
+        Verifica coherencia, rangos y fallos de parseo de varias columnas de fechas en un solo recorrido
+        Las fechas se comparan como ordinales enteros (días) contra una única referencia capturada al inicio,
+        por lo que una fecha se considera futura si su día es posterior al día de referencia
+        En el mismo recorrido se acumula el perfil temporal de cada columna (rango, frescura, volúmenes
+        por día/semana/mes, huecos y picos)
+        :param datos: Lista de diccionarios representando filas de datos
+        :param date_columns: Nombres de las columnas que contienen fechas
+        :param path_quality_rules: Ruta opcional al archivo YAML de configuración
+        :param reference_time: Momento de referencia para fechas futuras (por defecto, ahora)
+        :param structured: Devolver los errores de fila como ErrorRecord en lugar de mensajes
+        :param profiles: Perfiles temporales por columna a seguir acumulando (Opcional, para procesar por trozos)
+        :param profile_granularity: Periodo para huecos y picos del perfil ("day", "week" o "month")
+        :param sink: Sumidero de errores (ErrorSink) al que se envían los registros en cuanto se detectan,
+                     en lugar de acumularlos en "errors" (Opcional)
+        :param summary_sample_size: Si se indica, los errores se agregan por (columna, código) con esa cantidad
+                                    de filas de ejemplo y se devuelven en "error_summary" (Opcional)
+        :return: Diccionario con resultados por columna, reglas aplicadas y errores de configuración
+        """
+        result = {"columns": {}, "rules_applied": {}, "config_errors": [], "reference_date": None}
+        if datos is None or not datos or not date_columns:
+            return result
 
-            if not birth_column_name in row.keys():
-                errors.append(f"Fila {str(i + 1)}: Columna '{birth_column_name}' no encontrada")
-                continue
+        # ■■■■■■■■■■■■ Resumen agregado en lugar de un mensaje por celda ■■■■■■■■■■■■■
+        summary_sink = None
+        if summary_sample_size is not None and sink is None:
+            summary_sink = ErrorSummarySink(summary_sample_size)
+            sink = summary_sink
 
-            # ■■■■■■■■■■■■■ Saltar valores nulos, el análisis de nulos se hace en otro módulo ■■■■■■■■■■■■■
-            date_value = row[birth_column_name]
-            if date_value is None:
+        # ■■■■■■■■■■■■ Cargar configuración de fechas una sola vez ■■■■■■■■■■■■■
+        date_rules = DateAnalyzer._get_date_rules(path_quality_rules)
+        supported_formats = list(date_rules.supported_formats)
+        allow_future = date_rules.allow_future_dates
+        min_date_str = date_rules.min_date
+        max_date_str = date_rules.max_date
+
+        result["rules_applied"] = {
+            "supported_formats": supported_formats,
+            "allow_future_dates": allow_future,
+            "min_date": min_date_str,
+            "max_date": max_date_str
+        }
+
+        # ■■■■■■■■■■■■ Referencia y rangos como ordinales enteros ■■■■■■■■■■■■■
+        reference = reference_time if reference_time is not None else datetime.now()
+        reference_ordinal = reference.toordinal()
+        reference_str = DateHelper.format_date(reference, "%Y-%m-%d")
+        result["reference_date"] = reference_str
+
+        min_date = DateAnalyzer._parse_limit(min_date_str, "mínima", result["config_errors"])
+        max_date = DateAnalyzer._parse_limit(max_date_str, "máxima", result["config_errors"])
+        min_ordinal = min_date.toordinal() if min_date is not None else None
+        max_ordinal = max_date.toordinal() if max_date is not None else None
+        min_str = DateHelper.format_date(min_date, "%Y-%m-%d") if min_date is not None else None
+        max_str = DateHelper.format_date(max_date, "%Y-%m-%d") if max_date is not None else None
+
+        # ■■■■■■■■■■■■ Estado por columna ■■■■■■■■■■■■■
+        states = list()
+        for column in date_columns:
+            if column is None or not column.strip():
+                result["config_errors"].append(DateAnalyzer._INVALID_COLUMN_ERROR)
                 continue
-
-            date: str = ""
-
-            if isinstance(date_value, str):
-                date: str = date_value.strip()
-            else:
-                date: str = str(date_value).strip()
-
-            # ■■■■■■■■■■■■■ Saltar cadenas vacias ■■■■■■■■■■■■■
-            if not date:
+            if column in result["columns"]:
                 continue
-
-            # ■■■■■■■■■■■■■ Intentar parsear la fecha con diferentes formatos ■■■■■■■■■■■■■
-            date_parsed = None
-            for supported_format in supported_formats:
-                date_parsed = DateHelper.parse_date(date, supported_format)
-                if date_parsed is not None:
-                    break
-
-            if date_parsed is None:
-                errors.append(f"Fila {i + 1}: Fecha invalida en columna '{birth_column_name}': {date}")
-
-            # ■■■■■■■■■■■■■ Verificar reglas adicionales ■■■■■■■■■■■■■
+            if profiles is None:
+                profile = TemporalProfile()
             else:
-                # ▲▲▲▲▲ Verificar si la fecha es futura ▲▲▲▲▲▲
-                if not allow_future and DateHelper.is_date_before(datetime.now(), date_parsed):
-                    mensaje = f"""
-                    Fila {i + 1}: 
-                    Fecha futura en columna '{birth_column_name}': {DateHelper.format_date(date_parsed, "%Y-%m-%d")} 
-                    (actual: {DateHelper.format_date(datetime.now(), "%Y-%m-%d")})
-                    """
-                    errors.append(mensaje)
-
-                # ▲▲▲▲▲ Verificar rango minimo ▲▲▲▲▲▲
-                if min_date is not None and DateHelper.is_date_before(date_parsed, min_date):
-                    message = f"""
-                    Fila {i + 1}: Fecha fuera de rango minimo en '{birth_column_name}': {DateHelper.format_date(date_parsed, "%Y-%m-%d")}
-                    (minimo permitido: {DateHelper.format_date(min_date, "%Y-%m-%d")})
-                    """
-                    errors.append(message)
-
-                # ▲▲▲▲▲ Verificar rango maximo ▲▲▲▲▲▲
-                if max_date is not None and DateHelper.is_date_before(max_date, date_parsed):
-                    message = f"""
-                    Fila {i + 1}: Fecha fuera de rango maximo en '{birth_column_name}': {DateHelper.format_date(date_parsed, "%Y-%m-%d")}
-                    (maximo permitido: {DateHelper.format_date(max_date, "%Y-%m-%d")})
-                    """
-                    errors.append(message)
-
-        return {"errors": errors, "rules_applied": rules_applied}
+                profile = profiles.setdefault(column, TemporalProfile())
+            state = {
+                "resolver": DateFormatResolver(supported_formats),
+                "profile": profile,
+                "errors": list(),
+                "checked": 0,
+                "parse_failures": 0,
+                "future_dates": 0,
+                "below_minimum": 0,
+                "above_maximum": 0,
+                "missing_column": 0
+            }
+            result["columns"][column] = state
+            emit = sink.emit if sink is not None else state["errors"].append
+            states.append((column, state, emit))
+
+        # ■■■■■■■■■■■■ Fijar el formato de cada columna antes del recorrido ■■■■■■■■■■■■■
+        if isinstance(datos, list):
+            for column, state, _ in states:
+                state["resolver"].prime(row.get(column) for row in datos)
+
+        for row_number, row in enumerate(datos, start=1):
+            for column, state, emit in states:
+                if column not in row:
+                    state["missing_column"] += 1
+                    emit(ErrorRecord(row_number, column, "columna_no_encontrada"))
+                    continue
+
+                # ■■■■■■■■■■■■■ Saltar nulos y cadenas vacías, el análisis de nulos se hace en otro módulo ■■■■■■■■■■■■■
+                date_value = row[column]
+                if date_value is None:
+                    continue
+                date = date_value.strip() if isinstance(date_value, str) else str(date_value).strip()
+                if not date:
+                    continue
+
+                state["checked"] += 1
+                date_parsed = state["resolver"].parse(date)
+                if date_parsed is None:
+                    state["parse_failures"] += 1
+                    emit(ErrorRecord(row_number, column, "fecha_invalida", date))
+                    continue
+
+                # ▲▲▲▲▲ Verificar reglas adicionales comparando ordinales ▲▲▲▲▲▲
+                ordinal = date_parsed.toordinal()
+                state["profile"].add(date_parsed, ordinal)
+                if not allow_future and ordinal > reference_ordinal:
+                    state["future_dates"] += 1
+                    emit(ErrorRecord(
+                        row_number, column, "fecha_futura", DateHelper.format_date(date_parsed, '%Y-%m-%d'),
+                        reference_str
+                    ))
+                if min_ordinal is not None and ordinal < min_ordinal:
+                    state["below_minimum"] += 1
+                    emit(ErrorRecord(
+                        row_number, column, "fecha_bajo_minimo", DateHelper.format_date(date_parsed, '%Y-%m-%d'),
+                        min_str
+                    ))
+                if max_ordinal is not None and ordinal > max_ordinal:
+                    state["above_maximum"] += 1
+                    emit(ErrorRecord(
+                        row_number, column, "fecha_sobre_maximo", DateHelper.format_date(date_parsed, '%Y-%m-%d'),
+                        max_str
+                    ))
+
+        # ■■■■■■■■■■■■ Reemplazar el estado interno por el resumen de cada columna ■■■■■■■■■■■■■
+        for column, state, _ in states:
+            if not structured:
+                state["errors"] = ErrorRecord.render_all(state["errors"])
+            resolver = state.pop("resolver")
+            profile = state.pop("profile")
+            state["temporal_profile"] = profile.summary(reference, profile_granularity)
+            state["formats_observed"] = resolver.formats_observed()
+            state["error_total"] = (
+                    state["missing_column"] + state["parse_failures"] + state["future_dates"]
+                    + state["below_minimum"] + state["above_maximum"]
+            )
+
+        if summary_sink is not None:
+            result["error_summary"] = summary_sink.summary()
+
+        return result
 
     @staticmethod
     def check_date_range(
             datos: RowDataType,
             column_name: str,
             minimum_date: Optional[datetime] = None,
-            maximum_date: Optional[datetime] = None
-    ) -> list[str]:
+            maximum_date: Optional[datetime] = None,
+            supported_formats: Optional[list[str]] = None,
+            structured: bool = False
+    ) -> list:
         """
         Verifica que las fechas esten dentro de un rango especifico
         :param datos: Lista de diccionarios representando filas de datos
         :param column_name: Nombre de la columna que contiene las fechas
         :param minimum_date: Fecha minimia permitida (Opcional)
         :param maximum_date: Fecha maxima permitida (Opcional)
-        :return: Lista de mensajes de error indicando fechas fuera de rango
+        :param supported_formats: Formatos de fecha ya cargados (Opcional, evita releer la configuración)
+        :param structured: Devolver ErrorRecord en lugar de mensajes (Opcional)
+        :return: Lista de mensajes de error (o registros) indicando fechas fuera de rango
         """
         if datos is None or not datos:
             return list()
@@ -157,72 +249,69 @@ class DateAnalyzer:
         errors = list()
 
         if column_name is None or not column_name.strip():
-            errors.append("Error en encabezado: Nombre de columna de fecha inválido o vacío")
+            errors.append(DateAnalyzer._INVALID_COLUMN_ERROR)
             return errors
 
-        supported_formats = DateHelper.get_supported_formats()
-
-        for i in range(len(datos)):
-            row = datos[i]
-
-            # ■■■■■■■■■■■■■ Saltar filas sin la columna ■■■■■■■■■■■■■
-            if not column_name in row.keys():
-                continue
-
-            # ■■■■■■■■■■■■■ Saltar valores nulos ■■■■■■■■■■■■■
-            date_value = row[column_name]
-            if date_value is None:
+        if supported_formats is None:
+            supported_formats = DateHelper.get_supported_formats()
+
+        # ■■■■■■■■■■■■■ Recoger la columna y parsearla en bloque (saltando filas sin la columna) ■■■■■■■■■■■■■
+        row_numbers = list()
+        values = list()
+        for i, row in enumerate(datos):
+            if column_name in row:
+                row_numbers.append(i + 1)
+                values.append(row[column_name])
+        parsed_dates = DateHelper.parse_many(values, supported_formats)
+
+        min_str = DateHelper.format_date(minimum_date, '%Y-%m-%d') if minimum_date is not None else None
+        max_str = DateHelper.format_date(maximum_date, '%Y-%m-%d') if maximum_date is not None else None
+        for row_number, date_parsed in zip(row_numbers, parsed_dates):
+            if date_parsed is None:
                 continue
 
-            date: str = ""
+            # ▲▲▲▲▲▲ Verificar rango minimo ▲▲▲▲▲▲
+            if minimum_date is not None and DateHelper.is_date_before(date_parsed, minimum_date):
+                errors.append(ErrorRecord(
+                    row_number, column_name, "fecha_bajo_minimo", DateHelper.format_date(date_parsed, '%Y-%m-%d'),
+                    min_str
+                ))
 
-            if isinstance(date_value, str):
-                date = date_value.strip()
-            else:
-                date = str(date_value).strip()
+            # ▲▲▲▲▲▲ Verificar rango maximo ▲▲▲▲▲▲
+            if maximum_date is not None and DateHelper.is_date_before(maximum_date, date_parsed):
+                errors.append(ErrorRecord(
+                    row_number, column_name, "fecha_sobre_maximo", DateHelper.format_date(date_parsed, '%Y-%m-%d'),
+                    max_str
+                ))
 
-            # ■■■■■■■■■■■■■ Saltar cadenas vacias ■■■■■■■■■■■■■
-            if not date:
-                continue
+        return errors if structured else ErrorRecord.render_all(errors)
 
-            # ■■■■■■■■■■■■■ Intentar parsear la fecha ■■■■■■■■■■■■■
-            date_parsed = None
-            for supported_format in supported_formats:
-                date_parsed = DateHelper.parse_date(date, supported_format)
-                if date_parsed is not None:
-                    break
-
-            if date_parsed is not None:
-
-                # ▲▲▲▲▲▲ Verificar rango minimo ▲▲▲▲▲▲
-                if minimum_date is not None and DateHelper.is_date_before(date_parsed, minimum_date):
-                    message = f"""
-                    Fila {i + 1}: Fecha fuera de rango minimo en '{column_name}': {DateHelper.format_date(date_parsed, "%Y-%m-%d")}
-                    (minimo permitido: {DateHelper.format_date(minimum_date, "%Y-%m-%d")})
-                    """
-                    errors.append(message)
-
-                # ▲▲▲▲▲▲ Verificar rango maximo ▲▲▲▲▲▲
-                if maximum_date is not None and DateHelper.is_date_before(maximum_date, date_parsed):
-                    message = f"""
-                    Fila {i + 1}: Fecha fuera de rango maximo en '{column_name}': {DateHelper.format_date(date_parsed, "%Y-%m-%d")}
-                    (maximo permitido: {DateHelper.format_date(maximum_date, "%Y-%m-%d")})
-                    """
-                    errors.append(message)
-
-        return errors
+    @staticmethod
+    def _parse_limit(limit_str: Optional[str], label: str, config_errors: list[str]) -> Optional[datetime]:
+        """
+        Parsea una fecha límite de la configuración (ISO 8601: YYYY-MM-DD)
+        :param limit_str: Fecha límite en forma de cadena
+        :param label: Descripción del límite ("mínima" o "máxima")
+        :param config_errors: Lista donde registrar advertencias de configuración
+        :return: datetime o None si no está definida o es inválida
+        """
+        if not limit_str:
+            return None
+        limit = DateHelper.parse_date(str(limit_str), '%Y-%m-%d')
+        if limit is None:
+            config_errors.append(f"Advertencia: Fecha {label} inválida en configuración: {limit_str}")
+        return limit
 
     @staticmethod
-    def _get_date_rules(path_quality_rules: Optional[str]) -> dict[str, Any]:
+    def _get_date_rules(path_quality_rules: Optional[str]) -> DateRules:
         """
         Obtiene las reglas de fechas desde configuración o valores por defecto
         :param path_quality_rules: Ruta opcional al archivo YAML de configuración
-        :return: Diccionario con reglas de fechas
+        :return: Reglas de fechas tipadas
         """
         if path_quality_rules:
             try:
-                config = QualityRulesReader.load_configs(path_quality_rules)
-                return QualityRulesReader.get_data_type_rules(config, 'date')
+                return QualityRulesReader.load_rules(path_quality_rules).date
             except (FileNotFoundError, ValueError, Exception):
 
                 # ■■■■■■■■■■■■■ Si hay error, usar valores por defecto ■■■■■■■■■■■■■
@@ -230,4 +319,4 @@ class DateAnalyzer:
 
         # ■■■■■■■■■■■■■ Valores por defecto si no hay configuración ■■■■■■■■■■■■■
         default_config = QualityRulesReader.apply_default_rules()
-        return QualityRulesReader.get_data_type_rules(default_config, 'date')
+        return QualityRulesReader.get_typed_rules(default_config).date
@@ -7,6 +7,7 @@ DESCRIPCIÓN: Proporciona un punto de entrada centralizado para todas las funcio
 ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
 """
 import math
+from itertools import islice
 from typing import Any, Optional
 from datetime import datetime
 
@@ -14,8 +15,16 @@ from quality_auditor.null_analyzer import NullAnalyzer
 from quality_auditor.uniqueness_analyzer import UniquenessAnalyzer
 from quality_auditor.date_analyzer import DateAnalyzer
 from quality_auditor.statistical_analyzer import StatisticalAnalyzer
+from quality_auditor.sqlite_pushdown import SQLitePushdown
+from quality_auditor.null_monitor import SequentialNullMonitor, DEFAULT_FAIL_FAST_CONFIDENCE, DEFAULT_CHECK_ROWS
 from readers.quality_rules_reader import QualityRulesReader
+from readers.csv_reader import CSVReader
+from readers.jsonl_reader import JSONLinesReader
+from readers.compressed_input import CompressedInput
+from readers.columnar_snapshot import ColumnarSnapshot
+from readers.sqlite_source import SQLiteSource
 from utils.data_parser import DataParser
+from utils.row_sampler import RowSampler, DEFAULT_SAMPLE_SIZE, DEFAULT_CONFIDENCE
 
 # ⋮⋮⋮⋮⋮⋮⋮⋮ ALIAS de estructura datos ⋮⋮⋮⋮⋮⋮⋮⋮
 RowDataType = list[dict[str, Any]]
@@ -74,7 +83,9 @@ class QualityAuditor:
             path_quality_rules: Optional[str] = None,
             birth_column_name: Optional[str] = None,
             numerics_columns: Optional[list[str]] = None,
-            text_columns: Optional[list[str]] = None
+            text_columns: Optional[list[str]] = None,
+            date_columns: Optional[list[str]] = None,
+            base_audit: bool = True
     ) -> dict[str, Any]:
         """
         Realiza un analisis completo de calidad de datos con opciones avanzadas usando configuración
@@ -83,9 +94,17 @@ class QualityAuditor:
         :param birth_column_name: Columna especifica para analisis de coherencia de fechas
         :param numerics_columns: Lista de columnas a tratar como nuemricas
         :param text_columns: Lista de columnas a tratar como de texto
+        :param date_columns: Lista de columnas de fechas a analizar en un solo recorrido
+        :param base_audit: Incluir la auditoría general de quality_audit (False = solo los análisis pedidos)
         :return: Diccionario con todos los resultados de calidad ampliados
         """
-        results = QualityAuditor.quality_audit(data, path_quality_rules)
+        if base_audit:
+            results = QualityAuditor.quality_audit(data, path_quality_rules)
+        else:
+            results = {
+                "timestamp": datetime.now().isoformat(),
+                "total_rows": len(data) if data is not None else 0
+            }
 
         # ■■■■■■■■■■■■■ Cargar configuración para análisis avanzados ■■■■■■■■■■■■■
         config = QualityAuditor._load_configuration(path_quality_rules)
@@ -100,8 +119,15 @@ class QualityAuditor:
             results["date_analysis"]["date_column"] = birth_column_name
             results["date_analysis"]["errors"] = date_result.get("errors", [])
             results["date_analysis"]["rules_applied"] = date_result.get("rules_applied", {})
+            results["date_analysis"]["formats_observed"] = date_result.get("formats_observed", {})
             results["date_analysis"]["error_total"] = len(date_result.get("errors", []))
 
+        # ■■■■■■■■■■■■■ Analisis por lotes de varias columnas de fechas ■■■■■■■■■■■■■
+        if date_columns is not None and date_columns:
+            results["date_columns_analysis"] = DateAnalyzer.check_dates_batch(
+                filtered_data, date_columns, path_quality_rules
+            )
+
         # ■■■■■■■■■■■■■ Analisis estadistico detallado si se especifican columnas numericas ■■■■■■■■■■■■■
         if numerics_columns is not None and numerics_columns:
             numerics_values = StatisticalAnalyzer.get_numerics_values(filtered_data, path_quality_rules)
@@ -186,6 +212,517 @@ class QualityAuditor:
 
         return results
 
+    @staticmethod
+    def audit_file(
+            filepath: str,
+            path_quality_rules: Optional[str] = None,
+            birth_column_name: Optional[str] = None,
+            numerics_columns: Optional[list[str]] = None,
+            text_columns: Optional[list[str]] = None,
+            date_columns: Optional[list[str]] = None,
+            base_audit: bool = True,
+            source_config: Optional[dict[str, Any]] = None,
+            error_handling: Optional[dict[str, Any]] = None
+    ) -> dict[str, Any]:
+        """
+        Audita un archivo CSV o JSON Lines leyendo solo las columnas que necesitan los análisis configurados
+        Con fail_fast_on_quality_critical deja de leer en cuanto una columna supera con seguridad el umbral
+        crítico de nulos y devuelve solo esa alerta (ver SequentialNullMonitor)
+        :param filepath: Ruta del archivo CSV
+        :param path_quality_rules: Ruta opcional al archivo YAML de configuración
+        :param birth_column_name: Columna especifica para analisis de coherencia de fechas
+        :param numerics_columns: Lista de columnas a tratar como numericas
+        :param text_columns: Lista de columnas a tratar como de texto
+        :param date_columns: Lista de columnas de fechas a analizar en un solo recorrido
+        :param base_audit: Incluir la auditoría general (todas las columnas no ignoradas)
+        :param source_config: Sección input.primary_source del pipeline para el lector (Opcional)
+        :param error_handling: Sección execution.error_handling del pipeline (fail_fast_on_quality_critical,
+                               fail_fast_confidence, fail_fast_check_rows) (Opcional)
+        :return: Resultado de advance_quality_audit con la proyección aplicada en "projection" y, si la parada
+                 temprana está activa, su resultado en "fail_fast"
+        """
+        reader = JSONLinesReader.reader_for(filepath, source_config)
+        headers = reader.read_headers(filepath)
+        columns = QualityAuditor.required_columns(
+            headers, path_quality_rules, birth_column_name, numerics_columns, text_columns, date_columns, base_audit
+        )
+        projection = {
+            "columns_read": columns,
+            "columns_total": len(set(headers))
+        }
+
+        fail_fast = error_handling is not None and bool(error_handling.get("fail_fast_on_quality_critical", False))
+        if not fail_fast:
+            data = list(reader.read_rows(filepath, columns=columns))
+        else:
+            data, decision = QualityAuditor._read_with_fail_fast(
+                reader, filepath, columns, path_quality_rules, error_handling
+            )
+            if decision is not None:
+                return QualityAuditor._fail_fast_result(decision, projection)
+
+        results = QualityAuditor.advance_quality_audit(
+            data, path_quality_rules, birth_column_name, numerics_columns, text_columns, date_columns, base_audit
+        )
+        results["projection"] = projection
+        if fail_fast:
+            results["fail_fast"] = {"triggered": False, "rows_scanned": len(data)}
+        return results
+
+    @staticmethod
+    def audit_snapshot(snapshot_path: str, path_quality_rules: Optional[str] = None) -> dict[str, Any]:
+        """
+        Auditoría de nulos, unicidad y resumen numérico sobre una instantánea columnar (ColumnarSnapshot.write)
+        sin tokenizar ni parsear: las frecuencias salen de los códigos de diccionario y los arrays tipados, y el
+        predicado de nulos se evalúa una vez por valor distinto. Con reglas de exclusión las filas se
+        materializan y se usa quality_audit
+        :param snapshot_path: Ruta de la instantánea
+        :param path_quality_rules: Ruta opcional al archivo YAML de configuración
+        :return: Diccionario con total_rows, null_analysis, uniqueness_analysis y alerts (mismo formato que
+                 quality_audit; sin análisis estadístico, alerts no incluye valores fuera de rango), numeric_summary
+                 de las columnas tipadas y los datos de la instantánea en "snapshot"
+        """
+        config = QualityAuditor._load_configuration(path_quality_rules)
+        exclusion_rules = config.get('quality_rules', {}).get('exclusion_rules', {}) or {}
+
+        with ColumnarSnapshot(snapshot_path) as snapshot:
+            snapshot_info = {
+                "path": snapshot_path,
+                "columnar": True,
+                "kinds": {column: snapshot.columns[column]["kind"] for column in snapshot.headers}
+            }
+            if exclusion_rules.get('exclude_columns') or exclusion_rules.get('exclude_values'):
+                results = QualityAuditor.quality_audit(list(snapshot.iter_rows()), path_quality_rules)
+                results["snapshot"] = dict(snapshot_info, columnar=False)
+                return results
+
+            null_rules = QualityRulesReader.get_typed_rules(config).null
+            total_rows = snapshot.rows
+            null_analysis = dict()
+            uniqueness_counts = dict()
+            numeric_summary = dict()
+            for column in snapshot.headers if total_rows else []:
+
+                # ▲▲▲▲▲▲ Frecuencias por valor distinto: nulos y valores que aparecen una sola vez ▲▲▲▲▲▲
+                counts = snapshot.value_counts(column)
+                null_analysis[column] = sum(
+                    count for value, count in counts.items() if DataParser.is_null_value(value, null_rules)
+                )
+                uniqueness_counts[column] = (sum(1 for count in counts.values() if count == 1), total_rows)
+
+                # ▲▲▲▲▲▲ Columnas tipadas: suma directa sobre la vista (las celdas vacías valen 0) ▲▲▲▲▲▲
+                stats = snapshot.stats(column)
+                present = total_rows - stats["null_count"]
+                if stats["kind"] != "dict" and present:
+                    values = snapshot.values(column)
+                    numeric_summary[column] = {
+                        "kind": stats["kind"],
+                        "count": present,
+                        "min": stats["min"],
+                        "max": stats["max"],
+                        "mean": round(sum(values) / present, 4)
+                    }
+                    values.release()
+
+        # ■■■■■■■■■■■■■ Alertas con los mismos umbrales que generate_alerts ■■■■■■■■■■■■■
+        uniqueness_analysis = UniquenessAnalyzer.uniqueness_from_counts(uniqueness_counts, path_quality_rules)
+        if total_rows:
+            alerts = QualityAuditor._alerts_from_analysis(
+                null_analysis, uniqueness_analysis, dict(), total_rows, QualityRulesReader.get_thresholds(config)
+            )
+        else:
+            alerts = {"alerts": ["ALERTA: No hay datos para analizar"], "thresholds_applied": {}}
+
+        return {
+            "timestamp": datetime.now().isoformat(),
+            "total_rows": total_rows,
+            "null_analysis": null_analysis,
+            "uniqueness_analysis": uniqueness_analysis,
+            "alerts": alerts,
+            "numeric_summary": numeric_summary,
+            "snapshot": snapshot_info
+        }
+
+    @staticmethod
+    def _read_with_fail_fast(
+            reader: CSVReader,
+            filepath: str,
+            columns: Optional[list[str]],
+            path_quality_rules: Optional[str],
+            error_handling: dict[str, Any]
+    ) -> tuple[RowDataType, Optional[dict[str, Any]]]:
+        """
+        Lee el archivo por lotes comprobando tras cada lote si el umbral crítico de nulos ya está decidido
+        :param reader: Lector CSV con la configuración de la fuente
+        :param filepath: Ruta del archivo CSV
+        :param columns: Columnas a leer
+        :param path_quality_rules: Ruta opcional al archivo YAML de configuración
+        :param error_handling: Sección execution.error_handling del pipeline
+        :return: Tupla (filas leídas, decisión de parada o None si se leyó el archivo completo)
+        """
+        config = QualityAuditor._load_configuration(path_quality_rules)
+        threshold = QualityRulesReader.get_typed_thresholds(config).critical.null_percentage
+        check_rows = error_handling.get("fail_fast_check_rows", DEFAULT_CHECK_ROWS)
+        if isinstance(check_rows, bool) or not isinstance(check_rows, int) or check_rows < 1:
+            raise ValueError(f"fail_fast_check_rows debe ser un entero positivo: {check_rows}")
+
+        # ■■■■■■■■■■■■■ Total de filas por conteo rápido; desconocido en comprimidos ■■■■■■■■■■■■■
+        population = None if CompressedInput.detect(filepath) is not None else reader.count_rows(filepath)
+        monitor = SequentialNullMonitor(
+            threshold,
+            population,
+            QualityRulesReader.get_typed_rules(config).null,
+            error_handling.get("fail_fast_confidence", DEFAULT_FAIL_FAST_CONFIDENCE),
+            check_rows
+        )
+
+        data = list()
+        rows = reader.read_rows(filepath, columns=columns)
+        try:
+            while True:
+                batch = list(islice(rows, check_rows))
+                if not batch:
+                    return data, None
+                data.extend(batch)
+                decision = monitor.add(QualityAuditor._apply_exclusions(batch, config))
+                if decision is not None:
+                    return data, decision
+        finally:
+            rows.close()
+
+    @staticmethod
+    def _fail_fast_result(decision: dict[str, Any], projection: dict[str, Any]) -> dict[str, Any]:
+        """
+        Resultado de una auditoría detenida por la parada temprana
+        :param decision: Decisión de SequentialNullMonitor
+        :param projection: Columnas leídas y totales
+        :return: Diccionario con la decisión y la alerta crítica
+        """
+        if decision["decision"] == "certain":
+            bound = f"mínimo final garantizado {decision['lower_bound']}%"
+        else:
+            bound = f"cota inferior {decision['lower_bound']}% con confianza {round(decision['confidence'] * 100, 2)}%"
+        alert = (
+            f"CRÍTICA: Columna '{decision['column']}' supera el umbral crítico de nulos "
+            f"({decision['threshold']}%): {decision['null_percentage_observed']}% en las primeras "
+            f"{decision['rows_scanned']} filas ({bound})"
+        )
+        return {
+            "timestamp": datetime.now().isoformat(),
+            "total_rows": decision["population_rows"],
+            "fail_fast": decision,
+            "alerts": {
+                "alerts": [alert],
+                "total_alerts": 1,
+                "critical_alerts": 1,
+                "warning_alerts": 0,
+                "info_alerts": 0
+            },
+            "projection": projection
+        }
+
+    @staticmethod
+    def audit_sqlite(
+            database: str,
+            table: str,
+            path_quality_rules: Optional[str] = None,
+            source_config: Optional[dict[str, Any]] = None
+    ) -> dict[str, Any]:
+        """
+        Audita una tabla de una base SQLite local con el formato de quality_audit, calculando en SQLite lo que
+        admite agregados (ver SQLitePushdown): nulos, unicidad y distintos de todas las columnas, y estadísticos y
+        tipo predominante de las columnas sin valores de texto. Solo las columnas con texto se leen en Python,
+        por lotes de fetch_size filas y en dos pasadas (SQLitePushdown.streamed_statistics), sin retener las
+        filas; con reglas de exclusión de filas se leen todas en memoria y se usa quality_audit
+        :param database: Ruta del fichero de la base SQLite
+        :param table: Nombre de la tabla
+        :param path_quality_rules: Ruta opcional al archivo YAML de configuración
+        :param source_config: Sección input.primary_source del pipeline (fetch_size) (Opcional)
+        :return: Resultado de quality_audit y, en "pushdown", las columnas agregadas en SQL y las leídas en Python,
+                 los valores distintos y los valores numéricos fuera de [min_value, max_value] por columna
+        """
+        config = QualityAuditor._load_configuration(path_quality_rules)
+        exclusion_rules = config.get('quality_rules', {}).get('exclusion_rules', {}) or {}
+        numeric_rules = QualityRulesReader.get_typed_rules(config).numeric
+
+        with SQLiteSource(database, table, source_config) as source:
+            if not source.validate_file_exist():
+                raise FileNotFoundError(f"El archivo no existe: {database}")
+            headers = source.read_headers()
+            if not headers:
+                raise ValueError(f"La tabla {table} no existe en {database}")
+            columns = QualityAuditor.required_columns(headers, path_quality_rules)
+            pushdown = {
+                "database": database,
+                "table": table,
+                "pushed_columns": [],
+                "streamed_columns": columns,
+                "distinct_counts": {},
+                "out_of_range_counts": {}
+            }
+
+            # ■■■■■■■■■■■■■ Exclusiones de filas: se evalúan en Python sobre las filas leídas ■■■■■■■■■■■■■
+            if exclusion_rules.get('exclude_columns') or exclusion_rules.get('exclude_values'):
+                results = QualityAuditor.quality_audit(list(source.read_rows(columns)), path_quality_rules)
+                results["pushdown"] = pushdown
+                return results
+
+            # ■■■■■■■■■■■■■ Perfil agregado: un recorrido por grupo de columnas ■■■■■■■■■■■■■
+            profile = SQLitePushdown.profile(source, columns, config)
+            total_rows = profile["total_rows"]
+            if not total_rows:
+                results = QualityAuditor.quality_audit([], path_quality_rules)
+                results["pushdown"] = dict(pushdown, streamed_columns=[])
+                return results
+
+            profiles = profile["columns"]
+            streamed = [column for column in columns if profiles[column]["text_values"]]
+            pushed = [column for column in columns if not profiles[column]["text_values"]]
+            squares = SQLitePushdown.squared_deviations(
+                source,
+                {
+                    column: profiles[column]["total"] / profiles[column]["numeric_count"]
+                    for column in pushed if profiles[column]["numeric_count"]
+                },
+                config
+            )
+            frequencies = {column: SQLitePushdown.frequencies(source, column) for column in columns}
+
+            # ▲▲▲▲▲▲ Columnas con texto: estadísticos y tipos en Python por lotes, sin retener las filas ▲▲▲▲▲▲
+            streamed_profile = SQLitePushdown.streamed_statistics(
+                source, streamed, QualityRulesReader.get_typed_rules(config), source.fetch_size
+            ) if streamed else None
+
+        # ■■■■■■■■■■■■■ Estadísticos: agregados SQL más las columnas analizadas en Python ■■■■■■■■■■■■■
+        precision = numeric_rules.precision
+        statistical_analysis = {
+            "statistics": {
+                column: SQLitePushdown.statistics(profiles[column], squares[column], precision) for column in squares
+            },
+            "out_of_range": {},
+            "rules_applied": {
+                "precision": precision,
+                "min_value": numeric_rules.min_value,
+                "max_value": numeric_rules.max_value,
+                "allow_negative": numeric_rules.allow_negative
+            }
+        }
+        count_types = {"numerics": 0, "texts": 0, "booleans": 0, "others": 0}
+        for column in pushed:
+            count_types[SQLitePushdown.predominant_type(profiles[column], total_rows)] += 1
+        if streamed_profile is not None:
+            statistical_analysis["statistics"].update(streamed_profile["statistics"])
+            statistical_analysis["out_of_range"].update(streamed_profile["out_of_range"])
+            for kind, count in streamed_profile["count_types"].items():
+                count_types[kind] += count
+
+        null_analysis = {column: profiles[column]["nulls"] for column in columns}
+        uniqueness_analysis = UniquenessAnalyzer.uniqueness_from_counts(
+            {column: (frequencies[column]["singletons"], total_rows) for column in columns}, path_quality_rules
+        )
+        pushdown["pushed_columns"] = pushed
+        pushdown["streamed_columns"] = streamed
+        pushdown["distinct_counts"] = {column: frequencies[column]["distinct"] for column in columns}
+        pushdown["out_of_range_counts"] = {
+            column: profiles[column]["out_of_range"] if column in pushed
+            else streamed_profile["out_of_range_counts"][column]
+            for column in columns
+        }
+
+        return {
+            "timestamp": datetime.now().isoformat(),
+            "total_rows": total_rows,
+            "config_applied": {
+                "path_quality_rules": path_quality_rules,
+                "exclusions_applied": False,
+                "original_rows": total_rows,
+                "filtered_rows": total_rows
+            },
+            "null_analysis": null_analysis,
+            "uniqueness_analysis": uniqueness_analysis,
+            "statistical_analysis": statistical_analysis,
+            "count_types": count_types,
+            "alerts": QualityAuditor._alerts_from_analysis(
+                null_analysis,
+                uniqueness_analysis,
+                statistical_analysis,
+                total_rows,
+                QualityRulesReader.get_thresholds(config)
+            ),
+            "pushdown": pushdown
+        }
+
+    @staticmethod
+    def sample_audit(
+            filepath: str,
+            sample_size: int = DEFAULT_SAMPLE_SIZE,
+            method: str = "reservoir",
+            path_quality_rules: Optional[str] = None,
+            confidence: float = DEFAULT_CONFIDENCE,
+            seed: Optional[int] = 0,
+            source_config: Optional[dict[str, Any]] = None
+    ) -> dict[str, Any]:
+        """
+        Auditoría rápida sobre una muestra del archivo: porcentajes de nulos con intervalos de confianza (Wilson,
+        con corrección de población finita y efecto de diseño en el muestreo por bloques) y alertas marcadas
+        como estimaciones. La unicidad es una cifra de la muestra, sin intervalo: la proporción de valores que
+        aparecen una sola vez no es una proporción binomial y en la muestra tiende a ser mayor que en el archivo,
+        así que solo se alerta de unicidad baja
+        :param filepath: Ruta del archivo CSV
+        :param sample_size: Número de filas de la muestra
+        :param method: "reservoir", "systematic" o "block" (ver RowSampler)
+        :param path_quality_rules: Ruta opcional al archivo YAML de configuración
+        :param confidence: Nivel de confianza de los intervalos (0-1)
+        :param seed: Semilla del muestreo (None = no determinista)
+        :param source_config: Sección input.primary_source del pipeline para el lector (Opcional)
+        :return: Diccionario con muestreo aplicado, análisis de nulos y unicidad estimados y alertas
+        """
+        reader = JSONLinesReader.reader_for(filepath, source_config)
+        columns = QualityAuditor.required_columns(reader.read_headers(filepath), path_quality_rules)
+        sampled = RowSampler.sample(filepath, sample_size, method, seed, reader, columns)
+
+        config = QualityAuditor._load_configuration(path_quality_rules)
+        population = sampled["population_rows"]
+
+        # ■■■■■■■■■■■■■ Exclusiones por bloque para conservar los conglomerados del muestreo por bloques ■■■■■■■■■■■■■
+        blocks = RowSampler.split_blocks(sampled["rows"], sampled["block_sizes"])
+        blocks = [QualityAuditor._apply_exclusions(block, config) or list() for block in blocks]
+        sample = [row for block in blocks for row in block]
+        sample_rows = len(sample)
+
+        results = dict()
+        results["timestamp"] = datetime.now().isoformat()
+        results["total_rows"] = population
+        results["sampling"] = {
+            "estimated": True,
+            "method": sampled["method"],
+            "requested_method": method,
+            "sample_rows": sample_rows,
+            "population_rows": population,
+            "exact_population": sampled["exact_population"],
+            "confidence": confidence,
+            "seed": seed
+        }
+
+        # ■■■■■■■■■■■■■ Nulos: proporción de filas nulas por columna con su intervalo ■■■■■■■■■■■■■
+        block_nulls = [NullAnalyzer.count_nulls(block, path_quality_rules) for block in blocks] \
+            if len(blocks) > 1 else list()
+        block_sizes = [len(block) for block in blocks]
+        null_analysis = dict()
+        for column, nulls in NullAnalyzer.count_nulls(sample, path_quality_rules).items():
+            design_effect = RowSampler.design_effect([counts.get(column, 0) for counts in block_nulls], block_sizes) \
+                if block_nulls else 1.0
+            low, high = RowSampler.wilson_interval(nulls, sample_rows, confidence, population, design_effect)
+            null_analysis[column] = {
+                "null_count": nulls,
+                "null_percentage": round(nulls / sample_rows * 100.0, 2) if sample_rows else 0.0,
+                "ci_low": low,
+                "ci_high": high,
+                "design_effect": round(design_effect, 2)
+            }
+        results["null_analysis"] = null_analysis
+
+        # ■■■■■■■■■■■■■ Unicidad: valores que aparecen una sola vez en la muestra (cifra de la muestra) ■■■■■■■■■■■■■
+        uniqueness_analysis = dict()
+        for column, metrics in UniquenessAnalyzer.calculate_uniqueness(sample, path_quality_rules).items():
+            uniqueness_analysis[column] = dict(metrics, sample_only=True)
+        results["uniqueness_analysis"] = uniqueness_analysis
+
+        results["alerts"] = QualityAuditor._estimated_alerts(results, config)
+        return results
+
+    @staticmethod
+    def _estimated_alerts(results: dict[str, Any], config: dict[str, Any]) -> list[str]:
+        """
+        Genera alertas de nulos y unicidad a partir de una auditoría por muestreo, indicando que son estimaciones
+        :param results: Resultado parcial de sample_audit
+        :param config: Configuración cargada
+        :return: Lista de alertas
+        """
+        thresholds = QualityRulesReader.get_thresholds(config)
+        warning_thresholds = thresholds.get('warning', {})
+        critical_thresholds = thresholds.get('critical', {})
+        sampling = results["sampling"]
+        confidence_label = f"IC {round(sampling['confidence'] * 100)}%"
+        sample_label = f"muestra de {sampling['sample_rows']} filas"
+
+        alerts = list()
+        if not sampling["sample_rows"]:
+            return ["ESTIMACIÓN - ALERTA: La muestra no contiene filas para analizar"]
+
+        for column, metrics in results["null_analysis"].items():
+            percent_nulls = metrics["null_percentage"]
+            if percent_nulls >= critical_thresholds.get('null_percentage', 50.0):
+                alert_level = "CRÍTICA"
+            elif percent_nulls >= warning_thresholds.get('null_percentage', 25.0):
+                alert_level = "ADVERTENCIA"
+            else:
+                continue
+            alerts.append(
+                f"ESTIMACIÓN - {alert_level}: Columna '{column}' tiene ~{percent_nulls}% de valores nulos "
+                f"({confidence_label}: {metrics['ci_low']}%-{metrics['ci_high']}%, {sample_label})"
+            )
+
+        # ■■■■■■■■■■■■■ Unicidad: la cifra de la muestra sobrestima la del archivo, solo se alerta si es baja ■■■■■■■■■■■■■
+        for column, metrics in results["uniqueness_analysis"].items():
+            percent_uniqueness = metrics["uniqueness_percentage"]
+            if percent_uniqueness <= critical_thresholds.get('low_uniqueness', 5.0):
+                alert_level = "CRÍTICA"
+            elif percent_uniqueness <= warning_thresholds.get('low_uniqueness', 10.0):
+                alert_level = "ADVERTENCIA"
+            else:
+                continue
+            alerts.append(
+                f"ESTIMACIÓN - {alert_level}: Columna '{column}' tiene unicidad baja: {percent_uniqueness}% de "
+                f"valores únicos en la {sample_label} (sin intervalo de confianza)"
+            )
+        return alerts
+
+    @staticmethod
+    def required_columns(
+            headers: list[str],
+            path_quality_rules: Optional[str] = None,
+            birth_column_name: Optional[str] = None,
+            numerics_columns: Optional[list[str]] = None,
+            text_columns: Optional[list[str]] = None,
+            date_columns: Optional[list[str]] = None,
+            base_audit: bool = True
+    ) -> list[str]:
+        """
+        Calcula la proyección de columnas que necesitan los análisis configurados
+        La auditoría general usa todas las columnas salvo exclusions.columns_to_ignore; las columnas usadas
+        para excluir filas (exclude_values, exclude_columns, row_filters) se conservan siempre
+        :param headers: Encabezados del archivo
+        :param path_quality_rules: Ruta opcional al archivo YAML de configuración
+        :param birth_column_name: Columna especifica para analisis de coherencia de fechas
+        :param numerics_columns: Lista de columnas a tratar como numericas
+        :param text_columns: Lista de columnas a tratar como de texto
+        :param date_columns: Lista de columnas de fechas
+        :param base_audit: ¿Se ejecuta la auditoría general?
+        :return: Columnas a leer, en el orden del encabezado
+        """
+        config = QualityAuditor._load_configuration(path_quality_rules)
+        exclusion_rules = config.get('quality_rules', {}).get('exclusion_rules', {}) or {}
+        exclusions = QualityRulesReader.get_exclusions(config)
+
+        # ■■■■■■■■■■■■■ Columnas que deciden qué filas se excluyen ■■■■■■■■■■■■■
+        needed = set(exclusion_rules.get('exclude_columns', []) or [])
+        needed.update((exclusion_rules.get('exclude_values', {}) or {}).keys())
+        needed.update(rule.get('column') for rule in exclusions.get('row_filters', []) or [] if rule.get('column'))
+
+        # ■■■■■■■■■■■■■ Columnas de los análisis pedidos ■■■■■■■■■■■■■
+        if birth_column_name is not None and birth_column_name.strip():
+            needed.add(birth_column_name)
+        for requested in (numerics_columns, text_columns, date_columns):
+            needed.update(requested or [])
+
+        # ■■■■■■■■■■■■■ Auditoría general: todo salvo las columnas ignoradas ■■■■■■■■■■■■■
+        if base_audit:
+            ignored = set(exclusions.get('columns_to_ignore', []) or [])
+            needed.update(header for header in headers if header not in ignored)
+
+        return list(dict.fromkeys(header for header in headers if header in needed))
+
     @staticmethod
     def get_general_metrics(data: RowDataType) -> dict[str, int]:
         """
@@ -243,7 +780,6 @@ class QualityAuditor:
         :param path_quality_rules: Ruta opcional al archivo YAML de configuración
         :return: Diccionario con alertas y umbrales aplicados
         """
-        alerts = list()
         if data is None or not data:
             return {"alerts": ["ALERTA: No hay datos para analizar"], "thresholds_applied": {}}
 
@@ -251,6 +787,36 @@ class QualityAuditor:
         config = QualityAuditor._load_configuration(path_quality_rules)
         thresholds = QualityRulesReader.get_thresholds(config)
 
+        # ■■■■■■■■■■■■■ Aplicar exclusiones antes de análisis ■■■■■■■■■■■■■
+        filtered_data = QualityAuditor._apply_exclusions(data, config)
+
+        return QualityAuditor._alerts_from_analysis(
+            NullAnalyzer.count_nulls(filtered_data, path_quality_rules),
+            UniquenessAnalyzer.calculate_uniqueness(filtered_data, path_quality_rules),
+            StatisticalAnalyzer.summary_stadistic(filtered_data, path_quality_rules),
+            len(filtered_data),
+            thresholds
+        )
+
+    @staticmethod
+    def _alerts_from_analysis(
+            null_result: dict[str, Any],
+            uniqueness_result: dict[str, Any],
+            statistical_result: dict[str, Any],
+            total_rows: int,
+            thresholds: dict[str, Any]
+    ) -> dict[str, Any]:
+        """
+        Genera las alertas de generate_alerts a partir de análisis ya calculados (en Python o agregados en SQL)
+        :param null_result: Resultado de NullAnalyzer.count_nulls
+        :param uniqueness_result: Resultado de UniquenessAnalyzer.calculate_uniqueness
+        :param statistical_result: Resultado de StatisticalAnalyzer.summary_stadistic
+        :param total_rows: Filas analizadas tras las exclusiones
+        :param thresholds: Umbrales de QualityRulesReader.get_thresholds
+        :return: Diccionario con alertas y umbrales aplicados
+        """
+        alerts = list()
+
         # ■■■■■■■■■■■■■ Extraer umbrales para alertas ■■■■■■■■■■■■■
         warning_thresholds = thresholds.get('warning', {})
         critical_thresholds = thresholds.get('critical', {})
@@ -270,13 +836,8 @@ class QualityAuditor:
             }
         }
 
-        # ■■■■■■■■■■■■■ Aplicar exclusiones antes de análisis ■■■■■■■■■■■■■
-        filtered_data = QualityAuditor._apply_exclusions(data, config)
-
         # ■■■■■■■■■■■■■ Analisis de nulos con umbrales configurados ■■■■■■■■■■■■■
-        null_result = NullAnalyzer.count_nulls(filtered_data, path_quality_rules)
         count_nulls = null_result.get("null_counts", {})
-        total_rows = len(filtered_data)
 
         for column in count_nulls.keys():
             nulls = count_nulls[column]
@@ -298,7 +859,6 @@ class QualityAuditor:
             alerts.append(message)
 
         # ■■■■■■■■■■■■■ Analisis de unicidad con umbrales configurados ■■■■■■■■■■■■■
-        uniqueness_result = UniquenessAnalyzer.calculate_uniqueness(filtered_data, path_quality_rules)
         uniqueness = uniqueness_result.get("uniqueness_percentages", {})
 
         for column in uniqueness.keys():
@@ -332,7 +892,6 @@ class QualityAuditor:
             alerts.append(message)
 
         # ■■■■■■■■■■■■■ Alertas adicionales basadas en análisis estadístico ■■■■■■■■■■■■■
-        statistical_result = StatisticalAnalyzer.summary_stadistic(filtered_data, path_quality_rules)
         out_of_range = statistical_result.get("out_of_range", {})
 
         for column, violations in out_of_range.items():
@@ -363,7 +922,7 @@ class QualityAuditor:
         """
         if path_quality_rules:
             try:
-                return QualityRulesReader.load_configs(path_quality_rules)
+                return QualityRulesReader.load_snapshot(path_quality_rules).config
             except (FileNotFoundError, ValueError, Exception):
                 # ■■■■■■■■■■■■■ Si hay error, usar valores por defecto ■■■■■■■■■■■■■
                 pass
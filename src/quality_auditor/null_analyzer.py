@@ -10,6 +10,7 @@ DESCRIPCIÓN: Proporciona función para contar valores nulos por columna
 from typing import Any, Optional
 from utils.data_parser import DataParser
 from readers.quality_rules_reader import QualityRulesReader
+from readers.typed_rules import NullRules
 
 # ⋮⋮⋮⋮⋮⋮⋮⋮ ALIAS de estructura datos ⋮⋮⋮⋮⋮⋮⋮⋮
 RowDataType = list[dict[str, Any]]
@@ -55,16 +56,15 @@ class NullAnalyzer:
         return nulls
 
     @staticmethod
-    def _get_null_rules(path_quality_rules: Optional[str]) -> dict[str, Any]:
+    def _get_null_rules(path_quality_rules: Optional[str]) -> NullRules:
         """
         Obtiene las reglas de nulos desde configuración o valores por defecto
         :param path_quality_rules: Ruta opcional al archivo YAML de configuración
-        :return: Diccionario con reglas de nulos
+        :return: Reglas de nulos tipadas
         """
         if path_quality_rules:
             try:
-                config = QualityRulesReader.load_configs(path_quality_rules)
-                return QualityRulesReader.get_data_type_rules(config, 'null')
+                return QualityRulesReader.load_rules(path_quality_rules).null
             except (FileNotFoundError, ValueError, Exception):
 
                 # ■■■■■■■■■■■■■ Si hay error, usar valores por defecto ■■■■■■■■■■■■■
@@ -72,4 +72,4 @@ class NullAnalyzer:
         
         # ■■■■■■■■■■■■■ Valores por defecto si no hay configuración ■■■■■■■■■■■■■
         default_config = QualityRulesReader.apply_default_rules()
-        return QualityRulesReader.get_data_type_rules(default_config, 'null')
\ No newline at end of file
+        return QualityRulesReader.get_typed_rules(default_config).null
\ No newline at end of file
@@ -0,0 +1,156 @@
+"""
+■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+MÓDULO:      Monitor secuencial de nulos
+AUTOR:       Fisherk2
+FECHA:       2026-10-19
+DESCRIPCIÓN: Decide durante la lectura si el porcentaje de nulos de una columna supera el umbral crítico
+■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+"""
+import math
+from typing import Any, Iterable, Optional, Union
+
+from utils.data_parser import DataParser
+from utils.row_sampler import RowSampler
+from readers.typed_rules import NullRules
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ Valores por defecto de la parada temprana ⋮⋮⋮⋮⋮⋮⋮⋮
+DEFAULT_FAIL_FAST_CONFIDENCE = 0.99
+DEFAULT_CHECK_ROWS = 10000
+DEFAULT_MIN_ROWS = 100
+
+
+class SequentialNullMonitor:
+    """
+    Acumula conteos de nulos por columna lote a lote y decide la alerta crítica en cuanto es segura:
+    - certain: los nulos ya vistos superan el umbral aunque el resto de filas no tuviera ninguno
+    - sequential: el límite inferior del intervalo de Wilson (con corrección de población finita) supera
+      el umbral; el presupuesto de error 1 - confidence se reparte entre todas las comprobaciones (Bonferroni
+      sobre las previstas si se conoce el total de filas, o 6/(pi^2 k^2) para la comprobación k si no, con el
+      gasto acumulado acotado al presupuesto) y, en cada comprobación, entre las columnas (Bonferroni), por lo
+      que mirar tras cada lote y vigilar varias columnas no aumenta la probabilidad de una parada errónea
+    La prueba secuencial supone que las filas leídas son intercambiables con las restantes, pero se leen en el
+    orden del archivo: en archivos ordenados o anexados por tiempo, el prefijo puede no representar el total y
+    la parada sequential puede ser errónea. Con confidence = 1.0 solo se aplica la decisión certain
+    """
+
+    __slots__ = (
+        "threshold", "population", "confidence", "null_rules", "min_rows", "rows", "nulls", "looks",
+        "_planned_looks", "_spent"
+    )
+
+    def __init__(
+            self,
+            threshold: float,
+            population: Optional[int],
+            null_rules: Union[NullRules, dict[str, Any]],
+            confidence: float = DEFAULT_FAIL_FAST_CONFIDENCE,
+            check_rows: int = DEFAULT_CHECK_ROWS,
+            min_rows: int = DEFAULT_MIN_ROWS
+    ):
+        """
+        :param threshold: Umbral crítico de porcentaje de nulos
+        :param population: Número máximo de filas del archivo (CSVReader.count_rows) o None si no se conoce
+        :param null_rules: Reglas de nulos de la configuración (DataParser.is_null_value)
+        :param confidence: Confianza global exigida a una parada secuencial (0-1)
+        :param check_rows: Filas entre comprobaciones (fija el número de comprobaciones previstas)
+        :param min_rows: Filas mínimas antes de aplicar la prueba secuencial
+        """
+        self.threshold = threshold
+        self.population = population if population is not None and population > 0 else None
+        self.confidence = confidence
+        self.null_rules = NullRules.coerce(null_rules)
+        self.min_rows = min_rows
+        self.rows = 0
+        self.nulls: dict[str, int] = dict()
+        self.looks = 0
+        self._planned_looks = math.ceil(self.population / max(check_rows, 1)) if self.population else None
+        self._spent = 0.0
+
+    def add(self, rows: Iterable[dict[str, Any]]) -> Optional[dict[str, Any]]:
+        """
+        Registra un lote de filas (ya filtradas por las exclusiones) y comprueba si hay una decisión
+        :param rows: Filas como diccionarios
+        :return: Decisión de check() o None
+        """
+        nulls = self.nulls
+        null_rules = self.null_rules
+        for row in rows:
+            self.rows += 1
+            for column, value in row.items():
+                if column not in nulls:
+                    nulls[column] = 0
+                if DataParser.is_null_value(value, null_rules):
+                    nulls[column] += 1
+        return self.check()
+
+    def check(self) -> Optional[dict[str, Any]]:
+        """
+        Busca la primera columna cuyo porcentaje final de nulos ya no puede quedar bajo el umbral
+        :return: Diccionario con columna, tipo de decisión y métricas, o None si nada está decidido
+        """
+        if not self.rows:
+            return None
+        self.looks += 1
+        alpha = self._alpha()
+
+        for column, nulls in self.nulls.items():
+            observed = round(nulls / self.rows * 100.0, 2)
+
+            # ■■■■■■■■■■■■■ Cota determinista: el resto de filas como no nulas ■■■■■■■■■■■■■
+            guaranteed = nulls / self.population * 100.0 if self.population else 0.0
+            if guaranteed >= self.threshold:
+                return self._decision(column, "certain", nulls, observed, round(guaranteed, 2))
+
+            # ■■■■■■■■■■■■■ Prueba secuencial unilateral sobre las filas vistas ■■■■■■■■■■■■■
+            if alpha <= 0.0 or self.rows < self.min_rows or observed < self.threshold:
+                continue
+            lower, _ = RowSampler.wilson_interval(nulls, self.rows, 1.0 - 2 * alpha, self.population)
+            if lower >= self.threshold:
+                return self._decision(column, "sequential", nulls, observed, lower)
+        return None
+
+    def _alpha(self) -> float:
+        """
+        Probabilidad de error asignada a cada columna en la comprobación actual
+        :return: Nivel de significación unilateral de esta comprobación por columna (0 si el presupuesto se agotó)
+        """
+        budget = max(1.0 - self.confidence, 0.0)
+        if self._planned_looks is not None and self.looks <= self._planned_looks:
+            look_alpha = budget / self._planned_looks
+        else:
+            look_alpha = budget * 6.0 / (math.pi ** 2 * self.looks ** 2)
+
+        # ■■■■■■■■■■■■■ Gasto acumulado acotado al presupuesto y repartido entre columnas ■■■■■■■■■■■■■
+        look_alpha = min(look_alpha, max(budget - self._spent, 0.0))
+        self._spent += look_alpha
+        return look_alpha / max(len(self.nulls), 1)
+
+    def _decision(
+            self,
+            column: str,
+            decision: str,
+            nulls: int,
+            observed: float,
+            lower_bound: float
+    ) -> dict[str, Any]:
+        """
+        Construye el diccionario de una decisión de parada
+        :param column: Columna que supera el umbral
+        :param decision: "certain" o "sequential"
+        :param nulls: Nulos vistos en la columna
+        :param observed: Porcentaje de nulos en las filas vistas
+        :param lower_bound: Cota inferior del porcentaje final
+        :return: Diccionario con la decisión
+        """
+        return {
+            "triggered": True,
+            "column": column,
+            "decision": decision,
+            "null_count": nulls,
+            "rows_scanned": self.rows,
+            "population_rows": self.population,
+            "null_percentage_observed": observed,
+            "lower_bound": lower_bound,
+            "threshold": self.threshold,
+            "confidence": 1.0 if decision == "certain" else self.confidence
+        }
@@ -0,0 +1,419 @@
+"""
+■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+MÓDULO:      Agregados de calidad en SQLite
+AUTOR:       Fisherk2
+FECHA:       2026-10-19
+DESCRIPCIÓN: Traduce los predicados de DataParser a agregados SQL (nulos, unicidad, estadísticos) sobre SQLite
+■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+"""
+import math
+from typing import Any, Iterable, Optional
+
+from readers.quality_rules_reader import QualityRulesReader
+from readers.sqlite_source import SQLiteSource
+from readers.typed_rules import DataTypeRules, NumericRules
+from utils.data_parser import DataParser
+from utils.value_cache import ColumnValueCache
+from quality_auditor.statistical_analyzer import StatisticalAnalyzer
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ Caracteres que elimina str.strip() (trim de SQLite solo quita espacios por defecto) ⋮⋮⋮⋮⋮⋮⋮⋮
+PYTHON_WHITESPACE = (
+    "\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680\u2000\u2001\u2002\u2003\u2004\u2005\u2006"
+    "\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000"
+)
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ Columnas perfiladas por sentencia (SQLite limita las columnas de un SELECT) ⋮⋮⋮⋮⋮⋮⋮⋮
+PROFILE_COLUMNS_PER_QUERY = 100
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ Nombre de la función lower() de Python registrada en la conexión ⋮⋮⋮⋮⋮⋮⋮⋮
+PYTHON_LOWER_FUNCTION = "py_lower"
+
+
+class SQLitePushdown:
+    """
+    Calcula en SQLite los mismos conteos que los analizadores sobre las filas de SQLiteSource.read_rows
+    - Nulos: NULL o texto cuyo lower(trim()) está en las interpretaciones de nulo (DataParser.is_null_value)
+    - Unicidad: valores que aparecen una sola vez y distintos con GROUP BY sobre el texto de la columna
+    - Estadísticos y tipo predominante: solo en columnas sin valores almacenados como texto, donde cada celda
+      es NULL o un número y las reglas numéricas se evalúan como comparaciones SQL; las columnas con texto
+      quedan para el análisis en Python (clasificar float() sobre texto arbitrario no tiene equivalente SQL)
+    """
+
+    @staticmethod
+    def profile(source: SQLiteSource, columns: list[str], config: dict[str, Any]) -> dict[str, Any]:
+        """
+        Perfil de las columnas con un recorrido de la tabla por cada grupo de PROFILE_COLUMNS_PER_QUERY columnas
+        :param source: Tabla SQLite
+        :param columns: Columnas a perfilar
+        :param config: Configuración cargada
+        :return: Diccionario con "total_rows" y, por columna en "columns": nulls, text_values, numeric_count,
+                 minimum, maximum, total, negative_count, text_count, boolean_count y out_of_range
+        """
+        conditions = SQLitePushdown._conditions(source, config)
+        fields = (
+            "nulls", "text_values", "numeric_count", "minimum", "maximum", "total", "negative_count",
+            "text_count", "boolean_count", "out_of_range"
+        )
+
+        total_rows = 0
+        profiles = dict()
+        for start in range(0, max(len(columns), 1), PROFILE_COLUMNS_PER_QUERY):
+            group = columns[start:start + PROFILE_COLUMNS_PER_QUERY]
+            expressions = ["COUNT(*)"]
+            for column in group:
+                expressions.extend(SQLitePushdown._column_expressions(column, conditions))
+            values = source.aggregate(expressions)
+            total_rows = values[0]
+
+            # ▲▲▲▲▲▲ SUM sobre una tabla vacía es NULL: los conteos quedan en 0 ▲▲▲▲▲▲
+            for position, column in enumerate(group):
+                row = values[1 + position * len(fields):1 + (position + 1) * len(fields)]
+                profile = dict(zip(fields, row))
+                for field in ("nulls", "text_values", "numeric_count", "negative_count", "text_count",
+                              "boolean_count", "out_of_range"):
+                    profile[field] = profile[field] or 0
+                profiles[column] = profile
+
+        return {"total_rows": total_rows, "columns": profiles}
+
+    @staticmethod
+    def squared_deviations(
+            source: SQLiteSource,
+            means: dict[str, float],
+            config: dict[str, Any]
+    ) -> dict[str, float]:
+        """
+        Suma de cuadrados respecto a la media de los valores numéricos válidos de cada columna (segunda pasada,
+        igual que StatisticalAnalyzer.summary_stadistic)
+        :param source: Tabla SQLite
+        :param means: Diccionario columna -> media
+        :param config: Configuración cargada
+        :return: Diccionario columna -> suma de cuadrados
+        """
+        if not means:
+            return dict()
+        conditions = SQLitePushdown._conditions(source, config)
+        expressions = list()
+        for column, mean in means.items():
+            quoted = SQLiteSource.quote_identifier(column)
+            deviation = f"({quoted} - {SQLitePushdown._literal(mean)})"
+            expressions.append(
+                f"TOTAL(CASE WHEN {conditions['numeric'](quoted)} THEN {deviation} * {deviation} END)"
+            )
+        return dict(zip(means, source.aggregate(expressions)))
+
+    @staticmethod
+    def frequencies(source: SQLiteSource, column: str) -> dict[str, int]:
+        """
+        Valores distintos y valores que aparecen una sola vez en una columna (NULL cuenta como un valor,
+        igual que en el Counter de UniquenessAnalyzer)
+        :param source: Tabla SQLite
+        :param column: Columna a contar
+        :return: Diccionario con "distinct" y "singletons"
+        """
+        sql = (
+            f"SELECT COUNT(*), TOTAL(frequency = 1) FROM (SELECT COUNT(*) AS frequency "
+            f"FROM {SQLiteSource.quote_identifier(source.table)} GROUP BY {SQLiteSource.text_expression(column)})"
+        )
+        distinct, singletons = source.execute(sql).fetchone()
+        return {"distinct": distinct, "singletons": int(singletons)}
+
+    @staticmethod
+    def statistics(profile: dict[str, Any], squares_sum: float, precision: int) -> dict[str, Any]:
+        """
+        Estadísticos de una columna en el formato de StatisticalAnalyzer.summary_stadistic
+        :param profile: Perfil de la columna (profile)
+        :param squares_sum: Suma de cuadrados respecto a la media (squared_deviations)
+        :param precision: Decimales de redondeo
+        :return: Diccionario de estadísticos
+        """
+        count = profile["numeric_count"]
+        average = profile["total"] / count
+        variance = squares_sum / (count - 1) if count > 1 else 0.0
+        return {
+            "minimum": round(float(profile["minimum"]), precision),
+            "maximum": round(float(profile["maximum"]), precision),
+            "average": round(average, precision),
+            "sum": round(profile["total"], precision),
+            "count": count,
+            "standard_deviation": round(math.sqrt(variance), precision),
+            "has_negatives": profile["negative_count"] > 0,
+            "negative_count": profile["negative_count"]
+        }
+
+    @staticmethod
+    def streamed_statistics(
+            source: SQLiteSource,
+            columns: list[str],
+            type_rules: DataTypeRules,
+            batch_size: int
+    ) -> dict[str, Any]:
+        """
+        Estadísticos, valores fuera de rango y tipo predominante de las columnas con texto, leídas por lotes
+        (fetchmany) en dos pasadas: sumas, extremos y conteos, y después la suma de cuadrados respecto a la
+        media, igual que StatisticalAnalyzer.summary_stadistic y count_by_type pero sin retener las filas
+        :param source: Tabla SQLite
+        :param columns: Columnas a analizar (en el orden de la tabla)
+        :param type_rules: Reglas tipadas de la configuración
+        :param batch_size: Filas por lote
+        :return: Diccionario con "statistics", "out_of_range" (row_index = posición de la fila en la tabla),
+                 "count_types" y "out_of_range_counts" (ver out_of_range_count)
+        """
+        numeric_rules = type_rules.numeric
+        min_value = numeric_rules.min_value
+        max_value = numeric_rules.max_value
+        value_cache = ColumnValueCache()
+        tallies = {
+            column: {"total": 0, "numeric": 0, "text": 0, "boolean": 0, "sum": 0.0, "minimum": None,
+                     "maximum": None, "negatives": 0, "out_of_range": list(), "out_of_range_count": 0}
+            for column in columns
+        }
+
+        # ■■■■■■■■■■■■■ Primera pasada: conteos por tipo, suma, extremos y fuera de rango ■■■■■■■■■■■■■
+        row_offset = 0
+        for batch in source.read_batches(batch_size, columnar=True, columns=columns):
+            for column, values in zip(columns, batch):
+                tally = tallies[column]
+                column_cache = value_cache.for_column(column)
+                tally["total"] += len(values)
+                tally["out_of_range_count"] += SQLitePushdown.out_of_range_count(values, numeric_rules)
+                for position, value in enumerate(values):
+                    tag, number = DataParser.classify_value(value, type_rules, column_cache)
+                    if tag != "numeric":
+                        if tag in ("text", "boolean"):
+                            tally[tag] += 1
+                        continue
+                    tally["numeric"] += 1
+                    tally["sum"] += number
+                    if tally["minimum"] is None or number < tally["minimum"]:
+                        tally["minimum"] = number
+                    if tally["maximum"] is None or number > tally["maximum"]:
+                        tally["maximum"] = number
+                    if number < 0:
+                        tally["negatives"] += 1
+                    if StatisticalAnalyzer._is_out_of_range(number, min_value, max_value):
+                        tally["out_of_range"].append({
+                            "row_index": row_offset + position,
+                            "value": number,
+                            "reason": StatisticalAnalyzer._get_out_of_range_reason(number, min_value, max_value)
+                        })
+            row_offset += len(batch[0]) if batch else 0
+
+        # ■■■■■■■■■■■■■ Segunda pasada: suma de cuadrados respecto a la media ■■■■■■■■■■■■■
+        means = {column: tally["sum"] / tally["numeric"] for column, tally in tallies.items() if tally["numeric"] > 1}
+        squares = {column: 0.0 for column in means}
+        if means:
+            for batch in source.read_batches(batch_size, columnar=True, columns=columns):
+                for column, values in zip(columns, batch):
+                    if column not in means:
+                        continue
+                    mean = means[column]
+                    column_cache = value_cache.for_column(column)
+                    squares_sum = squares[column]
+                    for value in values:
+                        tag, number = DataParser.classify_value(value, type_rules, column_cache)
+                        if tag == "numeric":
+                            difference = number - mean
+                            squares_sum += difference * difference
+                    squares[column] = squares_sum
+
+        precision = numeric_rules.precision
+        statistics = dict()
+        out_of_range = dict()
+        count_types = {"numerics": 0, "texts": 0, "booleans": 0, "others": 0}
+        for column, tally in tallies.items():
+            if tally["total"]:
+                threshold = tally["total"] / 2.0
+                if tally["numeric"] >= threshold:
+                    count_types["numerics"] += 1
+                elif tally["text"] >= threshold:
+                    count_types["texts"] += 1
+                elif tally["boolean"] >= threshold:
+                    count_types["booleans"] += 1
+                else:
+                    count_types["others"] += 1
+            if not tally["numeric"]:
+                continue
+            count = tally["numeric"]
+            variance = squares[column] / (count - 1) if count > 1 else 0.0
+            statistics[column] = {
+                "minimum": round(tally["minimum"], precision),
+                "maximum": round(tally["maximum"], precision),
+                "average": round(tally["sum"] / count, precision),
+                "sum": round(tally["sum"], precision),
+                "count": count,
+                "standard_deviation": round(math.sqrt(variance), precision),
+                "has_negatives": tally["negatives"] > 0,
+                "negative_count": tally["negatives"]
+            }
+            if tally["out_of_range"]:
+                out_of_range[column] = tally["out_of_range"]
+
+        return {
+            "statistics": statistics,
+            "out_of_range": out_of_range,
+            "count_types": count_types,
+            "out_of_range_counts": {column: tally["out_of_range_count"] for column, tally in tallies.items()}
+        }
+
+    @staticmethod
+    def predominant_type(profile: dict[str, Any], total_rows: int) -> str:
+        """
+        Tipo predominante (más de la mitad de las filas) con las reglas de StatisticalAnalyzer.count_by_type
+        :param profile: Perfil de la columna (profile)
+        :param total_rows: Filas de la tabla
+        :return: "numerics", "texts", "booleans" u "others"
+        """
+        threshold = total_rows / 2.0
+        if profile["numeric_count"] >= threshold:
+            return "numerics"
+        if profile["text_count"] >= threshold:
+            return "texts"
+        if profile["boolean_count"] >= threshold:
+            return "booleans"
+        return "others"
+
+    @staticmethod
+    def out_of_range_count(values: Iterable[Any], numeric_rules: NumericRules) -> int:
+        """
+        Valores numéricos fuera de [min_value, max_value] entre valores ya leídos (columnas no agregadas en SQL)
+        :param values: Valores de la columna
+        :param numeric_rules: Reglas numéricas de la configuración
+        :return: Número de valores fuera de rango
+        """
+        min_value = numeric_rules.min_value
+        max_value = numeric_rules.max_value
+        if min_value is None and max_value is None:
+            return 0
+        count = 0
+        for value in values:
+            if DataParser.is_numeric_value(value):
+                number = float(value)
+                if (min_value is not None and number < min_value) or (max_value is not None and number > max_value):
+                    count += 1
+        return count
+
+    @staticmethod
+    def _column_expressions(column: str, conditions: dict[str, Any]) -> list[str]:
+        """
+        Expresiones de agregado del perfil de una columna, en el orden de los campos de profile
+        :param column: Nombre de la columna
+        :param conditions: Condiciones SQL de las reglas (_conditions)
+        :return: Lista de expresiones
+        """
+        quoted = SQLiteSource.quote_identifier(column)
+        text = SQLiteSource.text_expression(column)
+        numeric = conditions["numeric"](quoted)
+        is_text = conditions["text"](text)
+
+        # ▲▲▲▲▲▲ CASE evalúa de forma perezosa (AND no): el texto solo se calcula para números fuera de reglas ▲▲▲▲▲▲
+        not_numeric = f"CASE WHEN {quoted} IS NULL OR {numeric} THEN 0"
+        return [
+            f"SUM({conditions['null'](quoted)})",
+            f"SUM(typeof({quoted}) IN ('text', 'blob'))",
+            f"SUM({numeric})",
+            f"MIN(CASE WHEN {numeric} THEN {quoted} END)",
+            f"MAX(CASE WHEN {numeric} THEN {quoted} END)",
+            f"TOTAL(CASE WHEN {numeric} THEN {quoted} END)",
+            f"SUM({numeric} AND {quoted} < 0)",
+            f"SUM({not_numeric} ELSE {is_text} END)",
+            f"SUM({not_numeric} WHEN {is_text} THEN 0 ELSE {conditions['boolean'](quoted)} END)",
+            f"SUM({conditions['out_of_range'](quoted)})"
+        ]
+
+    @staticmethod
+    def _conditions(source: SQLiteSource, config: dict[str, Any]) -> dict[str, Any]:
+        """
+        Traduce las reglas de tipos a constructores de condiciones SQL
+        :param source: Tabla SQLite (registra lower() de Python si las interpretaciones no son ASCII)
+        :param config: Configuración cargada
+        :return: Diccionario de funciones expresión -> condición: null, boolean, numeric, text y out_of_range
+        """
+        rules = QualityRulesReader.get_typed_rules(config)
+        numeric_rules = rules.numeric
+        text_rules = rules.text
+        null_tokens = sorted(rules.null.supported_interpretations, key=str)
+        boolean_tokens = list(rules.boolean.supported_interpretations)
+        lower = SQLitePushdown._lower_function(source, list(null_tokens) + list(boolean_tokens))
+        whitespace = SQLitePushdown._literal(PYTHON_WHITESPACE)
+
+        def token_condition(tokens: list[Any]):
+
+            # ▲▲▲▲▲▲ El texto de un número no lleva espacios: solo se compara con las interpretaciones numéricas ▲▲▲▲▲▲
+            literals = ", ".join(SQLitePushdown._literal(token) for token in tokens)
+            numeric_literals = ", ".join(
+                SQLitePushdown._literal(token) for token in tokens
+                if isinstance(token, str) and DataParser.is_numeric_value(token)
+            )
+            return lambda quoted: (
+                f"CASE typeof({quoted}) WHEN 'null' THEN 1 "
+                f"WHEN 'text' THEN {lower}(trim({quoted}, {whitespace})) IN ({literals}) "
+                f"WHEN 'blob' THEN {lower}(trim(CAST({quoted} AS TEXT), {whitespace})) IN ({literals}) "
+                f"ELSE {f'lower(CAST({quoted} AS TEXT)) IN ({numeric_literals})' if numeric_literals else '0'} END"
+            )
+
+        # ■■■■■■■■■■■■■ Número válido: almacenado como número y dentro de las reglas (is_numeric_value) ■■■■■■■■■■■■■
+        numeric_checks = list()
+        bounds = list()
+        if not numeric_rules.allow_negative:
+            numeric_checks.append("{0} >= 0")
+        if numeric_rules.min_value is not None:
+            bounds.append("{0} < " + SQLitePushdown._literal(numeric_rules.min_value))
+            numeric_checks.append("{0} >= " + SQLitePushdown._literal(numeric_rules.min_value))
+        if numeric_rules.max_value is not None:
+            bounds.append("{0} > " + SQLitePushdown._literal(numeric_rules.max_value))
+            numeric_checks.append("{0} <= " + SQLitePushdown._literal(numeric_rules.max_value))
+        stored_number = "typeof({0}) IN ('integer', 'real')"
+        numeric_template = " AND ".join([stored_number] + numeric_checks)
+        out_of_range_template = f"{stored_number} AND ({' OR '.join(bounds)})" if bounds else "0"
+
+        # ■■■■■■■■■■■■■ Texto válido para un número: solo cuentan las reglas de longitud (is_string_value) ■■■■■■■■■■■■■
+        text_checks = ["length({0}) >= " + SQLitePushdown._literal(text_rules.min_length)]
+        if text_rules.max_length is not None:
+            text_checks.append("length({0}) <= " + SQLitePushdown._literal(text_rules.max_length))
+        text_template = " AND ".join(text_checks)
+
+        return {
+            "null": token_condition(null_tokens),
+            "boolean": token_condition(boolean_tokens),
+            "numeric": lambda quoted: f"({numeric_template.format(quoted)})",
+            "text": lambda text: f"({text_template.format(text)})",
+            "out_of_range": lambda quoted: f"({out_of_range_template.format(quoted)})"
+        }
+
+    @staticmethod
+    def _lower_function(source: SQLiteSource, tokens: list[Any]) -> str:
+        """
+        Función de minúsculas a usar: lower() de SQLite solo convierte ASCII, así que si alguna interpretación
+        no es ASCII (o contiene "k", destino del signo Kelvin) se registra str.lower de Python
+        :param source: Tabla SQLite
+        :param tokens: Interpretaciones de nulos y booleanos
+        :return: Nombre de la función SQL
+        """
+        if all(not isinstance(token, str) or (token.isascii() and "k" not in token) for token in tokens):
+            return "lower"
+        source.connect().create_function(
+            PYTHON_LOWER_FUNCTION, 1, lambda value: value.lower() if isinstance(value, str) else value,
+            deterministic=True
+        )
+        return PYTHON_LOWER_FUNCTION
+
+    @staticmethod
+    def _literal(value: Optional[Any]) -> str:
+        """
+        Literal SQL de una regla de configuración
+        :param value: Cadena, número o None
+        :return: Literal SQL
+        """
+        if value is None:
+            return "NULL"
+        if isinstance(value, str):
+            return "'" + value.replace("'", "''") + "'"
+        if isinstance(value, bool):
+            return "1" if value else "0"
+        if isinstance(value, int):
+            return str(value)
+        number = float(value)
+        if math.isinf(number):
+            return "9e999" if number > 0 else "-9e999"
+        return repr(number)
@@ -9,7 +9,9 @@ DESCRIPCIÓN: Proporciona funciones para resumen estadístico (min, max, promedi
 import math
 from typing import Any, Optional
 from utils.data_parser import DataParser
+from utils.value_cache import ColumnValueCache
 from readers.quality_rules_reader import QualityRulesReader
+from readers.typed_rules import DataTypeRules
 
 # ⋮⋮⋮⋮⋮⋮⋮⋮ ALIAS de estructura datos ⋮⋮⋮⋮⋮⋮⋮⋮
 RowDataType = list[dict[str, Any]]
@@ -34,11 +36,11 @@ class StatisticalAnalyzer:
             return {"statistics": {}, "out_of_range": {}, "rules_applied": {}}
 
         # ■■■■■■■■■■■■ Cargar configuración de números ■■■■■■■■■■■■■
-        numeric_rules = StatisticalAnalyzer._get_numeric_rules(path_quality_rules)
-        precision = numeric_rules.get('precision', 2)
-        min_value = numeric_rules.get('min_value')
-        max_value = numeric_rules.get('max_value')
-        allow_negative = numeric_rules.get('allow_negative', True)
+        type_rules = StatisticalAnalyzer._get_all_data_type_rules(path_quality_rules)
+        precision = type_rules.numeric.precision
+        min_value = type_rules.numeric.min_value
+        max_value = type_rules.numeric.max_value
+        allow_negative = type_rules.numeric.allow_negative
 
         # ■■■■■■■■■■■■ Guardar reglas aplicadas ■■■■■■■■■■■■■
         rules_applied = {
@@ -56,17 +58,19 @@ class StatisticalAnalyzer:
 
         results = dict()
         out_of_range = dict()
+        value_cache = ColumnValueCache()
 
         for column in all_columns:
             numeric_values = list()
             out_of_range_values = list()
+            column_cache = value_cache.for_column(column)
 
             # ▲▲▲▲▲▲ Recoger valores numericos de la columna ▲▲▲▲▲▲
             for row in data:
                 if column in row.keys():
                     value = row[column]
-                    if DataParser.is_numeric_value(value, numeric_rules):
-                        numeric_value = float(value)
+                    tag, numeric_value = DataParser.classify_value(value, type_rules, column_cache)
+                    if tag == "numeric":
                         numeric_values.append(numeric_value)
 
                         # ▲▲▲▲▲▲ Verificar si está fuera de rango ▲▲▲▲▲▲
@@ -148,9 +152,7 @@ class StatisticalAnalyzer:
 
         # ■■■■■■■■■■■■■ Obtener reglas de configuración ■■■■■■■■■■■■■
         all_rules = StatisticalAnalyzer._get_all_data_type_rules(path_quality_rules)
-        numeric_rules = all_rules.get('numeric', {})
-        text_rules = all_rules.get('text', {})
-        boolean_rules = all_rules.get('boolean', {})
+        value_cache = ColumnValueCache()
 
         # ■■■■■■■■■■■■■ Obtener todas las columnas posibles ■■■■■■■■■■■■■
         all_columns = set()
@@ -170,17 +172,19 @@ class StatisticalAnalyzer:
             count_text = 0
             count_booleans = 0
             count_total = 0
+            column_cache = value_cache.for_column(column)
 
             for row in data:
                 if column in row.keys():
                     value = row[column]
                     count_total += 1
 
-                    if DataParser.is_numeric_value(value, numeric_rules):
+                    tag, _ = DataParser.classify_value(value, all_rules, column_cache)
+                    if tag == "numeric":
                         count_numeric += 1
-                    elif DataParser.is_string_value(value, text_rules):
+                    elif tag == "text":
                         count_text += 1
-                    elif DataParser.is_bool_value(value, boolean_rules):
+                    elif tag == "boolean":
                         count_booleans += 1
 
             # ▲▲▲▲▲▲ Determinar tipo predominante (más del 50%) ▲▲▲▲▲▲
@@ -209,8 +213,8 @@ class StatisticalAnalyzer:
             return dict()
 
         # ■■■■■■■■■■■■■ Obtener reglas de configuración para números ■■■■■■■■■■■■■
-        all_rules = StatisticalAnalyzer._get_all_data_type_rules(path_quality_rules)
-        numeric_rules = all_rules.get('numeric', {})
+        type_rules = StatisticalAnalyzer._get_all_data_type_rules(path_quality_rules)
+        value_cache = ColumnValueCache()
 
         # ■■■■■■■■■■■■■ Obtener todas las columnas posibles ■■■■■■■■■■■■■
         all_columns = set()
@@ -221,38 +225,20 @@ class StatisticalAnalyzer:
         numerics_values = dict()
         for column in all_columns:
             numeric_list = list()
+            column_cache = value_cache.for_column(column)
 
             for row in data:
                 if column in row.keys():
                     value = row[column]
-                    if DataParser.is_numeric_value(value, numeric_rules):
-                        numeric_list.append(float(value))
+                    tag, numeric_value = DataParser.classify_value(value, type_rules, column_cache)
+                    if tag == "numeric":
+                        numeric_list.append(numeric_value)
 
             if numeric_list:
                 numerics_values[column] = numeric_list
 
         return numerics_values
 
-    @staticmethod
-    def _get_numeric_rules(path_quality_rules: Optional[str]) -> dict[str, Any]:
-        """
-        Obtiene las reglas de números desde configuración o valores por defecto
-        :param path_quality_rules: Ruta opcional al archivo YAML de configuración
-        :return: Diccionario con reglas de números
-        """
-        if path_quality_rules:
-            try:
-                config = QualityRulesReader.load_configs(path_quality_rules)
-                return QualityRulesReader.get_data_type_rules(config, 'numeric')
-            except (FileNotFoundError, ValueError, Exception):
-
-                # ■■■■■■■■■■■■■ Si hay error, usar valores por defecto ■■■■■■■■■■■■■
-                pass
-
-        # ■■■■■■■■■■■■■ Valores por defecto si no hay configuración ■■■■■■■■■■■■■
-        default_config = QualityRulesReader.apply_default_rules()
-        return QualityRulesReader.get_data_type_rules(default_config, 'numeric')
-
     @staticmethod
     def _is_out_of_range(value: float, min_value: Optional[float], max_value: Optional[float]) -> bool:
         """
@@ -284,17 +270,15 @@ class StatisticalAnalyzer:
         return "unknown"
 
     @staticmethod
-    def _get_all_data_type_rules(path_quality_rules: Optional[str] = None) -> dict[str, dict[str, Any]]:
+    def _get_all_data_type_rules(path_quality_rules: Optional[str] = None) -> DataTypeRules:
         """
         Obtiene todas las reglas de tipos de datos desde configuración o valores por defecto
         :param path_quality_rules: Ruta opcional al archivo YAML de configuración
-        :return: Diccionario con reglas para cada tipo de dato
+        :return: Reglas tipadas de cada tipo de dato (clave del clasificador compilado de DataParser)
         """
         if path_quality_rules:
             try:
-                config = QualityRulesReader.load_configs(path_quality_rules)
-                data_type_rules = config.get('quality_rules', {}).get('data_type_rules', {})
-                return data_type_rules
+                return QualityRulesReader.load_rules(path_quality_rules)
             except (FileNotFoundError, ValueError, Exception):
 
                 # ■■■■■■■■■■■■■ Si hay error, usar valores por defecto ■■■■■■■■■■■■■
@@ -302,4 +286,4 @@ class StatisticalAnalyzer:
 
         # ■■■■■■■■■■■■■ Valores por defecto si no hay configuración ■■■■■■■■■■■■■
         default_config = QualityRulesReader.apply_default_rules()
-        return default_config.get('quality_rules', {}).get('data_type_rules', {})
+        return QualityRulesReader.get_typed_rules(default_config)
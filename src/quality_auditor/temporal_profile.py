@@ -0,0 +1,173 @@
+"""
+■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+MÓDULO:      Perfil temporal de columnas de fecha
+AUTOR:       Fisherk2
+FECHA:       2026-10-19
+DESCRIPCIÓN: Acumulador combinable de frescura, volúmenes por periodo, huecos y picos de una columna de fechas
+■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+"""
+from collections import Counter
+from datetime import date, datetime
+from statistics import median
+from typing import Any, Optional
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ Granularidades soportadas para huecos y picos ⋮⋮⋮⋮⋮⋮⋮⋮
+GRANULARITIES = ("day", "week", "month")
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ Valores por defecto del resumen ⋮⋮⋮⋮⋮⋮⋮⋮
+DEFAULT_SPIKE_FACTOR = 3.0
+DEFAULT_MAX_GAPS = 20
+
+
+class TemporalProfile:
+    """
+    Perfil temporal acumulado en streaming para una columna de fechas
+    Solo guarda conteos por ordinal de día (entero); semanas y meses se derivan de los días distintos
+    al resumir, por lo que el coste por fila es un incremento en un Counter
+    Dos perfiles de trozos distintos del mismo archivo se combinan con merge()
+    """
+
+    __slots__ = ("day_counts", "latest", "total")
+
+    def __init__(self):
+        self.day_counts: Counter = Counter()
+        self.latest: Optional[datetime] = None
+        self.total = 0
+
+    def add(self, value: datetime, ordinal: Optional[int] = None):
+        """
+        Registra una fecha ya parseada
+        :param value: Fecha parseada
+        :param ordinal: Ordinal de día ya calculado (Opcional, evita recalcularlo)
+        :return:
+        """
+        self.day_counts[ordinal if ordinal is not None else value.toordinal()] += 1
+        self.total += 1
+        if self.latest is None or value > self.latest:
+            self.latest = value
+
+    def merge(self, other: "TemporalProfile") -> "TemporalProfile":
+        """
+        Combina en este perfil los conteos de otro (p. ej. de otro trozo del archivo)
+        :param other: Perfil a combinar
+        :return: Este mismo perfil, ya combinado
+        """
+        self.day_counts.update(other.day_counts)
+        self.total += other.total
+        if other.latest is not None and (self.latest is None or other.latest > self.latest):
+            self.latest = other.latest
+        return self
+
+    def summary(
+            self,
+            reference_time: Optional[datetime] = None,
+            granularity: str = "day",
+            spike_factor: float = DEFAULT_SPIKE_FACTOR,
+            max_gaps: int = DEFAULT_MAX_GAPS
+    ) -> dict[str, Any]:
+        """
+        Resume el perfil: rango, frescura, volúmenes por periodo, huecos y picos
+        :param reference_time: Momento de referencia para la frescura (por defecto, ahora)
+        :param granularity: Periodo usado para huecos y picos ("day", "week" o "month")
+        :param spike_factor: Un periodo es pico si supera spike_factor veces la mediana de periodos con datos
+        :param max_gaps: Número máximo de huecos listados (se priorizan los más largos)
+        :return: Diccionario con el perfil temporal
+        """
+        if granularity not in GRANULARITIES:
+            raise ValueError(f"Granularidad no soportada: {granularity}. Use una de {GRANULARITIES}")
+
+        summary = {
+            "total": self.total,
+            "min_date": None,
+            "max_date": None,
+            "latest": None,
+            "freshness_lag_days": None,
+            "freshness_lag_hours": None,
+            "counts_per_day": {},
+            "counts_per_week": {},
+            "counts_per_month": {},
+            "granularity": granularity,
+            "gaps": [],
+            "gap_count": 0,
+            "missing_periods": 0,
+            "spikes": []
+        }
+        if not self.day_counts:
+            return summary
+
+        # ■■■■■■■■■■■■■ Rango y frescura respecto a la referencia ■■■■■■■■■■■■■
+        reference = reference_time if reference_time is not None else datetime.now()
+        first_ordinal = min(self.day_counts)
+        last_ordinal = max(self.day_counts)
+        summary["min_date"] = date.fromordinal(first_ordinal).isoformat()
+        summary["max_date"] = date.fromordinal(last_ordinal).isoformat()
+        summary["latest"] = self.latest.isoformat(sep=" ")
+        summary["freshness_lag_days"] = reference.toordinal() - last_ordinal
+        summary["freshness_lag_hours"] = round((reference - self.latest).total_seconds() / 3600, 2)
+
+        # ■■■■■■■■■■■■■ Cubos enteros por semana y mes derivados de los días distintos ■■■■■■■■■■■■■
+        week_counts = Counter()
+        month_counts = Counter()
+        for ordinal, count in self.day_counts.items():
+            week_counts[(ordinal - 1) // 7] += count
+            day = date.fromordinal(ordinal)
+            month_counts[day.year * 12 + day.month - 1] += count
+
+        buckets = {"day": self.day_counts, "week": week_counts, "month": month_counts}
+        summary["counts_per_day"] = {
+            TemporalProfile._label(key, "day"): self.day_counts[key] for key in sorted(self.day_counts)
+        }
+        summary["counts_per_week"] = {
+            TemporalProfile._label(key, "week"): week_counts[key] for key in sorted(week_counts)
+        }
+        summary["counts_per_month"] = {
+            TemporalProfile._label(key, "month"): month_counts[key] for key in sorted(month_counts)
+        }
+
+        # ■■■■■■■■■■■■■ Huecos: saltos entre claves consecutivas del periodo elegido ■■■■■■■■■■■■■
+        counts = buckets[granularity]
+        keys = sorted(counts)
+        gaps = list()
+        for previous, current in zip(keys, keys[1:]):
+            if current - previous > 1:
+                gaps.append((previous + 1, current - 1))
+        summary["gap_count"] = len(gaps)
+        summary["missing_periods"] = sum(end - start + 1 for start, end in gaps)
+        longest = sorted(gaps, key=lambda gap: gap[1] - gap[0], reverse=True)[:max_gaps]
+        summary["gaps"] = [
+            {
+                "from": TemporalProfile._label(start, granularity),
+                "to": TemporalProfile._label(end, granularity),
+                "periods": end - start + 1
+            }
+            for start, end in sorted(longest)
+        ]
+
+        # ■■■■■■■■■■■■■ Picos: periodos muy por encima de la mediana ■■■■■■■■■■■■■
+        typical = median(counts.values())
+        threshold = typical * spike_factor
+        summary["spikes"] = [
+            {"period": TemporalProfile._label(key, granularity), "count": counts[key], "median": typical}
+            for key in keys if counts[key] > threshold
+        ]
+
+        return summary
+
+    @staticmethod
+    def _label(key: int, granularity: str) -> str:
+        """
+        Convierte la clave entera de un periodo en su etiqueta legible
+        :param key: Ordinal de día, índice de semana (lunes a domingo) o índice de mes (año * 12 + mes - 1)
+        :param granularity: Tipo de periodo
+        :return: "YYYY-MM-DD", "YYYY-Www" (semana ISO) o "YYYY-MM"
+        """
+        if granularity == "day":
+            return date.fromordinal(key).isoformat()
+        if granularity == "week":
+            iso = date.fromordinal(key * 7 + 1).isocalendar()
+            return f"{iso[0]}-W{iso[1]:02d}"
+        year, month_index = divmod(key, 12)
+        return f"{year:04d}-{month_index + 1:02d}"
+
+    def __len__(self) -> int:
+        return self.total
@@ -89,6 +89,31 @@ class UniquenessAnalyzer:
 
         return unique_result
 
+    @staticmethod
+    def uniqueness_from_counts(
+            column_counts: dict[str, tuple[int, int]],
+            path_quality_rules: Optional[str] = None
+    ) -> UniquenessResultType:
+        """
+        Construye el resultado de calculate_uniqueness a partir de conteos ya calculados por columna
+        (p. ej. sobre una instantánea columnar), con la misma clasificación por umbrales
+        :param column_counts: Diccionario columna -> (valores que aparecen una sola vez, total de valores)
+        :param path_quality_rules: Ruta opcional al archivo YAML de configuración
+        :return: Diccionario extendido con unicidad y clasificación por columna
+        """
+        thresholds = UniquenessAnalyzer._get_uniqueness_thresholds(path_quality_rules)
+        unique_result = dict()
+        for column, (unique_values, total_values) in column_counts.items():
+            unique_percent_rounded = round(unique_values / total_values * 100.0, 2) if total_values else 0.0
+            unique_result[column] = {
+                'uniqueness_percentage': unique_percent_rounded,
+                'classification': UniquenessAnalyzer._classify_uniqueness(unique_percent_rounded, thresholds)
+                if total_values else 'normal',
+                'unique_values': unique_values,
+                'total_values': total_values
+            }
+        return unique_result
+
     @staticmethod
     def get_unique_details(datos: RowDataType) -> MetricValuesType:
         """
@@ -152,7 +177,7 @@ class UniquenessAnalyzer:
         """
         if path_quality_rules:
             try:
-                config = QualityRulesReader.load_configs(path_quality_rules)
+                config = QualityRulesReader.load_snapshot(path_quality_rules).config
                 general_rules = QualityRulesReader.get_general_rules(config)
                 return {
                     'min_uniqueness_percentage': general_rules.get('min_uniqueness_percentage', 5.0),
@@ -0,0 +1,539 @@
+"""
+■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+MÓDULO:      Instantánea columnar binaria
+AUTOR:       Fisherk2
+FECHA:       2026-10-19
+DESCRIPCIÓN: Convierte un CSV una sola vez a un fichero columnar (array tipado, diccionario, bitmap de nulos)
+             que se relee con mmap y memoryview sin volver a tokenizar ni parsear
+■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+"""
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections import Counter
+from typing import Any, Iterator, Optional
+
+from .csv_reader import CSVReader, DEFAULT_BATCH_SIZE
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ Firma, versión y cola del fichero (desplazamiento y longitud del pie JSON) ⋮⋮⋮⋮⋮⋮⋮⋮
+SNAPSHOT_MAGIC = b"CSVSNAP1"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_SUFFIX = ".snap"
+TRAILER_FORMAT = "<QQ8s"
+TRAILER_SIZE = struct.calcsize(TRAILER_FORMAT)
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ Alineación de secciones (permite memoryview.cast sobre el mapa) ⋮⋮⋮⋮⋮⋮⋮⋮
+SECTION_ALIGNMENT = 8
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ Rango de enteros almacenables como 'q' ⋮⋮⋮⋮⋮⋮⋮⋮
+INT64_MIN = -2 ** 63
+INT64_MAX = 2 ** 63 - 1
+
+
+class ColumnarSnapshot:
+    """
+    Lectura de una instantánea columnar con mmap: cada columna es una vista memoryview sin copia
+    Tipos de columna:
+    - int / float: array tipado ('q' / 'd') cuando todos los valores tienen forma canónica (str(int(v)) == v,
+      repr(float(v)) == v), por lo que el texto original se reconstruye exacto; el bitmap marca las celdas ''
+      y las ausentes (None, fila corta), que el pie enumera aparte en "absent_rows"
+    - dict: códigos ('B', 'H' o 'I') sobre un diccionario de cadenas distintas; el código 0 es la celda
+      ausente (None, fila corta) y el bitmap marca esas celdas
+    El pie JSON guarda por columna tipo, secciones, nulos, distintos y mínimo/máximo
+    """
+
+    __slots__ = ("path", "footer", "headers", "rows", "columns", "_file", "_map", "_view", "_dictionaries")
+
+    def __init__(self, path: str):
+        """
+        :param path: Ruta de la instantánea
+        """
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Instantánea vacía o inválida: {path}")
+        self._view = memoryview(self._map)
+        self._dictionaries: dict[str, list[Optional[str]]] = dict()
+
+        # ■■■■■■■■■■■■■ Cola fija al final: localiza el pie JSON ■■■■■■■■■■■■■
+        if len(self._map) < len(SNAPSHOT_MAGIC) + TRAILER_SIZE or self._map[:len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC:
+            self.close()
+            raise ValueError(f"No es una instantánea columnar: {path}")
+        footer_offset, footer_length, magic = struct.unpack(TRAILER_FORMAT, self._map[-TRAILER_SIZE:])
+        if magic != SNAPSHOT_MAGIC:
+            self.close()
+            raise ValueError(f"Instantánea truncada: {path}")
+        self.footer: dict[str, Any] = json.loads(bytes(self._view[footer_offset:footer_offset + footer_length]))
+        if self.footer.get("version") != SNAPSHOT_VERSION:
+            self.close()
+            raise ValueError(f"Versión de instantánea no soportada: {self.footer.get('version')}")
+
+        self.headers: list[str] = self.footer["headers"]
+        self.rows: int = self.footer["rows"]
+        self.columns: dict[str, dict[str, Any]] = self.footer["columns"]
+
+    def __enter__(self) -> "ColumnarSnapshot":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Libera el mapa de memoria (si quedan vistas de columnas vivas, se libera al recolectarlas)
+        :return:
+        """
+        self._dictionaries = dict()
+        try:
+            if self._view is not None:
+                self._view.release()
+            self._map.close()
+        except BufferError:
+            pass
+        self._view = None
+        self._file.close()
+
+    # ■■■■■■■■■■■■■ Escritura ■■■■■■■■■■■■■
+
+    @staticmethod
+    def write(
+            filepath: str,
+            snapshot_path: Optional[str] = None,
+            reader: Optional[CSVReader] = None,
+            batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> str:
+        """
+        Convierte un CSV (comprimido o no) en una instantánea columnar leyéndolo una sola vez por lotes
+        Las filas usan la semántica de CSVReader.read_rows: filas en blanco omitidas, filas cortas con None,
+        encabezados duplicados con el último valor y valores sobrantes descartados
+        :param filepath: Ruta del archivo CSV
+        :param snapshot_path: Ruta de salida (por defecto <csv>.snap)
+        :param reader: Lector CSV con la configuración de la fuente (Opcional)
+        :param batch_size: Filas por lote de lectura
+        :return: Ruta de la instantánea escrita
+        """
+        reader = reader if reader is not None else CSVReader()
+        if not reader.has_headers:
+            raise ValueError("La instantánea columnar requiere un archivo con encabezados")
+        snapshot_path = snapshot_path if snapshot_path is not None else ColumnarSnapshot.snapshot_path(filepath)
+        headers = reader.read_headers(filepath)
+        if not headers:
+            raise ValueError(f"El archivo no tiene encabezados: {filepath}")
+
+        # ■■■■■■■■■■■■■ Una columna por encabezado distinto, en su última posición (como csv.DictReader) ■■■■■■■■■■■■■
+        last_position = {header: position for position, header in enumerate(headers)}
+        builders = {header: _ColumnBuilder() for header in last_position}
+        rows = 0
+        for batch in reader.read_batches(filepath, batch_size, columnar=True):
+            for header, position in last_position.items():
+                builders[header].extend(batch[position])
+            rows += len(batch[0]) if batch else 0
+
+        stat = os.stat(filepath)
+        footer = {
+            "version": SNAPSHOT_VERSION,
+            "byteorder": sys.byteorder,
+            "rows": rows,
+            "headers": list(last_position),
+            "columns": dict(),
+            "source": {"path": os.path.abspath(filepath), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        }
+
+        temporary_path = snapshot_path + ".tmp"
+        with open(temporary_path, 'wb') as file:
+            file.write(SNAPSHOT_MAGIC)
+            for header, builder in builders.items():
+                footer["columns"][header] = builder.write(file, rows)
+            footer_offset = file.tell()
+            footer_bytes = json.dumps(footer, ensure_ascii=False).encode('utf-8')
+            file.write(footer_bytes)
+            file.write(struct.pack(TRAILER_FORMAT, footer_offset, len(footer_bytes), SNAPSHOT_MAGIC))
+
+        # ▲▲▲▲▲▲ Sustitución atómica: un lector nunca ve una instantánea a medio escribir ▲▲▲▲▲▲
+        os.replace(temporary_path, snapshot_path)
+        return snapshot_path
+
+    @staticmethod
+    def snapshot_path(filepath: str) -> str:
+        """
+        Ruta por defecto de la instantánea de un CSV
+        :param filepath: Ruta del archivo CSV
+        :return: Ruta <csv>.snap
+        """
+        return filepath + SNAPSHOT_SUFFIX
+
+    @staticmethod
+    def open_for(filepath: str) -> Optional["ColumnarSnapshot"]:
+        """
+        Abre la instantánea por defecto de un CSV si existe y sigue correspondiendo al archivo (tamaño y fecha)
+        :param filepath: Ruta del archivo CSV
+        :return: Instantánea abierta o None si no existe o está desactualizada
+        """
+        path = ColumnarSnapshot.snapshot_path(filepath)
+        if not os.path.exists(path) or not os.path.exists(filepath):
+            return None
+        try:
+            snapshot = ColumnarSnapshot(path)
+        except ValueError:
+            return None
+        stat = os.stat(filepath)
+        source = snapshot.footer.get("source", {})
+        if source.get("size") != stat.st_size or source.get("mtime_ns") != stat.st_mtime_ns:
+            snapshot.close()
+            return None
+        return snapshot
+
+    # ■■■■■■■■■■■■■ Acceso por columna ■■■■■■■■■■■■■
+
+    def values(self, column: str) -> memoryview:
+        """
+        Vista sin copia de los valores tipados (int/float) o de los códigos de diccionario (dict)
+        :param column: Nombre de la columna
+        :return: memoryview con el formato del array ('q', 'd', 'B', 'H' o 'I')
+        """
+        offset, length, typecode = self.columns[column]["values"]
+        view = self._view[offset:offset + length].cast(typecode)
+        if self.footer["byteorder"] == sys.byteorder:
+            return view
+
+        # ▲▲▲▲▲▲ Instantánea de otra arquitectura: copia con los bytes invertidos ▲▲▲▲▲▲
+        swapped = array(typecode)
+        swapped.frombytes(view.cast('B'))
+        swapped.byteswap()
+        return memoryview(swapped)
+
+    def null_bitmap(self, column: str) -> memoryview:
+        """
+        Vista sin copia del bitmap de nulos (bit i del byte i // 8, orden little-endian)
+        Marca '' y None (celda ausente) en columnas int/float y solo None en columnas dict
+        :param column: Nombre de la columna
+        :return: memoryview de bytes
+        """
+        offset, length = self.columns[column]["nulls"]
+        return self._view[offset:offset + length]
+
+    def is_null(self, column: str, row: int) -> bool:
+        """
+        Consulta el bitmap de nulos de una celda
+        :param column: Nombre de la columna
+        :param row: Índice de fila (0 = primera fila de datos)
+        :return: ¿La celda está marcada en el bitmap?
+        """
+        return bool(self.null_bitmap(column)[row >> 3] & (1 << (row & 7)))
+
+    def dictionary(self, column: str) -> list[Optional[str]]:
+        """
+        Cadenas distintas de una columna dict (decodificadas una vez y cacheadas); la entrada 0 es None
+        :param column: Nombre de la columna
+        :return: Lista de valores indexada por código
+        """
+        if column not in self._dictionaries:
+            meta = self.columns[column]
+            if meta["kind"] != "dict":
+                raise ValueError(f"La columna '{column}' no está codificada con diccionario")
+            offsets_offset, offsets_length = meta["dictionary_offsets"]
+            data_offset, data_length = meta["dictionary_data"]
+            offsets = array('Q')
+            offsets.frombytes(self._view[offsets_offset:offsets_offset + offsets_length])
+            if self.footer["byteorder"] != sys.byteorder:
+                offsets.byteswap()
+            data = bytes(self._view[data_offset:data_offset + data_length])
+            entries: list[Optional[str]] = [None]
+            entries.extend(data[start:end].decode('utf-8') for start, end in zip(offsets[1:], offsets[2:]))
+            self._dictionaries[column] = entries
+        return self._dictionaries[column]
+
+    def column_text(self, column: str) -> list[Optional[str]]:
+        """
+        Reconstruye los valores originales de una columna como texto (None en celdas ausentes)
+        :param column: Nombre de la columna
+        :return: Lista de valores, uno por fila
+        """
+        kind = self.columns[column]["kind"]
+        values = self.values(column)
+        if kind == "dict":
+            entries = self.dictionary(column)
+            return [entries[code] for code in values]
+
+        to_text = str if kind == "int" else repr
+        text = [to_text(value) for value in values]
+        for row in self._marked_rows(self.null_bitmap(column)):
+            text[row] = ""
+        for row in self.columns[column]["absent_rows"]:
+            text[row] = None
+        return text
+
+    def value_counts(self, column: str) -> Counter:
+        """
+        Frecuencia de cada valor original de la columna, contando sobre los códigos o los valores tipados
+        (la conversión a texto se hace una vez por valor distinto, no por fila)
+        :param column: Nombre de la columna
+        :return: Counter valor original -> número de filas
+        """
+        meta = self.columns[column]
+        counts = Counter(self.values(column))
+        if meta["kind"] == "dict":
+            entries = self.dictionary(column)
+            return Counter({entries[code]: count for code, count in counts.items()})
+
+        # ■■■■■■■■■■■■■ Las celdas '' y ausentes guardan 0 como relleno: se descuentan de ese valor ■■■■■■■■■■■■■
+        marked = meta["null_count"]
+        absent = len(meta["absent_rows"])
+        placeholder = 0 if meta["kind"] == "int" else 0.0
+        if marked:
+            counts[placeholder] -= marked
+            if counts[placeholder] <= 0:
+                del counts[placeholder]
+        to_text = str if meta["kind"] == "int" else repr
+        text_counts = Counter({to_text(value): count for value, count in counts.items()})
+        if marked > absent:
+            text_counts[""] = marked - absent
+        if absent:
+            text_counts[None] = absent
+        return text_counts
+
+    def iter_rows(self, columns: Optional[list[str]] = None) -> Iterator[dict[str, Optional[str]]]:
+        """
+        Filas como diccionarios con la misma forma que CSVReader.read_rows
+        :param columns: Columnas a incluir (Opcional, por defecto todas)
+        :return: Iterador de filas
+        """
+        names = [header for header in self.headers if columns is None or header in columns]
+        texts = [self.column_text(name) for name in names]
+        for values in zip(*texts):
+            yield dict(zip(names, values))
+
+    def stats(self, column: str) -> dict[str, Any]:
+        """
+        Metadatos del pie de una columna: tipo, nulos del bitmap, distintos y mínimo/máximo
+        :param column: Nombre de la columna
+        :return: Diccionario con kind, null_count, distinct, min y max
+        """
+        meta = self.columns[column]
+        return {key: meta[key] for key in ("kind", "null_count", "distinct", "min", "max")}
+
+    @staticmethod
+    def _marked_rows(bitmap: memoryview) -> Iterator[int]:
+        """
+        Índices de fila con el bit activo en un bitmap
+        :param bitmap: Bitmap de nulos
+        :return: Iterador de índices
+        """
+        for byte_index, byte in enumerate(bitmap):
+            if byte:
+                for bit in range(8):
+                    if byte & (1 << bit):
+                        yield byte_index * 8 + bit
+
+
+class _ColumnBuilder:
+    """
+    Acumula una columna durante la escritura: empieza como array tipado según el primer valor no vacío
+    y pasa a diccionario en cuanto aparece un valor sin forma canónica
+    """
+
+    __slots__ = (
+        "kind", "typed", "null_rows", "absent_rows", "mapping", "entries", "codes", "minimum", "maximum", "rows"
+    )
+
+    def __init__(self):
+        self.kind: Optional[str] = None
+        self.typed = array('q')
+        self.null_rows: list[int] = list()
+        self.absent_rows: list[int] = list()
+        self.mapping: dict[Optional[str], int] = dict()
+        self.entries: list[Optional[str]] = list()
+        self.codes = array('I')
+        self.minimum = None
+        self.maximum = None
+        self.rows = 0
+
+    def extend(self, values: list[Optional[str]]):
+        """
+        Añade los valores de un lote
+        :param values: Valores de la columna en el lote (None = celda ausente)
+        :return:
+        """
+        for value in values:
+            if self.kind == "dict":
+                self._add_code(value)
+            elif value == "" or value is None:
+                self.null_rows.append(self.rows)
+                if value is None:
+                    self.absent_rows.append(self.rows)
+                self.typed.append(0)
+            else:
+                parsed = self._parse_typed(value)
+                if parsed is None:
+                    self._to_dictionary()
+                    self._add_code(value)
+                else:
+                    self.typed.append(parsed)
+                    if self.minimum is None or parsed < self.minimum:
+                        self.minimum = parsed
+                    if self.maximum is None or parsed > self.maximum:
+                        self.maximum = parsed
+            self.rows += 1
+
+    def write(self, file, rows: int) -> dict[str, Any]:
+        """
+        Escribe las secciones de la columna y devuelve sus metadatos para el pie
+        :param file: Fichero binario de salida
+        :param rows: Filas totales de la instantánea
+        :return: Metadatos de la columna
+        """
+        kind = self.kind if self.kind is not None else "int"
+        bitmap = bytearray((rows + 7) // 8)
+        for row in self.null_rows:
+            bitmap[row >> 3] |= 1 << (row & 7)
+
+        if kind == "dict":
+            typecode = 'B' if len(self.entries) <= 0xFF else 'H' if len(self.entries) <= 0xFFFF else 'I'
+            values = array(typecode, self.codes)
+            present = [entry for entry in self.entries if entry is not None]
+            meta = {
+                "kind": kind,
+                "distinct": len(present),
+                "min": min(present) if present else None,
+                "max": max(present) if present else None
+            }
+        else:
+            values = self.typed
+            meta = {
+                "kind": kind,
+                "distinct": len(self._present_values()),
+                "min": self.minimum,
+                "max": self.maximum
+            }
+        meta["null_count"] = len(self.null_rows)
+        meta["absent_rows"] = self.absent_rows if kind != "dict" else []
+        meta["values"] = [*_write_section(file, values.tobytes()), values.typecode]
+        meta["nulls"] = list(_write_section(file, bytes(bitmap)))
+
+        # ■■■■■■■■■■■■■ Diccionario: desplazamientos ('Q') y cadenas UTF-8 concatenadas ■■■■■■■■■■■■■
+        if kind == "dict":
+            encoded = [entry.encode('utf-8') if entry is not None else b"" for entry in self.entries]
+            offsets = array('Q', [0])
+            for entry in encoded:
+                offsets.append(offsets[-1] + len(entry))
+            meta["dictionary_offsets"] = list(_write_section(file, offsets.tobytes()))
+            meta["dictionary_data"] = list(_write_section(file, b"".join(encoded)))
+        return meta
+
+    def _present_values(self) -> set:
+        """
+        Valores tipados de las celdas no vacías
+        :return: Conjunto de valores
+        """
+        if not self.null_rows:
+            return set(self.typed)
+        empty = set(self.null_rows)
+        return {value for row, value in enumerate(self.typed) if row not in empty}
+
+    def _parse_typed(self, value: Optional[str]) -> Optional[Any]:
+        """
+        Parsea el valor al tipo de la columna si tiene forma canónica (el texto se puede reconstruir exacto)
+        :param value: Valor original no vacío
+        :return: Valor tipado o None si la columna debe pasar a diccionario
+        """
+        if self.kind is None:
+            parsed = _canonical_int(value)
+            if parsed is not None:
+                self.kind = "int"
+                return parsed
+            parsed = _canonical_float(value)
+            if parsed is not None:
+                self.kind = "float"
+                self.typed = array('d', self.typed)
+                return parsed
+            return None
+        return _canonical_int(value) if self.kind == "int" else _canonical_float(value)
+
+    def _to_dictionary(self):
+        """
+        Convierte lo acumulado como array tipado a códigos de diccionario reconstruyendo el texto original
+        :return:
+        """
+        to_text = repr if self.kind == "float" else str
+        empty = set(self.null_rows)
+        absent = set(self.absent_rows)
+        typed = self.typed
+        self.kind = "dict"
+        self.typed = array('q')
+        self.null_rows = list()
+        self.absent_rows = list()
+        self.mapping = {None: 0}
+        self.entries = [None]
+        self.codes = array('I')
+        for row, value in enumerate(typed):
+            if row in absent:
+                self._add_code(None, row)
+            else:
+                self._add_code("" if row in empty else to_text(value), row)
+
+    def _add_code(self, value: Optional[str], row: Optional[int] = None):
+        """
+        Añade el código de un valor, registrándolo en el diccionario si es nuevo
+        :param value: Valor original (None = celda ausente)
+        :param row: Índice de la fila (por defecto, la actual)
+        :return:
+        """
+        code = self.mapping.get(value)
+        if code is None:
+            code = len(self.entries)
+            self.mapping[value] = code
+            self.entries.append(value)
+        if value is None:
+            self.null_rows.append(self.rows if row is None else row)
+        self.codes.append(code)
+
+
+def _canonical_int(value: str) -> Optional[int]:
+    """
+    Entero cuyo texto es exactamente str(int(valor)) y cabe en 64 bits
+    :param value: Texto a evaluar
+    :return: Entero o None
+    """
+    try:
+        parsed = int(value)
+    except ValueError:
+        return None
+    if INT64_MIN <= parsed <= INT64_MAX and str(parsed) == value:
+        return parsed
+    return None
+
+
+def _canonical_float(value: str) -> Optional[float]:
+    """
+    Flotante finito cuyo texto es exactamente repr(float(valor)) (sin -0.0, que Counter confunde con 0.0)
+    :param value: Texto a evaluar
+    :return: Flotante o None
+    """
+    try:
+        parsed = float(value)
+    except ValueError:
+        return None
+    if parsed != parsed or parsed in (float("inf"), float("-inf")) or value == "-0.0" or repr(parsed) != value:
+        return None
+    return parsed
+
+
+def _write_section(file, data: bytes) -> tuple[int, int]:
+    """
+    Escribe una sección alineada a SECTION_ALIGNMENT bytes
+    :param file: Fichero binario de salida
+    :param data: Contenido de la sección
+    :return: Tupla (desplazamiento, longitud)
+    """
+    padding = -file.tell() % SECTION_ALIGNMENT
+    if padding:
+        file.write(b"\0" * padding)
+    offset = file.tell()
+    file.write(data)
+    return offset, len(data)
@@ -0,0 +1,262 @@
+"""
+■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+MÓDULO:      Entrada comprimida transparente
+AUTOR:       Fisherk2
+FECHA:       2026-10-19
+DESCRIPCIÓN: Detecta y abre ficheros gzip, bz2, xz y zip como flujos de texto, descomprimiendo en segundo plano
+■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+"""
+import bz2
+import gzip
+import io
+import locale
+import lzma
+import queue
+import threading
+import zipfile
+import zlib
+from typing import IO, Optional
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ Firmas (magic bytes) y extensiones de cada formato ⋮⋮⋮⋮⋮⋮⋮⋮
+MAGIC_BYTES = (
+    (b"\x1f\x8b", "gzip"),
+    (b"BZh", "bz2"),
+    (b"\xfd7zXZ\x00", "xz"),
+    (b"PK\x03\x04", "zip")
+)
+EXTENSIONS = {
+    ".gz": "gzip",
+    ".gzip": "gzip",
+    ".bz2": "bz2",
+    ".xz": "xz",
+    ".lzma": "xz",
+    ".zip": "zip"
+}
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ Bloques descomprimidos por lectura y bloques en cola por adelantado ⋮⋮⋮⋮⋮⋮⋮⋮
+DEFAULT_BLOCK_SIZE = 1024 * 1024
+DEFAULT_QUEUE_SIZE = 4
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ Errores de flujo comprimido corrupto o truncado (se informan como ValueError) ⋮⋮⋮⋮⋮⋮⋮⋮
+CORRUPTED_STREAM_ERRORS = (EOFError, zlib.error, lzma.LZMAError, zipfile.BadZipFile, gzip.BadGzipFile)
+
+
+class CompressedInput:
+    """
+    Apertura transparente de ficheros CSV comprimidos
+    El formato se detecta por los primeros bytes del fichero y, si no coinciden, por la extensión
+    """
+
+    @staticmethod
+    def detect(filepath: str) -> Optional[str]:
+        """
+        Detecta el formato de compresión de un fichero
+        :param filepath: Ruta absoluta o relativa del fichero
+        :return: "gzip", "bz2", "xz", "zip" o None si no está comprimido
+        """
+        with open(filepath, 'rb') as file:
+            head = file.read(6)
+        for magic, compression in MAGIC_BYTES:
+            if head.startswith(magic):
+                return compression
+
+        # ■■■■■■■■■■■■■ Sin firma reconocible: decide la extensión (fichero vacío o truncado) ■■■■■■■■■■■■■
+        lower_path = filepath.lower()
+        for extension, compression in EXTENSIONS.items():
+            if lower_path.endswith(extension) and head:
+                return compression
+        return None
+
+    @staticmethod
+    def open_binary(filepath: str, compression: Optional[str] = None) -> IO[bytes]:
+        """
+        Abre el fichero como flujo binario ya descomprimido
+        :param filepath: Ruta absoluta o relativa del fichero
+        :param compression: Formato ya detectado (Opcional, por defecto se detecta)
+        :return: Flujo binario de lectura
+        """
+        compression = compression if compression is not None else CompressedInput.detect(filepath)
+        if compression == "gzip":
+            return gzip.open(filepath, 'rb')
+        if compression == "bz2":
+            return bz2.open(filepath, 'rb')
+        if compression == "xz":
+            return lzma.open(filepath, 'rb')
+        if compression == "zip":
+            return CompressedInput._open_zip_member(filepath)
+        return open(filepath, 'rb')
+
+    @staticmethod
+    def open_text(
+            filepath: str,
+            encoding: Optional[str] = None,
+            buffering: int = -1,
+            background: bool = True
+    ) -> IO[str]:
+        """
+        Abre el fichero como texto con newline='' (lo que espera csv.reader), comprimido o no
+        :param filepath: Ruta absoluta o relativa del fichero
+        :param encoding: Codificación del fichero (por defecto la del sistema, igual que open())
+        :param buffering: Tamaño del búfer de lectura (-1 = por defecto)
+        :param background: Descomprimir en un hilo en segundo plano para solaparlo con el parseo
+        :return: Flujo de texto de lectura
+        """
+        compression = CompressedInput.detect(filepath)
+        if compression is None:
+            return open(filepath, 'r', newline='', encoding=encoding, buffering=buffering)
+
+        encoding = encoding if encoding is not None else locale.getpreferredencoding(False)
+        source = CompressedInput.open_binary(filepath, compression)
+        raw = BackgroundReader(source) if background else source
+        buffer_size = buffering if buffering > 0 else io.DEFAULT_BUFFER_SIZE
+        return io.TextIOWrapper(io.BufferedReader(raw, buffer_size), encoding=encoding, newline='')
+
+    @staticmethod
+    def _open_zip_member(filepath: str) -> IO[bytes]:
+        """
+        Abre el miembro CSV de un fichero zip (el primero con extensión .csv, o el primero si no hay ninguno)
+        :param filepath: Ruta del fichero zip
+        :return: Flujo binario del miembro
+        """
+        try:
+            archive = zipfile.ZipFile(filepath)
+        except zipfile.BadZipFile as error:
+            raise ValueError(f"Archivo zip invalido {filepath}: {error}") from error
+        members = [info for info in archive.infolist() if not info.is_dir()]
+        if not members:
+            archive.close()
+            raise ValueError(f"El archivo zip no contiene ficheros: {filepath}")
+        member = next((info for info in members if info.filename.lower().endswith(".csv")), members[0])
+        return _ZipMemberStream(archive, archive.open(member))
+
+
+class BackgroundReader(io.RawIOBase):
+    """
+    Flujo binario que lee de otro flujo en un hilo en segundo plano
+    Los descompresores de zlib, bz2 y lzma liberan el GIL, así que la descompresión del siguiente bloque
+    se solapa con el parseo del actual; la cola acotada limita la memoria usada por adelantado
+    """
+
+    def __init__(
+            self,
+            source: IO[bytes],
+            block_size: int = DEFAULT_BLOCK_SIZE,
+            queue_size: int = DEFAULT_QUEUE_SIZE
+    ):
+        """
+        :param source: Flujo binario de origen (p. ej. gzip.open)
+        :param block_size: Bytes leídos del origen en cada bloque
+        :param queue_size: Bloques que se pueden adelantar
+        """
+        super().__init__()
+        self._source = source
+        self._block_size = block_size
+        self._queue: queue.Queue = queue.Queue(queue_size)
+        self._stop = threading.Event()
+        self._pending = memoryview(b"")
+        self._eof = False
+        self._thread = threading.Thread(target=self._produce, daemon=True)
+        self._thread.start()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        """
+        Copia en el búfer los siguientes bytes disponibles
+        :param buffer: Búfer de destino
+        :return: Bytes copiados (0 al final del flujo)
+        """
+        if not self._pending:
+            if self._eof:
+                return 0
+            item = self._queue.get()
+            if item is None:
+                self._eof = True
+                return 0
+            if isinstance(item, BaseException):
+                self._eof = True
+                raise item
+            self._pending = memoryview(item)
+
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+    def close(self):
+        """
+        Detiene el hilo productor y cierra el flujo de origen
+        :return:
+        """
+        if self.closed:
+            return
+        self._stop.set()
+
+        # ■■■■■■■■■■■■■ Vaciar la cola para desbloquear al productor ■■■■■■■■■■■■■
+        while self._thread.is_alive():
+            try:
+                self._queue.get(timeout=0.05)
+            except queue.Empty:
+                pass
+        self._thread.join()
+        self._source.close()
+        super().close()
+
+    def _produce(self):
+        """
+        Hilo productor: lee bloques del origen y los encola; al final encola None (o la excepción)
+        :return:
+        """
+        try:
+            while not self._stop.is_set():
+                block = self._source.read(self._block_size)
+                if not block:
+                    break
+                self._put(block)
+        except CORRUPTED_STREAM_ERRORS as error:
+            corrupted = ValueError(f"Flujo comprimido corrupto: {error}")
+            corrupted.__cause__ = error
+            self._put(corrupted)
+        except Exception as error:
+            self._put(error)
+        finally:
+            self._put(None)
+
+    def _put(self, item):
+        """
+        Encola un elemento sin bloquear indefinidamente si el consumidor ya cerró el flujo
+        :param item: Bloque de bytes, excepción o None
+        :return:
+        """
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+
+class _ZipMemberStream(io.RawIOBase):
+    """
+    Flujo de un miembro de zip que cierra también el archivo contenedor
+    """
+
+    def __init__(self, archive: zipfile.ZipFile, member: IO[bytes]):
+        super().__init__()
+        self._archive = archive
+        self._member = member
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self._member.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def close(self):
+        if not self.closed:
+            self._member.close()
+            self._archive.close()
+        super().close()
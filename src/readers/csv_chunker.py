@@ -0,0 +1,324 @@
+"""
+■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+MÓDULO:      Particionador de ficheros CSV
+AUTOR:       Fisherk2
+FECHA:       2026-10-19
+DESCRIPCIÓN: Divide el cuerpo de un CSV en rangos de bytes que empiezan y terminan en límites de registro
+■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+"""
+import csv
+import io
+import locale
+import os
+from itertools import islice
+from typing import Any, Iterator, Optional
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ ALIAS de estructura datos ⋮⋮⋮⋮⋮⋮⋮⋮
+ByteRangeType = tuple[int, int]
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ Tamaño de bloque de lectura al buscar límites ⋮⋮⋮⋮⋮⋮⋮⋮
+SCAN_BLOCK_SIZE = 1024 * 1024
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ Tamaño objetivo por defecto de cada trozo ⋮⋮⋮⋮⋮⋮⋮⋮
+DEFAULT_CHUNK_SIZE = 16 * 1024 * 1024
+
+
+class QuoteScanner:
+    """
+    Máquina de estados de comillas (RFC 4180) sobre bloques consecutivos de bytes
+    Una comilla solo abre un campo al inicio de este (inicio del fichero, tras delimitador o salto de línea);
+    dentro del campo va doblada o cierra justo antes de delimitador, fin de línea o fin del fichero.
+    Cualquier otra comilla deja malformed en True: el llamador vuelve a tokenizar con csv.reader
+    """
+    __slots__ = ("quotechar", "in_quotes", "malformed", "_starters", "_terminators", "_previous", "_closing")
+
+    def __init__(self, quotechar: bytes = b'"', delimiter: bytes = b","):
+        """
+        :param quotechar: Byte de comillas del dialecto
+        :param delimiter: Byte delimitador del dialecto
+        """
+        self.quotechar = quotechar
+        self.in_quotes = False
+        self.malformed = False
+        self._starters = (delimiter, b"\n")
+        self._terminators = (delimiter, b"\r", b"\n")
+        self._previous = b"\n"
+        self._closing = False
+
+    def feed(self, block: bytes) -> list[tuple[int, int]]:
+        """
+        Avanza el estado con el siguiente bloque
+        :param block: Bytes consecutivos al bloque anterior
+        :return: Tramos (inicio, fin) del bloque dentro de campos entre comillas, en orden
+        """
+        spans = list()
+        if not block or self.malformed:
+            return spans
+        quotechar = self.quotechar
+        position = 0
+        span_start = 0
+
+        # ■■■■■■■■■■■■■ Comilla al final del bloque anterior: doblada o de cierre según el primer byte ■■■■■■■■■■■■■
+        if self._closing:
+            self._closing = False
+            if block[:1] == quotechar:
+                position = 1
+            elif block[:1] in self._terminators:
+                self.in_quotes = False
+            else:
+                self.malformed = True
+                return spans
+
+        while True:
+            quote = block.find(quotechar, position)
+            if not self.in_quotes:
+                if quote == -1:
+                    break
+
+                # ▲▲▲▲▲▲ Apertura: solo al inicio de un campo ▲▲▲▲▲▲
+                previous = block[quote - 1:quote] if quote else self._previous
+                if previous not in self._starters:
+                    self.malformed = True
+                    break
+                self.in_quotes = True
+                span_start = quote
+                position = quote + 1
+                continue
+
+            if quote == -1:
+                spans.append((span_start, len(block)))
+                break
+
+            # ▲▲▲▲▲▲ Dentro del campo: comilla doblada, cierre o (al final del bloque) pendiente ▲▲▲▲▲▲
+            following = block[quote + 1:quote + 2]
+            if following == quotechar:
+                position = quote + 2
+            elif not following:
+                spans.append((span_start, len(block)))
+                self._closing = True
+                break
+            elif following in self._terminators:
+                spans.append((span_start, quote))
+                self.in_quotes = False
+                position = quote + 1
+            else:
+                self.malformed = True
+                break
+
+        self._previous = block[-1:]
+        return spans
+
+    def finish(self) -> bool:
+        """
+        Cierra el recorrido al llegar al fin del fichero
+        :return: ¿Las comillas están bien formadas y cerradas?
+        """
+        if self._closing:
+            self._closing = False
+            self.in_quotes = False
+        return not self.malformed and not self.in_quotes
+
+
+class CSVChunker:
+    """
+    Particiona ficheros CSV en rangos de bytes procesables de forma independiente
+    Un salto de línea solo es límite de registro fuera de campos entre comillas (QuoteScanner, RFC 4180),
+    así que los campos entre comillas con saltos de línea nunca quedan partidos
+    Los límites se buscan en bytes: solo sirve para codificaciones compatibles con ASCII (is_ascii_compatible)
+    """
+
+    @staticmethod
+    def is_ascii_compatible(encoding: Optional[str]) -> bool:
+        """
+        Indica si en una codificación los caracteres ASCII (saltos de línea, comillas, delimitadores) ocupan
+        un solo byte con su valor ASCII, condición para buscar límites de registro en bytes
+        :param encoding: Codificación del fichero (por defecto la del sistema)
+        :return: ¿Es compatible con ASCII? (False para UTF-16/32 o codificaciones desconocidas)
+        """
+        encoding = encoding if encoding is not None else locale.getpreferredencoding(False)
+        ascii_bytes = bytes(range(128))
+        try:
+            return ascii_bytes.decode(encoding) == ascii_bytes.decode("ascii")
+        except (LookupError, UnicodeDecodeError):
+            return False
+
+    @staticmethod
+    def header_end(filepath: str, quotechar: Optional[bytes] = b'"', delimiter: bytes = b",") -> Optional[int]:
+        """
+        Posición en bytes donde empieza el cuerpo (tras el registro de encabezados)
+        :param filepath: Ruta absoluta o relativa del fichero
+        :param quotechar: Byte de comillas del dialecto (None si el dialecto no entrecomilla)
+        :param delimiter: Byte delimitador del dialecto
+        :return: Desplazamiento del primer byte del cuerpo o None si el encabezado tiene comillas mal formadas
+        """
+        ranges = CSVChunker._record_boundaries(filepath, [0], 0, quotechar=quotechar, delimiter=delimiter)
+        if ranges is None:
+            return None
+        return ranges[0] if ranges else os.path.getsize(filepath)
+
+    @staticmethod
+    def split_body(
+            filepath: str,
+            chunk_count: int,
+            min_chunk_size: int = SCAN_BLOCK_SIZE,
+            quotechar: Optional[bytes] = b'"',
+            delimiter: bytes = b",",
+            has_headers: bool = True
+    ) -> Optional[list[ByteRangeType]]:
+        """
+        Divide el cuerpo del fichero en rangos de bytes alineados a registros
+        :param filepath: Ruta absoluta o relativa del fichero
+        :param chunk_count: Número deseado de trozos
+        :param min_chunk_size: Tamaño mínimo de cada trozo en bytes
+        :param quotechar: Byte de comillas del dialecto (None si el dialecto no entrecomilla)
+        :param delimiter: Byte delimitador del dialecto
+        :param has_headers: ¿El primer registro es el encabezado? (si no, el cuerpo empieza en el byte 0)
+        :return: Lista de rangos (inicio, fin) o None si las comillas no están bien formadas
+        """
+        size = os.path.getsize(filepath)
+        body_start = CSVChunker.header_end(filepath, quotechar, delimiter) if has_headers else 0
+        if body_start is None:
+            return None
+        body_size = size - body_start
+        if body_size <= 0:
+            return []
+
+        # ■■■■■■■■■■■■■ Objetivos equiespaciados respetando el tamaño mínimo ■■■■■■■■■■■■■
+        chunk_count = max(1, min(chunk_count, body_size // max(min_chunk_size, 1)))
+        step = body_size / chunk_count
+        targets = [body_start + int(step * index) for index in range(1, chunk_count)]
+
+        boundaries = CSVChunker._record_boundaries(
+            filepath, targets, body_start, check_balance=True, quotechar=quotechar, delimiter=delimiter
+        )
+        if boundaries is None:
+            return None
+
+        # ■■■■■■■■■■■■■ Eliminar límites repetidos (registros más largos que un trozo) ■■■■■■■■■■■■■
+        edges = [body_start]
+        for boundary in boundaries:
+            if edges[-1] < boundary < size:
+                edges.append(boundary)
+        edges.append(size)
+        return [(start, end) for start, end in zip(edges, edges[1:])]
+
+    @staticmethod
+    def read_range(
+            filepath: str,
+            start: int,
+            end: int,
+            encoding: Optional[str] = None,
+            dialect_options: Optional[dict[str, Any]] = None
+    ) -> Iterator[list[str]]:
+        """
+        Lee las filas de un rango de bytes con csv.reader, omitiendo filas en blanco como csv.DictReader
+        :param filepath: Ruta absoluta o relativa del fichero
+        :param start: Primer byte del rango (inicio de registro)
+        :param end: Byte siguiente al último del rango (inicio de registro o fin de fichero)
+        :param encoding: Codificación del fichero (por defecto la del sistema, igual que open())
+        :param dialect_options: Opciones de csv.reader del lector (CSVReader.dialect_options)
+        :return: Iterador de filas como listas de valores
+        """
+        reader = csv.reader(
+            io.StringIO(CSVChunker.decode_range(filepath, start, end, encoding), newline=''),
+            **(dialect_options or dict())
+        )
+        for row in reader:
+            if row:
+                yield row
+
+    @staticmethod
+    def decode_range(filepath: str, start: int, end: int, encoding: Optional[str] = None) -> str:
+        """
+        Lee y decodifica un rango de bytes
+        :param filepath: Ruta absoluta o relativa del fichero
+        :param start: Primer byte del rango
+        :param end: Byte siguiente al último del rango
+        :param encoding: Codificación del fichero (por defecto la del sistema, igual que open())
+        :return: Texto del rango
+        """
+        encoding = encoding if encoding is not None else locale.getpreferredencoding(False)
+        with open(filepath, 'rb') as file:
+            file.seek(start)
+            data = file.read(end - start)
+        return data.decode(encoding)
+
+    @staticmethod
+    def line_offset(text: str, lines: int, encoding: Optional[str] = None) -> int:
+        """
+        Bytes que ocupan las primeras líneas físicas de un texto decodificado con decode_range
+        (las mismas líneas que cuenta csv.reader en line_num), para reanudar la lectura tras ellas
+        :param text: Texto del rango
+        :param lines: Número de líneas leídas
+        :param encoding: Codificación del fichero (por defecto la del sistema)
+        :return: Desplazamiento en bytes desde el inicio del rango
+        """
+        encoding = encoding if encoding is not None else locale.getpreferredencoding(False)
+        position = sum(len(line) for line in islice(io.StringIO(text, newline=''), lines))
+
+        # ▲▲▲▲▲▲ Descontar la marca de orden de bytes que algunos códecs anteponen al codificar ▲▲▲▲▲▲
+        one, two = len("\n".encode(encoding)), len("\n\n".encode(encoding))
+        return len(text[:position].encode(encoding)) - (2 * one - two) if position else 0
+
+    @staticmethod
+    def _record_boundaries(
+            filepath: str,
+            targets: list[int],
+            start: int,
+            check_balance: bool = False,
+            quotechar: Optional[bytes] = b'"',
+            delimiter: bytes = b","
+    ) -> Optional[list[int]]:
+        """
+        Para cada objetivo, busca el primer inicio de registro en o después de él
+        :param filepath: Ruta absoluta o relativa del fichero
+        :param targets: Desplazamientos objetivo en orden creciente
+        :param start: Desplazamiento desde el que se siguen las comillas (inicio de registro)
+        :param check_balance: Recorrer el fichero completo y verificar que las comillas están bien formadas
+        :param quotechar: Byte de comillas del dialecto (None: todo salto de línea es límite de registro)
+        :param delimiter: Byte delimitador del dialecto
+        :return: Desplazamientos de inicio de registro o None si hay comillas mal formadas (o sin cerrar,
+                 con check_balance)
+        """
+        boundaries = list()
+        pending = list(targets)
+        scanner = QuoteScanner(quotechar, delimiter) if quotechar is not None else None
+        position = start
+
+        with open(filepath, 'rb') as file:
+            file.seek(start)
+            while True:
+                block = file.read(SCAN_BLOCK_SIZE)
+                if not block:
+                    break
+                spans = scanner.feed(block) if scanner is not None else list()
+                if scanner is not None and scanner.malformed:
+                    return None
+
+                # ▲▲▲▲▲▲ Resolver los objetivos del bloque; los tramos entre comillas se recorren una vez ▲▲▲▲▲▲
+                search_from = 0
+                span = 0
+                while pending and pending[0] < position + len(block):
+                    newline = block.find(b"\n", max(pending[0] - position, search_from))
+                    while newline != -1:
+                        while span < len(spans) and spans[span][1] <= newline:
+                            span += 1
+                        if span == len(spans) or spans[span][0] > newline:
+                            break
+                        newline = block.find(b"\n", spans[span][1])
+                    if newline == -1:
+                        break
+                    boundaries.append(position + newline + 1)
+                    pending.pop(0)
+                    search_from = newline + 1
+
+                position += len(block)
+                if not pending and not check_balance:
+                    break
+
+        if check_balance and scanner is not None and not scanner.finish():
+            return None
+
+        # ■■■■■■■■■■■■■ Objetivos sin límite posterior: el trozo llega hasta el final ■■■■■■■■■■■■■
+        boundaries.extend(position for _ in pending)
+        return boundaries
@@ -0,0 +1,319 @@
+"""
+■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+MÓDULO:      Índice de registros de ficheros CSV
+AUTOR:       Fisherk2
+FECHA:       2026-10-19
+DESCRIPCIÓN: Conteo de registros con mmap e índice disperso de desplazamientos de fila guardado junto al CSV
+■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+"""
+import csv
+import io
+import json
+import locale
+import mmap
+import os
+from bisect import bisect_left
+from typing import Any, Iterable, Iterator, Optional
+
+from .csv_chunker import QuoteScanner
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ ALIAS de estructura datos ⋮⋮⋮⋮⋮⋮⋮⋮
+RowIndexType = dict[str, Any]
+ByteRangeType = tuple[int, int]
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ Ventana de conteo de saltos de línea sobre el mapa de memoria ⋮⋮⋮⋮⋮⋮⋮⋮
+COUNT_WINDOW_SIZE = 16 * 1024 * 1024
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ Registros entre entradas del índice y extensión del fichero auxiliar ⋮⋮⋮⋮⋮⋮⋮⋮
+DEFAULT_INDEX_EVERY = 1000
+INDEX_SUFFIX = ".idx"
+
+
+class CSVRowIndex:
+    """
+    Conteo rápido de registros e índice disperso de desplazamientos en bytes de un CSV
+    Sin comillas, los registros se cuentan con búsquedas de saltos de línea en bloque sobre mmap;
+    con comillas, una máquina de estados (QuoteScanner, RFC 4180) evita contar los saltos de línea dentro
+    de campos y pasa a tokenizar con csv.reader si alguna comilla no está al inicio o cierre de un campo.
+    El índice numera las filas igual que los informes de error
+    (encabezado = fila 1, filas en blanco omitidas) y permite partir el archivo y leer filas sin recorrerlo
+    """
+
+    @staticmethod
+    def count_records(
+            filepath: str,
+            has_headers: bool = True,
+            delimiter: bytes = b",",
+            quotechar: bytes = b'"'
+    ) -> Optional[int]:
+        """
+        Cuenta los registros del cuerpo con la misma semántica que csv.reader (filas en blanco incluidas)
+        :param filepath: Ruta absoluta o relativa del fichero
+        :param has_headers: ¿El primer registro es el encabezado?
+        :param delimiter: Byte delimitador del dialecto
+        :param quotechar: Byte de comillas del dialecto
+        :return: Número de registros sin encabezado, o None si el archivo requiere tokenizar (finales de línea
+                 solo con '\\r' o comillas mal formadas o sin cerrar)
+        """
+        if os.path.getsize(filepath) == 0:
+            return 0
+
+        with open(filepath, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return CSVRowIndex.count_windows(CSVRowIndex._windows(data), has_headers, delimiter, quotechar)
+
+    @staticmethod
+    def count_windows(
+            windows: Iterable[bytes],
+            has_headers: bool = True,
+            delimiter: bytes = b",",
+            quotechar: bytes = b'"'
+    ) -> Optional[int]:
+        """
+        Cuenta los registros del cuerpo a partir de bloques consecutivos de bytes (mmap o flujo descomprimido)
+        :param windows: Bloques de bytes del archivo en orden
+        :param has_headers: ¿El primer registro es el encabezado?
+        :param delimiter: Byte delimitador del dialecto
+        :param quotechar: Byte de comillas del dialecto
+        :return: Número de registros sin encabezado, o None si el archivo requiere tokenizar
+        """
+        newlines = 0
+        scanner = QuoteScanner(quotechar, delimiter)
+        carriage_returns = 0
+        crlf = 0
+        last_byte = b""
+        for window in windows:
+            if not window:
+                continue
+
+            # ■■■■■■■■■■■■■ Finales '\\r' aislados: csv.reader también los trata como fin de registro ■■■■■■■■■■■■■
+            if window.find(b"\r") != -1 or last_byte == b"\r":
+                carriage_returns += window.count(b"\r")
+                crlf += window.count(b"\r\n") + (1 if last_byte == b"\r" and window[:1] == b"\n" else 0)
+
+            # ■■■■■■■■■■■■■ Saltos de línea fuera de comillas; sin comillas es un conteo directo ■■■■■■■■■■■■■
+            spans = scanner.feed(window)
+            if scanner.malformed:
+                return None
+            newlines += window.count(b"\n") - sum(window.count(b"\n", start, end) for start, end in spans)
+            last_byte = window[-1:]
+
+        if not scanner.finish() or carriage_returns != crlf:
+            return None
+        if not last_byte:
+            return 0
+        records = newlines + (0 if last_byte == b"\n" else 1)
+        return max(records - 1, 0) if has_headers else records
+
+    @staticmethod
+    def build(filepath: str, every: int = DEFAULT_INDEX_EVERY, save: bool = True) -> Optional[RowIndexType]:
+        """
+        Construye el índice disperso: desplazamiento del inicio de la fila 2, 2 + every, 2 + 2*every...
+        Solo para el dialecto estándar (delimitador ',' y comillas '"')
+        :param filepath: Ruta absoluta o relativa del fichero
+        :param every: Número de filas entre entradas del índice
+        :param save: Guardar el índice en el fichero auxiliar <csv>.idx
+        :return: Diccionario con el índice o None si hay comillas mal formadas o sin cerrar, o finales '\\r'
+        """
+        if every < 1:
+            raise ValueError(f"El intervalo del índice debe ser positivo: {every}")
+
+        stat = os.stat(filepath)
+        offsets = list()
+        rows = 0
+        if stat.st_size > 0:
+            with open(filepath, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                if CSVRowIndex._has_bare_carriage_returns(data):
+                    return None
+                scanner = QuoteScanner()
+                records = CSVRowIndex._iter_records(data, scanner)
+
+                # ■■■■■■■■■■■■■ El primer registro es el encabezado ■■■■■■■■■■■■■
+                next(records, None)
+                for start, is_blank in records:
+                    if is_blank:
+                        continue
+                    if rows % every == 0:
+                        offsets.append(start)
+                    rows += 1
+                if not scanner.finish():
+                    return None
+
+        index = {
+            "every": every,
+            "rows": rows,
+            "offsets": offsets,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns
+        }
+        if save:
+            with open(CSVRowIndex.index_path(filepath), 'w', encoding='utf-8') as file:
+                json.dump(index, file)
+        return index
+
+    @staticmethod
+    def load(filepath: str) -> Optional[RowIndexType]:
+        """
+        Carga el índice auxiliar si existe y sigue correspondiendo al archivo (mismo tamaño y fecha)
+        :param filepath: Ruta absoluta o relativa del fichero CSV
+        :return: Diccionario con el índice o None si no existe o está desactualizado
+        """
+        index_path = CSVRowIndex.index_path(filepath)
+        if not os.path.exists(index_path) or not os.path.exists(filepath):
+            return None
+        try:
+            with open(index_path, 'r', encoding='utf-8') as file:
+                index = json.load(file)
+        except (IOError, ValueError):
+            return None
+
+        stat = os.stat(filepath)
+        if index.get("size") != stat.st_size or index.get("mtime_ns") != stat.st_mtime_ns:
+            return None
+        return index
+
+    @staticmethod
+    def index_path(filepath: str) -> str:
+        """
+        Ruta del fichero auxiliar del índice
+        :param filepath: Ruta del fichero CSV
+        :return: Ruta <csv>.idx
+        """
+        return filepath + INDEX_SUFFIX
+
+    @staticmethod
+    def split(index: RowIndexType, chunk_count: int, min_chunk_size: int = 1) -> list[ByteRangeType]:
+        """
+        Divide el cuerpo en rangos de bytes alineados a filas usando solo el índice (sin leer el archivo)
+        :param index: Índice construido con build() o load()
+        :param chunk_count: Número deseado de trozos
+        :param min_chunk_size: Tamaño mínimo de cada trozo en bytes
+        :return: Lista de rangos (inicio, fin)
+        """
+        offsets = index["offsets"]
+        size = index["size"]
+        if not offsets:
+            return []
+
+        body_start = offsets[0]
+        body_size = size - body_start
+        chunk_count = max(1, min(chunk_count, body_size // max(min_chunk_size, 1)))
+        step = body_size / chunk_count
+
+        # ■■■■■■■■■■■■■ Primer desplazamiento indexado en o después de cada objetivo ■■■■■■■■■■■■■
+        edges = [body_start]
+        for chunk in range(1, chunk_count):
+            position = bisect_left(offsets, body_start + int(step * chunk))
+            if position < len(offsets) and offsets[position] > edges[-1]:
+                edges.append(offsets[position])
+        edges.append(size)
+        return [(start, end) for start, end in zip(edges, edges[1:])]
+
+    @staticmethod
+    def read_row(
+            filepath: str,
+            row_num: int,
+            index: Optional[RowIndexType] = None,
+            encoding: Optional[str] = None,
+            dialect_options: Optional[dict[str, Any]] = None
+    ) -> Optional[list[str]]:
+        """
+        Lee una fila concreta (numeración de los informes de error) saltando a la entrada más cercana del índice
+        :param filepath: Ruta absoluta o relativa del fichero
+        :param row_num: Número de fila (2 = primera fila de datos)
+        :param index: Índice del archivo (por defecto se carga el fichero auxiliar o se construye sin guardarlo;
+                      sin índice válido la fila se busca desde el inicio)
+        :param encoding: Codificación del fichero (por defecto la del sistema, igual que open())
+        :param dialect_options: Opciones de csv.reader del lector (CSVReader.dialect_options)
+        :return: Valores de la fila o None si no existe
+        """
+        # ■■■■■■■■■■■■■ El índice auxiliar solo vale para el dialecto estándar ■■■■■■■■■■■■■
+        options = dialect_options or dict()
+        standard_dialect = options.get("delimiter", ",") == "," and options.get("quotechar", '"') == '"' \
+            and options.get("quoting") != csv.QUOTE_NONE
+        if index is None and standard_dialect:
+            index = CSVRowIndex.load(filepath) or CSVRowIndex.build(filepath, save=False)
+        if row_num < 2 or (index is not None and row_num >= index["rows"] + 2):
+            return None
+
+        # ■■■■■■■■■■■■■ Entrada del índice anterior o igual a la fila buscada (sin índice, desde el inicio) ■■■■■■■■■■■■■
+        if index is not None:
+            every = index["every"]
+            entry = (row_num - 2) // every
+            skip = (row_num - 2) - entry * every
+            offset = index["offsets"][entry]
+        else:
+            skip = row_num - 1
+            offset = 0
+
+        encoding = encoding if encoding is not None else locale.getpreferredencoding(False)
+        with open(filepath, 'rb') as file:
+            file.seek(offset)
+            reader = csv.reader(io.TextIOWrapper(file, encoding=encoding, newline=''), **options)
+            for row in reader:
+                if not row:
+                    continue
+                if skip == 0:
+                    return row
+                skip -= 1
+        return None
+
+    @staticmethod
+    def _iter_records(data: mmap.mmap, scanner: QuoteScanner) -> Iterator[tuple[int, bool]]:
+        """
+        Recorre los registros respetando saltos de línea dentro de comillas
+        Se detiene en la primera comilla mal formada (scanner.malformed)
+        :param data: Mapa de memoria del fichero
+        :param scanner: Estado de comillas del recorrido
+        :return: Iterador de (desplazamiento de inicio, ¿registro en blanco?)
+        """
+        data.seek(0)
+        start = 0
+        position = 0
+        readline = data.readline
+        for line in iter(readline, b""):
+            scanner.feed(line)
+            if scanner.malformed:
+                return
+            position += len(line)
+
+            # ▲▲▲▲▲▲ Dentro de comillas: el salto de línea pertenece al campo ▲▲▲▲▲▲
+            if scanner.in_quotes:
+                continue
+            yield start, position - start == len(line) and line.strip(b"\r\n") == b""
+            start = position
+
+        # ▲▲▲▲▲▲ Registro final sin cerrar (comillas sin balancear) ▲▲▲▲▲▲
+        if start < position:
+            yield start, False
+
+    @staticmethod
+    def _has_bare_carriage_returns(data: mmap.mmap) -> bool:
+        """
+        Detecta finales de línea '\\r' sin '\\n' (csv.reader también los trata como fin de registro)
+        :param data: Mapa de memoria del fichero
+        :return: ¿Hay algún '\\r' que no forme parte de un '\\r\\n'?
+        """
+        if data.find(b"\r") == -1:
+            return False
+        carriage_returns = 0
+        crlf = 0
+        for window in CSVRowIndex._windows(data):
+            carriage_returns += window.count(b"\r")
+            crlf += window.count(b"\r\n")
+
+        # ▲▲▲▲▲▲ Un '\\r\\n' partido entre dos ventanas se cuenta aparte ▲▲▲▲▲▲
+        crlf += sum(
+            1 for boundary in range(COUNT_WINDOW_SIZE, len(data), COUNT_WINDOW_SIZE)
+            if data[boundary - 1:boundary + 1] == b"\r\n"
+        )
+        return carriage_returns != crlf
+
+    @staticmethod
+    def _windows(data: mmap.mmap) -> Iterator[bytes]:
+        """
+        Divide el mapa de memoria en ventanas de tamaño fijo
+        :param data: Mapa de memoria del fichero
+        :return: Iterador de ventanas de bytes
+        """
+        for start in range(0, len(data), COUNT_WINDOW_SIZE):
+            yield data[start:start + COUNT_WINDOW_SIZE]
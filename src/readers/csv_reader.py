@@ -8,7 +8,28 @@ DESCRIPCIÓN: Lector de ficheros CSV que valida la existencia del fichero y su f
 """
 import os
 import csv
-from typing import Iterator
+from itertools import islice
+from typing import Any, Iterator, Optional, Union
+
+from .csv_chunker import CSVChunker
+from .csv_index import CSVRowIndex, COUNT_WINDOW_SIZE
+from .compressed_input import CompressedInput
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ ALIAS de estructura datos ⋮⋮⋮⋮⋮⋮⋮⋮
+RowBatchType = list[tuple[str, ...]]
+ColumnBatchType = list[list[Optional[str]]]
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ Valores por defecto de la lectura por lotes ⋮⋮⋮⋮⋮⋮⋮⋮
+DEFAULT_BATCH_SIZE = 10000
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ Modos de entrecomillado admitidos en input.primary_source.quoting ⋮⋮⋮⋮⋮⋮⋮⋮
+QUOTING_MODES = {
+    "minimal": csv.QUOTE_MINIMAL,
+    "all": csv.QUOTE_ALL,
+    "nonnumeric": csv.QUOTE_NONNUMERIC,
+    "none": csv.QUOTE_NONE
+}
 
 
 class CSVReader:
@@ -16,6 +37,29 @@ class CSVReader:
     Componente responsable de leer archivos CSV de forma segura
     """
 
+    def __init__(self, source_config: Optional[dict[str, Any]] = None):
+        """
+        :param source_config: Sección input.primary_source del pipeline (encoding, delimiter, quotechar,
+                              quoting, has_headers, buffer_size). Por defecto, la codificación del sistema y
+                              el dialecto estándar de csv
+        """
+        source_config = source_config or dict()
+        self.encoding: Optional[str] = source_config.get("encoding")
+        self.has_headers: bool = source_config.get("has_headers", True)
+        self.buffer_size: int = source_config.get("buffer_size", DEFAULT_BUFFER_SIZE)
+
+        # ■■■■■■■■■■■■■ Opciones de dialecto para csv.reader ■■■■■■■■■■■■■
+        self.dialect_options: dict[str, Any] = dict()
+        if source_config.get("delimiter"):
+            self.dialect_options["delimiter"] = source_config["delimiter"]
+        if source_config.get("quotechar"):
+            self.dialect_options["quotechar"] = source_config["quotechar"]
+        if source_config.get("quoting") is not None:
+            quoting = str(source_config["quoting"]).lower()
+            if quoting not in QUOTING_MODES:
+                raise ValueError(f"Modo de entrecomillado no soportado: {quoting}. Use uno de {list(QUOTING_MODES)}")
+            self.dialect_options["quoting"] = QUOTING_MODES[quoting]
+
     def validate_file_exist(self, filepath: str) -> bool:
         """
         Verifica si el archivo existe en la ruta especificada
@@ -28,15 +72,15 @@ class CSVReader:
         """
         Lee solo los encabezados del archivo CSV
         :param filepath: Ruta absoluta o relativa del fichero
-        :return: Lista de encabezados
+        :return: Lista de encabezados (vacía si la fuente declara has_headers: false)
         """
-        if not self.validate_file_exist(filepath):
+        if not self.validate_file_exist(filepath) or not self.has_headers:
             return []
 
         headers = []
         try:
-            with open(filepath, 'r', newline='') as file:
-                reader = csv.reader(file)
+            with CompressedInput.open_text(filepath, self.encoding) as file:
+                reader = csv.reader(file, **self.dialect_options)
                 first_row = next(reader)
 
                 # ■■■■■■■■■■■■■ En caso de que la primera fila pueda estar vacia ■■■■■■■■■■■■■
@@ -51,18 +95,27 @@ class CSVReader:
             return []
         return headers
 
-    def read_rows(self, filepath: str) -> Iterator[dict[str, str]]:
+    def read_rows(self, filepath: str, columns: Optional[list[str]] = None) -> Iterator[dict[str, str]]:
         """
         Lee las filas del archivo CSV como diccionarios
+        Con columns, el encabezado se resuelve a posiciones una sola vez y cada fila solo materializa
+        las columnas pedidas (las que no están en el encabezado se omiten)
         :param filepath: Ruta absoluta o relativa del fichero
+        :param columns: Columnas a leer (Opcional, por defecto todas con csv.DictReader)
         :return: Iterador para procesar las filas eficientemente
         """
         if not self.validate_file_exist(filepath):
             raise FileNotFoundError(f"El archivo no existe: {filepath}")
+        if not self.has_headers:
+            raise ValueError(f"La lectura por nombre de columna requiere encabezados (has_headers: false): {filepath}")
+
+        if columns is not None:
+            yield from self._read_projected_rows(filepath, columns)
+            return
 
         try:
-            with open(filepath, 'r', newline='') as file:
-                reader = csv.DictReader(file)
+            with CompressedInput.open_text(filepath, self.encoding) as file:
+                reader = csv.DictReader(file, **self.dialect_options)
 
                 # ■■■■■■■■■■■■■ Procesar fila por fila usando yield simulado con generador ■■■■■■■■■■■■■
                 for row in reader:
@@ -75,23 +128,172 @@ class CSVReader:
         except csv.Error:
             raise ValueError(f"Formato CSV invalido en {filepath}")
 
+    def _read_projected_rows(self, filepath: str, columns: list[str]) -> Iterator[dict[str, str]]:
+        """
+        Lee solo las columnas pedidas con la misma semántica que csv.DictReader
+        (encabezados duplicados toman el último valor, filas cortas dan None, filas en blanco se omiten)
+        :param filepath: Ruta absoluta o relativa del fichero
+        :param columns: Columnas a leer
+        :return: Iterador de diccionarios con las columnas pedidas presentes en el encabezado
+        """
+        try:
+            with CompressedInput.open_text(filepath, self.encoding) as file:
+                reader = csv.reader(file, **self.dialect_options)
+                headers = next(reader, None) or list()
+
+                # ■■■■■■■■■■■■■ Resolver encabezado -> posición una sola vez (el último duplicado gana) ■■■■■■■■■■■■■
+                last_position = {header: position for position, header in enumerate(headers)}
+                wanted = set(columns)
+                projection = [(header, position) for header, position in last_position.items() if header in wanted]
+                names = [header for header, _ in projection]
+                positions = [position for _, position in projection]
+                width = max(positions) + 1 if positions else 0
+
+                for row in reader:
+                    if not row:
+                        continue
+                    if len(row) >= width:
+                        yield dict(zip(names, [row[position] for position in positions]))
+                    else:
+                        yield {
+                            name: row[position] if position < len(row) else None
+                            for name, position in projection
+                        }
+
+        except IOError:
+            print(f"Error leyendo archivo CSV {filepath}")
+        except UnicodeDecodeError:
+            raise ValueError(f"Error decodificando archivo CSV {filepath}")
+        except csv.Error:
+            raise ValueError(f"Formato CSV invalido en {filepath}")
+
+    def read_raw_rows(self, filepath: str) -> Iterator[list[str]]:
+        """
+        Lee las filas del archivo CSV como listas posicionales (sin encabezado)
+        Las filas en blanco se omiten igual que en csv.DictReader
+        :param filepath: Ruta absoluta o relativa del fichero
+        :return: Iterador de filas como listas de valores
+        """
+        if not self.validate_file_exist(filepath):
+            raise FileNotFoundError(f"El archivo no existe: {filepath}")
+
+        try:
+            with CompressedInput.open_text(filepath, self.encoding) as file:
+                reader = csv.reader(file, **self.dialect_options)
+
+                # ■■■■■■■■■■■■■ Saltar encabezado (si la fuente lo tiene) ■■■■■■■■■■■■■
+                if self.has_headers:
+                    next(reader, None)
+
+                for row in reader:
+                    if row:
+                        yield row
+
+        except IOError:
+            print(f"Error leyendo archivo CSV {filepath}")
+        except UnicodeDecodeError:
+            raise ValueError(f"Error decodificando archivo CSV {filepath}")
+        except csv.Error:
+            raise ValueError(f"Formato CSV invalido en {filepath}")
+
+    def read_batches(
+            self,
+            filepath: str,
+            batch_size: int = DEFAULT_BATCH_SIZE,
+            columnar: bool = False
+    ) -> Iterator[Union[RowBatchType, ColumnBatchType]]:
+        """
+        Lee el cuerpo del archivo CSV en lotes de tamaño fijo (el último puede ser menor)
+        Usa la codificación y el dialecto de input.primary_source y un búfer de lectura grande;
+        las filas en blanco se omiten igual que en csv.DictReader
+        :param filepath: Ruta absoluta o relativa del fichero
+        :param batch_size: Número de filas por lote
+        :param columnar: Entregar cada lote por columnas (una lista por encabezado, rellenando con None
+                         las filas cortas e ignorando valores sobrantes) en lugar de lista de tuplas
+        :return: Iterador de lotes
+        """
+        if not self.validate_file_exist(filepath):
+            raise FileNotFoundError(f"El archivo no existe: {filepath}")
+        if batch_size < 1:
+            raise ValueError(f"El tamaño de lote debe ser positivo: {batch_size}")
+
+        try:
+            with CompressedInput.open_text(filepath, self.encoding, buffering=self.buffer_size) as file:
+                reader = csv.reader(file, **self.dialect_options)
+
+                # ■■■■■■■■■■■■■ Encabezado: fija el ancho de los lotes por columnas ■■■■■■■■■■■■■
+                headers = next(reader, None) if self.has_headers else None
+                rows = (tuple(row) for row in reader if row)
+
+                while True:
+                    batch = list(islice(rows, batch_size))
+                    if not batch:
+                        break
+                    if not columnar:
+                        yield batch
+                        continue
+
+                    # ▲▲▲▲▲▲ Transponer el lote; sin encabezado, el ancho es el de la fila más larga ▲▲▲▲▲▲
+                    width = len(headers) if headers is not None else max(len(row) for row in batch)
+                    if all(len(row) == width for row in batch):
+                        yield [list(column) for column in zip(*batch)]
+                    else:
+                        yield [
+                            [row[position] if position < len(row) else None for row in batch]
+                            for position in range(width)
+                        ]
+
+        except IOError:
+            print(f"Error leyendo archivo CSV {filepath}")
+        except UnicodeDecodeError:
+            raise ValueError(f"Error decodificando archivo CSV {filepath}")
+        except csv.Error:
+            raise ValueError(f"Formato CSV invalido en {filepath}")
+
     def count_rows(self, filepath) -> int:
         """
         Cuenta el numero total de filas en el archivo (Excluyendo encabezados)
+        Con delimitador y comillas de un byte ASCII (las configuradas o las estándar) y una codificación compatible
+        con ASCII cuenta sobre mmap sin tokenizar (CSVRowIndex.count_records); si no, con QUOTE_NONE o si alguna
+        comilla está mal formada, cuenta con csv.reader
         :param filepath: Ruta absoluta o relativo del fichero
         :return: Numero total de filas del fichero.
         """
         if not self.validate_file_exist(filepath):
             return 0
 
+        # ■■■■■■■■■■■■■ Conteo en bloque cuando el dialecto es el estándar (mmap o flujo descomprimido) ■■■■■■■■■■■■■
+        delimiter = self.dialect_options.get("delimiter", ",")
+        quotechar = self.dialect_options.get("quotechar", '"')
+        if self.dialect_options.get("quoting") != csv.QUOTE_NONE \
+                and len(delimiter) == 1 and delimiter.isascii() and len(quotechar) == 1 and quotechar.isascii() \
+                and CSVChunker.is_ascii_compatible(self.encoding):
+            try:
+                compression = CompressedInput.detect(filepath)
+                if compression is None:
+                    fast_count = CSVRowIndex.count_records(
+                        filepath, self.has_headers, delimiter.encode("ascii"), quotechar.encode("ascii")
+                    )
+                else:
+                    with CompressedInput.open_binary(filepath, compression) as stream:
+                        fast_count = CSVRowIndex.count_windows(
+                            iter(lambda: stream.read(COUNT_WINDOW_SIZE), b""), self.has_headers,
+                            delimiter.encode("ascii"), quotechar.encode("ascii")
+                        )
+            except (IOError, ValueError, EOFError):
+                fast_count = None
+            if fast_count is not None:
+                return fast_count
+
         count = 0
 
         try:
-            with open(filepath, 'r', newline='') as file:
-                reader = csv.reader(file)
+            with CompressedInput.open_text(filepath, self.encoding) as file:
+                reader = csv.reader(file, **self.dialect_options)
 
-                # ■■■■■■■■■■■■■ Saltar encabezado ■■■■■■■■■■■■■
-                next(reader, None)
+                # ■■■■■■■■■■■■■ Saltar encabezado (si la fuente lo tiene) ■■■■■■■■■■■■■
+                if self.has_headers:
+                    next(reader, None)
 
                 for row in reader:
                     count += 1
@@ -0,0 +1,291 @@
+"""
+■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+MÓDULO:      Lector de ficheros JSON Lines
+AUTOR:       Fisherk2
+FECHA:       2026-10-19
+DESCRIPCIÓN: Lector de JSON Lines / NDJSON con la misma interfaz que CSVReader (filas, lotes, proyección y conteo)
+■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+"""
+import json
+import os
+from itertools import islice
+from typing import Any, Iterator, Optional, Union
+
+from .csv_reader import CSVReader, RowBatchType, ColumnBatchType, DEFAULT_BATCH_SIZE, DEFAULT_BUFFER_SIZE
+from .compressed_input import CompressedInput, EXTENSIONS
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ Extensiones y valores de input.primary_source.type reconocidos como JSON Lines ⋮⋮⋮⋮⋮⋮⋮⋮
+JSONL_EXTENSIONS = (".jsonl", ".ndjson")
+JSONL_SOURCE_TYPES = ("jsonl", "ndjson", "json_lines")
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ Líneas decodificadas por llamada a json.loads y registros usados para deducir columnas ⋮⋮⋮⋮⋮⋮⋮⋮
+DEFAULT_DECODE_BATCH_SIZE = 1000
+DEFAULT_HEADER_SAMPLE_ROWS = 1000
+
+
+class JSONNumber(str):
+    """
+    Texto original de un número JSON (parse_int/parse_float), distinguible de una cadena JSON
+    """
+    __slots__ = ()
+
+
+class JSONLinesReader:
+    """
+    Lee ficheros JSON Lines (un objeto JSON por línea), comprimidos o no, como filas de texto equivalentes a las
+    de CSVReader para que validadores y auditores los procesen sin conversión previa:
+    - Columnas: claves de los primeros registros en orden de aparición; las claves que aparecen después
+      se conservan con su nombre en read_rows y como valores sobrantes al final de la fila en read_raw_rows
+    - Números con su texto original (JSONNumber), booleanos como "true"/"false",
+      objetos y listas como JSON
+    - Clave ausente y null JSON dan None, igual que una celda ausente de CSV (DataParser.is_null_value)
+    Las líneas se decodifican por lotes con una sola llamada a json.loads
+    """
+
+    def __init__(self, source_config: Optional[dict[str, Any]] = None):
+        """
+        :param source_config: Sección input.primary_source del pipeline (encoding, buffer_size,
+                              header_sample_rows, decode_batch_size). Por defecto UTF-8
+        """
+        source_config = source_config or dict()
+        self.encoding: str = source_config.get("encoding") or "utf-8"
+        self.has_headers = True
+        self.buffer_size: int = source_config.get("buffer_size", DEFAULT_BUFFER_SIZE)
+        self.header_sample_rows: int = source_config.get("header_sample_rows", DEFAULT_HEADER_SAMPLE_ROWS)
+        self.decode_batch_size: int = source_config.get("decode_batch_size", DEFAULT_DECODE_BATCH_SIZE)
+        self.dialect_options: dict[str, Any] = dict()
+
+    @staticmethod
+    def is_jsonl(filepath: str, source_config: Optional[dict[str, Any]] = None) -> bool:
+        """
+        Indica si una fuente es JSON Lines por input.primary_source.type o por su extensión
+        (también con sufijo de compresión, p. ej. .jsonl.gz)
+        :param filepath: Ruta del fichero
+        :param source_config: Sección input.primary_source del pipeline (Opcional)
+        :return: ¿Se debe leer como JSON Lines?
+        """
+        source_type = str((source_config or dict()).get("type", "")).lower()
+        if source_type:
+            return source_type in JSONL_SOURCE_TYPES
+        lower_path = str(filepath).lower()
+        for extension in EXTENSIONS:
+            if lower_path.endswith(extension):
+                lower_path = lower_path[:-len(extension)]
+                break
+        return lower_path.endswith(JSONL_EXTENSIONS)
+
+    @staticmethod
+    def reader_for(
+            filepath: str,
+            source_config: Optional[dict[str, Any]] = None
+    ) -> Union[CSVReader, "JSONLinesReader"]:
+        """
+        Lector adecuado para la fuente: JSONLinesReader para JSON Lines, CSVReader en otro caso
+        :param filepath: Ruta del fichero
+        :param source_config: Sección input.primary_source del pipeline (Opcional)
+        :return: Lector configurado
+        """
+        if JSONLinesReader.is_jsonl(filepath, source_config):
+            return JSONLinesReader(source_config)
+        return CSVReader(source_config)
+
+    def validate_file_exist(self, filepath: str) -> bool:
+        """
+        Verifica si el archivo existe en la ruta especificada
+        :param filepath: Ruta absoluta o relativa del fichero
+        :return: ¿El archivo existe?
+        """
+        return os.path.exists(filepath)
+
+    def read_headers(self, filepath: str) -> list[str]:
+        """
+        Columnas del archivo: claves de los primeros header_sample_rows registros en orden de aparición
+        Las líneas que no son objetos JSON se omiten aquí; el error se informa al leer las filas
+        :param filepath: Ruta absoluta o relativa del fichero
+        :return: Lista de columnas
+        """
+        if not self.validate_file_exist(filepath):
+            return []
+
+        headers = dict()
+        try:
+            with CompressedInput.open_text(filepath, self.encoding) as file:
+                lines = islice((line for line in file if line.strip()), self.header_sample_rows)
+                for line in lines:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if type(record) is dict:
+                        headers.update(dict.fromkeys(record))
+        except IOError:
+            print(f"Error leyendo encabezados en el fichero {filepath}")
+            return []
+        except UnicodeDecodeError:
+            print(f"Error decodificando archivo {filepath}")
+            return []
+        return list(headers)
+
+    def read_rows(self, filepath: str, columns: Optional[list[str]] = None) -> Iterator[dict[str, Optional[str]]]:
+        """
+        Lee los registros como diccionarios de texto
+        Sin columns, cada fila tiene todas las columnas del encabezado (None si falta la clave) más las claves
+        que no aparecían en la muestra; con columns, solo las pedidas presentes en el encabezado
+        :param filepath: Ruta absoluta o relativa del fichero
+        :param columns: Columnas a leer (Opcional)
+        :return: Iterador de filas
+        """
+        if not self.validate_file_exist(filepath):
+            raise FileNotFoundError(f"El archivo no existe: {filepath}")
+
+        headers = self.read_headers(filepath)
+        if columns is not None:
+            wanted = set(columns)
+            headers = [header for header in headers if header in wanted]
+        header_set = set(headers)
+
+        for record in self._iter_records(filepath):
+            row = {header: _to_text(record.get(header)) for header in headers}
+            if columns is None and not record.keys() <= header_set:
+                for key in record.keys() - header_set:
+                    row[key] = _to_text(record[key])
+            yield row
+
+    def read_raw_rows(self, filepath: str) -> Iterator[list[Optional[str]]]:
+        """
+        Lee los registros como listas posicionales en el orden del encabezado
+        Las claves que no aparecían en la muestra del encabezado se añaden al final de la fila, igual que los
+        valores sobrantes de una fila CSV más larga que el encabezado (el validador los informa como
+        campo_no_permitido)
+        :param filepath: Ruta absoluta o relativa del fichero
+        :return: Iterador de filas como listas de valores
+        """
+        if not self.validate_file_exist(filepath):
+            raise FileNotFoundError(f"El archivo no existe: {filepath}")
+
+        headers = self.read_headers(filepath)
+        header_set = set(headers)
+        for record in self._iter_records(filepath):
+            row = [_to_text(record.get(header)) for header in headers]
+            if not record.keys() <= header_set:
+                row.extend(_to_text(value) for key, value in record.items() if key not in header_set)
+            yield row
+
+    def read_batches(
+            self,
+            filepath: str,
+            batch_size: int = DEFAULT_BATCH_SIZE,
+            columnar: bool = False
+    ) -> Iterator[Union[RowBatchType, ColumnBatchType]]:
+        """
+        Lee los registros en lotes de tamaño fijo, como lista de tuplas o por columnas (igual que CSVReader)
+        :param filepath: Ruta absoluta o relativa del fichero
+        :param batch_size: Número de filas por lote
+        :param columnar: Entregar cada lote como una lista de valores por columna
+        :return: Iterador de lotes
+        """
+        if batch_size < 1:
+            raise ValueError(f"El tamaño de lote debe ser positivo: {batch_size}")
+
+        rows = (tuple(row) for row in self.read_raw_rows(filepath))
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                break
+            yield [list(column) for column in zip(*batch)] if columnar else batch
+
+    def count_rows(self, filepath: str) -> int:
+        """
+        Cuenta los registros (líneas no vacías) sin decodificarlos
+        :param filepath: Ruta absoluta o relativa del fichero
+        :return: Número de registros (0 si el archivo no existe o no se puede leer, igual que CSVReader)
+        """
+        if not self.validate_file_exist(filepath):
+            return 0
+
+        try:
+            with CompressedInput.open_binary(filepath) as file:
+                return sum(1 for line in file if line.strip())
+        except IOError:
+            print(f"Error contando filas: {filepath}")
+            return 0
+
+    def _iter_records(self, filepath: str) -> Iterator[dict[str, Any]]:
+        """
+        Decodifica los registros por lotes de líneas no vacías
+        :param filepath: Ruta absoluta o relativa del fichero
+        :return: Iterador de objetos JSON
+        """
+        try:
+            with CompressedInput.open_text(filepath, self.encoding, buffering=self.buffer_size) as file:
+                numbered = ((number, line) for number, line in enumerate(file, start=1) if line.strip())
+                while True:
+                    batch = list(islice(numbered, self.decode_batch_size))
+                    if not batch:
+                        break
+                    yield from _decode_batch(batch, filepath)
+        except UnicodeDecodeError:
+            raise ValueError(f"Error decodificando archivo JSON Lines {filepath}")
+
+
+def _decode_batch(batch: list[tuple[int, str]], filepath: str) -> list[dict[str, Any]]:
+    """
+    Decodifica un lote de líneas con una sola llamada a json.loads; ante un error, localiza la línea culpable
+    :param batch: Lista de (número de línea, texto)
+    :param filepath: Ruta del fichero (para el mensaje de error)
+    :return: Lista de objetos JSON
+    """
+    try:
+        records = json.loads(
+            "[" + ",".join(line for _, line in batch) + "]", parse_int=JSONNumber, parse_float=JSONNumber
+        )
+        if len(records) == len(batch) and all(type(record) is dict for record in records):
+            return records
+    except json.JSONDecodeError:
+        pass
+
+    # ■■■■■■■■■■■■■ Lote inválido: decodificar línea a línea para informar la primera línea errónea ■■■■■■■■■■■■■
+    records = list()
+    for number, line in batch:
+        try:
+            record = json.loads(line, parse_int=JSONNumber, parse_float=JSONNumber)
+        except json.JSONDecodeError as error:
+            raise ValueError(f"JSON invalido en {filepath}, linea {number}: {error.msg}")
+        if type(record) is not dict:
+            raise ValueError(f"La linea {number} de {filepath} no es un objeto JSON")
+        records.append(record)
+    return records
+
+
+def _to_text(value: Any) -> Optional[str]:
+    """
+    Texto equivalente a una celda CSV de un valor JSON ya decodificado
+    :param value: Valor decodificado
+    :return: Texto o None para null / clave ausente
+    """
+    if value is None or type(value) is str:
+        return value
+    if type(value) is JSONNumber:
+        return str(value)
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    return _dump(value)
+
+
+def _dump(value: Any) -> str:
+    """
+    Serializa un objeto o lista anidados conservando el texto original de sus números
+    :param value: Valor decodificado
+    :return: Texto JSON
+    """
+    if type(value) is dict:
+        return "{" + ", ".join(
+            json.dumps(key, ensure_ascii=False) + ": " + _dump(item) for key, item in value.items()
+        ) + "}"
+    if type(value) is list:
+        return "[" + ", ".join(_dump(item) for item in value) + "]"
+    if type(value) is JSONNumber:
+        return str(value)
+    return json.dumps(value, ensure_ascii=False)
@@ -7,16 +7,53 @@ DESCRIPCIÓN: Clase utilitaria para cargar y validar configuraciones de reglas d
 ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
 """
 
-from typing import Any
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Optional
+import threading
 import yaml
 import os
 
+from readers.typed_rules import DataTypeRules, Thresholds
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ Conjuntos de reglas tipadas distintos que se conservan para reutilizar el mismo objeto ⋮⋮⋮⋮⋮⋮⋮⋮
+MAX_INTERNED_RULES = 64
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ ALIAS de estructura datos ⋮⋮⋮⋮⋮⋮⋮⋮
+FileSignatureType = tuple[int, int, int]
+ReloadListenerType = Callable[[str, Optional["RulesSnapshot"], "RulesSnapshot"], None]
+
+
+@dataclass(frozen=True, eq=False)
+class RulesSnapshot:
+    """
+    Estado inmutable de un archivo de reglas: configuración parseada y reglas tipadas de una misma versión
+    Una recarga crea una instantánea nueva y la sustituye en una sola asignación, así que una auditoría en
+    curso sigue usando la versión con la que empezó
+    """
+    __slots__ = ("path", "signature", "config", "rules", "thresholds", "rules_error", "reload_error")
+    path: str
+    signature: FileSignatureType
+    config: dict[str, Any]
+    rules: Optional[DataTypeRules]
+    thresholds: Optional[Thresholds]
+    rules_error: Optional[str]
+    reload_error: Optional[str]
+
+
 class QualityRulesReader:
     """
     Clase de utilidad para cargar y gestionar configuraciones YAML
     de reglas de calidad de datos
     """
 
+    # ▲▲▲▲▲▲ Reglas iguales leídas en llamadas distintas comparten objeto (las cachés aciertan por identidad) ▲▲▲▲▲▲
+    _interned_rules: dict[DataTypeRules, DataTypeRules] = dict()
+
+    # ▲▲▲▲▲▲ Instantáneas por ruta absoluta y funciones avisadas tras cada recarga ▲▲▲▲▲▲
+    _snapshots: dict[str, RulesSnapshot] = dict()
+    _reload_listeners: list[ReloadListenerType] = list()
+    _reload_lock = threading.Lock()
+
     @staticmethod
     def load_configs(path_yaml: str) -> dict[str, Any]:
         """
@@ -44,6 +81,93 @@ class QualityRulesReader:
         except UnicodeDecodeError:
             raise ValueError(f"Error decodificando archivo YAML {path_yaml}")
 
+    @staticmethod
+    def load_snapshot(path_yaml: str) -> RulesSnapshot:
+        """
+        Configuración cacheada de un archivo de reglas, recargada solo si cambió su fecha, tamaño o inodo
+        (una llamada a os.stat por consulta). Si la nueva versión no se puede parsear se conserva la anterior
+        La configuración devuelta es compartida: no debe modificarse
+        :param path_yaml: Ruta al archivo YAML
+        :return: Instantánea vigente del archivo
+        :raises FileNotFoundError: Si el archivo no existe (se descarta su instantánea)
+        :raises yaml.YAMLError: Si hay error en el formato YAML y no había una versión anterior válida
+        """
+        path = os.path.abspath(path_yaml)
+        try:
+            signature = QualityRulesReader._signature(path)
+        except OSError as e:
+            QualityRulesReader.invalidate(path)
+            raise FileNotFoundError(f"Archivo de configuración no encontrado: {path_yaml}") from e
+
+        snapshot = QualityRulesReader._snapshots.get(path)
+        if snapshot is not None and snapshot.signature == signature:
+            return snapshot
+        return QualityRulesReader._reload(path, signature)
+
+    @staticmethod
+    def load_rules(path_yaml: str) -> DataTypeRules:
+        """
+        Reglas tipadas cacheadas de un archivo de reglas (ver load_snapshot)
+        :param path_yaml: Ruta al archivo YAML
+        :return: Reglas tipadas de la versión vigente
+        :raises ValueError: Si alguna regla de la versión vigente no tiene el tipo esperado
+        """
+        snapshot = QualityRulesReader.load_snapshot(path_yaml)
+        if snapshot.rules is None:
+            raise ValueError(snapshot.rules_error)
+        return snapshot.rules
+
+    @staticmethod
+    def refresh(path_yaml: str) -> bool:
+        """
+        Comprueba un archivo de reglas y lo recarga si cambió
+        :param path_yaml: Ruta al archivo YAML
+        :return: ¿Se sustituyó la configuración cacheada?
+        """
+        previous = QualityRulesReader._snapshots.get(os.path.abspath(path_yaml))
+        snapshot = QualityRulesReader.load_snapshot(path_yaml)
+        return previous is not None and snapshot.config is not previous.config
+
+    @staticmethod
+    def invalidate(path_yaml: Optional[str] = None):
+        """
+        Descarta la instantánea de un archivo de reglas (o de todos) para forzar su lectura en la próxima consulta
+        :param path_yaml: Ruta al archivo YAML (Opcional; sin ruta se descartan todas)
+        """
+        with QualityRulesReader._reload_lock:
+            if path_yaml is None:
+                QualityRulesReader._snapshots.clear()
+            else:
+                QualityRulesReader._snapshots.pop(os.path.abspath(path_yaml), None)
+
+    @staticmethod
+    def rules_in_use(rules: DataTypeRules) -> bool:
+        """
+        Indica si alguna instantánea cacheada usa estas reglas
+        :param rules: Reglas tipadas
+        :return: ¿Las usa algún archivo de reglas cacheado?
+        """
+        return any(snapshot.rules == rules for snapshot in list(QualityRulesReader._snapshots.values()))
+
+    @staticmethod
+    def add_reload_listener(listener: ReloadListenerType):
+        """
+        Registra una función que se llama tras cada recarga con (ruta, instantánea anterior, instantánea nueva),
+        para invalidar solo lo compilado a partir del archivo que cambió
+        :param listener: Función a registrar
+        """
+        if listener not in QualityRulesReader._reload_listeners:
+            QualityRulesReader._reload_listeners.append(listener)
+
+    @staticmethod
+    def remove_reload_listener(listener: ReloadListenerType):
+        """
+        Elimina una función registrada con add_reload_listener
+        :param listener: Función registrada
+        """
+        if listener in QualityRulesReader._reload_listeners:
+            QualityRulesReader._reload_listeners.remove(listener)
+
     @staticmethod
     def get_general_rules(config: dict[str, Any]) -> dict[str, Any]:
         """
@@ -78,6 +202,40 @@ class QualityRulesReader:
         data_type_rules = config['quality_rules'].get('data_type_rules', {})
         return data_type_rules.get(tipo, {})
 
+    @staticmethod
+    def get_typed_rules(config: dict[str, Any]) -> DataTypeRules:
+        """
+        Reglas de todos los tipos de dato como objetos inmutables y hashables, validadas una sola vez
+        (valores por defecto para las secciones que no están definidas). Configuraciones iguales devuelven
+        el mismo objeto
+        :param config: Configuración completa
+        :return: Reglas tipadas (null, boolean, numeric, text, date)
+        :raises ValueError: Si alguna regla no tiene el tipo esperado
+        """
+        if not config or 'quality_rules' not in config:
+            rules = DataTypeRules.from_dict(None)
+        else:
+            rules = DataTypeRules.from_dict(config['quality_rules'].get('data_type_rules'))
+
+        interned = QualityRulesReader._interned_rules.get(rules)
+        if interned is None:
+            if len(QualityRulesReader._interned_rules) >= MAX_INTERNED_RULES:
+                QualityRulesReader._interned_rules.clear()
+            interned = QualityRulesReader._interned_rules.setdefault(rules, rules)
+        return interned
+
+    @staticmethod
+    def get_typed_thresholds(config: dict[str, Any]) -> Thresholds:
+        """
+        Umbrales de alerta como objeto inmutable (valores por defecto para los que no están definidos)
+        :param config: Configuración completa
+        :return: Umbrales tipados de advertencia y críticos
+        :raises ValueError: Si algún umbral no es numérico
+        """
+        if not config or 'quality_rules' not in config:
+            return Thresholds.from_dict(None)
+        return Thresholds.from_dict(config['quality_rules'].get('thresholds'))
+
     @staticmethod
     def get_thresholds(config: dict[str, Any]) -> dict[str, Any]:
         """
@@ -85,23 +243,7 @@ class QualityRulesReader:
         :param config: Configuración completa
         :return: Diccionario con umbrales de advertencia y críticos
         """
-        if not config or 'quality_rules' not in config:
-            return QualityRulesReader._default_thresholds()
-        
-        thresholds = config['quality_rules'].get('thresholds', {})
-        
-        return {
-            'warning': {
-                'null_percentage': thresholds.get('warning', {}).get('null_percentage', 25.0),
-                'low_uniqueness': thresholds.get('warning', {}).get('low_uniqueness', 10.0),
-                'high_uniqueness': thresholds.get('warning', {}).get('high_uniqueness', 90.0)
-            },
-            'critical': {
-                'null_percentage': thresholds.get('critical', {}).get('null_percentage', 50.0),
-                'low_uniqueness': thresholds.get('critical', {}).get('low_uniqueness', 5.0),
-                'high_uniqueness': thresholds.get('critical', {}).get('high_uniqueness', 95.0)
-            }
-        }
+        return QualityRulesReader.get_typed_thresholds(config).to_dict()
 
     @staticmethod
     def get_exclusions(config: dict[str, Any]) -> dict[str, Any]:
@@ -156,11 +298,13 @@ class QualityRulesReader:
             if not isinstance(general[key], (int, float)):
                 return False
         
-        # ■■■■■■■■■■■■■ Validar reglas de tipo de dato ■■■■■■■■■■■■■
-        data_type_rules = quality_rules['data_type_rules']
-        if not isinstance(data_type_rules, dict):
+        # ■■■■■■■■■■■■■ Validar reglas de tipo de dato y umbrales construyendo sus objetos tipados ■■■■■■■■■■■■■
+        try:
+            QualityRulesReader.get_typed_rules(config)
+            QualityRulesReader.get_typed_thresholds(config)
+        except ValueError:
             return False
-        
+
         return True
 
     # ◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤ ⎡ Advertencia ⎦ ◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤◢◤
@@ -238,15 +382,59 @@ class QualityRulesReader:
         Retorna umbrales por defecto
         :return: Umbrales por defecto
         """
-        return {
-            'warning': {
-                'null_percentage': 25.0,
-                'low_uniqueness': 10.0,
-                'high_uniqueness': 90.0
-            },
-            'critical': {
-                'null_percentage': 50.0,
-                'low_uniqueness': 5.0,
-                'high_uniqueness': 95.0
-            }
-        }
\ No newline at end of file
+        return Thresholds.from_dict(None).to_dict()
+
+    @staticmethod
+    def _signature(path: str) -> FileSignatureType:
+        """
+        Firma barata de la versión de un archivo: fecha de modificación en ns, tamaño e inodo
+        (el inodo cambia cuando un editor reemplaza el archivo con un renombrado atómico)
+        :param path: Ruta absoluta del archivo
+        :return: Tupla (mtime_ns, tamaño, inodo)
+        """
+        stat = os.stat(path)
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    @staticmethod
+    def _reload(path: str, signature: FileSignatureType) -> RulesSnapshot:
+        """
+        Parsea un archivo de reglas y sustituye su instantánea en una sola asignación
+        :param path: Ruta absoluta del archivo
+        :param signature: Firma del archivo leída antes de parsearlo
+        :return: Instantánea vigente
+        """
+        with QualityRulesReader._reload_lock:
+            previous = QualityRulesReader._snapshots.get(path)
+            if previous is not None and previous.signature == signature:
+                return previous
+
+            try:
+                config = QualityRulesReader.load_configs(path)
+            except (yaml.YAMLError, ValueError, PermissionError) as e:
+                if previous is None:
+                    raise
+
+                # ■■■■■■■■■■■■■ Archivo a medio editar: se conservan las reglas anteriores hasta el próximo cambio ■■■■■■■■■■■■■
+                print(f"Advertencia: no se pudo recargar {path}, se conservan las reglas anteriores: {str(e)}")
+                QualityRulesReader._snapshots[path] = replace(previous, signature=signature, reload_error=str(e))
+                return QualityRulesReader._snapshots[path]
+
+            # ■■■■■■■■■■■■■ Reglas tipadas y umbrales de la misma versión ■■■■■■■■■■■■■
+            rules, thresholds, rules_error = None, None, None
+            try:
+                rules = QualityRulesReader.get_typed_rules(config)
+                thresholds = QualityRulesReader.get_typed_thresholds(config)
+            except (ValueError, AttributeError, TypeError) as e:
+                rules_error = str(e)
+
+            snapshot = RulesSnapshot(path, signature, config, rules, thresholds, rules_error, None)
+            QualityRulesReader._snapshots[path] = snapshot
+
+            # ▲▲▲▲▲▲ Las reglas anteriores que ya no usa ningún archivo dejan de conservarse ▲▲▲▲▲▲
+            if previous is not None and previous.rules is not None and previous.rules != rules \
+                    and not QualityRulesReader.rules_in_use(previous.rules):
+                QualityRulesReader._interned_rules.pop(previous.rules, None)
+
+        for listener in list(QualityRulesReader._reload_listeners):
+            listener(path, previous, snapshot)
+        return snapshot
@@ -0,0 +1,112 @@
+"""
+■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+MÓDULO:      Vigilancia de archivos de reglas
+AUTOR:       Fisherk2
+FECHA:       2026-10-19
+DESCRIPCIÓN: Recarga en caliente de archivos de reglas de calidad para procesos de auditoría de larga duración
+■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+"""
+import os
+import threading
+from typing import Iterable, Optional
+
+from readers.quality_rules_reader import QualityRulesReader
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ Segundos entre comprobaciones del hilo de vigilancia ⋮⋮⋮⋮⋮⋮⋮⋮
+DEFAULT_POLL_INTERVAL = 2.0
+
+
+class RulesWatcher:
+    """
+    Comprueba periódicamente los archivos de reglas vigilados (una llamada a os.stat por archivo) y recarga
+    los que cambiaron con QualityRulesReader.refresh. La sustitución es atómica: las auditorías en curso
+    terminan con las reglas con las que empezaron y las siguientes usan las nuevas sin reiniciar el proceso
+    """
+
+    def __init__(self, paths: Iterable[str] = (), interval: float = DEFAULT_POLL_INTERVAL):
+        """
+        :param paths: Archivos de reglas a vigilar
+        :param interval: Segundos entre comprobaciones del hilo de vigilancia
+        """
+        self.interval = interval
+        self.paths: list[str] = list()
+        self.errors: dict[str, str] = dict()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        for path in paths:
+            self.watch(path)
+
+    def __enter__(self) -> "RulesWatcher":
+        self.start()
+        return self
+
+    def __exit__(self, *_):
+        self.stop()
+
+    def watch(self, path_yaml: str):
+        """
+        Añade un archivo de reglas a la vigilancia
+        :param path_yaml: Ruta al archivo YAML
+        """
+        path = os.path.abspath(path_yaml)
+        if path not in self.paths:
+            self.paths.append(path)
+
+    def unwatch(self, path_yaml: str):
+        """
+        Deja de vigilar un archivo de reglas (su configuración cacheada se conserva)
+        :param path_yaml: Ruta al archivo YAML
+        """
+        path = os.path.abspath(path_yaml)
+        if path in self.paths:
+            self.paths.remove(path)
+        self.errors.pop(path, None)
+
+    def poll(self) -> list[str]:
+        """
+        Comprueba una vez todos los archivos vigilados y recarga los que cambiaron
+        Los errores (archivo borrado o YAML inválido sin versión anterior) se guardan en errors por archivo
+        :return: Rutas de los archivos cuya configuración se sustituyó
+        """
+        changed = list()
+        for path in list(self.paths):
+            try:
+                if QualityRulesReader.refresh(path):
+                    changed.append(path)
+                snapshot = QualityRulesReader.load_snapshot(path)
+            except Exception as e:
+                self.errors[path] = str(e)
+                continue
+
+            if snapshot.reload_error:
+                self.errors[path] = snapshot.reload_error
+            else:
+                self.errors.pop(path, None)
+        return changed
+
+    def start(self):
+        """
+        Inicia el hilo de vigilancia (hilo demonio: no impide terminar el proceso)
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="RulesWatcher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Detiene el hilo de vigilancia y espera a que termine la comprobación en curso
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        """
+        Bucle del hilo de vigilancia
+        """
+        self.poll()
+        while not self._stop_event.wait(self.interval):
+            self.poll()
@@ -0,0 +1,192 @@
+"""
+■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+MÓDULO:      Fuente de datos SQLite
+AUTOR:       Fisherk2
+FECHA:       2026-10-19
+DESCRIPCIÓN: Lectura de una tabla de una base SQLite local por lotes (fetchmany) y ejecución de agregados SQL
+■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+"""
+import os
+import sqlite3
+from pathlib import Path
+from typing import Any, Iterator, Optional, Union
+
+from .csv_reader import RowBatchType, ColumnBatchType, DEFAULT_BATCH_SIZE
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ Filas pedidas al cursor por llamada a fetchmany ⋮⋮⋮⋮⋮⋮⋮⋮
+DEFAULT_FETCH_SIZE = 10000
+
+
+class SQLiteSource:
+    """
+    Tabla de una base SQLite local abierta en solo lectura
+    - Filas: cada celda se lee como CAST(columna AS TEXT), el mismo texto que tendría exportada a CSV,
+      y NULL como None (una celda ausente para DataParser.is_null_value)
+    - Agregados: una sola sentencia SELECT sobre la tabla para que los análisis se calculen en SQLite
+      sin materializar filas en Python
+    """
+
+    def __init__(self, database: str, table: str, source_config: Optional[dict[str, Any]] = None):
+        """
+        :param database: Ruta del fichero de la base SQLite
+        :param table: Nombre de la tabla a leer
+        :param source_config: Sección input.primary_source del pipeline (fetch_size) (Opcional)
+        """
+        source_config = source_config or dict()
+        self.database = database
+        self.table = table
+        self.fetch_size: int = source_config.get("fetch_size", DEFAULT_FETCH_SIZE)
+        self._connection: Optional[sqlite3.Connection] = None
+
+    def __enter__(self) -> "SQLiteSource":
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    @staticmethod
+    def quote_identifier(name: str) -> str:
+        """
+        Escapa un nombre de tabla o columna para usarlo en una sentencia SQL
+        :param name: Nombre del identificador
+        :return: Identificador entre comillas dobles
+        """
+        return '"' + name.replace('"', '""') + '"'
+
+    @staticmethod
+    def text_expression(column: str) -> str:
+        """
+        Expresión SQL con el texto de una columna (igual al que entrega read_rows)
+        :param column: Nombre de la columna
+        :return: Expresión CAST(columna AS TEXT)
+        """
+        return f"CAST({SQLiteSource.quote_identifier(column)} AS TEXT)"
+
+    def validate_file_exist(self) -> bool:
+        """
+        Verifica si el fichero de la base existe
+        :return: ¿El archivo existe?
+        """
+        return os.path.isfile(self.database)
+
+    def connect(self) -> sqlite3.Connection:
+        """
+        Conexión de solo lectura a la base, abierta una vez y reutilizada
+        :return: Conexión SQLite
+        """
+        if self._connection is None:
+            if not self.validate_file_exist():
+                raise FileNotFoundError(f"El archivo no existe: {self.database}")
+            self._connection = sqlite3.connect(Path(self.database).resolve().as_uri() + "?mode=ro", uri=True)
+        return self._connection
+
+    def close(self):
+        """
+        Cierra la conexión si está abierta
+        """
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def read_headers(self) -> list[str]:
+        """
+        Columnas de la tabla en el orden de su definición
+        :return: Lista de columnas (vacía si la base o la tabla no existen)
+        """
+        if not self.validate_file_exist():
+            return []
+        rows = self.execute(f"PRAGMA table_info({self.quote_identifier(self.table)})").fetchall()
+        return [row[1] for row in rows]
+
+    def count_rows(self) -> int:
+        """
+        Cuenta las filas de la tabla
+        :return: Número de filas
+        """
+        return self.execute(f"SELECT COUNT(*) FROM {self.quote_identifier(self.table)}").fetchone()[0]
+
+    def read_rows(self, columns: Optional[list[str]] = None) -> Iterator[dict[str, Optional[str]]]:
+        """
+        Lee las filas como diccionarios de texto, en lotes de fetch_size filas
+        :param columns: Columnas a leer (Opcional; solo las presentes en la tabla)
+        :return: Iterador de filas
+        """
+        headers = self._projection(columns)
+        for batch in self._fetch(headers, self.fetch_size):
+            for row in batch:
+                yield dict(zip(headers, row))
+
+    def read_batches(
+            self,
+            batch_size: int = DEFAULT_BATCH_SIZE,
+            columnar: bool = False,
+            columns: Optional[list[str]] = None
+    ) -> Iterator[Union[RowBatchType, ColumnBatchType]]:
+        """
+        Lee la tabla en lotes de tamaño fijo, como lista de tuplas o por columnas (igual que CSVReader)
+        :param batch_size: Número de filas por lote
+        :param columnar: Entregar cada lote como una lista de valores por columna
+        :param columns: Columnas a leer (Opcional; solo las presentes en la tabla, en el orden de la tabla)
+        :return: Iterador de lotes
+        """
+        if batch_size < 1:
+            raise ValueError(f"El tamaño de lote debe ser positivo: {batch_size}")
+        for batch in self._fetch(self._projection(columns), batch_size):
+            yield [list(column) for column in zip(*batch)] if columnar else batch
+
+    def aggregate(self, expressions: list[str]) -> tuple:
+        """
+        Evalúa expresiones de agregado sobre la tabla completa en una sola sentencia
+        :param expressions: Expresiones SQL de agregado (SUM, MIN, MAX, TOTAL, COUNT...)
+        :return: Tupla con el resultado de cada expresión
+        """
+        sql = f"SELECT {', '.join(expressions)} FROM {self.quote_identifier(self.table)}"
+        return self.execute(sql).fetchone()
+
+    def execute(self, sql: str, parameters: tuple = ()) -> sqlite3.Cursor:
+        """
+        Ejecuta una sentencia de lectura sobre la conexión
+        :param sql: Sentencia SQL
+        :param parameters: Parámetros de la sentencia
+        :return: Cursor con el resultado
+        """
+        try:
+            return self.connect().execute(sql, parameters)
+        except sqlite3.DatabaseError as error:
+            raise ValueError(f"Error consultando la tabla {self.table} de {self.database}: {error}")
+
+    def _projection(self, columns: Optional[list[str]]) -> list[str]:
+        """
+        Columnas a leer en el orden de la tabla
+        :param columns: Columnas pedidas (Opcional)
+        :return: Lista de columnas
+        """
+        headers = self.read_headers()
+        if not headers:
+            if not self.validate_file_exist():
+                raise FileNotFoundError(f"El archivo no existe: {self.database}")
+            raise ValueError(f"La tabla {self.table} no existe en {self.database}")
+        if columns is None:
+            return headers
+        wanted = set(columns)
+        return [header for header in headers if header in wanted]
+
+    def _fetch(self, headers: list[str], batch_size: int) -> Iterator[list[tuple]]:
+        """
+        Recorre la tabla con fetchmany sobre las columnas como texto
+        :param headers: Columnas a leer
+        :param batch_size: Filas por llamada a fetchmany
+        :return: Iterador de lotes de tuplas
+        """
+        if not headers:
+            return
+        select = ", ".join(self.text_expression(header) for header in headers)
+        cursor = self.execute(f"SELECT {select} FROM {self.quote_identifier(self.table)}")
+        try:
+            while True:
+                batch = cursor.fetchmany(batch_size)
+                if not batch:
+                    break
+                yield batch
+        finally:
+            cursor.close()
@@ -0,0 +1,289 @@
+"""
+■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+MÓDULO:      Reglas de calidad tipadas
+AUTOR:       Fisherk2
+FECHA:       2026-10-19
+DESCRIPCIÓN: Objetos inmutables (dataclass congelada con __slots__) de las reglas por tipo de dato y umbrales
+■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+"""
+from dataclasses import dataclass, fields
+from typing import Any, Optional, Union
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ Valores por defecto cuando una regla no está configurada (los de DataParser sin reglas) ⋮⋮⋮⋮⋮⋮⋮⋮
+DEFAULT_NULL_INTERPRETATIONS = ('', 'null', 'none', 'na', 'n/a', '<null>')
+DEFAULT_BOOLEAN_INTERPRETATIONS = ('true', 'false', '1', '0', 'yes', 'no', 'on', 'off')
+DEFAULT_DATE_FORMATS = ("%Y-%m-%d",)
+DEFAULT_PRECISION = 2
+DEFAULT_WARNING_THRESHOLDS = {'null_percentage': 25.0, 'low_uniqueness': 10.0, 'high_uniqueness': 90.0}
+DEFAULT_CRITICAL_THRESHOLDS = {'null_percentage': 50.0, 'low_uniqueness': 5.0, 'high_uniqueness': 95.0}
+
+
+class RuleSet:
+    """
+    Base de las reglas tipadas: inmutables, sin __dict__ y hashables, para usarlas como clave de cachés
+    (clasificadores compilados por reglas). Se construyen una vez al cargar la configuración con from_dict
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_dict(cls, section: Optional[dict[str, Any]]) -> "RuleSet":
+        """
+        Construye las reglas desde su sección YAML, validando tipos y aplicando valores por defecto
+        :param section: Sección de la configuración (None o vacía para los valores por defecto)
+        :return: Reglas tipadas
+        :raises ValueError: Si la sección o alguno de sus valores no tiene el tipo esperado
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def coerce(cls, rules: Union["RuleSet", dict[str, Any], None]) -> "RuleSet":
+        """
+        Acepta reglas ya tipadas (sin coste) o un diccionario de reglas de la API anterior
+        :param rules: Reglas tipadas, diccionario o None
+        :return: Reglas tipadas
+        """
+        if type(rules) is cls or not (rules is None or isinstance(rules, dict)):
+            return rules
+        return cls.from_dict(rules)
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Representación como diccionario (formato de QualityRulesReader.get_data_type_rules)
+        :return: Diccionario con los campos de las reglas
+        """
+        result = dict()
+        for field in fields(self):
+            value = getattr(self, field.name)
+            if isinstance(value, RuleSet):
+                value = value.to_dict()
+            elif isinstance(value, (tuple, frozenset)):
+                value = list(value)
+            result[field.name] = value
+        return result
+
+    def __reduce__(self):
+        # ▲▲▲▲▲▲ Una dataclass congelada con __slots__ no admite la restauración de estado por defecto de pickle ▲▲▲▲▲▲
+        return type(self), tuple(getattr(self, field.name) for field in fields(self))
+
+
+@dataclass(frozen=True)
+class NullRules(RuleSet):
+    """
+    Interpretaciones de nulo, comparadas con el valor en minúsculas y sin espacios
+    """
+    __slots__ = ("supported_interpretations",)
+    supported_interpretations: frozenset
+
+    @classmethod
+    def from_dict(cls, section: Optional[dict[str, Any]]) -> "NullRules":
+        section = _section(section, 'null')
+        return cls(frozenset(_sequence(section, 'supported_interpretations', DEFAULT_NULL_INTERPRETATIONS)))
+
+
+@dataclass(frozen=True)
+class BooleanRules(RuleSet):
+    """
+    Interpretaciones de booleano en el orden configurado (la primera mitad son verdaderos, ver transform_data)
+    """
+    __slots__ = ("supported_interpretations",)
+    supported_interpretations: tuple
+
+    @classmethod
+    def from_dict(cls, section: Optional[dict[str, Any]]) -> "BooleanRules":
+        section = _section(section, 'boolean')
+        return cls(_sequence(section, 'supported_interpretations', DEFAULT_BOOLEAN_INTERPRETATIONS))
+
+
+@dataclass(frozen=True)
+class NumericRules(RuleSet):
+    """
+    Valores numéricos permitidos y precisión de los estadísticos
+    """
+    __slots__ = ("allow_negative", "min_value", "max_value", "precision")
+    allow_negative: bool
+    min_value: Optional[float]
+    max_value: Optional[float]
+    precision: int
+
+    @classmethod
+    def from_dict(cls, section: Optional[dict[str, Any]]) -> "NumericRules":
+        section = _section(section, 'numeric')
+        return cls(
+            _typed(section, 'allow_negative', True, bool),
+            _number(section, 'min_value'),
+            _number(section, 'max_value'),
+            _typed(section, 'precision', DEFAULT_PRECISION, int)
+        )
+
+
+@dataclass(frozen=True)
+class TextRules(RuleSet):
+    """
+    Longitudes y patrones permitidos para texto
+    """
+    __slots__ = ("min_length", "max_length", "allow_empty_strings", "allowed_patterns")
+    min_length: int
+    max_length: Optional[int]
+    allow_empty_strings: bool
+    allowed_patterns: tuple
+
+    @classmethod
+    def from_dict(cls, section: Optional[dict[str, Any]]) -> "TextRules":
+        section = _section(section, 'text')
+        return cls(
+            _typed(section, 'min_length', 1, int),
+            _typed(section, 'max_length', None, int),
+            _typed(section, 'allow_empty_strings', False, bool),
+            _sequence(section, 'allowed_patterns', ())
+        )
+
+
+@dataclass(frozen=True)
+class DateRules(RuleSet):
+    """
+    Formatos y límites de fechas (los límites se interpretan en DateAnalyzer)
+    """
+    __slots__ = ("allow_future_dates", "min_date", "max_date", "supported_formats")
+    allow_future_dates: bool
+    min_date: Any
+    max_date: Any
+    supported_formats: tuple
+
+    @classmethod
+    def from_dict(cls, section: Optional[dict[str, Any]]) -> "DateRules":
+        section = _section(section, 'date')
+        return cls(
+            _typed(section, 'allow_future_dates', False, bool),
+            section.get('min_date'),
+            section.get('max_date'),
+            _sequence(section, 'supported_formats', DEFAULT_DATE_FORMATS)
+        )
+
+
+@dataclass(frozen=True)
+class DataTypeRules(RuleSet):
+    """
+    Reglas de todos los tipos de dato (sección quality_rules.data_type_rules)
+    El hash se calcula una vez: estas reglas son la clave de los clasificadores compilados en cada clasificación
+    """
+    __slots__ = ("null", "boolean", "numeric", "text", "date", "_hash")
+    null: NullRules
+    boolean: BooleanRules
+    numeric: NumericRules
+    text: TextRules
+    date: DateRules
+
+    def __post_init__(self):
+        object.__setattr__(self, "_hash", hash((self.null, self.boolean, self.numeric, self.text, self.date)))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    @classmethod
+    def from_dict(cls, section: Optional[dict[str, Any]]) -> "DataTypeRules":
+        section = _section(section, 'data_type_rules')
+        return cls(
+            NullRules.from_dict(section.get('null')),
+            BooleanRules.from_dict(section.get('boolean')),
+            NumericRules.from_dict(section.get('numeric')),
+            TextRules.from_dict(section.get('text')),
+            DateRules.from_dict(section.get('date'))
+        )
+
+
+@dataclass(frozen=True)
+class ThresholdLevel(RuleSet):
+    """
+    Umbrales de un nivel de alerta (advertencia o crítico)
+    """
+    __slots__ = ("null_percentage", "low_uniqueness", "high_uniqueness")
+    null_percentage: float
+    low_uniqueness: float
+    high_uniqueness: float
+
+    @classmethod
+    def from_dict(cls, section: Optional[dict[str, Any]], defaults: dict[str, float] = None) -> "ThresholdLevel":
+        section = _section(section, 'thresholds')
+        defaults = defaults or DEFAULT_WARNING_THRESHOLDS
+        return cls(*(_typed(section, name, defaults[name], float) for name in DEFAULT_WARNING_THRESHOLDS))
+
+
+@dataclass(frozen=True)
+class Thresholds(RuleSet):
+    """
+    Umbrales de alerta de advertencia y críticos (sección quality_rules.thresholds)
+    """
+    __slots__ = ("warning", "critical")
+    warning: ThresholdLevel
+    critical: ThresholdLevel
+
+    @classmethod
+    def from_dict(cls, section: Optional[dict[str, Any]]) -> "Thresholds":
+        section = _section(section, 'thresholds')
+        return cls(
+            ThresholdLevel.from_dict(section.get('warning'), DEFAULT_WARNING_THRESHOLDS),
+            ThresholdLevel.from_dict(section.get('critical'), DEFAULT_CRITICAL_THRESHOLDS)
+        )
+
+
+def _section(section: Optional[dict[str, Any]], name: str) -> dict[str, Any]:
+    """
+    Sección de reglas como diccionario (vacío si no está configurada)
+    :param section: Valor de la sección en la configuración
+    :param name: Nombre de la sección (para el mensaje de error)
+    :return: Diccionario de la sección
+    """
+    if section is None:
+        return dict()
+    if not isinstance(section, dict):
+        raise ValueError(f"La sección de reglas '{name}' debe ser un diccionario: {section!r}")
+    return section
+
+
+def _typed(section: dict[str, Any], key: str, default: Any, expected: type) -> Any:
+    """
+    Valor de una regla con su tipo validado (None conserva el valor por defecto si este es None)
+    :param section: Sección de reglas
+    :param key: Nombre de la regla
+    :param default: Valor si la regla no está configurada
+    :param expected: Tipo esperado (float admite enteros; bool no se acepta como número)
+    :return: Valor de la regla
+    """
+    value = section.get(key, default)
+    if value is None and default is None:
+        return None
+    if expected is float and isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if not isinstance(value, expected) or (expected is not bool and isinstance(value, bool)):
+        raise ValueError(f"La regla '{key}' debe ser de tipo {expected.__name__}: {value!r}")
+    return value
+
+
+def _number(section: dict[str, Any], key: str) -> Optional[Union[int, float]]:
+    """
+    Límite numérico opcional
+    :param section: Sección de reglas
+    :param key: Nombre de la regla
+    :return: Número o None si no hay límite
+    """
+    value = section.get(key)
+    if value is not None and (isinstance(value, bool) or not isinstance(value, (int, float))):
+        raise ValueError(f"La regla '{key}' debe ser numérica o null: {value!r}")
+    return value
+
+
+def _sequence(section: dict[str, Any], key: str, default: tuple) -> tuple:
+    """
+    Lista de la configuración como tupla (hashable)
+    :param section: Sección de reglas
+    :param key: Nombre de la regla
+    :param default: Valor si la regla no está configurada
+    :return: Tupla de valores
+    """
+    value = section.get(key, default)
+    if value is None:
+        return tuple(default)
+    if not isinstance(value, (list, tuple)):
+        raise ValueError(f"La regla '{key}' debe ser una lista: {value!r}")
+    return tuple(value)
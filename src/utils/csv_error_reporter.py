@@ -6,12 +6,53 @@ FECHA:       2026-02-11
 DESCRIPCIÓN: Generador de mensajes de error consistentes para el validador de CSV
 ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
 """
+from src.utils.error_record import ErrorRecord
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ Códigos de error de archivo con mensaje propio ⋮⋮⋮⋮⋮⋮⋮⋮
+FILE_ERROR_TYPES = ("archivo_no_existe", "formato_invalido", "lectura_fallida")
+
 
 class CSVErrorReporter:
     """
     Generador de mensajes de error consistentes para el validador CSV
+    Los métodos *_record(s) crean registros estructurados; los métodos generate_* conservan
+    la salida clásica de lista de cadenas renderizando dichos registros
     """
 
+    def field_record(self, row_num: int, field_name: str, error_type: str, details: str, value=None) -> ErrorRecord:
+        """
+        Crea el registro de error para un campo específico
+        :param row_num: numero de fila donde ocurrio el error
+        :param field_name: nombre del campo con error
+        :param error_type: tipo de error (tipo_incorrecto, valor_nulo, etc.)
+        :param details: detalles adicionales sobre el error
+        :param value: valor del campo que provocó el error (opcional)
+        :return: Registro de error
+        """
+        return ErrorRecord(row_num, field_name, error_type, value, details)
+
+    def header_records(self, missing_headers: list[str], unexpected_headers: list[str]) -> list[ErrorRecord]:
+        """
+        Crea los registros de error para problemas con encabezados
+        :param missing_headers: Encabezados faltantes
+        :param unexpected_headers: Encabezados defectuosos
+        :return: Lista de registros de error
+        """
+        records = [ErrorRecord(0, header, "campo_faltante") for header in missing_headers]
+        records.extend(ErrorRecord(0, header, "campo_no_esperado") for header in unexpected_headers)
+        return records
+
+    def file_record(self, file_name: str, error_type: str, details: str) -> ErrorRecord:
+        """
+        Crea el registro de error relacionado con el archivo en sí
+        :param file_name: Nombre del fichero
+        :param error_type: Error lanzando
+        :param details: Especificación del error
+        :return: Registro de error
+        """
+        code = error_type if error_type in FILE_ERROR_TYPES else "error_archivo"
+        return ErrorRecord(0, None, code, file_name, details)
+
     def generate_field_error(self, row_num: int, field_name: str, error_type: str, details: str) -> list[str]:
         """
         Genera un mensaje de error para un campo específico
@@ -21,25 +62,7 @@ class CSVErrorReporter:
         :param details: detalles adicionales sobre el error
         :return: Array de strings con los mensajes de error
         """
-        errors = list()
-
-        # TODO: ▼△▼△▼△▼△▼△▼△▼△▼△▼△ Refactorizar △▼△▼△▼△▼△▼△▼△▼△▼△▼
-        if error_type == "tipo_incorrecto":
-            error_msg = f"Fila {row_num}: valor {details} en columna '{field_name}'"
-            errors.append(error_msg)
-        elif error_type == "valor_nulo":
-            error_msg = f"Fila {row_num}: campo requerido '{field_name}' está vacío"
-            errors.append(error_msg)
-        elif error_type == "campo_faltante":
-            error_msg = f"Archivo: campo requerido '{field_name}' no encontrado en encabezados"
-            errors.append(error_msg)
-        elif error_type == "campo_no_permitido":
-            error_msg = f"Fila {row_num}: campo '{field_name}' no permitido según esquema"
-            errors.append(error_msg)
-        else:
-            error_msg = f"Fila {row_num}: error en campo '{field_name}' - {details}"
-            errors.append(error_msg)
-        return errors
+        return [self.field_record(row_num, field_name, error_type, details).render()]
 
     def generate_header_error(self, missing_headers: list[str], unexpected_headers: list[str]) -> list[str]:
         """
@@ -48,20 +71,7 @@ class CSVErrorReporter:
         :param unexpected_headers: Encabezados defectuosos
         :return: Array de strings con los mensajes de error
         """
-        errors = list()
-
-        for header in missing_headers:
-            errors.extend(self.generate_field_error(
-                row_num=0,
-                field_name=header,
-                error_type="campo_faltante",
-                details="")
-            )
-
-        for header in unexpected_headers:
-            error_msg = f"Archivo: Campo no esperado '{header}' encontrado en encabezados"
-            errors.append(error_msg)
-        return errors
+        return ErrorRecord.render_all(self.header_records(missing_headers, unexpected_headers))
 
     def generate_file_error(self, file_name: str, error_type: str, details: str) -> list[str]:
         """
@@ -71,19 +81,4 @@ class CSVErrorReporter:
         :param details: Especificación del error
         :return: Array de strings con los mensajes de error
         """
-        errors = list()
-
-        # TODO: ▼△▼△▼△▼△▼△▼△▼△▼△▼△ Refactorizar △▼△▼△▼△▼△▼△▼△▼△▼△▼
-        if error_type == "archivo_no_existe":
-            error_msg = f"Archivo: '{file_name}' no existe"
-            errors.append(error_msg)
-        elif error_type == "formato_invalido":
-            error_msg = f"Archivo: No se pudo leer '{file_name}' - {details}"
-            errors.append(error_msg)
-        elif error_type == "lectura_fallida":
-            error_msg = f"Archivo: No se pudo leer '{file_name}' - {details}"
-            errors.append(error_msg)
-        else:
-            error_msg = f"Archivo: error en '{file_name}' - {details}"
-            errors.append(error_msg)
-        return errors
\ No newline at end of file
+        return [self.file_record(file_name, error_type, details).render()]
@@ -7,20 +7,36 @@ DESCRIPCIÓN: Capa de acceso a datos que proporciona funciones para validar y tr
 ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
 """
 
-from typing import Any
+from typing import Any, Callable, Optional, Union
+from utils.value_cache import ValueCache
+from readers.quality_rules_reader import QualityRulesReader, RulesSnapshot
+from readers.typed_rules import (
+    BooleanRules, DataTypeRules, NullRules, NumericRules, TextRules,
+    DEFAULT_NULL_INTERPRETATIONS, DEFAULT_BOOLEAN_INTERPRETATIONS
+)
 
 # ⋮⋮⋮⋮⋮⋮⋮⋮ ALIAS de estructura datos ⋮⋮⋮⋮⋮⋮⋮⋮
 RowDataType = list[dict[str, Any]]
 ColumnIndexMap = dict[str, list[int]]
+ClassificationType = tuple[str, Any]
+ClassifierType = Callable[[Any], ClassificationType]
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ Clasificadores compilados que se conservan (uno por conjunto de reglas distinto) ⋮⋮⋮⋮⋮⋮⋮⋮
+MAX_COMPILED_CLASSIFIERS = 32
 
 
 class DataParser:
     """
     Clase de utilidad para parseo y validación de datos estructurados
+    Las reglas se reciben tipadas (readers.typed_rules) o como diccionario de la API anterior; los diccionarios
+    se consultan directamente con .get(), sin convertirlos ni validarlos en cada llamada
     """
 
+    # ▲▲▲▲▲▲ Clasificadores compilados por reglas, en orden de compilación (el más antiguo se descarta primero) ▲▲▲▲▲▲
+    _compiled_classifiers: dict[DataTypeRules, ClassifierType] = dict()
+
     @staticmethod
-    def is_numeric_value(value: Any, numeric_rules: dict[str, Any] = None) -> bool:
+    def is_numeric_value(value: Any, numeric_rules: Union[NumericRules, dict[str, Any], None] = None) -> bool:
         """
         Verifica si un valor puede ser convertido a número según reglas
         :param value: Valor a evaluar
@@ -31,72 +47,61 @@ class DataParser:
             return False
         if isinstance(value, (int, float)):
             num_value = float(value)
-
-            # ■■■■■■■■■■■■■ Verificar reglas de valores permitidos ■■■■■■■■■■■■■
-            if numeric_rules:
-                if not numeric_rules.get('allow_negative', True) and num_value < 0:
-                    return False
-                min_value = numeric_rules.get('min_value')
-                if min_value is not None and num_value < min_value:
-                    return False
-                max_value = numeric_rules.get('max_value')
-                if max_value is not None and num_value > max_value:
-                    return False
-            return True
-
-        if isinstance(value, str):
+        elif isinstance(value, str):
             try:
                 num_value = float(value)
-
-                # ■■■■■■■■■■■■■ Verificar reglas de valores permitidos ■■■■■■■■■■■■■
-                if numeric_rules:
-                    if not numeric_rules.get('allow_negative', True) and num_value < 0:
-                        return False
-                    min_value = numeric_rules.get('min_value')
-                    if min_value is not None and num_value < min_value:
-                        return False
-                    max_value = numeric_rules.get('max_value')
-                    if max_value is not None and num_value > max_value:
-                        return False
-                return True
             except ValueError:
                 return False
-        return False
+        else:
+            return False
+
+        # ■■■■■■■■■■■■■ Verificar reglas de valores permitidos ■■■■■■■■■■■■■
+        if numeric_rules:
+            if isinstance(numeric_rules, dict):
+                allow_negative = numeric_rules.get('allow_negative', True)
+                min_value = numeric_rules.get('min_value')
+                max_value = numeric_rules.get('max_value')
+            else:
+                allow_negative = numeric_rules.allow_negative
+                min_value = numeric_rules.min_value
+                max_value = numeric_rules.max_value
+            if not allow_negative and num_value < 0:
+                return False
+            if min_value is not None and num_value < min_value:
+                return False
+            if max_value is not None and num_value > max_value:
+                return False
+        return True
 
     @staticmethod
-    def is_string_value(value: Any, text_rules: dict[str, Any] = None) -> bool:
+    def is_string_value(value: Any, text_rules: Union[TextRules, dict[str, Any], None] = None) -> bool:
         """
         Verifica si un valor es una cadena válida según reglas
         :param value: Valor a evaluar
         :param text_rules: Reglas de configuración para tipo texto (opcional)
         :return: ¿Es una cadena válida según reglas?
         """
-        if value is None:
+        if not isinstance(value, str):
             return False
-        if isinstance(value, str):
-            str_value = str(value)
 
-            # ■■■■■■■■■■■■■ Verificar reglas de longitud ■■■■■■■■■■■■■
-            if text_rules:
+        # ■■■■■■■■■■■■■ Verificar reglas de longitud ■■■■■■■■■■■■■
+        if text_rules:
+            if isinstance(text_rules, dict):
                 min_length = text_rules.get('min_length', 1)
-                if len(str_value) < min_length:
-                    return False
                 max_length = text_rules.get('max_length')
-                if max_length is not None and len(str_value) > max_length:
-                    return False
-
-                # ■■■■■■■■■■■■■ Verificar si permite cadenas vacias ■■■■■■■■■■■■■
-                if not text_rules.get('allow_empty_strings', False) and len(str_value.strip()) == 0:
-                    return False
-                return len(str_value.strip()) > 0
             else:
-                # Sin reglas: cualquier string no vacío es válido
-                return len(str_value.strip()) > 0
+                min_length = text_rules.min_length
+                max_length = text_rules.max_length
+            if len(value) < min_length:
+                return False
+            if max_length is not None and len(value) > max_length:
+                return False
 
-        return False
+        # ■■■■■■■■■■■■■ Con o sin reglas, solo son válidas las cadenas con contenido ■■■■■■■■■■■■■
+        return len(value.strip()) > 0
 
     @staticmethod
-    def is_bool_value(value: Any, boolean_rules: dict[str, Any] = None) -> bool:
+    def is_bool_value(value: Any, boolean_rules: Union[BooleanRules, dict[str, Any], None] = None) -> bool:
         """
         Verifica si un valor puede ser interpretado como booleano según reglas
         :param value: Valor a evaluar
@@ -111,17 +116,16 @@ class DataParser:
             lower_value = value.lower().strip()
 
             # ■■■■■■■■■■■■■ Usar interpretaciones configuradas ■■■■■■■■■■■■■
+            if isinstance(boolean_rules, dict) and boolean_rules:
+                return lower_value in boolean_rules.get('supported_interpretations', DEFAULT_BOOLEAN_INTERPRETATIONS)
             if boolean_rules:
-                supported_interpretations = boolean_rules.get('supported_interpretations',
-                                                              ['true', 'false', '1', '0', 'yes', 'no', 'on', 'off'])
-                return lower_value in supported_interpretations
-            else:
-                return lower_value in ['true', 'false', '1', '0', 'yes', 'no', 'on', 'off']
+                return lower_value in boolean_rules.supported_interpretations
+            return lower_value in DEFAULT_BOOLEAN_INTERPRETATIONS
 
         return False
 
     @staticmethod
-    def is_null_value(value: Any, null_rules: dict[str, Any] = None) -> bool:
+    def is_null_value(value: Any, null_rules: Union[NullRules, dict[str, Any], None] = None) -> bool:
         """
         Verifica si un valor es nulo o representa un valor nulo según reglas
         :param value: Valor a evaluar
@@ -134,15 +138,150 @@ class DataParser:
             trimmed = value.lower().strip()
 
             # ■■■■■■■■■■■■■ Usar interpretaciones configuradas ■■■■■■■■■■■■■
+            if type(null_rules) is NullRules:
+                return trimmed in null_rules.supported_interpretations
+            if isinstance(null_rules, dict) and null_rules:
+                return trimmed in null_rules.get('supported_interpretations', DEFAULT_NULL_INTERPRETATIONS)
             if null_rules:
-                supported_interpretations = null_rules.get('supported_interpretations',
-                                                           ['', 'null', 'none', 'na', 'n/a', '<null>'])
-                return trimmed in supported_interpretations
-            else:
-                return trimmed in ['', 'null', 'none', 'na', 'n/a', '<null>']
+                return trimmed in null_rules.supported_interpretations
+            return trimmed in DEFAULT_NULL_INTERPRETATIONS
 
         return False
 
+    @staticmethod
+    def classify_value(
+            value: Any,
+            data_type_rules: Union[DataTypeRules, dict[str, Any], None] = None,
+            cache: Optional[ValueCache] = None
+    ) -> ClassificationType:
+        """
+        Clasifica un valor como numérico, texto, booleano u otro (en ese orden de prioridad)
+        Si se proporciona un memo, cada cadena distinta se clasifica una sola vez
+        :param value: Valor a clasificar
+        :param data_type_rules: Reglas de configuración por tipo de dato (opcional)
+        :param cache: Memo de la columna a la que pertenece el valor (opcional)
+        :return: Tupla (etiqueta, valor parseado) con etiqueta en ["numeric", "text", "boolean", "other"]
+        """
+        if cache is None or not isinstance(value, str):
+            return DataParser._classify(value, data_type_rules)
+
+        entry = cache.get(value)
+        if entry is not None:
+            return entry
+        tag, parsed = DataParser._classify(value, data_type_rules)
+        return cache.put(value, tag, parsed)
+
+    @staticmethod
+    def compile_classifier(data_type_rules: DataTypeRules) -> ClassifierType:
+        """
+        Clasificador de classify_value con las reglas ya resueltas, compartido por todos los análisis que usan
+        las mismas reglas (las reglas tipadas son hashables y sirven de clave)
+        :param data_type_rules: Reglas tipadas de todos los tipos de dato
+        :return: Función valor -> (etiqueta, valor parseado)
+        """
+        classifier = DataParser._compiled_classifiers.get(data_type_rules)
+        if classifier is None:
+            classifier = DataParser._build_classifier(data_type_rules)
+            if len(DataParser._compiled_classifiers) >= MAX_COMPILED_CLASSIFIERS:
+                DataParser._compiled_classifiers.pop(next(iter(DataParser._compiled_classifiers)), None)
+            DataParser._compiled_classifiers[data_type_rules] = classifier
+        return classifier
+
+    @staticmethod
+    def discard_classifier(data_type_rules: DataTypeRules) -> bool:
+        """
+        Descarta el clasificador compilado de unas reglas
+        :param data_type_rules: Reglas tipadas
+        :return: ¿Había un clasificador compilado para esas reglas?
+        """
+        return DataParser._compiled_classifiers.pop(data_type_rules, None) is not None
+
+    @staticmethod
+    def on_rules_reloaded(path: str, previous: Optional[RulesSnapshot], snapshot: RulesSnapshot):
+        """
+        Aviso de QualityRulesReader tras recargar un archivo de reglas: descarta el clasificador de las reglas
+        anteriores si ningún otro archivo las usa y compila el de las nuevas, para que la siguiente auditoría
+        no pague la compilación. Los clasificadores de los demás archivos se conservan
+        :param path: Ruta absoluta del archivo recargado
+        :param previous: Instantánea anterior (None en la primera carga)
+        :param snapshot: Instantánea nueva
+        """
+        if previous is not None and previous.rules is not None and previous.rules != snapshot.rules \
+                and not QualityRulesReader.rules_in_use(previous.rules):
+            DataParser.discard_classifier(previous.rules)
+        if previous is not None and snapshot.rules is not None:
+            DataParser.compile_classifier(snapshot.rules)
+
+    @staticmethod
+    def _build_classifier(data_type_rules: DataTypeRules) -> ClassifierType:
+        """
+        Construye el clasificador de compile_classifier
+        :param data_type_rules: Reglas tipadas de todos los tipos de dato
+        :return: Función valor -> (etiqueta, valor parseado)
+        """
+        numeric_rules = data_type_rules.numeric
+        text_rules = data_type_rules.text
+        boolean_rules = data_type_rules.boolean
+        allow_negative = numeric_rules.allow_negative
+        min_value = numeric_rules.min_value
+        max_value = numeric_rules.max_value
+        min_length = text_rules.min_length
+        max_length = text_rules.max_length
+        booleans = frozenset(boolean_rules.supported_interpretations)
+
+        def classify(value: Any) -> ClassificationType:
+
+            # ▲▲▲▲▲▲ Valores que no son cadenas: mismos predicados que _classify ▲▲▲▲▲▲
+            if not isinstance(value, str):
+                if DataParser.is_numeric_value(value, numeric_rules):
+                    return "numeric", float(value)
+                if DataParser.is_bool_value(value, boolean_rules):
+                    return "boolean", value
+                return "other", None
+
+            # ▲▲▲▲▲▲ Cadenas: reglas ya resueltas en variables locales, sin consultar las reglas por celda ▲▲▲▲▲▲
+            try:
+                number = float(value)
+            except ValueError:
+                number = None
+            if number is not None and not (
+                    (not allow_negative and number < 0)
+                    or (min_value is not None and number < min_value)
+                    or (max_value is not None and number > max_value)
+            ):
+                return "numeric", number
+            length = len(value)
+            if length >= min_length and (max_length is None or length <= max_length) and value.strip():
+                return "text", value
+            if value.lower().strip() in booleans:
+                return "boolean", value
+            return "other", None
+
+        return classify
+
+    @staticmethod
+    def _classify(
+            value: Any,
+            data_type_rules: Union[DataTypeRules, dict[str, Any], None] = None
+    ) -> ClassificationType:
+        """
+        Clasificación sin memo de un valor individual
+        :param value: Valor a clasificar
+        :param data_type_rules: Reglas de configuración por tipo de dato (opcional)
+        :return: Tupla (etiqueta, valor parseado)
+        """
+        if not (data_type_rules is None or isinstance(data_type_rules, dict)):
+            return DataParser.compile_classifier(data_type_rules)(value)
+
+        rules = data_type_rules or {}
+        if DataParser.is_numeric_value(value, rules.get('numeric', {})):
+            return "numeric", float(value)
+        if DataParser.is_string_value(value, rules.get('text', {})):
+            return "text", value
+        if DataParser.is_bool_value(value, rules.get('boolean', {})):
+            return "boolean", value
+        return "other", None
+
     @staticmethod
     def thresholds_filter(data: RowDataType, exclusions: dict[str, Any]) -> RowDataType:
         """
@@ -250,3 +389,7 @@ class DataParser:
             datos_transformados.append(row_transformed)
 
         return datos_transformados
+
+
+# ■■■■■■■■■■■■■ Invalidación de clasificadores compilados al recargar un archivo de reglas ■■■■■■■■■■■■■
+QualityRulesReader.add_reload_listener(DataParser.on_rules_reloaded)
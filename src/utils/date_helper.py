@@ -7,8 +7,13 @@ DESCRIPCIÓN: Componente de bajo nivel que proporciona funciones auxiliares para
 ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
 """
 import datetime
-from typing import Optional, Any
+from typing import Any, Iterable, Optional
 from readers.quality_rules_reader import QualityRulesReader
+from utils.value_cache import ValueCache
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ Formatos ISO con parser manual (evita strptime) ⋮⋮⋮⋮⋮⋮⋮⋮
+ISO_DATE_FORMAT = "%Y-%m-%d"
+ISO_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 class DateHelper:
     """
@@ -38,11 +43,71 @@ class DateHelper:
         :param date_format: Formato de fecha especificado
         :return: datetime o None si hay error
         """
+        # ■■■■■■■■■■■■■ Ruta rápida para formatos ISO canónicos ■■■■■■■■■■■■■
+        if date_format == ISO_DATE_FORMAT or date_format == ISO_DATETIME_FORMAT:
+            if DateHelper._has_iso_shape(date, date_format):
+                try:
+                    return datetime.datetime.fromisoformat(date)
+                except ValueError:
+                    return None
+
         try:
             return datetime.datetime.strptime(date, date_format)
         except ValueError:
             return None
 
+    @staticmethod
+    def parse_many(
+            values: list[Any],
+            supported_formats: Optional[list[str]] = None,
+            resolver: Optional["DateFormatResolver"] = None
+    ) -> list[Optional[datetime.datetime]]:
+        """
+        Parsea en bloque una columna de fechas infiriendo su formato una sola vez
+        Los valores nulos, vacíos o no parseables se devuelven como None
+        :param values: Valores de la columna (cadenas u otros tipos convertibles a cadena)
+        :param supported_formats: Formatos soportados (por defecto, los de la configuración)
+        :param resolver: Resolutor de formato a reutilizar entre bloques de la misma columna (opcional)
+        :return: Lista de datetime o None, alineada con los valores de entrada
+        """
+        if resolver is None:
+            if supported_formats is None:
+                supported_formats = DateHelper.get_supported_formats()
+            resolver = DateFormatResolver(supported_formats)
+
+        # ■■■■■■■■■■■■■ Fijar el formato antes de parsear: toda la columna se interpreta igual ■■■■■■■■■■■■■
+        resolver.prime(values)
+        parse = resolver.parse
+        parsed_dates = list()
+        for value in values:
+            if value is None:
+                parsed_dates.append(None)
+                continue
+            date = value.strip() if isinstance(value, str) else str(value).strip()
+            parsed_dates.append(parse(date) if date else None)
+        return parsed_dates
+
+    @staticmethod
+    def _has_iso_shape(date: str, date_format: str) -> bool:
+        """
+        Verifica que la cadena tenga exactamente la forma canónica del formato ISO
+        (dígitos ASCII rellenados con ceros y separadores fijos), en cuyo caso
+        fromisoformat es equivalente a strptime
+        :param date: Fecha en forma de cadena
+        :param date_format: ISO_DATE_FORMAT o ISO_DATETIME_FORMAT
+        :return: ¿Tiene la forma canónica?
+        """
+        if date_format == ISO_DATE_FORMAT:
+            if len(date) != 10:
+                return False
+            digits = date[0:4] + date[5:7] + date[8:10]
+        else:
+            if len(date) != 19 or date[10] != " " or date[13] != ":" or date[16] != ":":
+                return False
+            digits = date[0:4] + date[5:7] + date[8:10] + date[11:13] + date[14:16] + date[17:19]
+
+        return date[4] == "-" and date[7] == "-" and digits.isascii() and digits.isdigit()
+
     @staticmethod
     def is_future_date(date: datetime.datetime) -> bool:
         """
@@ -81,7 +146,7 @@ class DateHelper:
         :return: Lista de formatos de fecha configurados
         """
         date_rules = DateHelper.get_date_rules(path_quality_rules)
-        return date_rules.get('supported_formats', ["%Y-%m-%d"])
+        return list(date_rules.get('supported_formats', ["%Y-%m-%d"]))
 
     @staticmethod
     def get_date_rules(path_quality_rules: Optional[str]) -> dict[str, Any]:
@@ -92,7 +157,7 @@ class DateHelper:
         """
         if path_quality_rules:
             try:
-                config = QualityRulesReader.load_configs(path_quality_rules)
+                config = QualityRulesReader.load_snapshot(path_quality_rules).config
                 return QualityRulesReader.get_data_type_rules(config, 'date')
             except (FileNotFoundError, ValueError, Exception):
 
@@ -101,4 +166,170 @@ class DateHelper:
         
         # ■■■■■■■■■■■■■ Valores por defecto si no hay configuración ■■■■■■■■■■■■■
         default_config = QualityRulesReader.apply_default_rules()
-        return QualityRulesReader.get_data_type_rules(default_config, 'date')
\ No newline at end of file
+        return QualityRulesReader.get_data_type_rules(default_config, 'date')
+
+
+class DateFormatResolver:
+    """
+    Resolución de formato de fecha por columna
+    Infiere el formato predominante sobre una muestra inicial de valores, lo fija y
+    solo intenta los demás formatos cuando el formato fijado no coincide.
+    Registra cuántas veces se observó cada formato.
+    Con la columna disponible de antemano, prime fija el formato antes de parsear y todas las filas
+    se interpretan igual; al parsear en flujo, las filas de la muestra se parsean por orden de prioridad
+    y, al fijar el formato, sus entradas del memo se resuelven de nuevo con el formato fijado.
+    """
+
+    # ⋮⋮⋮⋮⋮⋮⋮⋮ Etiqueta para valores que no coinciden con ningún formato ⋮⋮⋮⋮⋮⋮⋮⋮
+    INVALID = "invalid"
+
+    def __init__(self, supported_formats: list[str], sample_size: int = 100, cache: Optional[ValueCache] = None):
+        """
+        :param supported_formats: Formatos de fecha soportados, en orden de prioridad
+        :param sample_size: Número de valores distintos usados para inferir el formato
+        :param cache: Memo de la columna (opcional, se crea uno si no se proporciona)
+        """
+        self.supported_formats = list(supported_formats) if supported_formats else [ISO_DATE_FORMAT]
+        self.sample_size = sample_size
+        self.locked_format: Optional[str] = None
+        self.format_counts: dict[str, int] = dict()
+        self.invalid_count = 0
+        self._cache = cache if cache is not None else ValueCache()
+        self._sample_matches: dict[str, int] = {date_format: 0 for date_format in self.supported_formats}
+        self._sampled = 0
+        self._sampled_values: list[str] = list()
+        self._fallback_order = self.supported_formats
+
+    def parse(self, date: str) -> Optional[datetime.datetime]:
+        """
+        Parsea una fecha (sin espacios extremos) usando el formato inferido para la columna
+        :param date: Fecha en forma de cadena
+        :return: datetime o None si ningún formato coincide
+        """
+        entry = self._cache.get(date)
+        if entry is None:
+            date_format, date_parsed = self._parse_uncached(date)
+            entry = self._cache.put(date, date_format, date_parsed)
+
+        # ■■■■■■■■■■■■■ Registrar el formato observado por fila ■■■■■■■■■■■■■
+        tag = entry[0]
+        if tag == DateFormatResolver.INVALID:
+            self.invalid_count += 1
+        else:
+            self.format_counts[tag] = self.format_counts.get(tag, 0) + 1
+        return entry[1]
+
+    def prime(self, values: Iterable[Any]):
+        """
+        Infiere y fija el formato con los primeros valores distintos de la columna antes de parsearla
+        (con menos valores distintos que la muestra, la columna entera es la muestra)
+        :param values: Valores de la columna; los nulos y vacíos se ignoran
+        :return:
+        """
+        if self.locked_format is not None:
+            return
+        seen = set(self._sampled_values)
+        for value in values:
+            if value is None:
+                continue
+            date = value.strip() if isinstance(value, str) else str(value).strip()
+            if not date or date in seen:
+                continue
+            seen.add(date)
+            self._sample(date)
+            if self.locked_format is not None:
+                return
+        if self._sampled > 0:
+            self._lock()
+
+    def formats_observed(self) -> dict[str, Any]:
+        """
+        Resumen de formatos observados en la columna
+        :return: Diccionario con formato inferido, conteo por formato y valores inválidos
+        """
+        inferred_format = self.locked_format
+        if inferred_format is None and self._sampled > 0:
+            inferred_format = self._best_format()
+        return {
+            "inferred_format": inferred_format,
+            "counts": dict(self.format_counts),
+            "invalid": self.invalid_count
+        }
+
+    def _parse_uncached(self, date: str) -> tuple[str, Optional[datetime.datetime]]:
+        """
+        Parsea un valor distinto: muestreo mientras no haya formato fijado, ruta rápida después
+        :param date: Fecha en forma de cadena
+        :return: Tupla (formato usado o INVALID, datetime o None)
+        """
+        if self.locked_format is None:
+            return self._sample(date)
+        return self._parse_locked(date)
+
+    def _parse_locked(self, date: str) -> tuple[str, Optional[datetime.datetime]]:
+        """
+        Parsea con el formato fijado y, si no coincide, con los demás formatos en orden de prioridad
+        :param date: Fecha en forma de cadena
+        :return: Tupla (formato usado o INVALID, datetime o None)
+        """
+        date_parsed = DateHelper.parse_date(date, self.locked_format)
+        if date_parsed is not None:
+            return self.locked_format, date_parsed
+
+        # ■■■■■■■■■■■■■ Fallback solo cuando el formato fijado no coincide ■■■■■■■■■■■■■
+        for date_format in self._fallback_order:
+            date_parsed = DateHelper.parse_date(date, date_format)
+            if date_parsed is not None:
+                return date_format, date_parsed
+        return DateFormatResolver.INVALID, None
+
+    def _sample(self, date: str) -> tuple[str, Optional[datetime.datetime]]:
+        """
+        Prueba todos los formatos sobre un valor de la muestra y acumula coincidencias
+        :param date: Fecha en forma de cadena
+        :return: Tupla (primer formato coincidente o INVALID, datetime o None)
+        """
+        result = (DateFormatResolver.INVALID, None)
+        for date_format in self.supported_formats:
+            date_parsed = DateHelper.parse_date(date, date_format)
+            if date_parsed is not None:
+                self._sample_matches[date_format] += 1
+                if result[1] is None:
+                    result = (date_format, date_parsed)
+
+        self._sampled += 1
+        self._sampled_values.append(date)
+        if self._sampled >= self.sample_size:
+            self._lock()
+        return result
+
+    def _best_format(self) -> Optional[str]:
+        """
+        Formato con más coincidencias en la muestra (empates según orden de prioridad)
+        :return: Formato con más coincidencias o None si ninguno coincidió
+        """
+        best_format = None
+        best_matches = 0
+        for date_format in self.supported_formats:
+            if self._sample_matches[date_format] > best_matches:
+                best_format = date_format
+                best_matches = self._sample_matches[date_format]
+        return best_format
+
+    def _lock(self):
+        """
+        Fija el formato inferido de la muestra para los valores restantes
+        :return:
+        """
+        best_format = self._best_format()
+
+        # ■■■■■■■■■■■■■ Sin coincidencias: seguir con el orden configurado ■■■■■■■■■■■■■
+        self.locked_format = best_format if best_format is not None else self.supported_formats[0]
+        self._fallback_order = [f for f in self.supported_formats if f != self.locked_format]
+
+        # ■■■■■■■■■■■■■ Valores de la muestra ya memorizados: mismo formato que el resto de la columna ■■■■■■■■■■■■■
+        for date in self._sampled_values:
+            if date in self._cache:
+                self._cache.put(date, *self._parse_locked(date))
+        self._sampled_values.clear()
+
@@ -0,0 +1,116 @@
+"""
+■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+MÓDULO:      Registros estructurados de error
+AUTOR:       Fisherk2
+FECHA:       2026-10-19
+DESCRIPCIÓN: Registro compacto de error (fila, columna, código, valor) con formateo diferido a mensaje
+■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+"""
+from typing import Any, Iterable, Optional
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ Plantillas de mensaje por código de error ⋮⋮⋮⋮⋮⋮⋮⋮
+MESSAGE_TEMPLATES: dict[str, str] = {
+
+    # ▲▲▲▲▲▲ Validación de esquema CSV ▲▲▲▲▲▲
+    "tipo_incorrecto": "Fila {row}: valor {details} en columna '{column}'",
+    "valor_nulo": "Fila {row}: campo requerido '{column}' está vacío",
+    "campo_faltante": "Archivo: campo requerido '{column}' no encontrado en encabezados",
+    "campo_no_permitido": "Fila {row}: campo '{column}' no permitido según esquema",
+    "campo_no_esperado": "Archivo: Campo no esperado '{column}' encontrado en encabezados",
+    "patron_invalido": "Fila {row}: valor '{value}' no cumple el patrón de '{column}'",
+    "fuera_de_rango": "Fila {row}: valor {value} fuera de rango en '{column}' ({details})",
+    "valor_no_permitido": "Fila {row}: valor '{value}' no permitido en '{column}'",
+
+    # ▲▲▲▲▲▲ Errores de archivo (el valor es la ruta del fichero) ▲▲▲▲▲▲
+    "archivo_no_existe": "Archivo: '{value}' no existe",
+    "formato_invalido": "Archivo: No se pudo leer '{value}' - {details}",
+    "lectura_fallida": "Archivo: No se pudo leer '{value}' - {details}",
+    "error_archivo": "Archivo: error en '{value}' - {details}",
+
+    # ▲▲▲▲▲▲ Análisis de fechas ▲▲▲▲▲▲
+    "columna_no_encontrada": "Fila {row}: Columna '{column}' no encontrada",
+    "fecha_invalida": "Fila {row}: Fecha invalida en columna '{column}': {value}",
+    "fecha_futura": "Fila {row}: Fecha futura en columna '{column}': {value} (actual: {details})",
+    "fecha_bajo_minimo": "Fila {row}: Fecha fuera de rango minimo en '{column}': {value} (minimo permitido: {details})",
+    "fecha_sobre_maximo": "Fila {row}: Fecha fuera de rango maximo en '{column}': {value} (maximo permitido: {details})"
+}
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ Plantilla para códigos sin mensaje específico ⋮⋮⋮⋮⋮⋮⋮⋮
+DEFAULT_TEMPLATE = "Fila {row}: error en campo '{column}' - {details}"
+
+
+class ErrorRecord:
+    """
+    Registro compacto de un error encontrado durante la validación o el análisis
+    El mensaje en español solo se construye cuando se renderiza (informes, adaptadores de lista de cadenas)
+    """
+
+    __slots__ = ("row", "column", "code", "value", "details")
+
+    def __init__(self, row: int, column: Optional[str], code: str, value: Any = None, details: Any = ""):
+        """
+        :param row: Número de fila donde ocurrió el error (0 para errores de archivo o encabezado)
+        :param column: Nombre de la columna con error (None para errores de archivo)
+        :param code: Código del error (tipo_incorrecto, valor_nulo, fecha_futura, etc.)
+        :param value: Valor que provocó el error (opcional)
+        :param details: Detalles adicionales para el mensaje (opcional)
+        """
+        self.row = row
+        self.column = column
+        self.code = code
+        self.value = value
+        self.details = details
+
+    def render(self) -> str:
+        """
+        Formatea el registro como mensaje de error en español
+        :return: Mensaje de error
+        """
+        template = MESSAGE_TEMPLATES.get(self.code, DEFAULT_TEMPLATE)
+        return template.format(row=self.row, column=self.column, value=self.value, details=self.details)
+
+    def as_tuple(self) -> tuple:
+        """
+        Representación como tupla (fila, columna, código, valor, detalles)
+        :return: Tupla con los campos del registro
+        """
+        return self.row, self.column, self.code, self.value, self.details
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Representación como diccionario serializable
+        :return: Diccionario con los campos del registro y su mensaje
+        """
+        return {
+            "row": self.row,
+            "column": self.column,
+            "code": self.code,
+            "value": self.value,
+            "details": self.details,
+            "message": self.render()
+        }
+
+    @staticmethod
+    def render_all(errors: Iterable[Any]) -> list[str]:
+        """
+        Adaptador a la salida clásica de lista de cadenas
+        Acepta registros o mensajes ya formateados
+        :param errors: Registros de error o cadenas
+        :return: Lista de mensajes de error
+        """
+        return [error if isinstance(error, str) else error.render() for error in errors]
+
+    def __str__(self) -> str:
+        return self.render()
+
+    def __repr__(self) -> str:
+        return (f"ErrorRecord(row={self.row!r}, column={self.column!r}, code={self.code!r}, "
+                f"value={self.value!r}, details={self.details!r})")
+
+    def __eq__(self, other: Any) -> bool:
+        if not hasattr(other, "as_tuple"):
+            return NotImplemented
+        return self.as_tuple() == other.as_tuple()
+
+    def __hash__(self) -> int:
+        return hash(self.as_tuple())
@@ -0,0 +1,410 @@
+"""
+■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+MÓDULO:      Sumideros de errores
+AUTOR:       Fisherk2
+FECHA:       2026-10-19
+DESCRIPCIÓN: Destinos intercambiables a los que se envían los errores en cuanto se encuentran, incluido el resumen agregado
+■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+"""
+import json
+import os
+import random
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, Iterable, Optional
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ Líneas acumuladas antes de escribir a disco ⋮⋮⋮⋮⋮⋮⋮⋮
+DEFAULT_BUFFER_SIZE = 1000
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ Errores conservados por defecto en el sumidero circular ⋮⋮⋮⋮⋮⋮⋮⋮
+DEFAULT_RING_SIZE = 1000
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ Ejemplos conservados por defecto en cada grupo del resumen ⋮⋮⋮⋮⋮⋮⋮⋮
+DEFAULT_SAMPLE_SIZE = 5
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ Código asignado a los errores que llegan como texto ⋮⋮⋮⋮⋮⋮⋮⋮
+MESSAGE_CODE = "mensaje"
+
+
+class ErrorSink:
+    """
+    Destino base de errores (registros ErrorRecord o mensajes ya formateados)
+    Los productores llaman a emit() por cada error encontrado; la memoria depende del sumidero, no del archivo
+    """
+
+    def __init__(self):
+        self.count = 0
+
+    def emit(self, error: Any):
+        """
+        Recibe un error
+        :param error: Registro de error o mensaje
+        :return:
+        """
+        self.count += 1
+        self._write(error)
+
+    def emit_many(self, errors: Iterable[Any]):
+        """
+        Recibe varios errores
+        :param errors: Registros de error o mensajes
+        :return:
+        """
+        for error in errors:
+            self.emit(error)
+
+    def flush(self):
+        """
+        Vuelca los errores pendientes al destino
+        :return:
+        """
+        pass
+
+    def close(self):
+        """
+        Vuelca los pendientes y libera el destino
+        :return:
+        """
+        self.flush()
+
+    def _write(self, error: Any):
+        """
+        Entrega un error al destino concreto
+        :param error: Registro de error o mensaje
+        :return:
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def render(error: Any) -> str:
+        """
+        Formatea un error como mensaje en texto
+        :param error: Registro de error o mensaje
+        :return: Mensaje de error
+        """
+        if isinstance(error, str):
+            return error
+        return error.render() if hasattr(error, "render") else str(error)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+class ListErrorSink(ErrorSink):
+    """
+    Sumidero que conserva todos los errores en memoria (comportamiento clásico de lista)
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.errors: list[Any] = list()
+
+    def _write(self, error: Any):
+        self.errors.append(error)
+
+
+class RingErrorSink(ErrorSink):
+    """
+    Sumidero en memoria acotado: conserva solo los últimos max_size errores y cuenta todos
+    """
+
+    def __init__(self, max_size: int = DEFAULT_RING_SIZE):
+        super().__init__()
+        self._ring: deque = deque(maxlen=max_size if max_size and max_size > 0 else DEFAULT_RING_SIZE)
+
+    @property
+    def errors(self) -> list[Any]:
+        """
+        Últimos errores conservados, del más antiguo al más reciente
+        :return: Lista de errores
+        """
+        return list(self._ring)
+
+    @property
+    def dropped(self) -> int:
+        """
+        Errores recibidos que ya no se conservan
+        :return: Número de errores descartados
+        """
+        return self.count - len(self._ring)
+
+    def _write(self, error: Any):
+        self._ring.append(error)
+
+
+class CallbackErrorSink(ErrorSink):
+    """
+    Sumidero que entrega cada error a una función del llamador
+    """
+
+    def __init__(self, callback: Callable[[Any], None]):
+        super().__init__()
+        self.callback = callback
+
+    def _write(self, error: Any):
+        self.callback(error)
+
+
+class _BufferedFileErrorSink(ErrorSink):
+    """
+    Base de los sumideros a archivo: acumula líneas y las escribe por bloques
+    """
+
+    def __init__(self, file_path: str, buffer_size: int = DEFAULT_BUFFER_SIZE):
+        super().__init__()
+        self.file_path = file_path
+        self.buffer_size = buffer_size if buffer_size and buffer_size > 0 else DEFAULT_BUFFER_SIZE
+        self._buffer: list[str] = list()
+
+        # ▲▲▲▲▲▲ Crear directorio si no existe ▲▲▲▲▲▲
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(file_path, 'w', encoding='utf-8')
+        self._write_header()
+
+    def _write(self, error: Any):
+        self._buffer.append(self._format_line(error))
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        if self._file is None:
+            return
+        if self._buffer:
+            self._file.writelines(self._buffer)
+            self._buffer.clear()
+        self._file.flush()
+
+    def close(self):
+        if self._file is None:
+            return
+        self.flush()
+        self._write_footer()
+        self._file.close()
+        self._file = None
+
+    def _format_line(self, error: Any) -> str:
+        raise NotImplementedError
+
+    def _write_header(self):
+        pass
+
+    def _write_footer(self):
+        pass
+
+
+class TextFileErrorSink(_BufferedFileErrorSink):
+    """
+    Sumidero a archivo de texto con el mismo formato que QualityReport.generate_error_report
+    El total de errores se escribe al final, ya que no se conoce al empezar
+    """
+
+    def _format_line(self, error: Any) -> str:
+        return f"{self.count}. {self.render(error)}\n"
+
+    def _write_header(self):
+        self._file.write(
+            "🮙🮘🮙🮘🮙🮙🮘🮙🮘🮙🮙🮘🮙🮘🮙🮙🮘🮙🮘🮙 REPORTE DE ERRORES 🮙🮘🮙🮙🮙🮙🮘🮙🮘🮙🮙🮘🮙🮘🮙🮙🮘🮙🮘🮙\n")
+        self._file.write(f"Fecha y hora: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        self._file.write("▢▣" * 30 + "\n\n")
+
+    def _write_footer(self):
+        self._file.write("\n" + "▢▣" * 30 + "\n")
+        self._file.write(f"Total de errores: {self.count}\n")
+        self._file.write("■■■■■■■■■■■■■ Fin del reporte de errores ■■■■■■■■■■■■■\n")
+
+
+class JsonLinesErrorSink(_BufferedFileErrorSink):
+    """
+    Sumidero a archivo JSON Lines: un objeto por error con fila, columna, código, valor y mensaje
+    """
+
+    def _format_line(self, error: Any) -> str:
+        if hasattr(error, "to_dict"):
+            payload = error.to_dict()
+        else:
+            payload = {"message": self.render(error)}
+        return json.dumps(payload, ensure_ascii=False, default=str) + "\n"
+
+
+class ErrorGroup:
+    """
+    Estadísticas de un grupo (columna, código): conteo, primera y última fila y muestra de reservorio
+    """
+
+    __slots__ = ("column", "code", "count", "first_row", "last_row", "samples")
+
+    def __init__(self, column: Optional[str], code: str):
+        self.column = column
+        self.code = code
+        self.count = 0
+        self.first_row: Optional[int] = None
+        self.last_row: Optional[int] = None
+        self.samples: list[tuple[Any, Any]] = list()
+
+    def add(self, row: Any, value: Any, sample_size: int, rng: random.Random):
+        """
+        Registra una ocurrencia del error (muestreo de reservorio, algoritmo R)
+        :param row: Fila del error
+        :param value: Valor que provocó el error
+        :param sample_size: Tamaño máximo de la muestra
+        :param rng: Generador aleatorio del resumen
+        :return:
+        """
+        self.count += 1
+        if row is not None:
+            if self.first_row is None or row < self.first_row:
+                self.first_row = row
+            if self.last_row is None or row > self.last_row:
+                self.last_row = row
+        if len(self.samples) < sample_size:
+            self.samples.append((row, value))
+        else:
+            slot = rng.randrange(self.count)
+            if slot < sample_size:
+                self.samples[slot] = (row, value)
+
+    def merge(self, other: "ErrorGroup", sample_size: int, rng: random.Random):
+        """
+        Combina otro grupo de la misma clave; la muestra resultante respeta el peso de cada grupo
+        :param other: Grupo a combinar
+        :param sample_size: Tamaño máximo de la muestra
+        :param rng: Generador aleatorio del resumen
+        :return:
+        """
+        own_pool, own_weight = list(self.samples), self.count
+        other_pool, other_weight = list(other.samples), other.count
+        merged = list()
+        while len(merged) < sample_size and (own_pool or other_pool):
+            take_own = other_pool == [] or (
+                    own_pool != [] and rng.random() * (own_weight + other_weight) < own_weight
+            )
+            if take_own:
+                merged.append(own_pool.pop(rng.randrange(len(own_pool))))
+                own_weight -= self.count / max(len(self.samples), 1)
+            else:
+                merged.append(other_pool.pop(rng.randrange(len(other_pool))))
+                other_weight -= other.count / max(len(other.samples), 1)
+
+        self.samples = merged
+        self.count += other.count
+        for row in (other.first_row, other.last_row):
+            if row is None:
+                continue
+            if self.first_row is None or row < self.first_row:
+                self.first_row = row
+            if self.last_row is None or row > self.last_row:
+                self.last_row = row
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Representación como diccionario serializable
+        :return: Diccionario con estadísticas y muestra ordenada por fila
+        """
+        return {
+            "column": self.column,
+            "code": self.code,
+            "count": self.count,
+            "first_row": self.first_row,
+            "last_row": self.last_row,
+            "samples": [
+                {"row": row, "value": value}
+                for row, value in sorted(self.samples, key=lambda sample: (sample[0] is None, sample[0] or 0))
+            ]
+        }
+
+
+class ErrorSummarySink(ErrorSink):
+    """
+    Sumidero que no guarda mensajes: agrega los errores por (columna, código)
+    La memoria es proporcional al número de grupos y al tamaño de muestra, no al número de errores,
+    y dos resúmenes de trozos distintos se combinan con merge()
+    """
+
+    def __init__(self, sample_size: int = DEFAULT_SAMPLE_SIZE, seed: Optional[int] = 0):
+        super().__init__()
+        self.sample_size = sample_size if sample_size is not None and sample_size >= 0 else DEFAULT_SAMPLE_SIZE
+        self.groups: dict[tuple[Optional[str], str], ErrorGroup] = dict()
+        self._rng = random.Random(seed)
+
+    def _write(self, error: Any):
+        if isinstance(error, str) or not hasattr(error, "code"):
+            key, row, value = (None, MESSAGE_CODE), None, self.render(error)
+        else:
+            key, row, value = (error.column, error.code), error.row, error.value
+        group = self.groups.get(key)
+        if group is None:
+            group = ErrorGroup(key[0], key[1])
+            self.groups[key] = group
+        group.add(row, value, self.sample_size, self._rng)
+
+    def merge(self, other: "ErrorSummarySink") -> "ErrorSummarySink":
+        """
+        Combina en este resumen los grupos de otro (p. ej. de otro trozo del archivo)
+        :param other: Resumen a combinar
+        :return: Este mismo resumen, ya combinado
+        """
+        for key, other_group in other.groups.items():
+            group = self.groups.get(key)
+            if group is None:
+                group = ErrorGroup(key[0], key[1])
+                self.groups[key] = group
+            group.merge(other_group, self.sample_size, self._rng)
+        self.count += other.count
+        return self
+
+    def summary(self) -> dict[str, Any]:
+        """
+        Resumen agregado de errores
+        :return: Diccionario con el total y los grupos ordenados de mayor a menor conteo
+        """
+        groups = sorted(self.groups.values(), key=lambda group: (-group.count, str(group.column), group.code))
+        return {
+            "total": self.count,
+            "groups": [group.to_dict() for group in groups]
+        }
+
+    def render_lines(self) -> list[str]:
+        """
+        Líneas legibles por grupo, p. ej. "salario: 1200000 tipo_incorrecto, p. ej. filas 17, 902"
+        :return: Lista de líneas de resumen
+        """
+        lines = list()
+        for group in self.summary()["groups"]:
+            label = group["column"] if group["column"] is not None else "archivo"
+            rows = [str(sample["row"]) for sample in group["samples"] if sample["row"] is not None]
+            example = f", p. ej. filas {', '.join(rows)}" if rows else ""
+            lines.append(f"{label}: {group['count']} {group['code']}{example}")
+        return lines
+
+
+def create_error_sink(kind: str = "list", file_path: Optional[str] = None, **options) -> ErrorSink:
+    """
+    Crea un sumidero de errores por nombre
+    :param kind: "list", "ring", "callback", "summary", "txt" o "jsonl"
+    :param file_path: Ruta del archivo para los sumideros "txt" y "jsonl"
+    :param options: max_size (ring), callback (callback), sample_size (summary), buffer_size (txt, jsonl)
+    :return: Sumidero de errores
+    """
+    kind = kind.lower()
+    if kind == "list":
+        return ListErrorSink()
+    if kind == "ring":
+        return RingErrorSink(options.get("max_size", DEFAULT_RING_SIZE))
+    if kind == "callback":
+        return CallbackErrorSink(options["callback"])
+    if kind == "summary":
+        return ErrorSummarySink(options.get("sample_size", DEFAULT_SAMPLE_SIZE))
+    if kind in ("txt", "jsonl"):
+        if not file_path:
+            raise ValueError(f"El sumidero '{kind}' requiere file_path")
+        buffer_size = options.get("buffer_size", DEFAULT_BUFFER_SIZE)
+        if kind == "txt":
+            return TextFileErrorSink(file_path, buffer_size)
+        return JsonLinesErrorSink(file_path, buffer_size)
+    raise ValueError(f"Tipo de sumidero de errores no soportado: {kind}")
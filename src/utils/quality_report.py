@@ -12,6 +12,7 @@ import json
 import os
 
 from quality_auditor.main_auditor import QualityAuditor
+from utils.error_sink import ErrorSink, create_error_sink
 
 # ⋮⋮⋮⋮⋮⋮⋮⋮ ALIAS de estructura datos ⋮⋮⋮⋮⋮⋮⋮⋮
 RowDataType = list[dict[str, Any]]
@@ -30,7 +31,7 @@ class QualityReport:
         :return: String con formato JSON del informe
         """
         try:
-            json_raw: str = json.dumps(results, indent=2, ensure_ascii=False)
+            json_raw: str = json.dumps(results, indent=2, ensure_ascii=False, default=QualityReport._json_default)
             return json_raw
         except Exception as e:
             return f"Error al generar el informe JSON: {str(e)}"
@@ -182,6 +183,23 @@ class QualityReport:
                         report.append(f"Reglas aplicadas: {rules_applied}")
                         report.append("")
 
+        # ■■■■■■■■■■■■■ Frescura de las columnas de fecha si esta disponible ■■■■■■■■■■■■■
+        if "date_columns_analysis" in results.keys():
+            date_columns = results["date_columns_analysis"].get("columns", {})
+            if date_columns:
+                report.append("▏▎▍▌▋▊▉▉▉▉▉▉▉▉ FRESCURA DE FECHAS ▉▉▉▉▉▉▉▉▉▊▋▌▍▎")
+                for column in date_columns.keys():
+                    profile = date_columns[column].get("temporal_profile", {})
+                    if not profile or profile.get("latest") is None:
+                        report.append(f"    {column}: sin fechas validas")
+                        continue
+                    report.append(
+                        f"    {column}: {profile['min_date']} a {profile['max_date']}, "
+                        f"retraso {profile['freshness_lag_days']} dias, "
+                        f"{profile['gap_count']} huecos, {len(profile['spikes'])} picos"
+                    )
+                report.append("")
+
         return "\n".join(report)
 
     @staticmethod
@@ -211,6 +229,7 @@ class QualityReport:
         seccions["UNIQUENESS_ANALYSIS"] = "uniqueness_analysis"
         seccions["STATISTICAL_ANALYSIS"] = "statistical_analysis"
         seccions["DATE_ANALYSIS"] = "date_analysis"
+        seccions["DATE_COLUMNS_ANALYSIS"] = "date_columns_analysis"
         seccions["STATISTICAL_DETAILS"] = "statistical_details"
         seccions["COUNT_TYPES"] = "count_types"
         for title in seccions.keys():
@@ -224,9 +243,9 @@ class QualityReport:
                         if isinstance(value, Dict):
                             report.append(f"■■■■■■■■■■■■■ {key} ■■■■■■■■■■■■■")
                             for subkey in value.keys():
-                                report.append(f"    {subkey}: {str(value[subkey])}")
+                                report.append(f"    {subkey}: {QualityReport.render_value(value[subkey])}")
                         else:
-                            report.append(f"    {key}: {str(value)}")
+                            report.append(f"    {key}: {QualityReport.render_value(value)}")
                 else:
                     report.append(f"    {str(data)}")
                 report.append("")
@@ -371,10 +390,11 @@ class QualityReport:
         return full_path
 
     @staticmethod
-    def generate_error_report(error_list: list[str], file_path: str = "data/output/quality_error_report.txt") -> bool:
+    def generate_error_report(error_list: list, file_path: str = "data/output/quality_error_report.txt") -> bool:
         """
         Genera un archivo de texto plano con lista de errores o mensajes
-        :param error_list: Lista de mensajes de error
+        Los registros estructurados (ErrorRecord) se formatean aquí, al escribir cada línea
+        :param error_list: Lista de mensajes o registros de error
         :param file_path: Ruta donde guardar el archivo de errores
         :return: True si se guardó exitosamente, False en caso contrario
         """
@@ -390,7 +410,7 @@ class QualityReport:
                 file.write("▢▣" * 30 + "\n\n")
 
                 for i, error in enumerate(error_list, 1):
-                    file.write(f"{i}. {error}\n")
+                    file.write(f"{i}. {QualityReport.render_error(error)}\n")
 
                 file.write("\n" + "▢▣" * 30 + "\n")
                 file.write("■■■■■■■■■■■■■ Fin del reporte de errores ■■■■■■■■■■■■■\n")
@@ -399,3 +419,50 @@ class QualityReport:
         except IOError as e:
             print(f"Error al guardar reporte de errores: {e}")
             return False
+
+    @staticmethod
+    def open_error_sink(file_path: str, format_file: str = "txt", buffer_size: int = 1000) -> ErrorSink:
+        """
+        Abre un sumidero de errores en archivo para escribirlos en cuanto se encuentran
+        Alternativa en streaming a generate_error_report para ficheros con muchos errores
+        :param file_path: Ruta donde guardar el archivo de errores
+        :param format_file: Formato del archivo ("txt" o "jsonl")
+        :param buffer_size: Líneas acumuladas antes de cada escritura
+        :return: Sumidero de errores (usar con "with" o llamar a close())
+        """
+        return create_error_sink(format_file, file_path, buffer_size=buffer_size)
+
+    @staticmethod
+    def render_error(error: Any) -> str:
+        """
+        Formatea un error individual, sea un mensaje ya construido o un registro estructurado
+        :param error: Mensaje de error o registro con método render()
+        :return: Mensaje de error en texto
+        """
+        if isinstance(error, str):
+            return error
+        if hasattr(error, "render"):
+            return error.render()
+        return str(error)
+
+    @staticmethod
+    def render_value(value: Any) -> str:
+        """
+        Convierte un valor del resultado a texto, formateando las listas de registros de error
+        :param value: Valor a mostrar en el informe
+        :return: Representación en texto del valor
+        """
+        if isinstance(value, list) and any(hasattr(item, "render") for item in value):
+            return str([QualityReport.render_error(item) for item in value])
+        return str(value)
+
+    @staticmethod
+    def _json_default(value: Any) -> Any:
+        """
+        Serializa objetos no nativos de JSON (registros de error estructurados)
+        :param value: Objeto a serializar
+        :return: Representación serializable del objeto
+        """
+        if hasattr(value, "to_dict"):
+            return value.to_dict()
+        return str(value)
@@ -0,0 +1,321 @@
+"""
+■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+MÓDULO:      Muestreo de filas
+AUTOR:       Fisherk2
+FECHA:       2026-10-19
+DESCRIPCIÓN: Muestras de reservorio, sistemáticas y por bloques de un CSV, e intervalos de confianza de proporciones
+■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+"""
+import csv
+import io
+import locale
+import math
+import os
+import random
+from statistics import NormalDist
+from typing import Any, Iterable, Optional
+
+from readers.csv_reader import CSVReader
+from readers.csv_index import CSVRowIndex
+from readers.compressed_input import CompressedInput
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ ALIAS de estructura datos ⋮⋮⋮⋮⋮⋮⋮⋮
+RowDataType = list[dict[str, Any]]
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ Métodos de muestreo soportados ⋮⋮⋮⋮⋮⋮⋮⋮
+SAMPLING_METHODS = ("reservoir", "systematic", "block")
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ Valores por defecto ⋮⋮⋮⋮⋮⋮⋮⋮
+DEFAULT_SAMPLE_SIZE = 10000
+DEFAULT_BLOCK_ROWS = 100
+DEFAULT_CONFIDENCE = 0.95
+
+
+class RowSampler:
+    """
+    Obtiene muestras de filas de un CSV como diccionarios (misma forma que CSVReader.read_rows)
+    - reservoir: una pasada, muestra uniforme de tamaño fijo sin conocer el total (Algoritmo R)
+    - systematic: una pasada, una fila cada total/k a partir de un inicio aleatorio
+    - block: bloques de filas consecutivas en desplazamientos aleatorios (uno por estrato), sin leer el archivo completo
+    Los intervalos de Wilson suponen filas independientes; en el muestreo por bloques (muestreo por
+    conglomerados) se amplían con el efecto de diseño estimado entre bloques (design_effect)
+    """
+
+    @staticmethod
+    def sample(
+            filepath: str,
+            sample_size: int = DEFAULT_SAMPLE_SIZE,
+            method: str = "reservoir",
+            seed: Optional[int] = 0,
+            reader: Optional[CSVReader] = None,
+            columns: Optional[list[str]] = None,
+            block_rows: int = DEFAULT_BLOCK_ROWS
+    ) -> dict[str, Any]:
+        """
+        Obtiene una muestra de filas del archivo con el método indicado
+        Los archivos comprimidos y JSON Lines no admiten saltos por bytes del CSV: el muestreo por bloques
+        pasa a reservorio
+        :param filepath: Ruta del archivo CSV
+        :param sample_size: Número de filas de la muestra
+        :param method: "reservoir", "systematic" o "block"
+        :param seed: Semilla del generador aleatorio (None = no determinista)
+        :param reader: Lector con la configuración de la fuente (Opcional, CSVReader o JSONLinesReader)
+        :param columns: Columnas a leer (Opcional, proyección de CSVReader.read_rows)
+        :param block_rows: Filas consecutivas por bloque en el muestreo por bloques
+        :return: Diccionario con "rows", "method" usado, "population_rows", "exact_population" y
+                 "block_sizes" (filas de cada bloque en orden, solo en el muestreo por bloques)
+        """
+        if method not in SAMPLING_METHODS:
+            raise ValueError(f"Método de muestreo no soportado: {method}. Use uno de {SAMPLING_METHODS}")
+        if sample_size < 1:
+            raise ValueError(f"El tamaño de muestra debe ser positivo: {sample_size}")
+
+        reader = reader if reader is not None else CSVReader()
+        rng = random.Random(seed)
+        if method == "block" and (CompressedInput.detect(filepath) is not None or not isinstance(reader, CSVReader)):
+            method = "reservoir"
+
+        if method == "reservoir":
+            rows, seen = RowSampler.reservoir(reader.read_rows(filepath, columns=columns), sample_size, rng)
+            return {
+                "rows": rows, "method": method, "population_rows": seen, "exact_population": True, "block_sizes": None
+            }
+
+        # ■■■■■■■■■■■■■ Sistemático y por bloques parten del conteo rápido de registros ■■■■■■■■■■■■■
+        population = reader.count_rows(filepath)
+        block_sizes = None
+        if method == "systematic":
+            rows = RowSampler.systematic(reader.read_rows(filepath, columns=columns), sample_size, population, rng)
+        else:
+            rows, block_sizes = RowSampler.block(filepath, sample_size, population, rng, reader, columns, block_rows)
+        return {
+            "rows": rows,
+            "method": method,
+            "population_rows": population,
+            "exact_population": False,
+            "block_sizes": block_sizes
+        }
+
+    @staticmethod
+    def reservoir(rows: Iterable[dict[str, Any]], sample_size: int, rng: random.Random) -> tuple[RowDataType, int]:
+        """
+        Muestra uniforme de tamaño fijo en una sola pasada (Algoritmo R)
+        :param rows: Filas a muestrear
+        :param sample_size: Número de filas de la muestra
+        :param rng: Generador aleatorio
+        :return: Tupla (muestra, filas recorridas)
+        """
+        sample = list()
+        seen = 0
+        for row in rows:
+            seen += 1
+            if len(sample) < sample_size:
+                sample.append(row)
+                continue
+            position = rng.randrange(seen)
+            if position < sample_size:
+                sample[position] = row
+        return sample, seen
+
+    @staticmethod
+    def systematic(
+            rows: Iterable[dict[str, Any]],
+            sample_size: int,
+            population: int,
+            rng: random.Random
+    ) -> RowDataType:
+        """
+        Muestra sistemática: una fila cada population/sample_size desde un inicio aleatorio
+        :param rows: Filas a muestrear
+        :param sample_size: Número de filas de la muestra
+        :param population: Número estimado de filas (CSVReader.count_rows)
+        :param rng: Generador aleatorio
+        :return: Muestra de filas
+        """
+        step = max(population / sample_size, 1.0)
+        next_pick = rng.random() * step
+        sample = list()
+        for position, row in enumerate(rows):
+            if position >= next_pick:
+                sample.append(row)
+                next_pick += step
+                if len(sample) >= sample_size:
+                    break
+        return sample
+
+    @staticmethod
+    def block(
+            filepath: str,
+            sample_size: int,
+            population: int,
+            rng: random.Random,
+            reader: CSVReader,
+            columns: Optional[list[str]] = None,
+            block_rows: int = DEFAULT_BLOCK_ROWS
+    ) -> tuple[RowDataType, list[int]]:
+        """
+        Muestra por bloques de filas consecutivas leídos tras saltar a desplazamientos aleatorios
+        Con un índice auxiliar vigente (CSVRowIndex) los saltos caen en inicios de fila exactos; sin él,
+        se alinean al siguiente inicio de línea (el propio salto si ya lo es) y se descartan las filas con un
+        ancho distinto al encabezado
+        :param filepath: Ruta del archivo CSV sin comprimir
+        :param sample_size: Número de filas de la muestra
+        :param population: Número estimado de filas
+        :param rng: Generador aleatorio
+        :param reader: Lector CSV con la configuración de la fuente
+        :param columns: Columnas a conservar (Opcional)
+        :param block_rows: Filas consecutivas por bloque
+        :return: Tupla (muestra de filas, filas tomadas de cada bloque en orden)
+        """
+        if not reader.has_headers:
+            raise ValueError(f"La lectura por nombre de columna requiere encabezados (has_headers: false): {filepath}")
+        headers = reader.read_headers(filepath)
+        if not headers or population <= 0:
+            return list(), list()
+
+        # ■■■■■■■■■■■■■ Muestra mayor que el archivo: se lee entero (un solo bloque) ■■■■■■■■■■■■■
+        if sample_size >= population:
+            rows = list(reader.read_rows(filepath, columns=columns))
+            return rows, [len(rows)]
+
+        block_count = max(1, math.ceil(sample_size / block_rows))
+        index = CSVRowIndex.load(filepath)
+        if index is not None and index["offsets"]:
+            entries = rng.sample(range(len(index["offsets"])), min(block_count, len(index["offsets"])))
+            starts = sorted(index["offsets"][entry] for entry in entries)
+            aligned = True
+        else:
+            # ▲▲▲▲▲▲ Un salto aleatorio por estrato de igual tamaño: los bloques no se solapan ▲▲▲▲▲▲
+            body_start = RowSampler._body_start(filepath, reader.has_headers)
+            stratum = (os.path.getsize(filepath) - body_start) / block_count
+            starts = [body_start + int(stratum * (block + rng.random())) for block in range(block_count)]
+            aligned = False
+
+        # ■■■■■■■■■■■■■ Proyección: el último encabezado duplicado gana, como en csv.DictReader ■■■■■■■■■■■■■
+        last_position = {header: position for position, header in enumerate(headers)}
+        wanted = set(columns) if columns is not None else None
+        projection = [
+            (header, position) for header, position in last_position.items() if wanted is None or header in wanted
+        ]
+
+        encoding = reader.encoding if reader.encoding is not None else locale.getpreferredencoding(False)
+        width = len(headers)
+        sample = list()
+        block_sizes = list()
+        with open(filepath, 'rb') as file:
+            for start in starts:
+                # ▲▲▲▲▲▲ Desde el byte anterior: un salto que cae en un inicio de línea conserva esa fila ▲▲▲▲▲▲
+                if aligned or start == 0:
+                    file.seek(start)
+                else:
+                    file.seek(start - 1)
+                    file.readline()
+                text = io.TextIOWrapper(file, encoding=encoding, newline='', errors='replace')
+                rows = csv.reader(text, **reader.dialect_options)
+                taken = 0
+                try:
+                    for row in rows:
+                        if taken >= block_rows or len(sample) >= sample_size:
+                            break
+                        if not row or (not aligned and len(row) != width):
+                            continue
+                        sample.append({
+                            header: row[position] if position < len(row) else None
+                            for header, position in projection
+                        })
+                        taken += 1
+                except csv.Error:
+                    pass
+                finally:
+                    text.detach()
+                if taken:
+                    block_sizes.append(taken)
+        return sample, block_sizes
+
+    @staticmethod
+    def split_blocks(rows: RowDataType, block_sizes: Optional[list[int]]) -> list[RowDataType]:
+        """
+        Separa la muestra en sus bloques (conglomerados)
+        :param rows: Filas de la muestra en orden
+        :param block_sizes: Filas de cada bloque (None: muestra de filas independientes, un solo grupo)
+        :return: Lista de bloques de filas
+        """
+        if block_sizes is None:
+            return [rows]
+        blocks = list()
+        start = 0
+        for size in block_sizes:
+            blocks.append(rows[start:start + size])
+            start += size
+        return blocks
+
+    @staticmethod
+    def design_effect(successes: list[int], sizes: list[int]) -> float:
+        """
+        Efecto de diseño de una proporción estimada con muestreo por conglomerados (bloques de filas):
+        varianza del estimador de razón entre bloques dividida por la varianza con filas independientes
+        :param successes: Casos favorables de cada bloque
+        :param sizes: Filas de cada bloque
+        :return: Efecto de diseño (1.0 con menos de dos bloques o proporción 0/1; nunca menor que 1)
+        """
+        blocks = len(sizes)
+        trials = sum(sizes)
+        if blocks < 2 or trials <= 0:
+            return 1.0
+        proportion = sum(successes) / trials
+        if proportion <= 0.0 or proportion >= 1.0:
+            return 1.0
+
+        mean_size = trials / blocks
+        residuals = sum((hits - proportion * size) ** 2 for hits, size in zip(successes, sizes))
+        cluster_variance = residuals / (blocks * (blocks - 1) * mean_size * mean_size)
+        independent_variance = proportion * (1 - proportion) / trials
+        return max(1.0, cluster_variance / independent_variance)
+
+    @staticmethod
+    def wilson_interval(
+            successes: int,
+            trials: int,
+            confidence: float = DEFAULT_CONFIDENCE,
+            population: Optional[int] = None,
+            design_effect: float = 1.0
+    ) -> tuple[float, float]:
+        """
+        Intervalo de confianza de Wilson para una proporción, con corrección de población finita
+        Supone filas independientes; con design_effect > 1 usa el tamaño efectivo trials / design_effect
+        :param successes: Casos favorables en la muestra
+        :param trials: Tamaño de la muestra
+        :param confidence: Nivel de confianza (0-1)
+        :param population: Tamaño de la población (Opcional, aplica la corrección de población finita)
+        :param design_effect: Efecto de diseño del muestreo (RowSampler.design_effect, 1.0 = filas independientes)
+        :return: Tupla (límite inferior, límite superior) en porcentaje
+        """
+        if trials <= 0:
+            return 0.0, 100.0
+
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        proportion = successes / trials
+        z *= math.sqrt(max(design_effect, 1.0))
+
+        # ■■■■■■■■■■■■■ Corrección de población finita: la muestra completa no tiene incertidumbre ■■■■■■■■■■■■■
+        if population is not None and population > 1:
+            z *= math.sqrt(max(population - trials, 0) / (population - 1))
+
+        denominator = 1 + z * z / trials
+        center = (proportion + z * z / (2 * trials)) / denominator
+        margin = z * math.sqrt(proportion * (1 - proportion) / trials + z * z / (4 * trials * trials)) / denominator
+        return round(max(0.0, center - margin) * 100.0, 2), round(min(1.0, center + margin) * 100.0, 2)
+
+    @staticmethod
+    def _body_start(filepath: str, has_headers: bool = True) -> int:
+        """
+        Desplazamiento del primer byte tras la línea de encabezados
+        :param filepath: Ruta del archivo CSV
+        :param has_headers: ¿El archivo tiene línea de encabezados? (Sin ella, el cuerpo empieza en 0)
+        :return: Desplazamiento en bytes
+        """
+        if not has_headers:
+            return 0
+        with open(filepath, 'rb') as file:
+            file.readline()
+            return file.tell()
@@ -0,0 +1,150 @@
+"""
+■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+MÓDULO:      Memo acotado de valores distintos
+AUTOR:       Fisherk2
+FECHA:       2026-10-19
+DESCRIPCIÓN: Cache LRU por columna de valor crudo -> (etiqueta de tipo, valor parseado)
+■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+"""
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ ALIAS de estructura datos ⋮⋮⋮⋮⋮⋮⋮⋮
+CacheEntryType = tuple[str, Any]
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ Tamaño por defecto de cada memo de columna ⋮⋮⋮⋮⋮⋮⋮⋮
+DEFAULT_MAX_SIZE = 4096
+
+
+class ValueCache:
+    """
+    Memo acotado de valor crudo -> (etiqueta de tipo, valor parseado) con expulsión LRU
+    Las columnas reales repiten constantemente los mismos valores (estados, booleanos, fechas),
+    por lo que cada valor distinto se parsea una sola vez
+    """
+
+    __slots__ = ("max_size", "hits", "misses", "evictions", "_entries")
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
+        self.max_size = max_size if max_size and max_size > 0 else DEFAULT_MAX_SIZE
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict = OrderedDict()
+
+    def get(self, raw: Hashable) -> Optional[CacheEntryType]:
+        """
+        Obtiene la entrada memorizada para un valor crudo
+        :param raw: Valor crudo (normalmente cadena leída del archivo)
+        :return: Tupla (etiqueta, valor parseado) o None si no está memorizado
+        """
+        entry = self._entries.get(raw)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        # ■■■■■■■■■■■■■ Marcar como usado recientemente ■■■■■■■■■■■■■
+        self._entries.move_to_end(raw)
+        self.hits += 1
+        return entry
+
+    def put(self, raw: Hashable, tag: str, parsed: Any) -> CacheEntryType:
+        """
+        Memoriza la clasificación de un valor crudo, expulsando el menos usado si se excede el límite
+        :param raw: Valor crudo
+        :param tag: Etiqueta de tipo asignada al valor
+        :param parsed: Valor parseado (o None si no se pudo parsear)
+        :return: Entrada memorizada
+        """
+        entry = (tag, parsed)
+        self._entries[raw] = entry
+
+        # ■■■■■■■■■■■■■ Columna de alta cardinalidad: expulsar el menos reciente ■■■■■■■■■■■■■
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return entry
+
+    def get_or_compute(self, raw: Hashable, compute: Callable[[Any], CacheEntryType]) -> CacheEntryType:
+        """
+        Devuelve la entrada memorizada o la calcula y memoriza
+        :param raw: Valor crudo
+        :param compute: Función que recibe el valor crudo y retorna (etiqueta, valor parseado)
+        :return: Tupla (etiqueta, valor parseado)
+        """
+        entry = self.get(raw)
+        if entry is not None:
+            return entry
+        tag, parsed = compute(raw)
+        return self.put(raw, tag, parsed)
+
+    def clear(self):
+        """
+        Vacía el memo y reinicia sus contadores
+        :return:
+        """
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Métricas de uso del memo
+        :return: Diccionario con tamaño, aciertos, fallos y expulsiones
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups > 0 else 0.0
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, raw: Hashable) -> bool:
+        return raw in self._entries
+
+
+class ColumnValueCache:
+    """
+    Colección de memos independientes por columna
+    Cada columna tiene su propio límite para que una columna de alta cardinalidad
+    no expulse los valores de las columnas repetitivas
+    """
+
+    __slots__ = ("max_size_per_column", "_columns")
+
+    def __init__(self, max_size_per_column: int = DEFAULT_MAX_SIZE):
+        self.max_size_per_column = max_size_per_column
+        self._columns: dict[Hashable, ValueCache] = dict()
+
+    def for_column(self, column: Hashable) -> ValueCache:
+        """
+        Obtiene (o crea) el memo de una columna
+        :param column: Nombre de la columna (o cualquier clave hashable)
+        :return: Memo de la columna
+        """
+        cache = self._columns.get(column)
+        if cache is None:
+            cache = ValueCache(self.max_size_per_column)
+            self._columns[column] = cache
+        return cache
+
+    def clear(self):
+        """
+        Elimina todos los memos de columna
+        :return:
+        """
+        self._columns.clear()
+
+    def stats(self) -> dict[Hashable, dict[str, Any]]:
+        """
+        Métricas de uso por columna
+        :return: Diccionario con nombre de columna como clave y métricas como valor
+        """
+        return {column: cache.stats() for column, cache in self._columns.items()}
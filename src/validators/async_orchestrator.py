@@ -0,0 +1,225 @@
+"""
+■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+MÓDULO:      Orquestador asíncrono de auditorías
+AUTOR:       Fisherk2
+FECHA:       2026-10-19
+DESCRIPCIÓN: Valida y audita muchos archivos a la vez con asyncio, solapando lectura (hilos) y análisis (procesos)
+■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+"""
+import asyncio
+import functools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Iterator, Optional, Union
+
+from src.validators.csv_validator import CSVValidator
+from src.quality_auditor.main_auditor import QualityAuditor
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ ALIAS de estructura datos ⋮⋮⋮⋮⋮⋮⋮⋮
+FileSourceType = Union[Iterable[str], AsyncIterable[str]]
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ Valores por defecto de concurrencia y lectura anticipada ⋮⋮⋮⋮⋮⋮⋮⋮
+DEFAULT_IO_THREADS = 4
+DEFAULT_PREFETCH_BLOCK_SIZE = 1024 * 1024
+
+
+class AsyncAuditOrchestrator:
+    """
+    Audita archivos de forma concurrente y entrega cada resultado en cuanto su archivo termina
+    - Lectura: un grupo de hilos lee anticipadamente cada archivo (caché del sistema de ficheros) mientras
+      los procesos analizan otros; la descompresión ya ocurre en un hilo propio (CompressedInput)
+    - Análisis: tokenización, validación y auditoría en un ProcessPoolExecutor, sin competir por el GIL
+    - Contrapresión: como mucho max_concurrency archivos en curso; el siguiente archivo de la fuente
+      no se pide hasta que termina uno, así que la memoria no depende del número de archivos. La espera
+      del siguiente archivo no retrasa la entrega de los que terminan mientras tanto
+    """
+
+    def __init__(
+            self,
+            schema: Optional[CSVValidator.SchemaDefinition] = None,
+            path_quality_rules: Optional[str] = None,
+            workers: Optional[int] = None,
+            max_concurrency: Optional[int] = None,
+            io_threads: int = DEFAULT_IO_THREADS,
+            validation_config: Optional[dict[str, Any]] = None,
+            source_config: Optional[dict[str, Any]] = None,
+            audit_options: Optional[dict[str, Any]] = None
+    ):
+        """
+        :param schema: Esquema de validación (Opcional; sin esquema solo se audita con QualityAuditor.audit_file)
+        :param path_quality_rules: Ruta opcional al archivo YAML de reglas de calidad
+        :param workers: Procesos de análisis (por defecto, número de CPUs)
+        :param max_concurrency: Archivos en curso a la vez (por defecto, el doble de procesos)
+        :param io_threads: Hilos de lectura anticipada
+        :param validation_config: Sección validation_config del pipeline para CSVValidator (Opcional)
+        :param source_config: Sección input.primary_source del pipeline para el lector (Opcional)
+        :param audit_options: Argumentos adicionales de QualityAuditor.audit_file (Opcional)
+        """
+        self.schema = schema
+        self.path_quality_rules = path_quality_rules
+        self.workers = workers if workers is not None and workers > 0 else (os.cpu_count() or 1)
+        self.max_concurrency = max_concurrency if max_concurrency is not None and max_concurrency > 0 \
+            else 2 * self.workers
+        self.io_threads = max(io_threads, 1)
+        self.validation_config = validation_config
+        self.source_config = source_config
+        self.audit_options = audit_options if audit_options is not None else dict()
+
+    async def audit_files(self, filepaths: FileSourceType) -> AsyncIterator[dict[str, Any]]:
+        """
+        Audita los archivos de la fuente y entrega los resultados en orden de finalización
+        :param filepaths: Rutas de archivos (iterable o iterable asíncrono, p. ej. una cola de llegadas)
+        :return: Iterador asíncrono de resultados (ver _audit_one)
+        """
+        source = filepaths.__aiter__() if hasattr(filepaths, "__aiter__") else iter(filepaths)
+        pending: set[asyncio.Task] = set()
+        next_task: Optional[asyncio.Task] = None
+        exhausted = False
+
+        io_pool = ThreadPoolExecutor(max_workers=self.io_threads)
+        cpu_pool = ProcessPoolExecutor(max_workers=self.workers)
+        try:
+            while True:
+
+                # ■■■■■■■■■■■■■ Pedir el siguiente archivo solo si hay hueco bajo el límite ■■■■■■■■■■■■■
+                if next_task is None and not exhausted and len(pending) < self.max_concurrency:
+                    next_task = asyncio.create_task(self._next_source(source))
+                waiting = pending | {next_task} if next_task is not None else pending
+                if not waiting:
+                    return
+
+                # ■■■■■■■■■■■■■ La llegada de un archivo y el fin de otro compiten en la misma espera ■■■■■■■■■■■■■
+                done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+                if next_task in done:
+                    filepath = next_task.result()
+                    next_task = None
+                    if filepath is None:
+                        exhausted = True
+                    else:
+                        pending.add(asyncio.create_task(self._audit_one(filepath, io_pool, cpu_pool)))
+                for task in done & pending:
+                    pending.discard(task)
+                    yield task.result()
+        finally:
+
+            # ▲▲▲▲▲▲ Consumidor detenido antes de tiempo: no lanzar el trabajo pendiente ▲▲▲▲▲▲
+            unfinished = pending | {next_task} if next_task is not None else pending
+            for task in unfinished:
+                task.cancel()
+            if unfinished:
+                await asyncio.gather(*unfinished, return_exceptions=True)
+
+            # ▲▲▲▲▲▲ Cerrar los grupos fuera del bucle de eventos: esperar aquí lo bloquearía ▲▲▲▲▲▲
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, functools.partial(cpu_pool.shutdown, wait=True, cancel_futures=True))
+            await loop.run_in_executor(None, functools.partial(io_pool.shutdown, wait=True, cancel_futures=True))
+
+    async def audit_all(self, filepaths: FileSourceType) -> list[dict[str, Any]]:
+        """
+        Audita todos los archivos y devuelve los resultados en orden de finalización
+        :param filepaths: Rutas de archivos (iterable o iterable asíncrono)
+        :return: Lista de resultados
+        """
+        return [result async for result in self.audit_files(filepaths)]
+
+    def run(self, filepaths: Iterable[str]) -> list[dict[str, Any]]:
+        """
+        Punto de entrada síncrono: ejecuta audit_all en un bucle de eventos nuevo
+        :param filepaths: Rutas de archivos
+        :return: Lista de resultados en orden de finalización
+        """
+        return asyncio.run(self.audit_all(filepaths))
+
+    async def _audit_one(
+            self,
+            filepath: str,
+            io_pool: ThreadPoolExecutor,
+            cpu_pool: ProcessPoolExecutor
+    ) -> dict[str, Any]:
+        """
+        Lectura anticipada en un hilo y análisis en un proceso de un archivo
+        :param filepath: Ruta del archivo
+        :param io_pool: Grupo de hilos de lectura
+        :param cpu_pool: Grupo de procesos de análisis
+        :return: Diccionario con "filepath", "validation" (None sin esquema), "quality", "error" y "elapsed_seconds"
+        """
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        result = {"filepath": filepath, "validation": None, "quality": None, "error": None}
+        try:
+            await loop.run_in_executor(io_pool, prefetch_file, filepath)
+            result.update(await loop.run_in_executor(
+                cpu_pool,
+                audit_file_task,
+                filepath,
+                self.schema,
+                self.path_quality_rules,
+                self.validation_config,
+                self.source_config,
+                self.audit_options
+            ))
+        except Exception as error:
+            result["error"] = f"{type(error).__name__}: {error}"
+        result["elapsed_seconds"] = round(time.perf_counter() - start, 4)
+        return result
+
+    @staticmethod
+    async def _next_source(source: Union[Iterator, AsyncIterator]) -> Optional[str]:
+        """
+        Siguiente ruta de la fuente, síncrona o asíncrona
+        :param source: Iterador de rutas
+        :return: Ruta o None si la fuente se agotó
+        """
+        if hasattr(source, "__anext__"):
+            try:
+                return await source.__anext__()
+            except StopAsyncIteration:
+                return None
+        return next(source, None)
+
+
+def prefetch_file(filepath: str, block_size: int = DEFAULT_PREFETCH_BLOCK_SIZE) -> int:
+    """
+    Lee el archivo completo sobre un único búfer reutilizado para dejarlo en la caché del sistema de ficheros
+    La lectura libera el GIL y no retiene los datos, así que no aumenta la memoria del proceso
+    :param filepath: Ruta del archivo
+    :param block_size: Tamaño del búfer de lectura
+    :return: Bytes leídos (0 si el archivo no existe; el error se informa al analizarlo)
+    """
+    if not os.path.isfile(filepath):
+        return 0
+    buffer = bytearray(block_size)
+    total = 0
+    with open(filepath, 'rb', buffering=0) as file:
+        while True:
+            read = file.readinto(buffer)
+            if not read:
+                return total
+            total += read
+
+
+def audit_file_task(
+        filepath: str,
+        schema: Optional[CSVValidator.SchemaDefinition],
+        path_quality_rules: Optional[str],
+        validation_config: Optional[dict[str, Any]],
+        source_config: Optional[dict[str, Any]],
+        audit_options: dict[str, Any]
+) -> dict[str, Any]:
+    """
+    Análisis de un archivo en un proceso de trabajo (función de módulo para poder serializarla)
+    :param filepath: Ruta del archivo
+    :param schema: Esquema de validación (Opcional)
+    :param path_quality_rules: Ruta opcional al archivo YAML de reglas de calidad
+    :param validation_config: Sección validation_config del pipeline (Opcional)
+    :param source_config: Sección input.primary_source del pipeline (Opcional)
+    :param audit_options: Argumentos adicionales de QualityAuditor.audit_file
+    :return: Diccionario con "validation" y "quality"
+    """
+    if schema is not None:
+        return CSVValidator(validation_config, source_config).validate_and_audit(
+            filepath, schema, path_quality_rules, audit_options=audit_options
+        )
+    quality = QualityAuditor.audit_file(filepath, path_quality_rules, source_config=source_config, **audit_options)
+    return {"validation": None, "quality": quality}
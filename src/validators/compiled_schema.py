@@ -0,0 +1,347 @@
+"""
+■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+MÓDULO:      Esquema compilado
+AUTOR:       Fisherk2
+FECHA:       2026-10-19
+DESCRIPCIÓN: Compila un esquema y unos encabezados en una tabla posición -> validador para filas de csv.reader
+■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+"""
+import re
+from typing import Any, Callable, Optional
+
+from src.validators.type_validator import TypeValidator
+from src.validators.schema_validator import SchemaValidator
+from src.utils.error_record import ErrorRecord
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ ALIAS de estructura datos ⋮⋮⋮⋮⋮⋮⋮⋮
+SchemaDefinition = dict[str, dict]
+FieldValidatorType = Callable[[list[str], int, list[ErrorRecord]], None]
+ViolationType = tuple[str, str]
+ConstraintCheckType = Callable[[str, Any], list[ViolationType]]
+ColumnValidatorType = Callable[[list[list[str]], int, dict[int, list[ErrorRecord]]], None]
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ Filas por lote en la validación columna a columna ⋮⋮⋮⋮⋮⋮⋮⋮
+DEFAULT_ROW_BATCH_SIZE = 4096
+
+
+def date_formats_of(field_schema: dict) -> Optional[list[str]]:
+    """
+    Formatos de fecha declarados en la clave 'formato' de un campo
+    :param field_schema: Definición del campo en el esquema
+    :return: Lista de formatos o None si el campo no declara ninguno
+    """
+    formats = field_schema.get("formato")
+    if formats is None:
+        return None
+    return [formats] if isinstance(formats, str) else list(formats)
+
+
+def compile_constraints(field_schema: dict) -> Optional[ConstraintCheckType]:
+    """
+    Compila una sola vez las restricciones de un campo: 'patron' (re.compile), 'valores' (frozenset)
+    y 'minimo' / 'maximo' (límites ya convertidos al tipo del campo)
+    Las restricciones solo se evalúan sobre valores no vacíos y del tipo correcto
+    :param field_schema: Definición del campo en el esquema
+    :return: Función (valor sin espacios, valor convertido) -> lista de (código, detalles), o None sin restricciones
+    """
+    checks: list[Callable[[str, Any], Optional[ViolationType]]] = list()
+
+    # ■■■■■■■■■■■■■ Patrón: coincidencia completa sobre el texto ■■■■■■■■■■■■■
+    if "patron" in field_schema:
+        fullmatch = re.compile(field_schema["patron"]).fullmatch
+        pattern_violation = ("patron_invalido", field_schema["patron"])
+        checks.append(lambda text, parsed: None if fullmatch(text) else pattern_violation)
+
+    # ■■■■■■■■■■■■■ Enumeración: pertenencia a un conjunto congelado de textos ■■■■■■■■■■■■■
+    if "valores" in field_schema:
+        allowed = frozenset(str(value) for value in field_schema["valores"])
+        enum_violation = ("valor_no_permitido", "")
+        checks.append(lambda text, parsed: None if text in allowed else enum_violation)
+
+    # ■■■■■■■■■■■■■ Rango: límites convertidos una vez al tipo del campo ■■■■■■■■■■■■■
+    is_date = str(field_schema.get("tipo", "cadena")).lower() == "fecha"
+    for key, comparison in (("minimo", "minimo permitido"), ("maximo", "maximo permitido")):
+        if key not in field_schema:
+            continue
+        bound = field_schema[key]
+        if is_date:
+            bound = SchemaValidator.parse_date_bound(bound)
+        range_violation = ("fuera_de_rango", f"{comparison}: {field_schema[key]}")
+        if key == "minimo":
+            checks.append(
+                lambda text, parsed, bound=bound, violation=range_violation:
+                violation if parsed is not None and parsed < bound else None
+            )
+        else:
+            checks.append(
+                lambda text, parsed, bound=bound, violation=range_violation:
+                violation if parsed is not None and parsed > bound else None
+            )
+
+    if not checks:
+        return None
+
+    def check(text: str, parsed: Any) -> list[ViolationType]:
+        violations = list()
+        for constraint in checks:
+            violation = constraint(text, parsed)
+            if violation is not None:
+                violations.append(violation)
+        return violations
+
+    return check
+
+
+class CompiledField:
+    """
+    Reglas de un campo del esquema resueltas una sola vez: tipo, formatos de fecha, restricciones compiladas
+    y, si hay restricciones, el conversor del tipo (los límites se comparan con el valor convertido)
+    """
+
+    __slots__ = ("field_name", "expected_type", "type_details", "date_formats", "constraints", "parser")
+
+    def __init__(self, field_name: str, field_schema: dict, type_validator: TypeValidator):
+        """
+        :param field_name: Nombre del campo
+        :param field_schema: Definición del campo en el esquema
+        :param type_validator: Validador de tipos cuyo memo se reutiliza
+        """
+        self.field_name = field_name
+        self.expected_type = field_schema.get("tipo", "cadena")
+        self.type_details = f"{self.expected_type} no valido"
+        self.date_formats = date_formats_of(field_schema)
+        self.constraints = compile_constraints(field_schema)
+        self.parser = None if self.constraints is None else type_validator.compile_parser(
+            self.expected_type, column=field_name, date_formats=self.date_formats
+        )
+
+
+class CompiledSchema:
+    """
+    Esquema compilado una sola vez contra los encabezados de un archivo
+    Cada columna se resuelve en una función que valida su posición de la fila (lista de csv.reader),
+    y los campos requeridos se precalculan como conjuntos de posiciones
+    Produce los mismos errores, en el mismo orden, que CSVValidator._validate_row_records sobre csv.DictReader:
+    encabezados duplicados toman la primera posición y el último valor, las filas cortas dan valores nulos
+    y los valores sobrantes generan un único error de campo no permitido por fila
+    """
+
+    __slots__ = ("headers", "width", "required_positions", "missing_required", "_validators", "_column_validators")
+
+    def __init__(self, schema: SchemaDefinition, headers: list[str], type_validator: Optional[TypeValidator] = None):
+        """
+        :param schema: Esquema de validacion que define tipos y campos requeridos
+        :param headers: Encabezados del archivo CSV
+        :param type_validator: Validador de tipos cuyo memo se reutiliza (opcional)
+        """
+        type_validator = type_validator if type_validator is not None else TypeValidator()
+        self.headers = list(headers)
+        self.width = len(self.headers)
+
+        # ■■■■■■■■■■■■■ Posición efectiva de cada encabezado (el último valor gana, como en un dict) ■■■■■■■■■■■■■
+        last_position = dict()
+        for position, header in enumerate(self.headers):
+            last_position[header] = position
+
+        # ■■■■■■■■■■■■■ Campos requeridos como conjuntos de posiciones y nombres ausentes ■■■■■■■■■■■■■
+        self.required_positions = frozenset(
+            position for header, position in last_position.items()
+            if header in schema and schema[header].get("requerido", False)
+        )
+        self.missing_required = tuple(
+            field_name for field_name, field_schema in schema.items()
+            if field_schema.get("requerido", False) and field_name not in last_position
+        )
+
+        # ■■■■■■■■■■■■■ Tablas de validadores (por fila y por columna) en el orden de primera aparición ■■■■■■■■■■■■■
+        self._validators: list[FieldValidatorType] = list()
+        self._column_validators: list[ColumnValidatorType] = list()
+        for header, position in last_position.items():
+            if header in schema:
+                field = CompiledField(header, schema[header], type_validator)
+                self._validators.append(self._compile_field(field, position, type_validator))
+                column_validator = self._compile_column(field, position, type_validator)
+            else:
+                self._validators.append(self._compile_not_allowed(header))
+                column_validator = None
+
+            # ▲▲▲▲▲▲ Columnas sin validador por lotes reutilizan el validador por fila ▲▲▲▲▲▲
+            if column_validator is None:
+                column_validator = self._per_row_column(self._validators[-1])
+            self._column_validators.append(column_validator)
+
+    def validate_row(self, row: list[str], row_num: int) -> list[ErrorRecord]:
+        """
+        Valida una fila posicional
+        :param row: Fila leída con csv.reader
+        :param row_num: Numero de fila del archivo CSV
+        :return: Lista de registros de error de la fila
+        """
+        errors = list()
+        for validate in self._validators:
+            validate(row, row_num, errors)
+
+        # ■■■■■■■■■■■■■ Valores sobrantes: DictReader los agrupa bajo la clave None ■■■■■■■■■■■■■
+        if len(row) > self.width:
+            errors.append(ErrorRecord(row_num, None, "campo_no_permitido", None, ""))
+
+        for field_name in self.missing_required:
+            errors.append(ErrorRecord(row_num, field_name, "valor_nulo", None, ""))
+        return errors
+
+    def validate_rows(self, rows: list[list[str]], first_row_num: int) -> list[ErrorRecord]:
+        """
+        Valida un lote de filas columna a columna: cada columna se extrae una vez y su tipo se comprueba
+        con TypeValidator.validate_column, de modo que el coste crece con columnas x lotes y no con celdas
+        Retorna los mismos errores, en el mismo orden, que validate_row aplicado fila a fila
+        :param rows: Filas leídas con csv.reader
+        :param first_row_num: Numero de fila del archivo CSV de la primera fila del lote
+        :return: Lista de registros de error del lote ordenada por fila
+        """
+        row_errors: dict[int, list[ErrorRecord]] = dict()
+        for validate_column in self._column_validators:
+            validate_column(rows, first_row_num, row_errors)
+
+        # ■■■■■■■■■■■■■ Valores sobrantes y campos requeridos ausentes, como en validate_row ■■■■■■■■■■■■■
+        width = self.width
+        missing_required = self.missing_required
+        for index, row in enumerate(rows):
+            if len(row) > width or missing_required:
+                errors = row_errors.setdefault(index, list())
+                row_num = first_row_num + index
+                if len(row) > width:
+                    errors.append(ErrorRecord(row_num, None, "campo_no_permitido", None, ""))
+                for field_name in missing_required:
+                    errors.append(ErrorRecord(row_num, field_name, "valor_nulo", None, ""))
+
+        errors = list()
+        for index in sorted(row_errors):
+            errors.extend(row_errors[index])
+        return errors
+
+    def _compile_column(
+            self,
+            field: CompiledField,
+            position: int,
+            type_validator: TypeValidator
+    ) -> Optional[ColumnValidatorType]:
+        """
+        Crea el validador por lotes de una columna del esquema
+        :param field: Campo del esquema compilado
+        :param position: Posición del valor en la fila
+        :param type_validator: Validador de tipos
+        :return: Función que valida la columna de un lote, o None si el campo tiene restricciones
+        """
+        if field.constraints is not None:
+            return None
+
+        is_required = position in self.required_positions
+        field_name = field.field_name
+        expected_type = field.expected_type
+        type_details = field.type_details
+        date_formats = field.date_formats
+        validate_type_column = type_validator.validate_column
+
+        def validate(rows: list[list[str]], first_row_num: int, row_errors: dict[int, list[ErrorRecord]]):
+            values = [row[position] if position < len(row) else None for row in rows]
+            invalid = validate_type_column(values, expected_type, field_name, date_formats)
+            nulls = [
+                index for index, value in enumerate(values) if value is None or value.strip() == ""
+            ] if is_required else ()
+
+            # ▲▲▲▲▲▲ Nulo y tipo incorrecto son excluyentes por celda: el orden por fila se conserva ▲▲▲▲▲▲
+            for index in nulls:
+                row_errors.setdefault(index, list()).append(
+                    ErrorRecord(first_row_num + index, field_name, "valor_nulo", None, "")
+                )
+            for index in invalid:
+                row_errors.setdefault(index, list()).append(
+                    ErrorRecord(first_row_num + index, field_name, "tipo_incorrecto", values[index], type_details)
+                )
+
+        return validate
+
+    @staticmethod
+    def _per_row_column(validate: FieldValidatorType) -> ColumnValidatorType:
+        """
+        Adapta un validador por fila al recorrido por lotes
+        :param validate: Validador de una columna sobre filas individuales
+        :return: Función que aplica el validador a cada fila del lote
+        """
+        def validate_column(rows: list[list[str]], first_row_num: int, row_errors: dict[int, list[ErrorRecord]]):
+            for index, row in enumerate(rows):
+                errors = row_errors.get(index)
+                if errors is None:
+                    errors = list()
+                    validate(row, first_row_num + index, errors)
+                    if errors:
+                        row_errors[index] = errors
+                else:
+                    validate(row, first_row_num + index, errors)
+
+        return validate_column
+
+    def _compile_field(
+            self,
+            field: CompiledField,
+            position: int,
+            type_validator: TypeValidator
+    ) -> FieldValidatorType:
+        """
+        Crea el validador de una columna del esquema
+        :param field: Campo del esquema compilado
+        :param position: Posición del valor en la fila
+        :param type_validator: Validador de tipos
+        :return: Función que valida la posición de la fila y agrega sus errores
+        """
+        is_required = position in self.required_positions
+        field_name = field.field_name
+        type_details = field.type_details
+        constraints = field.constraints
+
+        # ■■■■■■■■■■■■■ Sin restricciones basta con comprobar el tipo ■■■■■■■■■■■■■
+        if constraints is None:
+            checker = type_validator.compile_checker(
+                field.expected_type, column=field_name, date_formats=field.date_formats
+            )
+
+            def validate(row: list[str], row_num: int, errors: list[ErrorRecord]):
+                value = row[position] if position < len(row) else None
+                if value is None or value.strip() == "":
+                    if is_required:
+                        errors.append(ErrorRecord(row_num, field_name, "valor_nulo", None, ""))
+                    return
+                if not checker(value):
+                    errors.append(ErrorRecord(row_num, field_name, "tipo_incorrecto", value, type_details))
+
+            return validate
+
+        parser = field.parser
+
+        def validate_constrained(row: list[str], row_num: int, errors: list[ErrorRecord]):
+            value = row[position] if position < len(row) else None
+            text = value.strip() if value is not None else ""
+            if text == "":
+                if is_required:
+                    errors.append(ErrorRecord(row_num, field_name, "valor_nulo", None, ""))
+                return
+            is_valid, parsed = parser(value)
+            if not is_valid:
+                errors.append(ErrorRecord(row_num, field_name, "tipo_incorrecto", value, type_details))
+                return
+            for code, details in constraints(text, parsed):
+                errors.append(ErrorRecord(row_num, field_name, code, value, details))
+
+        return validate_constrained
+
+    @staticmethod
+    def _compile_not_allowed(field_name: str) -> FieldValidatorType:
+        """
+        Crea el validador de una columna que no pertenece al esquema
+        :param field_name: Nombre del campo
+        :return: Función que agrega el error de campo no permitido
+        """
+        def validate(row: list[str], row_num: int, errors: list[ErrorRecord]):
+            errors.append(ErrorRecord(row_num, field_name, "campo_no_permitido", None, ""))
+
+        return validate
@@ -6,12 +6,29 @@ FECHA:       2026-02-13
 DESCRIPCIÓN: Coordinador de validacion completa de archivos CSV
 ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
 """
-from typing import Any
+import csv
+import io
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Optional, Union
 
 from src.readers.csv_reader import CSVReader
+from src.readers.jsonl_reader import JSONLinesReader
+from src.readers.csv_chunker import CSVChunker, DEFAULT_CHUNK_SIZE, SCAN_BLOCK_SIZE
+from src.readers.csv_index import CSVRowIndex
+from src.readers.compressed_input import CompressedInput
 from src.validators.type_validator import TypeValidator
 from src.validators.schema_validator import SchemaValidator
+from src.validators.compiled_schema import CompiledSchema, CompiledField, DEFAULT_ROW_BATCH_SIZE
 from src.utils.csv_error_reporter import CSVErrorReporter
+from src.utils.error_record import ErrorRecord
+from src.utils.error_sink import ErrorSink, ListErrorSink, ErrorSummarySink
+from src.quality_auditor.main_auditor import QualityAuditor
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ Errores que devuelve como máximo cada tarea del modo paralelo (el resto del trozo se reanuda) ⋮⋮⋮⋮⋮⋮⋮⋮
+MAX_RANGE_ERRORS = 10000
 
 
 class CSVValidator:
@@ -22,85 +39,538 @@ class CSVValidator:
     # ⋮⋮⋮⋮⋮⋮⋮⋮ Definir la estructura del esquema como tipo ⋮⋮⋮⋮⋮⋮⋮⋮
     SchemaDefinition = dict[str, dict]
 
-    def __init__(self):
-        self.csv_reader = CSVReader()
+    def __init__(
+            self,
+            validation_config: Optional[dict[str, Any]] = None,
+            source_config: Optional[dict[str, Any]] = None
+    ):
+        """
+        :param validation_config: Sección validation_config del pipeline (stop_on_first_error,
+                                  collect_all_errors, max_errors_before_stop). Por defecto se recogen todos los errores
+        :param source_config: Sección input.primary_source del pipeline (Opcional; type "jsonl" lee JSON Lines)
+        """
+        self.source_config = source_config
+        self.csv_reader = CSVReader(source_config)
         self.type_validator = TypeValidator()
         self.schema_validator = SchemaValidator()
         self.error_reporter = CSVErrorReporter()
+        self.validation_config = validation_config if validation_config is not None else dict()
+
+        # ▲▲▲▲▲▲ Campos compilados de _validate_field_records: nombre -> (definición del esquema, campo) ▲▲▲▲▲▲
+        self._compiled_fields: dict[str, tuple[dict, CompiledField]] = dict()
 
-    def validate_file(self, filepath: str, schema: SchemaDefinition) -> list[str]:
+    def validate_file(self, filepath: str, schema: SchemaDefinition, workers: int = 1) -> list[str]:
         """
         Valida un archivo CSV completo contra un esquema
         :param filepath: Ruta del archivo CSV a validar
         :param schema: Esquema de validacion que define tipos y campos requeridos
+        :param workers: Procesos para validar el cuerpo por trozos en paralelo (1 = secuencial)
         :return: Lista de mensajes de error encontrados
         """
-        all_errors = list()
+        return ErrorRecord.render_all(self.validate_file_records(filepath, schema, workers))
 
-        # ■■■■■■■■■■■■■ Validar estructura del esquema ■■■■■■■■■■■■■
-        if not self.schema_validator.validate_schema_structure(schema):
-            schema_error = self.error_reporter.generate_file_error(
-                file_name=filepath,
-                error_type="esquema_invalido",
-                details="El esquema de validacion no tiene la estructura correcta"
-            )
-            all_errors.extend(schema_error)
-            return all_errors
+    def validate_file_records(self, filepath: str, schema: SchemaDefinition, workers: int = 1) -> list[ErrorRecord]:
+        """
+        Valida un archivo CSV completo contra un esquema produciendo registros estructurados
+        Los mensajes solo se formatean cuando se renderizan (ErrorRecord.render / QualityReport)
+        :param filepath: Ruta del archivo CSV a validar
+        :param schema: Esquema de validacion que define tipos y campos requeridos
+        :param workers: Procesos para validar el cuerpo por trozos en paralelo (1 = secuencial)
+        :return: Lista de registros de error encontrados
+        """
+        return self.validate_file_detailed(filepath, schema, workers=workers)["errors"]
+
+    def validate_file_detailed(
+            self,
+            filepath: str,
+            schema: SchemaDefinition,
+            header_only: bool = False,
+            sink: Optional[ErrorSink] = None,
+            workers: int = 1,
+            chunk_size: int = DEFAULT_CHUNK_SIZE,
+            batch_size: int = DEFAULT_ROW_BATCH_SIZE
+    ) -> dict[str, Any]:
+        """
+        Valida un archivo CSV respetando los límites de validation_config y reporta hasta dónde llegó
+        La lectura se detiene en cuanto se alcanza el límite de errores, sin recorrer el resto del archivo
+        Con un sumidero, cada error se envía en cuanto se encuentra y no se acumula en el resultado
+        :param filepath: Ruta del archivo CSV a validar
+        :param schema: Esquema de validacion que define tipos y campos requeridos
+        :param header_only: Comprobar solo esquema, existencia y encabezados, sin leer filas
+        :param sink: Sumidero de errores (archivo, JSON Lines, circular, callback). Opcional
+        :param workers: Procesos para validar el cuerpo por trozos en paralelo (1 = secuencial)
+        :param chunk_size: Tamaño objetivo en bytes de cada trozo en modo paralelo
+        :param batch_size: Filas por lote en la validación columna a columna
+        :return: Diccionario con errores (ErrorRecord, vacío si hay sumidero), número de errores, truncado,
+                 motivo de parada, filas validadas y última fila
+        """
+        error_limit = self._resolve_error_limit(self.validation_config)
+        collector = ListErrorSink() if sink is None else sink
+        result = self._new_result(collector, sink, error_limit)
+        error_count, emit_bounded = self._bounded_emitter(collector, error_limit)
 
-        # ■■■■■■■■■■■■■ Verificar existencia del archivo ■■■■■■■■■■■■■
-        if not self.csv_reader.validate_file_exist(filepath):
-            file_error = self.error_reporter.generate_file_error(
-                file_name=filepath,
-                error_type="archivo_no_existe",
-                details=""
-            )
-            all_errors.extend(file_error)
-            return all_errors
+        def remaining_errors() -> Optional[int]:
+            return None if error_limit is None else error_limit - error_count()
 
         # ■■■■■■■■■■■■■ Validar contenido del fichero ■■■■■■■■■■■■■
+        reader = self._reader_for(filepath)
+        rows = None
         try:
 
-            # ▲▲▲▲▲▲ Leer encabezados del archivo ▲▲▲▲▲▲
-            file_headers = self.csv_reader.read_headers(filepath)
+            # ▲▲▲▲▲▲ Esquema, existencia y encabezados; si fallan, no continuar con la validacion de filas ▲▲▲▲▲▲
+            stop_reason, file_headers = self._check_file_headers(filepath, schema, reader, collector.emit, emit_bounded)
+            if stop_reason is not None:
+                return self._finish_result(result, stop_reason, error_count())
+            if header_only:
+                return self._finish_result(result, "solo_encabezados", error_count())
+
+            # ▲▲▲▲▲▲ Modo paralelo: trozos alineados a registros validados en un pool de procesos (solo CSV) ▲▲▲▲▲▲
+            if workers is not None and workers > 1 and reader is self.csv_reader:
+                ranges = self._split_for_workers(filepath, reader, workers, chunk_size)
+                if ranges is not None and len(ranges) > 1:
+                    if self._validate_ranges_parallel(filepath, schema, file_headers, ranges, workers,
+                                                      result, emit_bounded, remaining_errors):
+                        return self._finish_result(result, "limite_errores", error_count())
+                    return self._finish_result(result, None, error_count())
+
+            # ▲▲▲▲▲▲ Compilar el esquema contra los encabezados una sola vez ▲▲▲▲▲▲
+            compiled_schema = CompiledSchema(schema, file_headers, self.type_validator)
+            validate_rows = compiled_schema.validate_rows
+
+            # ▲▲▲▲▲▲ Validar lotes de filas columna a columna, parando al alcanzar el límite ▲▲▲▲▲▲
+            row_index = 1  # Empezar en 1 porque la fila 0 son encabezados
+            rows = reader.read_raw_rows(filepath)
+            while True:
+                batch = list(islice(rows, batch_size))
+                if not batch:
+                    break
+                batch_errors = validate_rows(batch, row_index + 1)
+                emitted_before = error_count()
+                if batch_errors and emit_bounded(batch_errors):
+
+                    # ▲▲▲▲▲▲ La parada ocurre en la fila del último error emitido, igual que fila a fila ▲▲▲▲▲▲
+                    stop_row = batch_errors[error_limit - emitted_before - 1].row
+                    result["rows_validated"] += stop_row - row_index
+                    result["last_row"] = stop_row
+                    return self._finish_result(result, "limite_errores", error_count())
+                row_index += len(batch)
+                result["rows_validated"] += len(batch)
+                result["last_row"] = row_index
 
-            # ▲▲▲▲▲▲ Validar encabezados contra esquema ▲▲▲▲▲▲
-            headers_errors = self._validate_headers(
-                file_headers=file_headers,
-                schema=schema
-            )
-            all_errors.extend(headers_errors)
+        except IOError:
+            collector.emit(self.error_reporter.file_record(
+                file_name=filepath,
+                error_type="lectura_fallida",
+                details="No se pudo leer el fichero CSV"
+            ))
+        except ValueError:
+            collector.emit(self.error_reporter.file_record(
+                file_name=filepath,
+                error_type="formato_invalido",
+                details="Formato invalido para archivos CSV"
+            ))
+        finally:
+
+            # ▲▲▲▲▲▲ Cerrar el archivo aunque la lectura se haya detenido antes del final ▲▲▲▲▲▲
+            if rows is not None:
+                rows.close()
+
+        return self._finish_result(result, None, error_count())
+
+    def validate_and_audit(
+            self,
+            filepath: str,
+            schema: SchemaDefinition,
+            path_quality_rules: Optional[str] = None,
+            sink: Optional[ErrorSink] = None,
+            audit_options: Optional[dict[str, Any]] = None
+    ) -> dict[str, Any]:
+        """
+        Valida el archivo contra el esquema y audita su calidad con una sola lectura y tokenización
+        Los encabezados se leen una vez; cada lote de filas de csv.reader pasa por CompiledSchema.validate_rows
+        y se convierte en diccionarios (igual que csv.DictReader) para QualityAuditor.quality_audit.
+        Si se alcanza el límite de errores, la validación se detiene pero la lectura continúa para completar
+        la auditoría
+        :param filepath: Ruta del archivo CSV a validar
+        :param schema: Esquema de validacion que define tipos y campos requeridos
+        :param path_quality_rules: Ruta opcional al archivo YAML de reglas de calidad
+        :param sink: Sumidero de errores de validación (Opcional)
+        :param audit_options: Argumentos de QualityAuditor.audit_file para los análisis avanzados (Opcional;
+                              error_handling se ignora porque la validación lee el archivo completo)
+        :return: Diccionario con "validation" (resultado de validate_file_detailed) y "quality" (quality_audit,
+                 o advance_quality_audit con audit_options)
+        """
+        error_limit = self._resolve_error_limit(self.validation_config)
+        collector = ListErrorSink() if sink is None else sink
+        validation = self._new_result(collector, sink, error_limit)
+        error_count, emit_bounded = self._bounded_emitter(collector, error_limit)
+        reader = self._reader_for(filepath)
+        data = list()
+        rows = None
+        try:
 
-            # ▲▲▲▲▲▲ Si hay errores en los encabezados, no continuar con la validacion de filas ▲▲▲▲▲▲
-            if self._has_critical_headers_errors(headers_errors):
-                return all_errors
+            # ■■■■■■■■■■■■■ Esquema, existencia y encabezados (solo lee la primera línea) ■■■■■■■■■■■■■
+            stop_reason, file_headers = self._check_file_headers(filepath, schema, reader, collector.emit, emit_bounded)
+            if stop_reason in ("esquema_invalido", "archivo_no_existe"):
+                self._finish_result(validation, stop_reason, error_count())
+                return {"validation": validation, "quality": self._audit_rows([], path_quality_rules, audit_options)}
+            validating = stop_reason is None
+            width = len(file_headers)
+            validate_rows = CompiledSchema(schema, file_headers, self.type_validator).validate_rows
 
-            # ▲▲▲▲▲▲ Validar cada fila del archivo ▲▲▲▲▲▲
+            # ■■■■■■■■■■■■■ Un solo recorrido: validación por lotes y filas para la auditoría ■■■■■■■■■■■■■
             row_index = 1  # Empezar en 1 porque la fila 0 son encabezados
-            for row in self.csv_reader.read_rows(filepath):
-                row_index += 1
-                row_errors = self._validate_row(
-                    row=row,
-                    schema=schema,
-                    row_num=row_index
-                )
-                all_errors.extend(row_errors)
+            rows = reader.read_raw_rows(filepath)
+            while True:
+                batch = list(islice(rows, DEFAULT_ROW_BATCH_SIZE))
+                if not batch:
+                    break
+
+                # ▲▲▲▲▲▲ Validar columna a columna mientras no se alcance el límite ▲▲▲▲▲▲
+                if validating:
+                    batch_errors = validate_rows(batch, row_index + 1)
+                    emitted_before = error_count()
+                    if batch_errors and emit_bounded(batch_errors):
+                        stop_row = batch_errors[error_limit - emitted_before - 1].row
+                        validation["rows_validated"] += stop_row - row_index
+                        validation["last_row"] = stop_row
+                        validating = False
+                        stop_reason = "limite_errores"
+                    else:
+                        validation["rows_validated"] += len(batch)
+                        validation["last_row"] = row_index + len(batch)
+                row_index += len(batch)
+
+                # ▲▲▲▲▲▲ Filas como diccionarios con la misma semántica que csv.DictReader ▲▲▲▲▲▲
+                for row in batch:
+                    record = dict(zip(file_headers, row))
+                    if len(row) < width:
+                        for header in file_headers[len(row):]:
+                            record[header] = None
+                    elif len(row) > width:
+                        record[None] = row[width:]
+                    data.append(record)
 
         except IOError:
-            file_error = self.error_reporter.generate_file_error(
+            collector.emit(self.error_reporter.file_record(
                 file_name=filepath,
                 error_type="lectura_fallida",
                 details="No se pudo leer el fichero CSV"
-            )
-            all_errors.extend(file_error)
+            ))
         except ValueError:
-            file_error = self.error_reporter.generate_file_error(
+            collector.emit(self.error_reporter.file_record(
                 file_name=filepath,
                 error_type="formato_invalido",
                 details="Formato invalido para archivos CSV"
+            ))
+        finally:
+            if rows is not None:
+                rows.close()
+
+        self._finish_result(validation, stop_reason, error_count())
+        return {"validation": validation, "quality": self._audit_rows(data, path_quality_rules, audit_options)}
+
+    @staticmethod
+    def _audit_rows(
+            data: list[dict[str, Any]],
+            path_quality_rules: Optional[str],
+            audit_options: Optional[dict[str, Any]]
+    ) -> dict[str, Any]:
+        """
+        Auditoría de las filas leídas por validate_and_audit
+        :param data: Filas como diccionarios
+        :param path_quality_rules: Ruta opcional al archivo YAML de reglas de calidad
+        :param audit_options: Argumentos de QualityAuditor.audit_file (Opcional)
+        :return: Resultado de quality_audit, o de advance_quality_audit si hay opciones de auditoría
+        """
+        options = {key: value for key, value in (audit_options or dict()).items() if key != "error_handling"}
+        if not options:
+            return QualityAuditor.quality_audit(data, path_quality_rules)
+        return QualityAuditor.advance_quality_audit(data, path_quality_rules, **options)
+
+    def validate_file_summary(
+            self,
+            filepath: str,
+            schema: SchemaDefinition,
+            sample_size: int = 5,
+            header_only: bool = False
+    ) -> dict[str, Any]:
+        """
+        Valida un archivo CSV agregando los errores por (columna, código) en lugar de listarlos
+        Solo se conservan conteos, primera/última fila y una muestra de reservorio por grupo
+        :param filepath: Ruta del archivo CSV a validar
+        :param schema: Esquema de validacion que define tipos y campos requeridos
+        :param sample_size: Filas de ejemplo conservadas por grupo
+        :param header_only: Comprobar solo esquema, existencia y encabezados, sin leer filas
+        :return: Resultado de validate_file_detailed con "error_summary" (y "summary_lines" legibles)
+        """
+        summary_sink = ErrorSummarySink(sample_size)
+        result = self.validate_file_detailed(filepath, schema, header_only=header_only, sink=summary_sink)
+        result["error_summary"] = summary_sink.summary()
+        result["summary_lines"] = summary_sink.render_lines()
+        return result
+
+    def _check_file_headers(
+            self,
+            filepath: str,
+            schema: SchemaDefinition,
+            reader: Union[CSVReader, JSONLinesReader],
+            emit: Callable[[ErrorRecord], None],
+            emit_bounded: Callable[[list[ErrorRecord]], bool]
+    ) -> tuple[Optional[str], list[str]]:
+        """
+        Valida la estructura del esquema, la existencia del archivo y sus encabezados (solo lee la primera línea)
+        :param filepath: Ruta del archivo a validar
+        :param schema: Esquema de validacion que define tipos y campos requeridos
+        :param reader: Lector de la fuente
+        :param emit: Función que emite un error
+        :param emit_bounded: Función que emite errores respetando el límite; indica si se alcanzó
+        :return: Tupla (motivo de parada o None si se pueden validar las filas, encabezados del archivo)
+        """
+        # ■■■■■■■■■■■■■ Validar estructura del esquema ■■■■■■■■■■■■■
+        if not self.schema_validator.validate_schema_structure(schema):
+            emit(self.error_reporter.file_record(
+                file_name=filepath,
+                error_type="esquema_invalido",
+                details="El esquema de validacion no tiene la estructura correcta"
+            ))
+            return "esquema_invalido", list()
+
+        # ■■■■■■■■■■■■■ Verificar existencia del archivo ■■■■■■■■■■■■■
+        if not reader.validate_file_exist(filepath):
+            emit(self.error_reporter.file_record(
+                file_name=filepath,
+                error_type="archivo_no_existe",
+                details=""
+            ))
+            return "archivo_no_existe", list()
+
+        # ■■■■■■■■■■■■■ Validar encabezados contra esquema ■■■■■■■■■■■■■
+        file_headers = reader.read_headers(filepath)
+        headers_errors = self._validate_headers_records(
+            file_headers=file_headers,
+            schema=schema
+        )
+        limit_reached = emit_bounded(headers_errors)
+        if self._has_critical_headers_errors(headers_errors):
+            return "encabezados_criticos", file_headers
+        if limit_reached:
+            return "limite_errores", file_headers
+        return None, file_headers
+
+    @staticmethod
+    def _new_result(collector: ErrorSink, sink: Optional[ErrorSink], error_limit: Optional[int]) -> dict[str, Any]:
+        """
+        Resultado de validación vacío
+        :param collector: Sumidero que recibe los errores
+        :param sink: Sumidero indicado por el usuario (None si los errores se devuelven en el resultado)
+        :param error_limit: Número máximo de errores (None si se recogen todos)
+        :return: Diccionario con errores, número de errores, truncado, motivo de parada, filas validadas y última fila
+        """
+        return {
+            "errors": collector.errors if sink is None else list(),
+            "error_count": 0,
+            "truncated": False,
+            "stop_reason": None,
+            "rows_validated": 0,
+            "last_row": 1,
+            "error_limit": error_limit
+        }
+
+    @staticmethod
+    def _bounded_emitter(
+            collector: ErrorSink,
+            error_limit: Optional[int]
+    ) -> tuple[Callable[[], int], Callable[[list[ErrorRecord]], bool]]:
+        """
+        Funciones para contar los errores emitidos en esta validación y emitir sin superar el límite
+        :param collector: Sumidero que recibe los errores
+        :param error_limit: Número máximo de errores (None si se recogen todos)
+        :return: Tupla (errores emitidos, emitir errores indicando si se alcanzó el límite)
+        """
+        first_count = collector.count
+
+        def error_count() -> int:
+            return collector.count - first_count
+
+        def emit_bounded(errors: list[ErrorRecord]) -> bool:
+            # ▲▲▲▲▲▲ Emite los errores sin superar el límite; indica si se alcanzó ▲▲▲▲▲▲
+            if error_limit is not None and error_count() + len(errors) >= error_limit:
+                collector.emit_many(errors[:error_limit - error_count()])
+                return True
+            collector.emit_many(errors)
+            return False
+
+        return error_count, emit_bounded
+
+    def _reader_for(self, filepath: str) -> Union[CSVReader, JSONLinesReader]:
+        """
+        Lector de la fuente: JSONLinesReader para JSON Lines (por tipo de fuente o extensión), CSVReader en otro caso
+        :param filepath: Ruta del archivo a validar
+        :return: Lector con la interfaz de CSVReader
+        """
+        if JSONLinesReader.is_jsonl(filepath, self.source_config):
+            return JSONLinesReader(self.source_config)
+        return self.csv_reader
+
+    @staticmethod
+    def _split_for_workers(
+            filepath: str,
+            reader: CSVReader,
+            workers: int,
+            chunk_size: int
+    ) -> Optional[list[tuple[int, int]]]:
+        """
+        Calcula los trozos del cuerpo para el modo paralelo
+        :param filepath: Ruta del archivo CSV
+        :param reader: Lector CSV con la codificación y el dialecto de la fuente
+        :param workers: Procesos disponibles
+        :param chunk_size: Tamaño objetivo en bytes de cada trozo
+        :return: Rangos de bytes o None si el archivo no se puede partir con seguridad
+        """
+        # ■■■■■■■■■■■■■ Un flujo comprimido no se puede partir por bytes: validación secuencial ■■■■■■■■■■■■■
+        if CompressedInput.detect(filepath) is not None:
+            return None
+
+        # ■■■■■■■■■■■■■ Límites en bytes: codificación compatible con ASCII, comillas y delimitador de un byte ■■■■■■■■■■■■■
+        if not CSVChunker.is_ascii_compatible(reader.encoding):
+            return None
+        delimiter = reader.dialect_options.get("delimiter", ",").encode(reader.encoding or "ascii", "replace")
+        quotechar = None
+        if reader.dialect_options.get("quoting") != csv.QUOTE_NONE:
+            quotechar = reader.dialect_options.get("quotechar", '"').encode(reader.encoding or "ascii", "replace")
+            if len(quotechar) != 1:
+                return None
+        if len(delimiter) != 1:
+            return None
+
+        size = os.path.getsize(filepath)
+        chunk_size = chunk_size if chunk_size and chunk_size > 0 else DEFAULT_CHUNK_SIZE
+        chunk_count = max(workers, -(-size // chunk_size))
+
+        min_chunk_size = min(chunk_size, SCAN_BLOCK_SIZE)
+
+        # ■■■■■■■■■■■■■ Con un índice auxiliar vigente, los límites salen del índice sin leer el archivo ■■■■■■■■■■■■■
+        standard_dialect = quotechar == b'"' and delimiter == b","
+        index = CSVRowIndex.load(filepath) if reader.has_headers and standard_dialect else None
+        if index is not None:
+            return CSVRowIndex.split(index, chunk_count, min_chunk_size=min_chunk_size)
+
+        # ■■■■■■■■■■■■■ Archivos pequeños quedan en un solo trozo (validación secuencial) ■■■■■■■■■■■■■
+        return CSVChunker.split_body(
+            filepath,
+            chunk_count,
+            min_chunk_size=min_chunk_size,
+            quotechar=quotechar,
+            delimiter=delimiter,
+            has_headers=reader.has_headers
+        )
+
+    def _validate_ranges_parallel(
+            self,
+            filepath: str,
+            schema: SchemaDefinition,
+            file_headers: list[str],
+            ranges: list[tuple[int, int]],
+            workers: int,
+            result: dict[str, Any],
+            emit_bounded: Callable[[list[ErrorRecord]], bool],
+            remaining_errors: Callable[[], Optional[int]]
+    ) -> bool:
+        """
+        Valida los trozos en un pool de procesos y emite sus errores en orden de fila con numeración global
+        Cada trozo numera sus filas desde 1; el desplazamiento global se acumula al recibir los trozos en orden
+        Solo hay `workers` trozos en curso a la vez y cada tarea recibe los errores que faltan para el límite,
+        así que al alcanzarlo no queda trabajo pendiente; una tarea que llega a MAX_RANGE_ERRORS sin límite
+        devuelve dónde se detuvo y el resto del trozo se valida como una tarea nueva
+        :param filepath: Ruta del archivo CSV
+        :param schema: Esquema de validacion
+        :param file_headers: Encabezados ya leídos del archivo
+        :param ranges: Rangos de bytes alineados a registros
+        :param workers: Procesos del pool
+        :param result: Resultado en construcción (filas validadas y última fila)
+        :param emit_bounded: Función que emite errores respetando el límite; indica si se alcanzó
+        :param remaining_errors: Función con los errores que faltan para el límite (None sin límite)
+        :return: ¿Se alcanzó el límite de errores?
+        """
+        row_offset = 1  # La fila 1 son los encabezados
+        pending = deque(ranges)
+        in_flight = deque()
+        pool = ProcessPoolExecutor(max_workers=workers)
+
+        reader = self.csv_reader
+
+        def submit(start: int, end: int):
+            future = pool.submit(
+                validate_byte_range, filepath, start, end, schema, file_headers, remaining_errors(),
+                reader.encoding, reader.dialect_options
             )
-            all_errors.extend(file_error)
+            return future, end
+
+        try:
+            while pending or in_flight:
+
+                # ▲▲▲▲▲▲ Ventana acotada: como mucho un trozo por proceso en curso ▲▲▲▲▲▲
+                while pending and len(in_flight) < workers:
+                    in_flight.append(submit(*pending.popleft()))
+
+                future, end = in_flight.popleft()
+                chunk_errors, chunk_rows, resume_offset = future.result()
+
+                # ▲▲▲▲▲▲ Resto de un trozo interrumpido: se valida antes que los trozos siguientes ▲▲▲▲▲▲
+                if resume_offset is not None:
+                    in_flight.appendleft(submit(resume_offset, end))
+
+                for error in chunk_errors:
+                    error.row += row_offset
+                remaining = remaining_errors()
+                if chunk_errors and emit_bounded(chunk_errors):
+
+                    # ▲▲▲▲▲▲ La parada ocurre en la fila del último error emitido, igual que en secuencial ▲▲▲▲▲▲
+                    stop_row = chunk_errors[remaining - 1].row
+                    result["rows_validated"] += stop_row - row_offset
+                    result["last_row"] = stop_row
+                    return True
+                row_offset += chunk_rows
+                result["rows_validated"] += chunk_rows
+                result["last_row"] = row_offset
+        finally:
+
+            # ▲▲▲▲▲▲ No ejecutar trozos pendientes si se detuvo antes ▲▲▲▲▲▲
+            pool.shutdown(wait=True, cancel_futures=True)
+        return False
 
-        return all_errors
+    @staticmethod
+    def _resolve_error_limit(validation_config: dict[str, Any]) -> Optional[int]:
+        """
+        Traduce validation_config en un número máximo de errores
+        stop_on_first_error (o collect_all_errors en falso sin máximo) equivale a 1 error;
+        max_errors_before_stop positivo fija el máximo; en otro caso no hay límite
+        :param validation_config: Configuración de validación
+        :return: Número máximo de errores o None si se recogen todos
+        """
+        if validation_config.get("stop_on_first_error", False) is True:
+            return 1
+        max_errors = validation_config.get("max_errors_before_stop")
+        if isinstance(max_errors, int) and not isinstance(max_errors, bool) and max_errors > 0:
+            return max_errors
+        if validation_config.get("collect_all_errors", True) is False:
+            return 1
+        return None
+
+    @staticmethod
+    def _finish_result(result: dict[str, Any], stop_reason: Optional[str], error_count: int) -> dict[str, Any]:
+        """
+        Completa el resultado de validación con el motivo de parada
+        :param result: Resultado parcial de validate_file_detailed
+        :param stop_reason: Motivo por el que se dejó de leer filas (None si se recorrió el archivo completo)
+        :param error_count: Número de errores emitidos
+        :return: Resultado completo
+        """
+        result["error_count"] = error_count
+        result["stop_reason"] = stop_reason
+        result["truncated"] = stop_reason in ("limite_errores", "solo_encabezados", "encabezados_criticos")
+        return result
 
     def _validate_headers(self, file_headers: list[str], schema: SchemaDefinition) -> list[str]:
         """
@@ -109,6 +579,15 @@ class CSVValidator:
         :param schema: Esquema de validacion que define tipos y campos requeridos
         :return: Lista de errores en encabezados.
         """
+        return ErrorRecord.render_all(self._validate_headers_records(file_headers, schema))
+
+    def _validate_headers_records(self, file_headers: list[str], schema: SchemaDefinition) -> list[ErrorRecord]:
+        """
+        Valida que los encabezados del archivo coincidan con el esquema
+        :param file_headers: Lista de encabezados del archivo CSV
+        :param schema: Esquema de validacion que define tipos y campos requeridos
+        :return: Lista de registros de error en encabezados.
+        """
         errors = list()
 
         # ■■■■■■■■■■■■■ Obtener campos requeridos del esquema ■■■■■■■■■■■■■
@@ -129,7 +608,7 @@ class CSVValidator:
 
         # ■■■■■■■■■■■■■ Generar errores si hay discrepancias ■■■■■■■■■■■■■
         if len(missing_headers) > 0 or len(unexpected_headers) > 0:
-            header_errors = self.error_reporter.generate_header_error(
+            header_errors = self.error_reporter.header_records(
                 missing_headers=missing_headers,
                 unexpected_headers=unexpected_headers
             )
@@ -137,14 +616,17 @@ class CSVValidator:
 
         return errors
 
-    def _has_critical_headers_errors(self, headers_errors: list[str]) -> bool:
+    def _has_critical_headers_errors(self, headers_errors: list) -> bool:
         """
         Determina si hay errores de encabezado criticos que impidan continuar
-        :param headers_errors: Lista de encabezados con posibles errores
+        :param headers_errors: Lista de errores de encabezado (registros o mensajes)
         :return: ¿Hay errores criticos en los encabezados?
         """
         for error in headers_errors:
-            if "campo requerido" in error or "no encontrado" in error:
+            if isinstance(error, str):
+                if "campo requerido" in error or "no encontrado" in error:
+                    return True
+            elif error.code == "campo_faltante":
                 return True
         return False
 
@@ -156,6 +638,16 @@ class CSVValidator:
         :param row_num: Numero de fila del archivo CSV
         :return: Lista de errores encontrado en la fila del archivo CSV
         """
+        return ErrorRecord.render_all(self._validate_row_records(row, schema, row_num))
+
+    def _validate_row_records(self, row: dict[str, str], schema: SchemaDefinition, row_num: int) -> list[ErrorRecord]:
+        """
+        Valida una fila individual contra el esquema
+        :param row: Fila completa del archivo CSV
+        :param schema: Esquema de validacion que define tipos y campos requeridos
+        :param row_num: Numero de fila del archivo CSV
+        :return: Lista de registros de error encontrados en la fila del archivo CSV
+        """
         errors = list()
 
         # ■■■■■■■■■■■■■ Validar cada campo en la fila ■■■■■■■■■■■■■
@@ -164,18 +656,17 @@ class CSVValidator:
             # ▲▲▲▲▲▲ Verificar si el campo esta permitido en el esquema ▲▲▲▲▲▲
             if self.schema_validator.field_exist_in_schema(field_name=field_name, schema=schema):
                 field_schema = schema[field_name]
-                field_errors = self._validate_field(field_name, field_value, field_schema, row_num)
+                field_errors = self._validate_field_records(field_name, field_value, field_schema, row_num)
                 errors.extend(field_errors)
 
             # ▲▲▲▲▲▲ Campo no permitido en el esquema ▲▲▲▲▲▲
             else:
-                field_errors = self.error_reporter.generate_field_error(
+                errors.append(self.error_reporter.field_record(
                     row_num=row_num,
                     field_name=field_name,
                     error_type="campo_no_permitido",
                     details=""
-                )
-                errors.extend(field_errors)
+                ))
 
         # ■■■■■■■■■■■■■ Validar campos requeridos que podrian estar ausentes ■■■■■■■■■■■■■
         all_field_names = self.schema_validator.get_all_field_names(schema)
@@ -183,13 +674,12 @@ class CSVValidator:
             field_schema = schema[field_name]
             is_required = field_schema.get("requerido", False)
             if is_required and not (field_name in row):
-                field_errors = self.error_reporter.generate_field_error(
+                errors.append(self.error_reporter.field_record(
                     row_num=row_num,
                     field_name=field_name,
                     error_type="valor_nulo",
                     details=""
-                )
-                errors.extend(field_errors)
+                ))
 
         return errors
 
@@ -202,34 +692,120 @@ class CSVValidator:
         :param row_num: Numero de fila del archivo CSV
         :return: Lista de errores encontrado en el campo.
         """
+        return ErrorRecord.render_all(self._validate_field_records(field_name, field_value, field_schema, row_num))
+
+    def _validate_field_records(
+            self,
+            field_name: str,
+            field_value: Any,
+            field_schema: dict,
+            row_num: int
+    ) -> list[ErrorRecord]:
+        """
+        Valida un campo individual segun su definicion en el esquema
+        :param field_name: Nombre del campo
+        :param field_value: Valor a evaluar de dicho campo
+        :param field_schema: Campo del esquema de referencia para evaluar
+        :param row_num: Numero de fila del archivo CSV
+        :return: Lista de registros de error encontrados en el campo.
+        """
         errors = list()
 
         # ■■■■■■■■■■■■■ Verificar si es un campo requerido y esta vacio ■■■■■■■■■■■■■
         is_required = field_schema.get("requerido", False)
         if is_required and ((field_value is None) or str(field_value).strip() == ""):
-            field_errors = self.error_reporter.generate_field_error(
+            errors.append(self.error_reporter.field_record(
                 row_num=row_num,
                 field_name=field_name,
                 error_type="valor_nulo",
                 details=""
-            )
-            errors.extend(field_errors)
+            ))
 
         # ■■■■■■■■■■■■■ Validar tipo de dato ■■■■■■■■■■■■■
-        expected_type = field_schema.get("tipo", "cadena")
+        field = self._compiled_field(field_name, field_schema)
         if field_value is not None and str(field_value).strip() != "":
             is_valid_type = self.type_validator.validate_type(
                 value=field_value,
-                expected_type=expected_type
+                expected_type=field.expected_type,
+                column=field_name,
+                date_formats=field.date_formats
             )
             if not is_valid_type:
-                type_error_details = f"{expected_type} no valido"
-                field_errors = self.error_reporter.generate_field_error(
+                errors.append(self.error_reporter.field_record(
                     row_num=row_num,
                     field_name=field_name,
                     error_type="tipo_incorrecto",
-                    details=type_error_details
-                )
-                errors.extend(field_errors)
+                    details=field.type_details,
+                    value=field_value
+                ))
+
+            # ▲▲▲▲▲▲ Restricciones de patrón, enumeración y rango sobre valores del tipo correcto ▲▲▲▲▲▲
+            if is_valid_type and field.constraints is not None:
+                for code, details in field.constraints(str(field_value).strip(), field.parser(field_value)[1]):
+                    errors.append(self.error_reporter.field_record(
+                        row_num=row_num,
+                        field_name=field_name,
+                        error_type=code,
+                        details=details,
+                        value=field_value
+                    ))
 
         return errors
+
+    def _compiled_field(self, field_name: str, field_schema: dict) -> CompiledField:
+        """
+        Campo compilado una sola vez por definición del esquema (se recompila si cambia la definición)
+        :param field_name: Nombre del campo
+        :param field_schema: Campo del esquema de referencia para evaluar
+        :return: Campo compilado
+        """
+        entry = self._compiled_fields.get(field_name)
+        if entry is None or entry[0] is not field_schema:
+            entry = (field_schema, CompiledField(field_name, field_schema, self.type_validator))
+            self._compiled_fields[field_name] = entry
+        return entry[1]
+
+
+def validate_byte_range(
+        filepath: str,
+        start: int,
+        end: int,
+        schema: CSVValidator.SchemaDefinition,
+        file_headers: list[str],
+        max_errors: Optional[int] = None,
+        encoding: Optional[str] = None,
+        dialect_options: Optional[dict[str, Any]] = None
+) -> tuple[list[ErrorRecord], int, Optional[int]]:
+    """
+    Valida un rango de bytes alineado a registros (función de nivel de módulo para el pool de procesos)
+    Cada proceso compila su propio esquema; las filas se numeran desde 1 dentro del trozo
+    La validación se detiene en el lote que alcanza max_errors o MAX_RANGE_ERRORS; en el segundo caso
+    (sin llegar a max_errors) se devuelve el byte desde el que continuar
+    :param filepath: Ruta del archivo CSV
+    :param start: Primer byte del trozo
+    :param end: Byte siguiente al último del trozo
+    :param schema: Esquema de validacion
+    :param file_headers: Encabezados del archivo
+    :param max_errors: Errores que faltan para el límite de validation_config (Opcional)
+    :param encoding: Codificación del fichero (CSVReader.encoding; por defecto la del sistema)
+    :param dialect_options: Opciones de csv.reader del lector (CSVReader.dialect_options)
+    :return: Tupla (errores con fila local, filas validadas, byte desde el que reanudar o None si terminó)
+    """
+    validate_rows = CompiledSchema(schema, file_headers).validate_rows
+    error_cap = MAX_RANGE_ERRORS if max_errors is None else min(max_errors, MAX_RANGE_ERRORS)
+    errors = list()
+    row_count = 0
+    text = CSVChunker.decode_range(filepath, start, end, encoding)
+    reader = csv.reader(io.StringIO(text, newline=''), **(dialect_options or dict()))
+    rows = (row for row in reader if row)
+    while True:
+        batch = list(islice(rows, DEFAULT_ROW_BATCH_SIZE))
+        if not batch:
+            break
+        errors.extend(validate_rows(batch, row_count + 1))
+        row_count += len(batch)
+        if len(errors) >= error_cap:
+            if max_errors is not None and len(errors) >= max_errors:
+                return errors[:max_errors], row_count, None
+            return errors, row_count, start + CSVChunker.line_offset(text, reader.line_num, encoding)
+    return errors, row_count, None
@@ -6,6 +6,15 @@ FECHA:       2026-02-12
 DESCRIPCIÓN: Validador de estructura del esquema de validación.
 ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
 """
+import re
+from datetime import date, datetime
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ Tipos de dato soportados por el esquema ⋮⋮⋮⋮⋮⋮⋮⋮
+SUPPORTED_TYPES = ("entero", "flotante", "cadena", "booleano", "fecha")
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ Tipos que admiten restricciones de rango (minimo / maximo) ⋮⋮⋮⋮⋮⋮⋮⋮
+RANGE_TYPES = ("entero", "flotante", "fecha")
+
 
 class SchemaValidator:
     """
@@ -48,9 +57,8 @@ class SchemaValidator:
         if not isinstance(field_type, str):
             return False
 
-        # TODO: ■■■■■■■■■■■■■ Verificar que el tipo sea uno de los tipos soportados ■■■■■■■■■■■■■
-        supported_types = ["entero", "flotante", "cadena", "booleano"]
-        if not field_type.lower() in supported_types:
+        # ■■■■■■■■■■■■■ Verificar que el tipo sea uno de los tipos soportados ■■■■■■■■■■■■■
+        if not field_type.lower() in SUPPORTED_TYPES:
             return False
 
         # ■■■■■■■■■■■■■ Verificar que 'requerido' exista y sea booleano si está presente ■■■■■■■■■■■■■
@@ -59,8 +67,73 @@ class SchemaValidator:
             if not isinstance(required_value, bool):
                 return False
 
+        return self._are_valid_constraints(field_def, field_type.lower())
+
+    def _are_valid_constraints(self, field_def: dict, field_type: str) -> bool:
+        """
+        Valida las restricciones opcionales de un campo (formato, patron, minimo, maximo, valores)
+        :param field_def: Diccionario con la definicion de un campo
+        :param field_type: Tipo del campo en minúsculas
+        :return: ¿Las restricciones son validas?
+        """
+        # ■■■■■■■■■■■■■ 'formato': cadena o lista de cadenas, solo para fechas ■■■■■■■■■■■■■
+        if "formato" in field_def:
+            formats = field_def["formato"]
+            formats = [formats] if isinstance(formats, str) else formats
+            if field_type != "fecha" or not isinstance(formats, list) or not formats:
+                return False
+            if not all(isinstance(date_format, str) and date_format for date_format in formats):
+                return False
+
+        # ■■■■■■■■■■■■■ 'patron': expresión regular compilable ■■■■■■■■■■■■■
+        if "patron" in field_def:
+            if not isinstance(field_def["patron"], str):
+                return False
+            try:
+                re.compile(field_def["patron"])
+            except re.error:
+                return False
+
+        # ■■■■■■■■■■■■■ 'valores': lista no vacía de valores permitidos ■■■■■■■■■■■■■
+        if "valores" in field_def:
+            values = field_def["valores"]
+            if not isinstance(values, list) or not values:
+                return False
+
+        # ■■■■■■■■■■■■■ 'minimo' / 'maximo': solo en tipos ordenables y con minimo <= maximo ■■■■■■■■■■■■■
+        bounds = [field_def[key] for key in ("minimo", "maximo") if key in field_def]
+        if bounds:
+            if field_type not in RANGE_TYPES:
+                return False
+            if field_type == "fecha":
+                bounds = [self.parse_date_bound(bound) for bound in bounds]
+                if any(bound is None for bound in bounds):
+                    return False
+            elif not all(isinstance(bound, (int, float)) and not isinstance(bound, bool) for bound in bounds):
+                return False
+            if len(bounds) == 2 and bounds[0] > bounds[1]:
+                return False
+
         return True
 
+    @staticmethod
+    def parse_date_bound(value) -> datetime:
+        """
+        Convierte un límite de fecha del esquema (fecha YAML o cadena ISO) a datetime
+        :param value: Límite definido en el esquema
+        :return: datetime o None si no es una fecha válida
+        """
+        if isinstance(value, datetime):
+            return value
+        if isinstance(value, date):
+            return datetime(value.year, value.month, value.day)
+        if isinstance(value, str):
+            try:
+                return datetime.fromisoformat(value.strip())
+            except ValueError:
+                return None
+        return None
+
     def get_required_fields(self, schema: SchemaDefinition) -> list[str]:
         """
         Extrae la lista de campos requeridos del esquema
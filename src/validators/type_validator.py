@@ -6,7 +6,21 @@ FECHA:       2026-02-12
 DESCRIPCIÓN: Validador y conversor de tipos establecido en el esquema
 ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
 """
-from typing import Any
+import re
+from typing import Any, Callable, Iterable, Optional
+
+from utils.value_cache import ColumnValueCache
+from utils.date_helper import DateHelper, DateFormatResolver
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ Formatos de fecha cuando el esquema no define 'formato' ⋮⋮⋮⋮⋮⋮⋮⋮
+DEFAULT_DATE_FORMATS = ("%Y-%m-%d",)
+
+# ⋮⋮⋮⋮⋮⋮⋮⋮ Prefiltros de aceptación rápida por tipo (lo que no coincide se valida de forma exacta) ⋮⋮⋮⋮⋮⋮⋮⋮
+FAST_TYPE_PATTERNS = {
+    "entero": re.compile(r"\s*[+-]?[0-9]+\s*", re.ASCII).fullmatch,
+    "flotante": re.compile(r"\s*[+-]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?\s*", re.ASCII).fullmatch,
+    "booleano": re.compile(r"\s*(?:true|false|1|0|si|no|verdadero|falso|t|f)\s*", re.IGNORECASE | re.ASCII).fullmatch
+}
 
 
 class TypeValidator:
@@ -14,23 +28,188 @@ class TypeValidator:
     Componente responsable de validar tipos de datos y realizar conversiones seguras
     """
 
-    def validate_type(self, value: Any, expected_type: str) -> bool:
+    def __init__(self):
+        # ⋮⋮⋮⋮⋮⋮⋮⋮ Memo por (columna, tipo) de valor crudo -> (tipo o "invalid", valor convertido) ⋮⋮⋮⋮⋮⋮⋮⋮
+        self._value_cache = ColumnValueCache()
+
+    def validate_type(
+            self,
+            value: Any,
+            expected_type: str,
+            column: Optional[str] = None,
+            date_formats: Optional[list[str]] = None
+    ) -> bool:
         """
         Valida si un valor coincide con el tipo esperado
+        Las cadenas se memorizan por columna para validar cada valor distinto una sola vez
         :param value: Valor a validar
-        :param expected_type: Tipo esperado ("entero", "flotante", "cadena", "booleano")
+        :param expected_type: Tipo esperado ("entero", "flotante", "cadena", "booleano", "fecha")
+        :param column: Nombre de la columna del valor, usado como clave del memo (opcional)
+        :param date_formats: Formatos aceptados para el tipo "fecha" (opcional, por defecto ISO YYYY-MM-DD)
         :return: ¿Es del tipo esperado?
         """
         # ■■■■■■■■■■■■■ Convertir tipo string a tipo real para validación ■■■■■■■■■■■■■
         lower_type = expected_type.lower()
 
+        # ■■■■■■■■■■■■■ Fechas con formatos propios del esquema ■■■■■■■■■■■■■
+        if lower_type == "fecha" and date_formats:
+            if value is None or value == "":
+                return True
+            stripped = str(value).strip()
+            return any(DateHelper.parse_date(stripped, date_format) is not None for date_format in date_formats)
+
         # ■■■■■■■■■■■■■ Valores nulos/vacíos se consideran válidos para validación de tipo ■■■■■■■■■■■■■
         if value is None or value == "":
             # ■■■■■■■■■■■■■ La validación de nulos se hace por separado ■■■■■■■■■■■■■
             return True
 
-        # ■■■■■■■■■■■■■ Eliminar espacios en blanco iniciales y finales ■■■■■■■■■■■■■
-        value = str(value).strip()
+        if not isinstance(value, str):
+            return self._check_type(str(value).strip(), lower_type)
+
+        # ■■■■■■■■■■■■■ Consultar el memo de la columna antes de parsear ■■■■■■■■■■■■■
+        cache = self._value_cache.for_column((column, lower_type))
+        entry = cache.get(value)
+        if entry is None:
+            stripped = value.strip()
+            if self._check_type(stripped, lower_type):
+                entry = cache.put(value, lower_type, self.convert_value(stripped, lower_type))
+            else:
+                entry = cache.put(value, "invalid", None)
+        return entry[0] != "invalid"
+
+    def compile_checker(
+            self,
+            expected_type: str,
+            column: Optional[str] = None,
+            date_formats: Optional[list[str]] = None
+    ) -> Callable[[Any], bool]:
+        """
+        Resuelve una sola vez el validador de un tipo y lo devuelve como función de un argumento
+        Equivale a validate_type(value, expected_type, column) sin repetir la comparación de cadenas del tipo
+        :param expected_type: Tipo esperado ("entero", "flotante", "cadena", "booleano", "fecha")
+        :param column: Nombre de la columna, usado como clave del memo (opcional)
+        :param date_formats: Formatos aceptados para el tipo "fecha" (opcional)
+        :return: Función que recibe el valor y retorna si es del tipo esperado
+        """
+        # ■■■■■■■■■■■■■ Cualquier valor se puede representar como cadena ■■■■■■■■■■■■■
+        if expected_type.lower() == "cadena":
+            return lambda value: True
+
+        parser = self.compile_parser(expected_type, column, date_formats)
+        return lambda value: parser(value)[0]
+
+    def validate_column(
+            self,
+            values: Iterable[Any],
+            expected_type: str,
+            column: Optional[str] = None,
+            date_formats: Optional[list[str]] = None
+    ) -> list[int]:
+        """
+        Valida de una vez un trozo de columna y retorna las posiciones de los valores inválidos
+        Cada valor distinto del trozo se decide una sola vez: primero con un prefiltro regex de aceptación
+        rápida y, si no coincide, con la validación exacta de validate_type. Los valores vacíos no son
+        errores de tipo (son nulos y los trata quien llama)
+        :param values: Valores de la columna (cadenas de csv.reader o None para valores ausentes)
+        :param expected_type: Tipo esperado ("entero", "flotante", "cadena", "booleano", "fecha")
+        :param column: Nombre de la columna, usado como clave del memo (opcional)
+        :param date_formats: Formatos aceptados para el tipo "fecha" (opcional)
+        :return: Lista de índices (dentro de values) con valores que no son del tipo esperado
+        """
+        lower_type = expected_type.lower()
+        if lower_type == "cadena":
+            return list()
+
+        checker = self.compile_checker(expected_type, column, date_formats)
+        fast_match = FAST_TYPE_PATTERNS.get(lower_type)
+        verdicts = dict()
+        invalid = list()
+        for index, value in enumerate(values):
+            verdict = verdicts.get(value)
+            if verdict is None:
+                text = value if isinstance(value, str) or value is None else str(value)
+                if text is None or text.strip() == "":
+                    verdict = True
+                elif fast_match is not None and fast_match(text) is not None:
+                    verdict = True
+                else:
+                    verdict = checker(text)
+                verdicts[value] = verdict
+            if not verdict:
+                invalid.append(index)
+        return invalid
+
+    def compile_parser(
+            self,
+            expected_type: str,
+            column: Optional[str] = None,
+            date_formats: Optional[list[str]] = None
+    ) -> Callable[[Any], tuple[bool, Any]]:
+        """
+        Resuelve una sola vez el validador y conversor de un tipo
+        Para "fecha" el formato se infiere una vez por columna entre los formatos indicados (DateFormatResolver)
+        :param expected_type: Tipo esperado ("entero", "flotante", "cadena", "booleano", "fecha")
+        :param column: Nombre de la columna, usado como clave del memo (opcional)
+        :param date_formats: Formatos aceptados para el tipo "fecha" (opcional, por defecto ISO YYYY-MM-DD)
+        :return: Función que recibe el valor y retorna (¿es válido?, valor convertido o None)
+        """
+        lower_type = expected_type.lower()
+
+        if lower_type == "cadena":
+            return lambda value: (True, value.strip() if isinstance(value, str) and value else value or None)
+
+        # ■■■■■■■■■■■■■ Fechas: formato resuelto una vez por columna ■■■■■■■■■■■■■
+        if lower_type == "fecha":
+            formats = tuple(date_formats) if date_formats else DEFAULT_DATE_FORMATS
+            resolver = DateFormatResolver(
+                list(formats), cache=self._value_cache.for_column((column, lower_type, formats))
+            )
+
+            def date_parser(value: Any) -> tuple[bool, Any]:
+                if value is None or value == "":
+                    return True, None
+                date_parsed = resolver.parse(value.strip() if isinstance(value, str) else str(value).strip())
+                return date_parsed is not None, date_parsed
+
+            return date_parser
+
+        cache = self._value_cache.for_column((column, lower_type))
+        check_type = self._check_type
+        convert_value = self.convert_value
+
+        def parser(value: Any) -> tuple[bool, Any]:
+            if value is None or value == "":
+                return True, None
+            if not isinstance(value, str):
+                stripped = str(value).strip()
+                if check_type(stripped, lower_type):
+                    return True, convert_value(stripped, lower_type)
+                return False, None
+            entry = cache.get(value)
+            if entry is None:
+                stripped = value.strip()
+                if check_type(stripped, lower_type):
+                    entry = cache.put(value, lower_type, convert_value(stripped, lower_type))
+                else:
+                    entry = cache.put(value, "invalid", None)
+            return entry[0] != "invalid", entry[1]
+
+        return parser
+
+    def cache_stats(self) -> dict:
+        """
+        Métricas de uso del memo de validación por (columna, tipo)
+        :return: Diccionario con métricas por clave de memo
+        """
+        return self._value_cache.stats()
+
+    def _check_type(self, value: str, lower_type: str) -> bool:
+        """
+        Valida un valor ya normalizado contra el tipo esperado (sin memo)
+        :param value: Valor sin espacios extremos
+        :param lower_type: Tipo esperado en minúsculas
+        :return: ¿Es del tipo esperado?
+        """
 
         # TODO: ■■■■■■■■■■■■■ Refactorizar ■■■■■■■■■■■■■
         if lower_type == "entero":
@@ -45,6 +224,9 @@ class TypeValidator:
         elif lower_type == "booleano":
             return self._is_valid_bool(value)
 
+        elif lower_type == "fecha":
+            return self._parse_date(value) is not None
+
         # ■■■■■■■■■■■■■ Tipo desconocido ■■■■■■■■■■■■■
         else:
             return False
@@ -74,6 +256,8 @@ class TypeValidator:
                 return value
             elif lower_type == "booleano":
                 return self._parse_bool(value)
+            elif lower_type == "fecha":
+                return self._parse_date(value)
 
             # ■■■■■■■■■■■■■ Tipo desconocido ■■■■■■■■■■■■■
             else:
@@ -103,6 +287,18 @@ class TypeValidator:
         # TODO: ■■■■■■■■■■■■■ Refactorizar ■■■■■■■■■■■■■
         return lower_value in ["true", "1", "si", "verdadero", "t"]
 
+    def _parse_date(self, value: str) -> Any:
+        """
+        Convierte un string a fecha con los formatos por defecto
+        :param value: Valor a convertir a fecha
+        :return: datetime o None si ningún formato coincide
+        """
+        for date_format in DEFAULT_DATE_FORMATS:
+            date_parsed = DateHelper.parse_date(value, date_format)
+            if date_parsed is not None:
+                return date_parsed
+        return None
+
     # ▣▢▣▢▣▢▣▢▣▢▣▢▣▢▣▢▣▢▣▢▣▢▣▢▣  Validadores especificos ▣▢▣▢▣▢▣▢▣▢▣▢▣▢▣▢▣▢▣▢▣▢▣▢▣
 
     def _is_valid_integer(self, value: str) -> bool:
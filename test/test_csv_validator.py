@@ -6,12 +6,26 @@ FECHA:       2026-02-13
 DESCRIPCIÓN: Campo de pruebas unitarias para la implementacion de validador CSV
 ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
 """
+import asyncio
+import csv
+import gzip
+import io
+import json
 import os
 import tempfile
+import time
+import zipfile
 import yaml
+from unittest import mock
 
 from src.validators.csv_validator import CSVValidator
+from src.validators.async_orchestrator import AsyncAuditOrchestrator
+from src.readers.csv_reader import CSVReader
+from src.readers.jsonl_reader import JSONLinesReader
+from src.readers.csv_index import CSVRowIndex
 from src.validators.schema_validator import SchemaValidator
+from src.quality_auditor.main_auditor import QualityAuditor
+from src.utils.error_sink import RingErrorSink, JsonLinesErrorSink, ErrorSummarySink
 
 
 class TestCSVValidator:
@@ -39,6 +53,19 @@ class TestCSVValidator:
         self.test_validate_null_values()
         self.test_validate_non_existent_file()
         self.test_validate_unexpected_headers()
+        self.test_validate_error_records()
+        self.test_compiled_schema_matches_dict_rows()
+        self.test_validate_error_limits()
+        self.test_validate_error_sinks()
+        self.test_validate_error_summary()
+        self.test_validate_parallel_chunks()
+        self.test_csv_row_index()
+        self.test_validate_and_audit()
+        self.test_validate_schema_constraints()
+        self.test_read_batches()
+        self.test_validate_compressed_input()
+        self.test_async_orchestrator()
+        self.test_validate_json_lines()
         print(
             "🮙🮘🮙🮘🮙🮙🮘🮙🮘🮙🮙🮘🮙🮘🮙🮙🮘🮙🮘🮙 Todas las pruebas completadas 🮙🮘🮙🮘🮙🮙🮘🮙🮘🮙🮙🮘🮙🮘🮙🮙🮘🮙🮘🮙")
 
@@ -186,6 +213,589 @@ class TestCSVValidator:
         # ■■■■■■■■■■■■■ Limpiar archivo temporal ■■■■■■■■■■■■■
         os.remove(temp_file)
 
+    def test_validate_error_records(self):
+        """
+        Test: Los registros estructurados se renderizan igual que la salida clásica de cadenas
+        :return:
+        """
+        # ■■■■■■■■■■■■■ Validar el CSV invalido en ambos formatos ■■■■■■■■■■■■■
+        records = self.validator.validate_file_records(
+            filepath=self.invalid_csv_path,
+            schema=self.schema
+        )
+        errors = self.validator.validate_file(
+            filepath=self.invalid_csv_path,
+            schema=self.schema
+        )
+
+        # ■■■■■■■■■■■■■ Mismos mensajes y códigos estructurados disponibles ■■■■■■■■■■■■■
+        rendered = [record.render() for record in records]
+        codes = {record.code for record in records}
+        if rendered == errors and "tipo_incorrecto" in codes and "valor_nulo" in codes:
+            print("✓ testValidateErrorRecords: PASSED")
+        else:
+            print("✗ testValidateErrorRecords: FAILED - Records do not match string errors")
+            print(f"  Records: {str(records)}")
+            print(f"  Errors: {str(errors)}")
+
+    def test_compiled_schema_matches_dict_rows(self):
+        """
+        Test: El esquema compilado sobre filas posicionales produce los mismos errores que la validacion por diccionarios
+        :return:
+        """
+        # ■■■■■■■■■■■■■ Encabezado duplicado, filas cortas, largas y en blanco ■■■■■■■■■■■■■
+        temp_content = "id,nombre,edad,edad,extra,activo\n1,a,3,x,z,true\n\n2,,\n3,b,4,5,q,si,sobra\n,  ,1.5,2,,t\n"
+        temp_file = self._create_temp_file(temp_content)
+        compiled_errors = self.validator.validate_file_records(
+            filepath=temp_file,
+            schema=self.schema
+        )
+
+        # ■■■■■■■■■■■■■ Referencia: validacion fila a fila con csv.DictReader ■■■■■■■■■■■■■
+        expected_errors = self.validator._validate_headers_records(
+            self.validator.csv_reader.read_headers(temp_file), self.schema
+        )
+        for row_num, row in enumerate(self.validator.csv_reader.read_rows(temp_file), start=2):
+            expected_errors.extend(self.validator._validate_row_records(row, self.schema, row_num))
+
+        # ■■■■■■■■■■■■■ Lotes pequeños (columna a columna) y parada por limite dentro de un lote ■■■■■■■■■■■■■
+        batched_errors = self.validator.validate_file_detailed(temp_file, self.schema, batch_size=2)["errors"]
+        limited = CSVValidator({"max_errors_before_stop": 4})
+        row_by_row = limited.validate_file_detailed(temp_file, self.schema, batch_size=1)
+        batched = limited.validate_file_detailed(temp_file, self.schema, batch_size=3)
+        same_stop = all(row_by_row[key] == batched[key] for key in ("errors", "rows_validated", "last_row"))
+
+        invalid_indices = self.validator.type_validator.validate_column(
+            ["1", " 2 ", "1_000", "x", "", None, "3.5"], "entero"
+        )
+        if compiled_errors == expected_errors and batched_errors == expected_errors and same_stop \
+                and invalid_indices == [3, 6]:
+            print("✓ testCompiledSchemaMatchesDictRows: PASSED")
+        else:
+            print("✗ testCompiledSchemaMatchesDictRows: FAILED - Compiled errors differ from dict validation")
+            print(f"  Compiled: {str(compiled_errors)}")
+            print(f"  Expected: {str(expected_errors)}")
+
+        # ■■■■■■■■■■■■■ Limpiar archivo temporal ■■■■■■■■■■■■■
+        os.remove(temp_file)
+
+    def test_validate_error_limits(self):
+        """
+        Test: Parada temprana por primer error, por maximo de errores y validacion solo de encabezados
+        :return:
+        """
+        # ■■■■■■■■■■■■■ Detenerse en el primer error ■■■■■■■■■■■■■
+        first_error = CSVValidator({"stop_on_first_error": True}).validate_file_detailed(
+            filepath=self.invalid_csv_path,
+            schema=self.schema
+        )
+
+        # ■■■■■■■■■■■■■ Detenerse tras N errores ■■■■■■■■■■■■■
+        max_errors = CSVValidator({"max_errors_before_stop": 3}).validate_file_detailed(
+            filepath=self.invalid_csv_path,
+            schema=self.schema
+        )
+
+        # ■■■■■■■■■■■■■ Solo encabezados, sin leer filas ■■■■■■■■■■■■■
+        header_only = self.validator.validate_file_detailed(
+            filepath=self.invalid_csv_path,
+            schema=self.schema,
+            header_only=True
+        )
+
+        passed = (
+            first_error["error_count"] == 1 and first_error["truncated"]
+            and first_error["stop_reason"] == "limite_errores" and first_error["last_row"] == 2
+            and max_errors["error_count"] == 3 and max_errors["truncated"]
+            and header_only["rows_validated"] == 0 and header_only["stop_reason"] == "solo_encabezados"
+        )
+        if passed:
+            print("✓ testValidateErrorLimits: PASSED")
+        else:
+            print("✗ testValidateErrorLimits: FAILED - Early termination not honored")
+            print(f"  First error: {str(first_error)}")
+            print(f"  Max errors: {str(max_errors)}")
+            print(f"  Header only: {str(header_only)}")
+
+    def test_validate_error_sinks(self):
+        """
+        Test: Los errores se envian a sumideros acotados o a archivo sin acumularse en el resultado
+        :return:
+        """
+        expected_errors = self.validator.validate_file_records(
+            filepath=self.invalid_csv_path,
+            schema=self.schema
+        )
+
+        # ■■■■■■■■■■■■■ Sumidero circular: conserva solo los ultimos errores ■■■■■■■■■■■■■
+        ring = RingErrorSink(max_size=2)
+        ring_result = self.validator.validate_file_detailed(
+            filepath=self.invalid_csv_path,
+            schema=self.schema,
+            sink=ring
+        )
+
+        # ■■■■■■■■■■■■■ Sumidero JSON Lines con escritura por bloques ■■■■■■■■■■■■■
+        temp_file = self._create_temp_file("")
+        with JsonLinesErrorSink(temp_file, buffer_size=2) as jsonl:
+            self.validator.validate_file_detailed(
+                filepath=self.invalid_csv_path,
+                schema=self.schema,
+                sink=jsonl
+            )
+        with open(temp_file, 'r', encoding='utf-8') as file:
+            lines = [json.loads(line) for line in file]
+
+        passed = (
+            ring_result["errors"] == [] and ring_result["error_count"] == len(expected_errors)
+            and ring.errors == expected_errors[-2:] and ring.dropped == len(expected_errors) - 2
+            and [line["message"] for line in lines] == [error.render() for error in expected_errors]
+        )
+        if passed:
+            print("✓ testValidateErrorSinks: PASSED")
+        else:
+            print("✗ testValidateErrorSinks: FAILED - Sink output differs from collected errors")
+            print(f"  Ring: {str(ring.errors)}")
+            print(f"  Lines: {str(lines)}")
+
+        # ■■■■■■■■■■■■■ Limpiar archivo temporal ■■■■■■■■■■■■■
+        os.remove(temp_file)
+
+    def test_validate_error_summary(self):
+        """
+        Test: Resumen agregado por (columna, codigo) con muestra acotada y combinable entre trozos
+        :return:
+        """
+        # ■■■■■■■■■■■■■ Archivo donde todas las filas tienen el mismo error de tipo ■■■■■■■■■■■■■
+        rows = "\n".join(f"{i},Ana,x{i},true" for i in range(1, 51))
+        temp_file = self._create_temp_file("id,nombre,edad,activo\n" + rows + "\n")
+        result = self.validator.validate_file_summary(
+            filepath=temp_file,
+            schema=self.schema,
+            sample_size=3
+        )
+        group = result["error_summary"]["groups"][0]
+
+        # ■■■■■■■■■■■■■ Combinar dos resumenes parciales ■■■■■■■■■■■■■
+        first_half, second_half = ErrorSummarySink(3), ErrorSummarySink(3)
+        records = self.validator.validate_file_records(filepath=temp_file, schema=self.schema)
+        first_half.emit_many(records[:20])
+        second_half.emit_many(records[20:])
+        merged = first_half.merge(second_half).summary()["groups"][0]
+
+        passed = (
+            result["errors"] == [] and result["error_count"] == 50
+            and (group["column"], group["code"], group["count"]) == ("edad", "tipo_incorrecto", 50)
+            and group["first_row"] == 2 and group["last_row"] == 51 and len(group["samples"]) == 3
+            and result["summary_lines"][0].startswith("edad: 50 tipo_incorrecto")
+            and (merged["count"], merged["first_row"], merged["last_row"]) == (50, 2, 51)
+            and len(merged["samples"]) == 3
+        )
+        if passed:
+            print("✓ testValidateErrorSummary: PASSED")
+        else:
+            print("✗ testValidateErrorSummary: FAILED - Unexpected aggregated summary")
+            print(f"  Summary: {str(result['error_summary'])}")
+            print(f"  Merged: {str(merged)}")
+
+        # ■■■■■■■■■■■■■ Limpiar archivo temporal ■■■■■■■■■■■■■
+        os.remove(temp_file)
+
+    def test_validate_parallel_chunks(self):
+        """
+        Test: La validacion paralela por trozos conserva el orden y la numeracion global de filas
+        :return:
+        """
+        temp_file = self._create_temp_file(self._multiline_csv_content())
+
+        sequential = self.validator.validate_file_records(filepath=temp_file, schema=self.schema)
+        parallel = self.validator.validate_file_detailed(
+            filepath=temp_file,
+            schema=self.schema,
+            workers=2,
+            chunk_size=512
+        )
+        parallel_ok = parallel["errors"] == sequential and parallel["rows_validated"] == 300
+
+        # ■■■■■■■■■■■■■ Con límite de errores, el modo paralelo para en la misma fila que el secuencial ■■■■■■■■■■■■■
+        limited_validator = CSVValidator(validation_config={"max_errors_before_stop": 40})
+        limited = [
+            limited_validator.validate_file_detailed(filepath=temp_file, schema=self.schema, workers=workers,
+                                                     chunk_size=512)
+            for workers in (1, 2)
+        ]
+        limit_ok = (
+            limited[0]["errors"] == limited[1]["errors"] == sequential[:40]
+            and limited[0]["last_row"] == limited[1]["last_row"]
+            and limited[0]["rows_validated"] == limited[1]["rows_validated"]
+        )
+
+        # ■■■■■■■■■■■■■ Los trozos se leen con el dialecto y la codificación de la fuente ■■■■■■■■■■■■■
+        semicolon_text = io.StringIO()
+        with open(temp_file, encoding="utf-8", newline="") as file:
+            csv.writer(semicolon_text, delimiter=";", lineterminator="\n").writerows(
+                [value.replace("Maria", "María") for value in row] for row in csv.reader(file)
+            )
+        semicolon_file = self._create_temp_file(semicolon_text.getvalue())
+        semicolon_validator = CSVValidator(source_config={"delimiter": ";", "encoding": "utf-8"})
+        semicolon = [
+            semicolon_validator.validate_file_detailed(filepath=semicolon_file, schema=self.schema, workers=workers,
+                                                       chunk_size=512)
+            for workers in (1, 2)
+        ]
+        dialect_ok = semicolon[0]["errors"] == semicolon[1]["errors"] and len(semicolon[1]["errors"]) == len(sequential)
+        os.remove(semicolon_file)
+
+        if parallel_ok and limit_ok and dialect_ok:
+            print("✓ testValidateParallelChunks: PASSED")
+        elif not parallel_ok:
+            print("✗ testValidateParallelChunks: FAILED - Parallel errors differ from sequential validation")
+            print(f"  Parallel: {str(parallel['errors'][:5])}")
+            print(f"  Sequential: {str(sequential[:5])}")
+        elif not limit_ok:
+            print("✗ testValidateParallelChunks: FAILED - Parallel run stops at a different row with max_errors")
+            print(f"  Last rows: {limited[0]['last_row']} / {limited[1]['last_row']}")
+        else:
+            print("✗ testValidateParallelChunks: FAILED - Chunks ignore the source dialect or encoding")
+            print(f"  Errors: {len(semicolon[0]['errors'])} / {len(semicolon[1]['errors'])}")
+
+        # ■■■■■■■■■■■■■ Limpiar archivo temporal ■■■■■■■■■■■■■
+        os.remove(temp_file)
+
+    def test_csv_row_index(self):
+        """
+        Test: Índice auxiliar .idx (trozos y acceso directo a filas) y conteo sobre mmap igual que csv.reader
+        :return:
+        """
+        temp_file = self._create_temp_file(self._multiline_csv_content())
+        sequential = self.validator.validate_file_records(filepath=temp_file, schema=self.schema)
+        dict_rows = list(self.validator.csv_reader.read_raw_rows(temp_file))
+        first_error = sequential[0]
+
+        # ■■■■■■■■■■■■■ El índice se guarda junto al CSV y los trozos paralelos salen de él ■■■■■■■■■■■■■
+        index = CSVRowIndex.build(temp_file, every=20)
+        with mock.patch.object(CSVRowIndex, "split", wraps=CSVRowIndex.split) as split:
+            indexed = self.validator.validate_file_detailed(
+                filepath=temp_file,
+                schema=self.schema,
+                workers=2,
+                chunk_size=512
+            )
+        index_ok = (
+            index["rows"] == 300
+            and os.path.exists(CSVRowIndex.index_path(temp_file))
+            and CSVRowIndex.load(temp_file) == index
+            and split.called
+            and indexed["errors"] == sequential
+            and CSVRowIndex.read_row(temp_file, first_error.row) == dict_rows[first_error.row - 2]
+        )
+        os.remove(CSVRowIndex.index_path(temp_file))
+
+        # ■■■■■■■■■■■■■ Conteo sin tokenizar, también con comillas explícitas en la configuración ■■■■■■■■■■■■■
+        headerless_reader = CSVReader({"has_headers": False})
+        with mock.patch.object(CSVRowIndex, "count_records", wraps=CSVRowIndex.count_records) as count_records:
+            counts = [
+                self.validator.csv_reader.count_rows(temp_file),
+                CSVReader({"quotechar": '"', "quoting": "minimal"}).count_rows(temp_file),
+                headerless_reader.count_rows(temp_file)
+            ]
+        count_ok = (
+            counts == [306, 306, 307] and count_records.call_count == 3
+            and next(headerless_reader.read_raw_rows(temp_file)) == ["id", "nombre", "edad", "activo"]
+        )
+
+        # ■■■■■■■■■■■■■ Comillas fuera del inicio de un campo: se cuentan y leen como csv.reader ■■■■■■■■■■■■■
+        stray_file = self._create_temp_file('a,b\n5"x,1\n6"y,2\n7,3\n')
+        stray_ok = (
+            self.validator.csv_reader.count_rows(stray_file) == 3
+            and CSVRowIndex.read_row(stray_file, 3) == ['6"y', '2']
+        )
+        os.remove(stray_file)
+
+        if index_ok and count_ok and stray_ok:
+            print("✓ testCSVRowIndex: PASSED")
+        elif not index_ok:
+            print("✗ testCSVRowIndex: FAILED - Sidecar index not saved, reused or consistent with csv.reader")
+            print(f"  Split from index: {split.called}")
+        elif not count_ok:
+            print("✗ testCSVRowIndex: FAILED - Fast count differs from csv.reader or was not used")
+            print(f"  Counts: {counts} ({count_records.call_count} fast)")
+        else:
+            print("✗ testCSVRowIndex: FAILED - Stray quotes counted or read differently from csv.reader")
+
+        # ■■■■■■■■■■■■■ Limpiar archivo temporal ■■■■■■■■■■■■■
+        os.remove(temp_file)
+
+    def test_validate_and_audit(self):
+        """
+        Test: Validacion y auditoria con una sola lectura equivalen a ejecutarlas por separado
+        :return:
+        """
+        combined = self.validator.validate_and_audit(
+            filepath=self.invalid_csv_path,
+            schema=self.schema
+        )
+
+        # ■■■■■■■■■■■■■ Flujo clasico: validar y releer el archivo para auditar ■■■■■■■■■■■■■
+        expected_errors = self.validator.validate_file_records(filepath=self.invalid_csv_path, schema=self.schema)
+        expected_quality = QualityAuditor.quality_audit(list(self.validator.csv_reader.read_rows(self.invalid_csv_path)))
+
+        quality = combined["quality"]
+        passed = (
+            combined["validation"]["errors"] == expected_errors
+            and quality["total_rows"] == expected_quality["total_rows"]
+            and quality["null_analysis"] == expected_quality["null_analysis"]
+            and quality["statistical_analysis"] == expected_quality["statistical_analysis"]
+        )
+        if passed:
+            print("✓ testValidateAndAudit: PASSED")
+        else:
+            print("✗ testValidateAndAudit: FAILED - Combined result differs from separate runs")
+            print(f"  Combined: {str(combined['validation'])}")
+
+    def test_validate_schema_constraints(self):
+        """
+        Test: Restricciones de fecha con formato, patron, rango y valores en ambas rutas de validacion
+        :return:
+        """
+        schema = {
+            "codigo": {"tipo": "cadena", "requerido": True, "patron": r"[A-Z]{3}-\d{3}"},
+            "edad": {"tipo": "entero", "minimo": 0, "maximo": 120},
+            "estado": {"tipo": "cadena", "valores": ["activo", "inactivo"]},
+            "alta": {"tipo": "fecha", "formato": "%d/%m/%Y", "minimo": "2000-01-01"}
+        }
+        content = (
+            "codigo,edad,estado,alta\n"
+            "ABC-123,30,activo,15/03/2020\n"
+            "abc-1,150,borrado,01/01/1999\n"
+            "XYZ-999,-1,inactivo,2020-03-15\n"
+        )
+        temp_file = self._create_temp_file(content)
+
+        records = self.validator.validate_file_records(filepath=temp_file, schema=schema)
+        found = [(record.row, record.column, record.code) for record in records]
+        expected = [
+            (3, "codigo", "patron_invalido"),
+            (3, "edad", "fuera_de_rango"),
+            (3, "estado", "valor_no_permitido"),
+            (3, "alta", "fuera_de_rango"),
+            (4, "edad", "fuera_de_rango"),
+            (4, "alta", "tipo_incorrecto")
+        ]
+
+        # ■■■■■■■■■■■■■ La ruta por diccionarios debe coincidir con el esquema compilado ■■■■■■■■■■■■■
+        legacy = list()
+        for row_num, row in enumerate(self.validator.csv_reader.read_rows(temp_file), start=2):
+            legacy.extend(self.validator._validate_row_records(row, schema, row_num))
+
+        invalid_schema = {"edad": {"tipo": "entero", "minimo": 10, "maximo": 1}}
+        if (
+                found == expected
+                and legacy == records
+                and not self.validator.schema_validator.validate_schema_structure(invalid_schema)
+        ):
+            print("✓ testValidateSchemaConstraints: PASSED")
+        else:
+            print("✗ testValidateSchemaConstraints: FAILED - Constraint errors differ from expected")
+            print(f"  Errors: {found}")
+
+        # ■■■■■■■■■■■■■ Limpiar archivo temporal ■■■■■■■■■■■■■
+        os.remove(temp_file)
+
+    def test_read_batches(self):
+        """
+        Test: Lectura por lotes de tuplas y por columnas con el dialecto de input.primary_source
+        :return:
+        """
+        temp_file = self._create_temp_file("id;nombre;edad\n1;\"a;b\";3\n\n2;c\n3;d;5;extra\n4;e;6\n")
+        reader = CSVReader({"encoding": "utf-8", "delimiter": ";", "quoting": "minimal"})
+
+        row_batches = list(reader.read_batches(temp_file, batch_size=3))
+        column_batches = list(reader.read_batches(temp_file, batch_size=3, columnar=True))
+
+        expected_rows = [
+            [("1", "a;b", "3"), ("2", "c"), ("3", "d", "5", "extra")],
+            [("4", "e", "6")]
+        ]
+        expected_columns = [
+            [["1", "2", "3"], ["a;b", "c", "d"], ["3", None, "5"]],
+            [["4"], ["e"], ["6"]]
+        ]
+        if row_batches == expected_rows and column_batches == expected_columns:
+            print("✓ testReadBatches: PASSED")
+        else:
+            print("✗ testReadBatches: FAILED - Batches differ from expected")
+            print(f"  Rows: {row_batches}")
+            print(f"  Columns: {column_batches}")
+
+        # ■■■■■■■■■■■■■ Limpiar archivo temporal ■■■■■■■■■■■■■
+        os.remove(temp_file)
+
+    def test_validate_compressed_input(self):
+        """
+        Test: Los archivos gzip y zip se leen y validan igual que el CSV sin comprimir
+        :return:
+        """
+        with open(self.invalid_csv_path, 'rb') as file:
+            content = file.read()
+
+        # ■■■■■■■■■■■■■ Mismo contenido comprimido en gzip y en un zip con otro miembro ■■■■■■■■■■■■■
+        gzip_handle = tempfile.NamedTemporaryFile(suffix='.csv.gz', delete=False)
+        gzip_handle.write(gzip.compress(content))
+        gzip_handle.close()
+        zip_handle = tempfile.NamedTemporaryFile(suffix='.zip', delete=False)
+        zip_handle.close()
+        with zipfile.ZipFile(zip_handle.name, 'w') as archive:
+            archive.writestr("LEEME.txt", "notas")
+            archive.writestr("datos.csv", content)
+
+        expected_errors = self.validator.validate_file(filepath=self.invalid_csv_path, schema=self.schema)
+        expected_count = self.validator.csv_reader.count_rows(self.invalid_csv_path)
+        passed = True
+        for compressed_path in (gzip_handle.name, zip_handle.name):
+            errors = self.validator.validate_file(filepath=compressed_path, schema=self.schema, workers=2)
+            count = self.validator.csv_reader.count_rows(compressed_path)
+            passed = passed and errors == expected_errors and count == expected_count
+
+        if passed:
+            print("✓ testValidateCompressedInput: PASSED")
+        else:
+            print("✗ testValidateCompressedInput: FAILED - Compressed input differs from plain CSV")
+
+        # ■■■■■■■■■■■■■ Limpiar archivos temporales ■■■■■■■■■■■■■
+        os.remove(gzip_handle.name)
+        os.remove(zip_handle.name)
+
+    def test_async_orchestrator(self):
+        """
+        Test: El orquestador asíncrono devuelve por archivo lo mismo que validate_and_audit
+        :return:
+        """
+        filepaths = [self.invalid_csv_path, self.valid_csv_path, "archivo_inexistente.csv"] * 3
+        orchestrator = AsyncAuditOrchestrator(self.schema, workers=2, max_concurrency=2)
+        results = orchestrator.run(filepaths)
+
+        # ■■■■■■■■■■■■■ Mismo resultado por archivo que la ejecución síncrona ■■■■■■■■■■■■■
+        expected = {
+            filepath: self.validator.validate_and_audit(filepath=filepath, schema=self.schema)
+            for filepath in set(filepaths)
+        }
+        passed = len(results) == len(filepaths) and all(
+            result["error"] is None
+            and result["validation"]["errors"] == expected[result["filepath"]]["validation"]["errors"]
+            and result["quality"]["null_analysis"] == expected[result["filepath"]]["quality"]["null_analysis"]
+            for result in results
+        )
+
+        # ■■■■■■■■■■■■■ Fuente asíncrona en espera: el resultado listo no espera al siguiente archivo ■■■■■■■■■■■■■
+        async def queue_fed() -> list[float]:
+            queue = asyncio.Queue()
+            await queue.put(self.valid_csv_path)
+
+            async def source():
+                while (item := await queue.get()) is not None:
+                    yield item
+
+            start = time.perf_counter()
+            arrivals = list()
+            asyncio.get_running_loop().call_later(1.0, queue.put_nowait, None)
+            async for _ in AsyncAuditOrchestrator(self.schema, workers=1).audit_files(source()):
+                arrivals.append(time.perf_counter() - start)
+            return arrivals
+
+        arrivals = asyncio.run(queue_fed())
+        passed = passed and len(arrivals) == 1 and arrivals[0] < 1.0
+
+        # ■■■■■■■■■■■■■ Con esquema, cada archivo se lee con el dialecto de la fuente ■■■■■■■■■■■■■
+        with open(self.invalid_csv_path, encoding="utf-8", newline="") as file:
+            semicolon_text = io.StringIO()
+            csv.writer(semicolon_text, delimiter=";", lineterminator="\n").writerows(csv.reader(file))
+        semicolon_file = self._create_temp_file(semicolon_text.getvalue())
+        source_config = {"delimiter": ";", "encoding": "utf-8"}
+        direct = CSVValidator(source_config=source_config).validate_and_audit(filepath=semicolon_file,
+                                                                              schema=self.schema)
+        orchestrated = AsyncAuditOrchestrator(self.schema, workers=1, source_config=source_config,
+                                              audit_options={"numerics_columns": ["edad"]}).run([semicolon_file])[0]
+        passed = (
+            passed and orchestrated["error"] is None
+            and orchestrated["validation"]["errors"] == direct["validation"]["errors"]
+            and "statistical_details" in orchestrated["quality"]
+        )
+        os.remove(semicolon_file)
+        if passed:
+            print("✓ testAsyncOrchestrator: PASSED")
+        else:
+            print("✗ testAsyncOrchestrator: FAILED - Async results differ from synchronous runs")
+
+    def test_validate_json_lines(self):
+        """
+        Test: Un archivo JSON Lines con el mismo contenido se valida y audita igual que el CSV
+        (celdas vacías como clave ausente o null, enteros como números JSON)
+        :return:
+        """
+        jsonl_handle = tempfile.NamedTemporaryFile(mode='w', suffix='.jsonl', delete=False, encoding='utf-8')
+        for position, row in enumerate(CSVReader().read_rows(self.invalid_csv_path)):
+            record = dict()
+            for key, value in row.items():
+                if value == "" and position > 0:
+                    if position % 2:
+                        record[key] = None
+                    continue
+                record[key] = int(value) if value.isdigit() else value
+            jsonl_handle.write(json.dumps(record, ensure_ascii=False) + "\n")
+            if position == 1:
+                jsonl_handle.write("\n")
+        jsonl_handle.close()
+
+        expected = self.validator.validate_and_audit(filepath=self.invalid_csv_path, schema=self.schema)
+        result = self.validator.validate_and_audit(filepath=jsonl_handle.name, schema=self.schema)
+        errors = self.validator.validate_file(filepath=jsonl_handle.name, schema=self.schema, workers=2)
+        passed = (
+            [(error.row, error.column, error.code) for error in result["validation"]["errors"]]
+            == [(error.row, error.column, error.code) for error in expected["validation"]["errors"]]
+            and len(errors) == len(expected["validation"]["errors"])
+            and result["quality"]["null_analysis"] == expected["quality"]["null_analysis"]
+        )
+
+        # ■■■■■■■■■■■■■ Una línea que no es JSON se informa como formato inválido ■■■■■■■■■■■■■
+        with open(jsonl_handle.name, 'a', encoding='utf-8') as file:
+            file.write("{no es json}\n")
+        broken = self.validator.validate_file_records(filepath=jsonl_handle.name, schema=self.schema)
+        passed = passed and broken[-1].code == "formato_invalido"
+
+        # ■■■■■■■■■■■■■ Claves fuera de la muestra del encabezado: valores sobrantes, como en CSV ■■■■■■■■■■■■■
+        late_key_path = jsonl_handle.name + ".late.jsonl"
+        with open(late_key_path, 'w', encoding='utf-8') as file:
+            file.write('{"id": 1, "nombre": "Ana"}\n{"id": 2, "nombre": "Luis", "extra": "x"}\n')
+        late_key = CSVValidator(source_config={"header_sample_rows": 1}).validate_file_records(
+            filepath=late_key_path, schema={"id": {"tipo": "entero"}, "nombre": {"tipo": "cadena"}}
+        )
+        passed = (
+            passed and [(error.row, error.code) for error in late_key] == [(3, "campo_no_permitido")]
+            and JSONLinesReader().count_rows("archivo_inexistente.jsonl") == CSVReader().count_rows("x.csv") == 0
+        )
+        os.remove(late_key_path)
+
+        if passed:
+            print("✓ testValidateJsonLines: PASSED")
+        else:
+            print("✗ testValidateJsonLines: FAILED - JSON Lines results differ from the equivalent CSV")
+
+        os.remove(jsonl_handle.name)
+
+    def _multiline_csv_content(self) -> str:
+        """
+        Contenido de 300 filas con campos entre comillas con saltos de linea y filas en blanco
+        :return: Texto CSV con encabezado
+        """
+        rows = list()
+        for i in range(1, 301):
+            name = '"Ana\nMaria, ""A"""' if i % 3 == 0 else ("" if i % 7 == 0 else "Luis")
+            rows.append(f"{i},{name},{'x' if i % 5 == 0 else i},true")
+            if i % 50 == 0:
+                rows.append("")
+        return "id,nombre,edad,activo\n" + "\n".join(rows) + "\n"
+
     def _create_temp_file(self, content: str) -> str:
         """
         Crea un archivo temporal seguro con contenido especifico
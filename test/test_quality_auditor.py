@@ -7,22 +7,39 @@ DESCRIPCIÓN: Pruebas unitarias e integración para el sistema de auditoría de
 ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
 """
 
+import copy
 import os
+import random
+import sqlite3
 import sys
+import tempfile
+from dataclasses import FrozenInstanceError
+from types import SimpleNamespace
+from datetime import datetime
 from typing import Dict, Any, List
+import yaml
 
 # ⋮⋮⋮⋮⋮⋮⋮⋮ Agrega directorio ruta src para importaciones ⋮⋮⋮⋮⋮⋮⋮⋮
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from quality_auditor.main_auditor import QualityAuditor
 from quality_auditor.null_analyzer import NullAnalyzer
 from quality_auditor.uniqueness_analyzer import UniquenessAnalyzer
 from quality_auditor.statistical_analyzer import StatisticalAnalyzer
 from quality_auditor.date_analyzer import DateAnalyzer
+from quality_auditor.null_monitor import SequentialNullMonitor
 from utils.quality_report import QualityReport
 from readers.quality_rules_reader import QualityRulesReader
+from readers.rules_watcher import RulesWatcher
+from readers.columnar_snapshot import ColumnarSnapshot
 from readers.csv_reader import CSVReader
+from readers.sqlite_source import SQLiteSource
+from readers.typed_rules import DataTypeRules, Thresholds
 from utils.data_parser import DataParser
+from utils.value_cache import ValueCache
+from utils.date_helper import DateHelper, DateFormatResolver
+from utils.row_sampler import RowSampler
 
 
 class TestQualityAuditor:
@@ -187,6 +204,82 @@ class TestQualityAuditor:
             result = DateAnalyzer.check_date_coherence(future_date_data, "birth_date")
             assert len(result["errors"]) > 0, "Future date should generate errors"
 
+            # ■■■■■■■■■■■■■ Formato inferido por columna ■■■■■■■■■■■■■
+            mixed_format_data = [
+                {"id": 1, "birth_date": "15/01/1990"},
+                {"id": 2, "birth_date": "20/05/1995"},
+                {"id": 3, "birth_date": "1985-12-10"},
+                {"id": 4, "birth_date": "fecha"}
+            ]
+            result = DateAnalyzer.check_date_coherence(mixed_format_data, "birth_date")
+            observed = result["formats_observed"]
+            assert observed["counts"] == {"%d/%m/%Y": 2, "%Y-%m-%d": 1}, f"Unexpected formats: {observed}"
+            assert observed["invalid"] == 1, "Should count one invalid date"
+            assert len(result["errors"]) == 1, "Only the invalid date should generate an error"
+
+            # ■■■■■■■■■■■■■ Varias columnas en un solo recorrido ■■■■■■■■■■■■■
+            batch_data = [
+                {"alta": "2020-01-01", "baja": "2030-01-01"},
+                {"alta": "2021-06-15", "baja": "no-fecha"},
+                {"alta": "2022-03-01"}
+            ]
+            result = DateAnalyzer.check_dates_batch(
+                batch_data, ["alta", "baja"], reference_time=datetime(2025, 1, 1)
+            )
+            assert result["reference_date"] == "2025-01-01", "Should capture the reference date once"
+            assert result["columns"]["alta"]["error_total"] == 0, "Past dates should have no errors"
+            baja = result["columns"]["baja"]
+            assert baja["future_dates"] == 1, "Should detect one future date"
+            assert baja["parse_failures"] == 1, "Should detect one parse failure"
+            assert baja["missing_column"] == 1, "Should detect one row without the column"
+
+            # ■■■■■■■■■■■■■ Registros estructurados, formateados solo al renderizar ■■■■■■■■■■■■■
+            result = DateAnalyzer.check_dates_batch(
+                batch_data, ["baja"], reference_time=datetime(2025, 1, 1), structured=True
+            )
+            records = result["columns"]["baja"]["errors"]
+            assert [record.code for record in records] == ["fecha_futura", "fecha_invalida", "columna_no_encontrada"], \
+                "Unexpected error codes"
+            assert records[0].render() == baja["errors"][0], "Rendered record should match the classic message"
+
+            # ■■■■■■■■■■■■■ Resumen agregado por (columna, código) ■■■■■■■■■■■■■
+            result = DateAnalyzer.check_dates_batch(
+                batch_data, ["baja"], reference_time=datetime(2025, 1, 1), summary_sample_size=2
+            )
+            summary = result["error_summary"]
+            assert summary["total"] == 3 and len(summary["groups"]) == 3, "Should aggregate three error groups"
+            assert result["columns"]["baja"]["errors"] == [], "Errors should not be materialized"
+            assert result["columns"]["baja"]["error_total"] == 3, "Error total should still be counted"
+
+            # ■■■■■■■■■■■■■ Perfil temporal combinable entre trozos ■■■■■■■■■■■■■
+            profiles = dict()
+            first_chunk = [{"alta": "2024-12-01"}, {"alta": "2024-12-02"}]
+            second_chunk = [{"alta": "2024-12-05"}] + [{"alta": "2024-12-06"}] * 8
+            for chunk in (first_chunk, second_chunk):
+                result = DateAnalyzer.check_dates_batch(
+                    chunk, ["alta"], reference_time=datetime(2024, 12, 10), profiles=profiles
+                )
+            profile = result["columns"]["alta"]["temporal_profile"]
+            assert profile["total"] == 11, "Profile should accumulate across chunks"
+            assert profile["min_date"] == "2024-12-01" and profile["max_date"] == "2024-12-06", "Wrong range"
+            assert profile["freshness_lag_days"] == 4, "Freshness lag should be 4 days"
+            assert profile["gaps"] == [{"from": "2024-12-03", "to": "2024-12-04", "periods": 2}], "Wrong gaps"
+            assert [spike["period"] for spike in profile["spikes"]] == ["2024-12-06"], "Wrong spikes"
+            assert profile["counts_per_month"] == {"2024-12": 11}, "Wrong monthly counts"
+
+            # ■■■■■■■■■■■■■ Parseo en bloque ■■■■■■■■■■■■■
+            parsed = DateHelper.parse_many(["2020-01-01", None, "", "31/12/2020", "x"], ["%Y-%m-%d", "%d/%m/%Y"])
+            assert parsed == [datetime(2020, 1, 1), None, None, datetime(2020, 12, 31), None], "Bulk parse mismatch"
+
+            # ■■■■■■■■■■■■■ Fechas ambiguas: una sola interpretación por columna ■■■■■■■■■■■■■
+            ambiguous = ["01/02/2024", "12/31/2024", "11/30/2024", "10/25/2024", "03/04/2024", "01/02/2024"]
+            day_first = ["%d/%m/%Y", "%m/%d/%Y"]
+            parsed = DateHelper.parse_many(ambiguous, resolver=DateFormatResolver(day_first, sample_size=4))
+            assert [date.month for date in parsed] == [1, 12, 11, 10, 3, 1], "Bulk parse should use the locked format"
+            resolver = DateFormatResolver(day_first, sample_size=4)
+            streamed = [resolver.parse(date) for date in ambiguous]
+            assert streamed[4].month == 3 and streamed[5].month == 1, "Sampled values should be re-parsed on lock"
+
             print("✅ test_date_analyzer PASSED")
             return True
 
@@ -248,6 +341,283 @@ class TestQualityAuditor:
             print(f"❌ test_quality_auditor_with_config FAILED: {str(e)}")
             return False
 
+    @staticmethod
+    def test_quality_auditor_projection() -> bool:
+        """
+        Prueba de QualityAuditor.audit_file leyendo solo las columnas necesarias
+        :return: ¿Pasa la prueba?
+        """
+        temp_path = None
+        try:
+            content = "id,name,age,email,age,salary\n1,John,30,a@x.com,31,50000\n\n2,Jane,25\n3,Bob,35,b@x.com,36,55000\n"
+            with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as temp_file:
+                temp_file.write(content)
+                temp_path = temp_file.name
+
+            # ■■■■■■■■■■■■■ Lectura proyectada equivale a DictReader restringido a las columnas ■■■■■■■■■■■■■
+            reader = CSVReader()
+            full_rows = list(reader.read_rows(temp_path))
+            projected_rows = list(reader.read_rows(temp_path, columns=["salary", "age", "missing"]))
+            expected_rows = [{"age": row["age"], "salary": row["salary"]} for row in full_rows]
+            assert projected_rows == expected_rows, "Projected rows should match DictReader values"
+
+            # ■■■■■■■■■■■■■ Solo analisis numerico: se lee una columna ■■■■■■■■■■■■■
+            result = QualityAuditor.audit_file(temp_path, numerics_columns=["age"], base_audit=False)
+            assert result["projection"]["columns_read"] == ["age"], "Should read only the requested column"
+            assert result["projection"]["columns_total"] == 5, "Should count distinct headers"
+            assert result["statistical_details"]["age"]["max"] == 36, "Should analyze the projected column"
+            assert "null_analysis" not in result, "Base audit should be skipped"
+
+            # ■■■■■■■■■■■■■ Auditoria general: todas las columnas ■■■■■■■■■■■■■
+            full = QualityAuditor.audit_file(temp_path)
+            assert full["projection"]["columns_read"] == ["id", "name", "age", "email", "salary"], \
+                "Base audit should read every column"
+            assert full["null_analysis"] == QualityAuditor.quality_audit(full_rows)["null_analysis"], \
+                "Projected audit should match the dict reader audit"
+
+            print("✅ test_quality_auditor_projection PASSED")
+            return True
+
+        except Exception as e:
+            print(f"❌ test_quality_auditor_projection FAILED: {str(e)}")
+            return False
+        finally:
+            if temp_path is not None:
+                os.remove(temp_path)
+
+    @staticmethod
+    def test_quality_auditor_sampling() -> bool:
+        """
+        Prueba de QualityAuditor.sample_audit con intervalos de confianza y alertas estimadas
+        :return: ¿Pasa la prueba?
+        """
+        temp_path = None
+        try:
+            with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as temp_file:
+                temp_file.write("id,email,zona\n")
+                rng = random.Random(3)
+                nulls = 0
+                for row in range(5000):
+                    is_null = rng.random() < 0.4
+                    nulls += is_null
+                    zone = '' if (row // 250) % 2 == 0 else 'norte'
+                    temp_file.write(f"{row},{'' if is_null else f'u{row}@x.com'},{zone}\n")
+                temp_path = temp_file.name
+            true_percentage = round(nulls / 5000 * 100.0, 2)
+
+            # ■■■■■■■■■■■■■ Cada método: tamaño de muestra e intervalo que contiene el porcentaje real ■■■■■■■■■■■■■
+            for method in ("reservoir", "systematic", "block"):
+                result = QualityAuditor.sample_audit(temp_path, sample_size=500, method=method, seed=7)
+                assert result["sampling"]["method"] == method, f"{method} should be used"
+                assert result["sampling"]["sample_rows"] == 500, f"{method} should sample 500 rows"
+                assert result["total_rows"] == 5000, f"{method} should report the population"
+                email = result["null_analysis"]["email"]
+                assert email["ci_low"] <= true_percentage <= email["ci_high"], f"{method} interval should contain it"
+                uniqueness = result["uniqueness_analysis"]["email"]
+                assert uniqueness["sample_only"] and "ci_low" not in uniqueness, \
+                    f"{method} uniqueness should be a sample-only figure"
+                assert result["alerts"] and all(alert.startswith("ESTIMACIÓN") for alert in result["alerts"]), \
+                    "Alerts should be marked as estimates"
+
+            # ■■■■■■■■■■■■■ Nulos agrupados en tramos: el muestreo por bloques amplía el intervalo ■■■■■■■■■■■■■
+            block = QualityAuditor.sample_audit(temp_path, sample_size=1000, method="block", seed=7)
+            zone = block["null_analysis"]["zona"]
+            assert zone["design_effect"] > 1.0 and zone["ci_low"] <= 50.0 <= zone["ci_high"], \
+                "Block sampling interval should account for clustered rows"
+
+            # ■■■■■■■■■■■■■ Salto al inicio del cuerpo: la primera fila de datos se puede muestrear ■■■■■■■■■■■■■
+            first_jump = SimpleNamespace(random=lambda: 0.0)
+            rows, _ = RowSampler.block(temp_path, 10, 5000, first_jump, CSVReader(), block_rows=10)
+            assert rows[0]["id"] == "0", "A jump onto a line start should keep that row"
+            try:
+                RowSampler.block(temp_path, 10, 5000, first_jump, CSVReader({"has_headers": False}))
+                raise AssertionError("Block sampling without headers should be rejected")
+            except ValueError:
+                pass
+
+            # ■■■■■■■■■■■■■ Muestra del archivo completo: intervalo degenerado ■■■■■■■■■■■■■
+            full = QualityAuditor.sample_audit(temp_path, sample_size=10000)
+            assert full["null_analysis"]["email"]["ci_low"] == full["null_analysis"]["email"]["ci_high"] == true_percentage, \
+                "Whole-population sample should have no uncertainty"
+
+            print("✅ test_quality_auditor_sampling PASSED")
+            return True
+
+        except Exception as e:
+            print(f"❌ test_quality_auditor_sampling FAILED: {str(e)}")
+            return False
+        finally:
+            if temp_path is not None:
+                os.remove(temp_path)
+
+    @staticmethod
+    def test_quality_auditor_fail_fast() -> bool:
+        """
+        Prueba de la parada temprana de QualityAuditor.audit_file ante un umbral crítico de nulos
+        :return: ¿Pasa la prueba?
+        """
+        temp_path = None
+        error_handling = {"fail_fast_on_quality_critical": True, "fail_fast_check_rows": 100}
+        try:
+            with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as temp_file:
+                temp_file.write("id,email\n")
+                for row in range(1000):
+                    temp_file.write(f"{row},{'' if row < 600 else f'u{row}@x.com'}\n")
+                temp_path = temp_file.name
+
+            # ■■■■■■■■■■■■■ 600 nulos al inicio de 1000 filas: decidido sin leer el resto ■■■■■■■■■■■■■
+            result = QualityAuditor.audit_file(temp_path, error_handling=error_handling)
+            decision = result["fail_fast"]
+            assert decision["triggered"] and decision["column"] == "email", "Email should trigger the fail fast"
+            assert decision["rows_scanned"] < 1000, "Should stop before the end of the file"
+            assert "null_analysis" not in result, "Full audit should be skipped"
+            assert result["alerts"]["critical_alerts"] == 1, "Should report one critical alert"
+
+            # ■■■■■■■■■■■■■ Sin parada temprana configurada: auditoría completa ■■■■■■■■■■■■■
+            full = QualityAuditor.audit_file(temp_path)
+            assert "fail_fast" not in full and full["null_analysis"]["email"] == 600, "Should audit every row"
+
+            # ■■■■■■■■■■■■■ Archivo bajo el umbral: se lee entero y no se dispara ■■■■■■■■■■■■■
+            with open(temp_path, 'w') as file:
+                file.write("id,email\n")
+                for row in range(1000):
+                    file.write(f"{row},{'' if row % 5 < 2 else f'u{row}@x.com'}\n")
+            result = QualityAuditor.audit_file(temp_path, error_handling=error_handling)
+            assert result["fail_fast"] == {"triggered": False, "rows_scanned": 1000}, "Should not trigger"
+            assert result["null_analysis"]["email"] == 400, "Should run the full audit"
+
+            # ■■■■■■■■■■■■■ Presupuesto de error repartido entre columnas y acotado ■■■■■■■■■■■■■
+            monitor = SequentialNullMonitor(50.0, 10, {}, confidence=0.99, check_rows=5)
+            monitor.nulls = {"id": 0, "email": 0}
+            spent = 0.0
+            for monitor.looks in range(1, 50):
+                spent += monitor._alpha() * len(monitor.nulls)
+            assert spent <= 0.01 + 1e-12, f"Total error spent {spent} exceeds 1 - confidence"
+
+            # ■■■■■■■■■■■■■ Filas entre comprobaciones no positivas: error de configuración ■■■■■■■■■■■■■
+            for check_rows in (0, -5, "100"):
+                try:
+                    QualityAuditor.audit_file(
+                        temp_path, error_handling={**error_handling, "fail_fast_check_rows": check_rows}
+                    )
+                    raise AssertionError(f"fail_fast_check_rows={check_rows!r} should be rejected")
+                except ValueError:
+                    pass
+
+            print("✅ test_quality_auditor_fail_fast PASSED")
+            return True
+
+        except Exception as e:
+            print(f"❌ test_quality_auditor_fail_fast FAILED: {str(e)}")
+            return False
+        finally:
+            if temp_path is not None:
+                os.remove(temp_path)
+
+    @staticmethod
+    def test_columnar_snapshot() -> bool:
+        """
+        Prueba de la instantánea columnar y de QualityAuditor.audit_snapshot frente a la lectura del CSV
+        :return: ¿Pasa la prueba?
+        """
+        temp_path = None
+        snapshot_path = None
+        try:
+            with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as temp_file:
+                temp_file.write("id,name,score,code,name\n")
+                for row in range(300):
+                    score = "" if row % 7 == 0 else repr(row / 4)
+                    temp_file.write(f"{row},n{row % 11},{score},{'NULL' if row % 5 == 0 else f'0{row % 3}'},x{row}\n")
+                temp_file.write("300,short\n\n")
+                temp_path = temp_file.name
+
+            snapshot_path = ColumnarSnapshot.write(temp_path)
+            rows = list(CSVReader().read_rows(temp_path))
+
+            # ■■■■■■■■■■■■■ Columnas tipadas y texto original reconstruido exacto ■■■■■■■■■■■■■
+            with ColumnarSnapshot.open_for(temp_path) as snapshot:
+                assert snapshot.columns["id"]["kind"] == "int", "Id should be stored as int64"
+                assert snapshot.columns["score"]["kind"] == "float", "Score should be stored as float64"
+                assert snapshot.columns["code"]["kind"] == "dict", "Leading zeros should keep text encoding"
+                assert snapshot.values("id")[300] == 300, "Typed values should be readable without parsing"
+                assert list(snapshot.iter_rows()) == rows, "Rows should match CSVReader.read_rows"
+
+            # ■■■■■■■■■■■■■ Mismos nulos y unicidad que la auditoría sobre filas ■■■■■■■■■■■■■
+            result = QualityAuditor.audit_snapshot(snapshot_path)
+            assert result["null_analysis"] == NullAnalyzer.count_nulls(rows), "Null counts should match"
+            assert result["uniqueness_analysis"] == UniquenessAnalyzer.calculate_uniqueness(rows), \
+                "Uniqueness should match"
+            assert result["numeric_summary"]["id"]["max"] == 300, "Numeric summary should use the footer"
+            expected_alerts = QualityAuditor.generate_alerts(rows)
+            assert result["alerts"]["alerts"] == expected_alerts["alerts"], "Alerts should match generate_alerts"
+
+            print("✅ test_columnar_snapshot PASSED")
+            return True
+
+        except Exception as e:
+            print(f"❌ test_columnar_snapshot FAILED: {str(e)}")
+            return False
+        finally:
+            for path in (temp_path, snapshot_path):
+                if path is not None and os.path.exists(path):
+                    os.remove(path)
+
+    @staticmethod
+    def test_sqlite_audit() -> bool:
+        """
+        Prueba de QualityAuditor.audit_sqlite (agregados en SQLite) frente a quality_audit sobre las mismas filas
+        :return: ¿Pasa la prueba?
+        """
+        database_path = None
+        try:
+            with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as temp_file:
+                database_path = temp_file.name
+            connection = sqlite3.connect(database_path)
+            connection.execute('CREATE TABLE "ventas 2025" (id INTEGER, monto REAL, cantidad, nombre TEXT, codigo)')
+            rng = random.Random(3)
+            connection.executemany('INSERT INTO "ventas 2025" VALUES (?, ?, ?, ?, ?)', [
+                (
+                    row,
+                    None if row % 6 == 0 else round(rng.uniform(-50, 500), 3),
+                    rng.choice([1, 0, -2, None, 2.5]),
+                    rng.choice(["Ana", " NULL ", "", "n/a", None, "Luis\u3000"]),
+                    rng.choice(["12.5", "x", 7, None])
+                )
+                for row in range(400)
+            ])
+            connection.commit()
+            connection.close()
+
+            # ■■■■■■■■■■■■■ Mismo resultado que la auditoría sobre las filas leídas (columnas con texto en varios lotes) ■■■■■■■■■■■■■
+            rows = list(SQLiteSource(database_path, "ventas 2025", {"fetch_size": 64}).read_rows())
+            expected = QualityAuditor.quality_audit(rows)
+            result = QualityAuditor.audit_sqlite(database_path, "ventas 2025", source_config={"fetch_size": 64})
+            for key in ("total_rows", "null_analysis", "uniqueness_analysis", "statistical_analysis",
+                        "count_types", "alerts"):
+                assert result[key] == expected[key], f"{key} should match quality_audit"
+
+            # ■■■■■■■■■■■■■ Columnas numéricas en SQL, columnas con texto leídas en Python ■■■■■■■■■■■■■
+            pushdown = result["pushdown"]
+            assert pushdown["pushed_columns"] == ["id", "monto", "cantidad"], "Numeric columns should be pushed"
+            assert pushdown["streamed_columns"] == ["nombre", "codigo"], "Text columns should be streamed"
+            assert pushdown["distinct_counts"]["cantidad"] == 5, "Distinct counts should include NULL"
+
+            try:
+                QualityAuditor.audit_sqlite(database_path, "no_existe")
+                assert False, "Missing tables should raise ValueError"
+            except ValueError:
+                pass
+
+            print("✅ test_sqlite_audit PASSED")
+            return True
+
+        except Exception as e:
+            print(f"❌ test_sqlite_audit FAILED: {str(e)}")
+            return False
+        finally:
+            if database_path is not None and os.path.exists(database_path):
+                os.remove(database_path)
+
     @staticmethod
     def test_quality_rules_reader() -> bool:
         """
@@ -283,6 +653,123 @@ class TestQualityAuditor:
             print(f"❌ test_quality_rules_reader FAILED: {str(e)}")
             return False
 
+    @staticmethod
+    def test_typed_rules() -> bool:
+        """
+        Prueba las reglas tipadas de QualityRulesReader y su uso en DataParser
+        :return: ¿Pasa la prueba?
+        """
+        try:
+            config = QualityRulesReader.load_configs("../schemas/quality_rules.yaml")
+
+            # ■■■■■■■■■■■■■ Reglas inmutables, hashables y compartidas entre cargas ■■■■■■■■■■■■■
+            rules = QualityRulesReader.get_typed_rules(config)
+            assert rules is QualityRulesReader.get_typed_rules(QualityRulesReader.load_configs(
+                "../schemas/quality_rules.yaml")), "Equal configs should share the rules object"
+            assert rules.numeric.precision == 2, "Precision should come from the config"
+            assert rules.text.max_length == 1000, "Max length should come from the config"
+            assert hash(rules) == hash(DataTypeRules.from_dict(config["quality_rules"]["data_type_rules"]))
+            assert not hasattr(rules, "__dict__"), "Rules should use __slots__"
+            try:
+                rules.numeric.min_value = 0
+                assert False, "Rules should be frozen"
+            except FrozenInstanceError:
+                pass
+            assert QualityRulesReader.get_typed_thresholds(config).critical.null_percentage == 50.0
+            assert QualityRulesReader.get_thresholds(None) == Thresholds.from_dict(None).to_dict()
+
+            # ■■■■■■■■■■■■■ Mismo resultado que las reglas en diccionario ■■■■■■■■■■■■■
+            rule_dicts = {"numeric": {"allow_negative": False, "max_value": 100}, "text": {"min_length": 3}}
+            typed = DataTypeRules.from_dict(rule_dicts)
+            for value in ["42", "-1", "500", "ab", "abc", " ", "yes", None, 7, True]:
+                assert DataParser.classify_value(value, typed) == DataParser.classify_value(value, rule_dicts), \
+                    f"Typed and dict rules should classify {value!r} equally"
+            assert DataParser.is_null_value("N/A", rules.null), "'N/A' should be null"
+            assert DataParser.is_numeric_value("-1", typed.numeric) is False, "Negatives should be rejected"
+            assert DataParser.is_numeric_value("-1", {"allow_negative": True, "precision": "2"}), \
+                "Dict rules are read as before, without validating unrelated keys"
+
+            # ■■■■■■■■■■■■■ Validación única de tipos en check_config_structure ■■■■■■■■■■■■■
+            assert QualityRulesReader.check_config_structure(config), "Schema config should be valid"
+            invalid = copy.deepcopy(config)
+            invalid["quality_rules"]["data_type_rules"]["numeric"]["min_value"] = "cero"
+            assert not QualityRulesReader.check_config_structure(invalid), "Text min_value should be invalid"
+
+            print("✅ test_typed_rules PASSED")
+            return True
+
+        except Exception as e:
+            print(f"❌ test_typed_rules FAILED: {str(e)}")
+            return False
+
+    @staticmethod
+    def test_rules_hot_reload() -> bool:
+        """
+        Prueba la recarga en caliente de un archivo de reglas con RulesWatcher
+        :return: ¿Pasa la prueba?
+        """
+        rules_path = None
+        try:
+            with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as temp_file:
+                rules_path = temp_file.name
+            config = QualityRulesReader.load_configs("../schemas/quality_rules.yaml")
+
+            def write_rules(max_value, mtime):
+                config["quality_rules"]["data_type_rules"]["numeric"]["max_value"] = max_value
+                with open(rules_path, mode='w', encoding='utf-8') as rules_file:
+                    yaml.safe_dump(config, rules_file)
+                os.utime(rules_path, (mtime, mtime))
+
+            write_rules(100, 1_000_000)
+            watcher = RulesWatcher([rules_path], interval=0.01)
+            old_snapshot = QualityRulesReader.load_snapshot(rules_path)
+            old_rules = old_snapshot.rules
+            assert QualityRulesReader.load_snapshot(rules_path) is old_snapshot, "Unchanged files should be cached"
+            assert StatisticalAnalyzer.get_numerics_values([{"v": "500"}], rules_path) == {}, "500 should exceed max_value"
+            assert watcher.poll() == [], "Unchanged files should not reload"
+
+            # ■■■■■■■■■■■■■ Cambio de reglas: nueva instantánea y clasificador anterior descartado ■■■■■■■■■■■■■
+            write_rules(1000, 1_000_010)
+            assert watcher.poll() == [os.path.abspath(rules_path)], "Edited file should reload"
+            new_rules = QualityRulesReader.load_rules(rules_path)
+            assert new_rules.numeric.max_value == 1000, "New rules should be used"
+            assert old_rules not in DataParser._compiled_classifiers, "Old classifier should be discarded"
+            assert new_rules in DataParser._compiled_classifiers, "New classifier should be precompiled"
+            assert old_snapshot.rules is old_rules, "In-flight snapshots should keep their rules"
+            assert StatisticalAnalyzer.get_numerics_values([{"v": "500"}], rules_path) == {"v": [500.0]}
+
+            # ■■■■■■■■■■■■■ YAML a medio editar: se conserva la última versión válida ■■■■■■■■■■■■■
+            with open(rules_path, mode='w', encoding='utf-8') as rules_file:
+                rules_file.write("quality_rules: [sin cerrar")
+            os.utime(rules_path, (1_000_020, 1_000_020))
+            assert watcher.poll() == [], "Invalid YAML should not replace the rules"
+            assert QualityRulesReader.load_rules(rules_path) is new_rules, "Last valid rules should be kept"
+            assert os.path.abspath(rules_path) in watcher.errors, "Reload errors should be reported"
+
+            # ■■■■■■■■■■■■■ from src import RulesWatcher recarga la caché de los analizadores ■■■■■■■■■■■■■
+            from src import RulesWatcher as PackageRulesWatcher
+            write_rules(2000, 1_000_030)
+            assert PackageRulesWatcher([rules_path]).poll() == [os.path.abspath(rules_path)], "Edit should reload"
+            assert any(rules.numeric.max_value == 2000 for rules in DataParser._compiled_classifiers), \
+                "DataParser should precompile the reloaded rules"
+            assert StatisticalAnalyzer.get_numerics_values([{"v": "1500"}], rules_path) == {"v": [1500.0]}
+
+            with watcher:
+                assert watcher._thread.is_alive(), "Watcher thread should be running"
+            assert watcher._thread is None, "Watcher thread should stop"
+
+            print("✅ test_rules_hot_reload PASSED")
+            return True
+
+        except Exception as e:
+            print(f"❌ test_rules_hot_reload FAILED: {str(e)}")
+            return False
+        finally:
+            if rules_path is not None:
+                QualityRulesReader.invalidate(rules_path)
+                if os.path.exists(rules_path):
+                    os.remove(rules_path)
+
     @staticmethod
     def test_quality_report_generator() -> bool:
         """
@@ -419,6 +906,36 @@ class TestQualityAuditor:
             print(f"❌ test_data_parser_transform FAILED: {str(e)}")
             return False
 
+    @staticmethod
+    def test_value_cache() -> bool:
+        """
+        Prueba del memo LRU de valores distintos usado por el clasificador
+        :return: ¿Pasa la prueba?
+        """
+        try:
+
+            # ■■■■■■■■■■■■■ Clasificación memorizada ■■■■■■■■■■■■■
+            cache = ValueCache(max_size=2)
+            assert DataParser.classify_value("42", None, cache) == ("numeric", 42.0), "'42' should be numeric"
+            assert DataParser.classify_value("42", None, cache) == ("numeric", 42.0), "Cached '42' should be numeric"
+            assert cache.hits == 1 and cache.misses == 1, "Second lookup should hit the cache"
+            assert DataParser.classify_value("abc", None, cache)[0] == "text", "'abc' should be text"
+
+            # ■■■■■■■■■■■■■ Expulsión LRU en columnas de alta cardinalidad ■■■■■■■■■■■■■
+            DataParser.classify_value("42", None, cache)
+            DataParser.classify_value("7", None, cache)
+            assert len(cache) == 2, "Cache should stay bounded"
+            assert "abc" not in cache, "Least recently used value should be evicted"
+            assert "42" in cache, "Recently used value should be kept"
+            assert cache.evictions == 1, "Should count one eviction"
+
+            print("✅ test_value_cache PASSED")
+            return True
+
+        except Exception as e:
+            print(f"❌ test_value_cache FAILED: {str(e)}")
+            return False
+
     @staticmethod
     def test_integration_complete_flow() -> bool:
         """
@@ -551,10 +1068,18 @@ class TestQualityAuditor:
             ("Date Analyzer", TestQualityAuditor.test_date_analyzer),
             ("Quality Auditor Basic", TestQualityAuditor.test_quality_auditor_basic),
             ("Quality Auditor with Config", TestQualityAuditor.test_quality_auditor_with_config),
+            ("Quality Auditor Projection", TestQualityAuditor.test_quality_auditor_projection),
+            ("Quality Auditor Sampling", TestQualityAuditor.test_quality_auditor_sampling),
+            ("Quality Auditor Fail Fast", TestQualityAuditor.test_quality_auditor_fail_fast),
+            ("Columnar Snapshot", TestQualityAuditor.test_columnar_snapshot),
+            ("SQLite Pushdown Audit", TestQualityAuditor.test_sqlite_audit),
             ("Quality Rules Reader", TestQualityAuditor.test_quality_rules_reader),
+            ("Typed Rules", TestQualityAuditor.test_typed_rules),
+            ("Rules Hot Reload", TestQualityAuditor.test_rules_hot_reload),
             ("Quality Report Generator", TestQualityAuditor.test_quality_report_generator),
             ("Data Parser", TestQualityAuditor.test_data_parser),
             ("Data Parser Transform", TestQualityAuditor.test_data_parser_transform),
+            ("Value Cache", TestQualityAuditor.test_value_cache),
             ("Integration Complete Flow", TestQualityAuditor.test_integration_complete_flow),
             ("Edge Cases", TestQualityAuditor.test_edge_cases)
         ]